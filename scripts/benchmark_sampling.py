@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark percentile accuracy of the Monte Carlo random sampling options
+
+For representative velocity profiles, every sampling option is run repeatedly
+at several trial counts with different seeds and compared against a large
+pseudo-random reference run. Completion sprints are integers, so percentile
+accuracy is measured as the root-mean-square error of the probability of
+finishing by the reference P50/P85/P95 sprint, next to the error of the
+forecast mean. "gain" is the variance reduction of that probability error
+relative to pseudo-random draws at the same trial count, i.e. how many times
+fewer trials the sampler needs for the same accuracy.
+
+Usage:
+    python scripts/benchmark_sampling.py [--repeats 40] [--reference 2000000]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import click
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.forecasting import (  # noqa: E402
+    MonteCarloConfiguration,
+    RandomSampling,
+    SimulationEngine,
+)
+from src.domain.value_objects import VelocityMetrics  # noqa: E402
+from src.infrastructure.monte_carlo_model import MonteCarloModel  # noqa: E402
+
+CONFIDENCE_LEVELS = [0.5, 0.85, 0.95]
+TRIAL_COUNTS = [250, 500, 1000, 2000, 5000, 10000]
+
+PROFILES = {
+    "typical (20 +/- 5, 200 pts)": (200.0, VelocityMetrics(20, 20, 5, 10, 30, 0)),
+    "variable (8 +/- 6, 120 pts)": (120.0, VelocityMetrics(8, 7, 6, 1, 20, 0)),
+    "stable (40 +/- 1, 300 pts)": (300.0, VelocityMetrics(40, 40, 1, 38, 42, 0)),
+    "long (15 +/- 7, 600 pts)": (600.0, VelocityMetrics(15, 14, 7, 3, 30, 0)),
+}
+
+
+def _forecast(model, remaining_work, velocity_metrics, sampling, trials, seed):
+    config = MonteCarloConfiguration(
+        num_simulations=trials,
+        confidence_levels=CONFIDENCE_LEVELS,
+        engine=SimulationEngine.VECTORIZED,
+        random_seed=seed,
+        random_sampling=sampling,
+    )
+    return model.forecast(remaining_work, velocity_metrics, config)
+
+
+def _summary(result, sprints):
+    """Forecast mean and probability of finishing by each of the given sprints"""
+    distribution = result.probability_distribution
+    return np.array(
+        [result.expected_sprints]
+        + [
+            sum(p for sprint, p in distribution.items() if sprint <= limit)
+            for limit in sprints
+        ]
+    )
+
+
+@click.command()
+@click.option("--repeats", default=40, help="Seeds per sampler and trial count")
+@click.option("--reference", default=2_000_000, help="Trials in the reference run")
+def main(repeats: int, reference: int):
+    model = MonteCarloModel()
+
+    for name, (remaining_work, velocity_metrics) in PROFILES.items():
+        reference_result = _forecast(
+            model,
+            remaining_work,
+            velocity_metrics,
+            RandomSampling.PSEUDO_RANDOM,
+            reference,
+            seed=0,
+        )
+        sprints = [
+            reference_result.get_percentile(level) for level in CONFIDENCE_LEVELS
+        ]
+        truth = _summary(reference_result, sprints)
+        click.echo(
+            f"\n{name}: reference mean={truth[0]:.3f}, "
+            f"P50/P85/P95={[int(s) for s in sprints]}"
+        )
+        click.echo(
+            f"{'sampler':<14}{'trials':>8}{'rmse mean':>11}{'rmse P50':>10}"
+            f"{'rmse P85':>10}{'rmse P95':>10}{'gain':>7}{'ms/run':>9}"
+        )
+
+        baseline_mse = {}
+        for sampling in RandomSampling:
+            for trials in TRIAL_COUNTS:
+                start = time.perf_counter()
+                estimates = np.array(
+                    [
+                        _summary(
+                            _forecast(
+                                model,
+                                remaining_work,
+                                velocity_metrics,
+                                sampling,
+                                trials,
+                                seed=seed,
+                            ),
+                            sprints,
+                        )
+                        for seed in range(1, repeats + 1)
+                    ]
+                )
+                elapsed_ms = (time.perf_counter() - start) * 1000 / repeats
+                mse = ((estimates - truth) ** 2).mean(axis=0)
+                baseline_mse.setdefault(trials, mse)
+                gain = baseline_mse[trials][1:].sum() / max(mse[1:].sum(), 1e-12)
+                rmse = np.sqrt(mse)
+                click.echo(
+                    f"{sampling.value:<14}{trials:>8}{rmse[0]:>11.4f}"
+                    f"{rmse[1]:>10.4f}{rmse[2]:>10.4f}{rmse[3]:>10.4f}"
+                    f"{gain:>7.1f}{elapsed_ms:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,40 @@
 """Use cases for forecasting using the model abstraction"""
 
+import itertools
 import logging
-from typing import Optional
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple
 
 from ..domain.forecasting import (
     ForecastingModel,
     ForecastingModelFactory,
     ForecastResult,
     ModelConfiguration,
+    ModelRun,
+    ModelRunStatus,
     ModelType,
+    PortfolioForecast,
 )
+from ..domain.multi_project import ProjectData
 from ..domain.repositories import IssueRepository
+from ..domain.sensitivity import (
+    SENSITIVITY_PARAMETERS,
+    SensitivityAnalysis,
+    SensitivityOutcome,
+    SensitivityPoint,
+    TornadoBar,
+)
 from ..domain.value_objects import VelocityMetrics
 
 logger = logging.getLogger(__name__)
@@ -85,18 +109,129 @@ class GenerateForecastUseCase:
         return result
 
 
+def _run_forecast(
+    model: ForecastingModel,
+    remaining_work: float,
+    velocity_metrics: VelocityMetrics,
+    config: ModelConfiguration,
+) -> ForecastResult:
+    """Forecast with one model; module level so process pools can run it"""
+    return GenerateForecastUseCase(model).execute(
+        remaining_work, velocity_metrics, config
+    )
+
+
+# Start notices of process-pool models, set in each worker by its initializer
+_start_notices: Optional[multiprocessing.Queue] = None
+
+
+def _init_process_worker(start_notices: multiprocessing.Queue) -> None:
+    global _start_notices
+    _start_notices = start_notices
+
+
+def _run_forecast_in_process(model_type: ModelType, *args) -> ForecastResult:
+    """Announce the start of a process-pool model, then forecast with it"""
+    _start_notices.put(model_type)
+    return _run_forecast(*args)
+
+
+class _DaemonThreadPool(Executor):
+    """
+    Bounded pool of daemon worker threads
+
+    Unlike ThreadPoolExecutor workers, which the interpreter joins at exit,
+    a daemon worker left running by an abandoned model does not delay exit.
+    """
+
+    def __init__(self, max_workers: int):
+        self._work: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._futures: List[Future] = []
+        self._num_workers = max_workers
+        for _ in range(max_workers):
+            threading.Thread(
+                target=self._worker, name="forecast-model", daemon=True
+            ).start()
+
+    def submit(self, function: Callable, *args, **kwargs) -> Future:
+        future: Future = Future()
+        self._futures.append(future)
+        self._work.put((future, function, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if cancel_futures:
+            for future in self._futures:
+                future.cancel()
+        # Workers exit once they reach these, after their current model
+        for _ in range(self._num_workers):
+            self._work.put(None)
+        if wait:
+            for future in self._futures:
+                if not future.cancelled():
+                    future.exception()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            future, function, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
 class CompareForecastModelsUseCase:
-    """Compare forecasts from multiple models"""
+    """Compare forecasts from multiple models, running them concurrently"""
+
+    # Longest wait between checks for started and overdue models
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        model_factory: ForecastingModelFactory,
+        timeout: Optional[float] = None,
+        process_model_types: Collection[ModelType] = (),
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize with a model factory
+
+        Models run on a bounded pool of daemon threads, which suits light
+        models and the vectorized Monte Carlo engine (NumPy releases the GIL).
+        Models listed in process_model_types, e.g. pure-Python simulations,
+        run on a process pool instead; they and their configurations must be
+        picklable. A timed-out thread keeps running until its model returns
+        but never delays interpreter exit; a timed-out process is left to
+        finish when the pool shuts down.
 
-    def __init__(self, model_factory: ForecastingModelFactory):
+        Each model's timeout counts from when a worker starts it, so a model
+        queued behind max_workers others still gets all of it. Queued models
+        are reported as timed out without running once every worker of their
+        pool is held by a model that has already timed out.
+
+        Args:
+            model_factory: Factory of the models to compare
+            timeout: Seconds each model may run once started (None = no limit)
+            process_model_types: Models to run in separate processes
+            max_workers: Upper bound on the thread pool and on the process
+                pool (None = a thread per model, and all cores)
+        """
         self.model_factory = model_factory
+        self.timeout = timeout
+        self.process_model_types = frozenset(process_model_types)
+        self.max_workers = max_workers
 
     def execute(
         self,
         remaining_work: float,
         velocity_metrics: VelocityMetrics,
-        model_types: Optional[list[ModelType]] = None,
-    ) -> dict[ModelType, ForecastResult]:
+        model_types: Optional[List[ModelType]] = None,
+    ) -> Dict[ModelType, ForecastResult]:
         """
         Run multiple models and compare results
 
@@ -106,29 +241,428 @@ class CompareForecastModelsUseCase:
             model_types: List of models to compare (None = all available)
 
         Returns:
-            Dictionary mapping model type to forecast result
+            Dictionary mapping model type to forecast result, for the models
+            that completed in time; each result's metadata has its
+            elapsed_seconds
         """
         results = {}
+        for model_type, run in self.run(
+            remaining_work, velocity_metrics, model_types
+        ).items():
+            if run.status == ModelRunStatus.COMPLETED:
+                run.result.model_metadata["elapsed_seconds"] = run.elapsed_seconds
+                results[model_type] = run.result
+        return results
 
+    def run(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        model_types: Optional[List[ModelType]] = None,
+    ) -> Dict[ModelType, ModelRun]:
+        """
+        Run multiple models concurrently and report every model's outcome
+
+        Models that fail or exceed the timeout are reported with their status
+        instead of a result; a timed-out model is abandoned, not interrupted.
+        Models whose default configuration lacks inputs only the caller can
+        supply, such as a throughput history, are reported as NOT_CONFIGURED
+        without running.
+
+        Returns:
+            Dictionary mapping model type to its run, in the order requested
+        """
         # Get models to compare
         if model_types is None:
             available_models = self.model_factory.get_available_models()
             model_types = [info.model_type for info in available_models]
 
-        # Run each model
+        runs: Dict[ModelType, ModelRun] = {}
+        arguments: Dict[ModelType, tuple] = {}
         for model_type in model_types:
             try:
                 # Create model with default config
                 model = self.model_factory.create(model_type)
                 config = self.model_factory.get_default_config(model_type)
+            except Exception as e:
+                logger.error(f"Failed to create {model_type.value} model: {e}")
+                runs[model_type] = ModelRun(
+                    model_type, ModelRunStatus.FAILED, 0.0, error=str(e)
+                )
+                continue
 
-                # Generate forecast
-                use_case = GenerateForecastUseCase(model)
-                result = use_case.execute(remaining_work, velocity_metrics, config)
-                results[model_type] = result
+            missing = model.configuration_errors(config)
+            if missing:
+                logger.info(f"Skipping {model_type.value} model: {'; '.join(missing)}")
+                runs[model_type] = ModelRun(
+                    model_type,
+                    ModelRunStatus.NOT_CONFIGURED,
+                    0.0,
+                    error="; ".join(missing),
+                )
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to run {model_type.value} model: {str(e)}")
+            arguments[model_type] = (model, remaining_work, velocity_metrics, config)
+
+        process_types = [t for t in arguments if t in self.process_model_types]
+        thread_types = [t for t in arguments if t not in self.process_model_types]
+
+        futures: Dict[ModelType, Future] = {}
+        started_at: Dict[ModelType, float] = {}
+        finished_at: Dict[ModelType, float] = {}
+        abandoned_at: Dict[ModelType, float] = {}
+        pools: List[Tuple[List[ModelType], int]] = []
+        executors: List[Executor] = []
+        start_notices: Optional[multiprocessing.Queue] = None
+
+        try:
+            if thread_types:
+                size = min(self.max_workers or len(thread_types), len(thread_types))
+                thread_pool = _DaemonThreadPool(size)
+                executors.append(thread_pool)
+                pools.append((thread_types, size))
+            if process_types:
+                size = min(self.max_workers or os.cpu_count() or 1, len(process_types))
+                start_notices = multiprocessing.Queue()
+                process_pool = ProcessPoolExecutor(
+                    max_workers=size,
+                    initializer=_init_process_worker,
+                    initargs=(start_notices,),
+                )
+                executors.append(process_pool)
+                pools.append((process_types, size))
+
+            for model_type, model_arguments in arguments.items():
+                if model_type in self.process_model_types:
+                    future = process_pool.submit(
+                        _run_forecast_in_process, model_type, *model_arguments
+                    )
+                else:
+
+                    def run_in_thread(model_type=model_type, args=model_arguments):
+                        started_at.setdefault(model_type, time.perf_counter())
+                        return _run_forecast(*args)
+
+                    future = thread_pool.submit(run_in_thread)
+                future.add_done_callback(
+                    lambda _, model_type=model_type: finished_at.setdefault(
+                        model_type, time.perf_counter()
+                    )
+                )
+                futures[model_type] = future
+
+            self._wait_for_models(
+                futures, pools, start_notices, started_at, abandoned_at
+            )
+        finally:
+            # Do not block on abandoned models
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if start_notices is not None:
+                self._record_starts(start_notices, started_at)
+                start_notices.close()
+
+        for model_type, future in futures.items():
+            if model_type in abandoned_at:
+                if model_type in started_at:
+                    logger.error(
+                        f"{model_type.value} model timed out after {self.timeout}s"
+                    )
+                    elapsed = abandoned_at[model_type] - started_at[model_type]
+                else:
+                    logger.error(
+                        f"{model_type.value} model could not start: every "
+                        f"worker is held by a timed-out model"
+                    )
+                    elapsed = 0.0
+                runs[model_type] = ModelRun(
+                    model_type, ModelRunStatus.TIMED_OUT, elapsed
+                )
                 continue
 
-        return results
+            # Done callbacks may run just after waiters are woken
+            finished = finished_at.get(model_type, time.perf_counter())
+            elapsed = finished - started_at.get(model_type, finished)
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Failed to run {model_type.value} model: {error}")
+                runs[model_type] = ModelRun(
+                    model_type, ModelRunStatus.FAILED, elapsed, error=str(error)
+                )
+            else:
+                runs[model_type] = ModelRun(
+                    model_type, ModelRunStatus.COMPLETED, elapsed, future.result()
+                )
+
+        return {model_type: runs[model_type] for model_type in model_types}
+
+    def _wait_for_models(
+        self,
+        futures: Dict[ModelType, Future],
+        pools: List[Tuple[List[ModelType], int]],
+        start_notices: Optional[multiprocessing.Queue],
+        started_at: Dict[ModelType, float],
+        abandoned_at: Dict[ModelType, float],
+    ) -> None:
+        """
+        Wait until every model is done or abandoned
+
+        A model is abandoned once it has run for the timeout, or while still
+        queued once every worker of its pool holds an abandoned model.
+        """
+        pending = set(futures)
+        while pending:
+            self._record_starts(start_notices, started_at)
+            now = time.perf_counter()
+            for model_type in list(pending):
+                if futures[model_type].done():
+                    pending.discard(model_type)
+                elif (
+                    self.timeout is not None
+                    and model_type in started_at
+                    and now - started_at[model_type] >= self.timeout
+                ):
+                    abandoned_at[model_type] = now
+                    pending.discard(model_type)
+
+            for pool_types, size in pools:
+                held = sum(
+                    1
+                    for t in pool_types
+                    if t in abandoned_at and t in started_at and not futures[t].done()
+                )
+                queued = [t for t in pool_types if t in pending and t not in started_at]
+                if queued and held >= size:
+                    for model_type in queued:
+                        abandoned_at[model_type] = now
+                        pending.discard(model_type)
+
+            if not pending:
+                return
+            if self.timeout is None:
+                poll = self.POLL_INTERVAL if start_notices is not None else None
+            else:
+                deadlines = [
+                    started_at[t] + self.timeout for t in pending if t in started_at
+                ]
+                poll = max(0.0, min([now + self.POLL_INTERVAL, *deadlines]) - now)
+            wait(
+                [futures[t] for t in pending],
+                timeout=poll,
+                return_when=FIRST_COMPLETED,
+            )
+
+    @staticmethod
+    def _record_starts(
+        start_notices: Optional[multiprocessing.Queue],
+        started_at: Dict[ModelType, float],
+    ) -> None:
+        """Note the start of process-pool models that reported it"""
+        if start_notices is None:
+            return
+        while True:
+            try:
+                model_type = start_notices.get_nowait()
+            except queue.Empty:
+                return
+            started_at.setdefault(model_type, time.perf_counter())
+
+
+class ForecastPortfolioUseCase:
+    """Forecast the completion of several projects as one portfolio"""
+
+    def __init__(self, forecasting_model: ForecastingModel):
+        self.forecasting_model = forecasting_model
+
+    @classmethod
+    def from_factory(
+        cls, model_factory: Optional[ForecastingModelFactory] = None
+    ) -> "ForecastPortfolioUseCase":
+        """Use case with the Monte Carlo model of the factory, or the default one"""
+        if model_factory is None:
+            from ..infrastructure.forecasting_model_factory import DefaultModelFactory
+
+            model_factory = DefaultModelFactory()
+        return cls(model_factory.create(ModelType.MONTE_CARLO))
+
+    def execute(
+        self,
+        projects: List[ProjectData],
+        config: ModelConfiguration,
+        correlation: Optional[Sequence[Sequence[float]]] = None,
+    ) -> Optional[PortfolioForecast]:
+        """
+        Simulate all projects with remaining work and velocity jointly
+
+        Projects without remaining work do not delay the portfolio and are
+        left out, as are projects without a positive velocity, which cannot
+        be forecast.
+
+        Args:
+            projects: Projects of the portfolio
+            config: Model configuration
+            correlation: Optional correlation matrix of team velocities, with
+                one row and column per entry of projects
+
+        Returns:
+            Forecast of the simulated projects, or None if there are none
+        """
+        selected = []
+        for index, project in enumerate(projects):
+            if project.remaining_work <= 0:
+                continue
+            if not project.velocity_metrics or project.velocity_metrics.average <= 0:
+                logger.warning(
+                    f"Project {project.name} has remaining work but no velocity; "
+                    "leaving it out of the portfolio forecast"
+                )
+                continue
+            selected.append(index)
+        if not selected:
+            return None
+
+        if correlation is not None:
+            if len(correlation) != len(projects):
+                raise ValueError(
+                    f"Correlation matrix has {len(correlation)} rows but there "
+                    f"are {len(projects)} projects"
+                )
+            correlation = [[correlation[i][j] for j in selected] for i in selected]
+
+        return self.forecasting_model.forecast_portfolio(
+            [projects[index].remaining_work for index in selected],
+            [projects[index].velocity_metrics for index in selected],
+            config,
+            correlation,
+        )
+
+
+class RunSensitivitySweepUseCase:
+    """Sweep velocity assumptions and rank their impact on the forecast"""
+
+    def __init__(
+        self,
+        forecasting_model: ForecastingModel,
+        velocity_for_lookback: Optional[Callable[[int], VelocityMetrics]] = None,
+    ):
+        """
+        Initialize with a forecasting model
+
+        Args:
+            forecasting_model: The model to use for forecasting
+            velocity_for_lookback: Velocity metrics for a lookback window in
+                sprints, required to sweep lookback windows
+        """
+        self.forecasting_model = forecasting_model
+        self.velocity_for_lookback = velocity_for_lookback
+
+    def execute(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        variance_multipliers: Sequence[float] = (0.5, 0.75, 1.0, 1.25, 1.5),
+        mean_shifts: Sequence[float] = (-0.2, -0.1, 0.0, 0.1, 0.2),
+        lookback_windows: Sequence[Optional[int]] = (None,),
+        tornado_confidence: float = 0.85,
+    ) -> SensitivityAnalysis:
+        """
+        Forecast every combination of the given assumptions in one batch
+
+        The baseline (multiplier 1.0, no shift, baseline window) is always part
+        of the grid. Each tornado bar varies one parameter with the others at
+        baseline.
+
+        Args:
+            remaining_work: Amount of work remaining
+            velocity_metrics: Baseline velocity statistics
+            config: Model configuration
+            variance_multipliers: Factors applied to the velocity spread
+            mean_shifts: Relative changes of the mean velocity
+            lookback_windows: Velocity windows in sprints (None = baseline)
+            tornado_confidence: Confidence level of the tornado outcomes
+
+        Returns:
+            SensitivityAnalysis with the grid outcomes and tornado dataset
+        """
+        config_errors = config.validate()
+        if config_errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(config_errors)}")
+        if tornado_confidence not in config.confidence_levels:
+            raise ValueError(
+                f"Tornado confidence {tornado_confidence} must be one of the "
+                "configured confidence levels"
+            )
+
+        axes = {
+            "variance_multiplier": self._with_baseline(variance_multipliers, 1.0),
+            "mean_shift": self._with_baseline(mean_shifts, 0.0),
+            "lookback_sprints": self._with_baseline(lookback_windows, None),
+        }
+        if axes["lookback_sprints"] != [None] and self.velocity_for_lookback is None:
+            raise ValueError("Sweeping lookback windows requires velocity_for_lookback")
+
+        window_metrics = {
+            lookback: (
+                velocity_metrics
+                if lookback is None
+                else self.velocity_for_lookback(lookback)
+            )
+            for lookback in axes["lookback_sprints"]
+        }
+        points = [
+            SensitivityPoint(multiplier, shift, lookback)
+            for multiplier, shift, lookback in itertools.product(
+                *(axes[name] for name in SENSITIVITY_PARAMETERS)
+            )
+        ]
+        grid = [point.apply(window_metrics[point.lookback_sprints]) for point in points]
+
+        logger.info(f"Running sensitivity sweep over {len(points)} grid points")
+        forecasts = self.forecasting_model.forecast_velocity_grid(
+            remaining_work, grid, config
+        )
+
+        outcomes = [
+            SensitivityOutcome(point, metrics, forecast)
+            for point, metrics, forecast in zip(points, grid, forecasts)
+        ]
+        by_point = {outcome.point: outcome for outcome in outcomes}
+        baseline = by_point[SensitivityPoint()]
+
+        return SensitivityAnalysis(
+            baseline=baseline,
+            outcomes=outcomes,
+            tornado=self._tornado(axes, by_point, tornado_confidence),
+            tornado_confidence=tornado_confidence,
+        )
+
+    def _with_baseline(self, values: Sequence, baseline) -> List:
+        """Distinct values in order, including the baseline value"""
+        distinct = list(dict.fromkeys(values))
+        return distinct if baseline in distinct else [baseline] + distinct
+
+    def _tornado(
+        self, axes: dict, by_point: dict, confidence: float
+    ) -> List[TornadoBar]:
+        """One bar per parameter, widest first"""
+        bars = []
+        for name in SENSITIVITY_PARAMETERS:
+            if len(axes[name]) < 2:
+                continue
+            outcomes = []
+            for value in axes[name]:
+                forecast = by_point[SensitivityPoint(**{name: value})].forecast
+                outcomes.append((forecast.get_percentile(confidence), value))
+            low_outcome, low_value = min(outcomes, key=lambda entry: entry[0])
+            high_outcome, high_value = max(outcomes, key=lambda entry: entry[0])
+            bars.append(
+                TornadoBar(
+                    parameter=name,
+                    low_value=low_value,
+                    high_value=high_value,
+                    low_outcome=low_outcome,
+                    high_outcome=high_outcome,
+                )
+            )
+        return sorted(bars, key=lambda bar: bar.swing, reverse=True)
@@ -1,21 +1,23 @@
 """Use cases for multi-project import using data source abstraction"""
 
 import logging
-import statistics
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from ..domain.data_sources import DataSourceFactory, DataSourceType
 from ..domain.entities import SimulationConfig
+from ..domain.forecasting import ForecastingModelFactory
 from ..domain.multi_project import AggregatedMetrics, MultiProjectReport, ProjectData
 from ..domain.repositories import ConfigRepository, IssueRepository, SprintRepository
-from ..domain.value_objects import FieldMapping, VelocityMetrics
+from ..domain.value_objects import FieldMapping
+from .forecasting_use_cases import ForecastPortfolioUseCase
 from .import_data import ImportDataUseCase
 from .use_cases import (
     AnalyzeHistoricalDataUseCase,
     CalculateRemainingWorkUseCase,
     CalculateVelocityUseCase,
     RunMonteCarloSimulationUseCase,
+    monte_carlo_configuration,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,7 @@ class ProcessMultipleDataSourcesUseCase:
         issue_repo_factory,
         sprint_repo_factory,
         config_repo_factory,
+        model_factory: Optional[ForecastingModelFactory] = None,
     ):
         """
         Initialize with factories
@@ -39,11 +42,13 @@ class ProcessMultipleDataSourcesUseCase:
             issue_repo_factory: Callable that returns a new IssueRepository instance
             sprint_repo_factory: Callable that returns a new SprintRepository instance
             config_repo_factory: Callable that returns a new ConfigRepository instance
+            model_factory: Factory of the portfolio forecasting model
         """
         self.data_source_factory = data_source_factory
         self.issue_repo_factory = issue_repo_factory
         self.sprint_repo_factory = sprint_repo_factory
         self.config_repo_factory = config_repo_factory
+        self.model_factory = model_factory
 
     def execute(
         self,
@@ -53,6 +58,7 @@ class ProcessMultipleDataSourcesUseCase:
         status_mapping: Dict[str, List[str]],
         simulation_config: SimulationConfig,
         velocity_config: Dict,
+        velocity_correlation: Optional[Sequence[Sequence[float]]] = None,
     ) -> MultiProjectReport:
         """
         Process multiple data files and generate report
@@ -64,6 +70,8 @@ class ProcessMultipleDataSourcesUseCase:
             status_mapping: Status category mapping
             simulation_config: Monte Carlo simulation configuration
             velocity_config: Velocity calculation configuration
+            velocity_correlation: Optional correlation matrix of the teams'
+                velocities, one row and column per data file
 
         Returns:
             MultiProjectReport with individual and aggregated results
@@ -98,7 +106,7 @@ class ProcessMultipleDataSourcesUseCase:
 
         # Calculate aggregated metrics
         aggregated_metrics = self._calculate_aggregated_metrics(
-            projects, simulation_config
+            projects, simulation_config, velocity_correlation
         )
 
         return MultiProjectReport(
@@ -206,7 +214,10 @@ class ProcessMultipleDataSourcesUseCase:
         )
 
     def _calculate_aggregated_metrics(
-        self, projects: List[ProjectData], simulation_config: SimulationConfig
+        self,
+        projects: List[ProjectData],
+        simulation_config: SimulationConfig,
+        velocity_correlation: Optional[Sequence[Sequence[float]]] = None,
     ) -> AggregatedMetrics:
         """Calculate aggregated metrics across all projects"""
 
@@ -222,45 +233,18 @@ class ProcessMultipleDataSourcesUseCase:
             if p.velocity_metrics and p.velocity_metrics.average > 0
         )
 
-        # Overall completion percentage
-        # overall_completion = (total_completed / total_issues * 100) if total_issues > 0 else 0
-
-        # Combined simulation results
-        combined_simulation = None
+        # Simulate all projects jointly in every trial. The portfolio finishes
+        # with its last project, which a single simulation of the summed work
+        # at the combined velocity would underestimate.
+        portfolio_forecast = None
         if combined_velocity > 0 and total_remaining_work > 0:
-            # Combine velocity metrics
-            velocities = [p.velocity_metrics for p in projects if p.velocity_metrics]
-            if velocities:
-                avg_velocity = statistics.mean([v.average for v in velocities])
-                avg_std_dev = statistics.mean(
-                    [v.std_dev for v in velocities if v.std_dev > 0]
-                )
-
-                combined_velocity_metrics = VelocityMetrics(
-                    average=combined_velocity,
-                    median=combined_velocity,
-                    std_dev=avg_std_dev
-                    * (combined_velocity / avg_velocity),  # Scale std dev
-                    min_value=min(v.min_value for v in velocities),
-                    max_value=sum(v.max_value for v in velocities),
-                    trend=statistics.mean([v.trend for v in velocities]),
-                )
-
-                # Run combined simulation
-                # Create a temporary issue repo with all remaining work
-                temp_repo = self.issue_repo_factory()
-
-                # Use first project's repo as a template for simulation
-                for project in projects:
-                    if project.simulation_result:
-                        combined_simulation = RunMonteCarloSimulationUseCase(
-                            temp_repo
-                        ).execute(
-                            total_remaining_work,
-                            combined_velocity_metrics,
-                            simulation_config,
-                        )
-                        break
+            portfolio_forecast = ForecastPortfolioUseCase.from_factory(
+                self.model_factory
+            ).execute(
+                projects,
+                monte_carlo_configuration(simulation_config),
+                velocity_correlation,
+            )
 
         return AggregatedMetrics(
             total_projects=len(projects),
@@ -268,5 +252,14 @@ class ProcessMultipleDataSourcesUseCase:
             total_completed_issues=total_completed,
             total_remaining_work=total_remaining_work,
             combined_velocity=combined_velocity,
-            combined_simulation_result=combined_simulation,
+            portfolio_prediction_intervals=(
+                portfolio_forecast.portfolio.prediction_intervals
+                if portfolio_forecast
+                else []
+            ),
+            portfolio_expected_sprints=(
+                portfolio_forecast.portfolio.expected_sprints
+                if portfolio_forecast
+                else None
+            ),
         )
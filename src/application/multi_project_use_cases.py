@@ -1,20 +1,21 @@
 """Use cases for multi-project/CSV processing"""
 
 import logging
-import statistics
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 
 from ..domain.entities import SimulationConfig
+from ..domain.forecasting import ForecastingModelFactory
 from ..domain.multi_project import AggregatedMetrics, MultiProjectReport, ProjectData
 from ..domain.repositories import IssueRepository, SprintRepository
 from ..domain.value_objects import FieldMapping
 from .csv_analysis import AnalyzeCSVStructureUseCase, AnalyzeVelocityUseCase
+from .forecasting_use_cases import ForecastPortfolioUseCase
 from .use_cases import (
     CalculateRemainingWorkUseCase,
     CalculateVelocityUseCase,
     RunMonteCarloSimulationUseCase,
+    monte_carlo_configuration,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,16 +24,23 @@ logger = logging.getLogger(__name__)
 class ProcessMultipleCSVsUseCase:
     """Process multiple CSV files and generate individual and aggregated results"""
 
-    def __init__(self, issue_repo_factory, sprint_repo_factory):
+    def __init__(
+        self,
+        issue_repo_factory,
+        sprint_repo_factory,
+        model_factory: Optional[ForecastingModelFactory] = None,
+    ):
         """
         Initialize with repository factories to create separate repos per project
 
         Args:
             issue_repo_factory: Callable that returns a new IssueRepository instance
             sprint_repo_factory: Callable that returns a new SprintRepository instance
+            model_factory: Factory of the portfolio forecasting model
         """
         self.issue_repo_factory = issue_repo_factory
         self.sprint_repo_factory = sprint_repo_factory
+        self.model_factory = model_factory
 
     def execute(
         self,
@@ -41,6 +49,7 @@ class ProcessMultipleCSVsUseCase:
         status_mapping: Dict[str, List[str]],
         simulation_config: SimulationConfig,
         velocity_config: Dict,
+        velocity_correlation: Optional[Sequence[Sequence[float]]] = None,
     ) -> MultiProjectReport:
         """
         Process multiple CSV files and generate report
@@ -51,6 +60,8 @@ class ProcessMultipleCSVsUseCase:
             status_mapping: Status category mapping
             simulation_config: Monte Carlo simulation configuration
             velocity_config: Velocity calculation configuration
+            velocity_correlation: Optional correlation matrix of the teams'
+                velocities, one row and column per CSV file
 
         Returns:
             MultiProjectReport with individual and aggregated results
@@ -82,7 +93,7 @@ class ProcessMultipleCSVsUseCase:
 
         # Calculate aggregated metrics
         aggregated_metrics = self._calculate_aggregated_metrics(
-            projects, simulation_config
+            projects, simulation_config, velocity_correlation
         )
 
         return MultiProjectReport(
@@ -213,7 +224,10 @@ class ProcessMultipleCSVsUseCase:
         )
 
     def _calculate_aggregated_metrics(
-        self, projects: List[ProjectData], simulation_config: SimulationConfig
+        self,
+        projects: List[ProjectData],
+        simulation_config: SimulationConfig,
+        velocity_correlation: Optional[Sequence[Sequence[float]]] = None,
     ) -> AggregatedMetrics:
         """Calculate aggregated metrics across all projects"""
 
@@ -221,55 +235,36 @@ class ProcessMultipleCSVsUseCase:
         total_done_issues = sum(p.done_issues for p in projects)
         total_remaining_work = sum(p.remaining_work for p in projects)
 
-        # Calculate average and combined velocity
-        velocities = [
+        # Combined velocity (sum of individual velocities)
+        combined_velocity = sum(
             p.velocity_metrics.average for p in projects if p.velocity_metrics
-        ]
-        average_velocity = statistics.mean(velocities) if velocities else 0.0
-        combined_velocity = sum(velocities)
-
-        # Get earliest and latest completion dates from all projects
-        all_completion_dates = []
-        for project in projects:
-            if project.simulation_result and hasattr(
-                project.simulation_result, "mean_completion_date"
-            ):
-                all_completion_dates.append(
-                    project.simulation_result.mean_completion_date
-                )
-
-        earliest_completion = (
-            min(all_completion_dates) if all_completion_dates else datetime.now()
-        )
-        latest_completion = (
-            max(all_completion_dates) if all_completion_dates else datetime.now()
         )
 
-        # Calculate combined confidence intervals (using combined velocity)
-        if combined_velocity > 0:
-            confidence_intervals = {}
-            for confidence_level in simulation_config.confidence_levels:
-                sprints_needed = int(
-                    (total_remaining_work / combined_velocity) + 0.5
-                )  # Round up
-                # Add some variance based on individual project uncertainties
-                variance_factor = 1.0 + (confidence_level - 0.5) * 0.5
-                confidence_intervals[confidence_level] = int(
-                    sprints_needed * variance_factor
-                )
-        else:
-            confidence_intervals = {
-                level: 0 for level in simulation_config.confidence_levels
-            }
+        # Simulate the projects jointly; the portfolio finishes with the last
+        portfolio_forecast = None
+        if total_remaining_work > 0:
+            portfolio_forecast = ForecastPortfolioUseCase.from_factory(
+                self.model_factory
+            ).execute(
+                projects,
+                monte_carlo_configuration(simulation_config),
+                velocity_correlation,
+            )
 
         return AggregatedMetrics(
             total_projects=len(projects),
             total_issues=total_issues,
-            total_done_issues=total_done_issues,
+            total_completed_issues=total_done_issues,
             total_remaining_work=total_remaining_work,
-            average_velocity=average_velocity,
             combined_velocity=combined_velocity,
-            earliest_completion_date=earliest_completion,
-            latest_completion_date=latest_completion,
-            confidence_intervals=confidence_intervals,
+            portfolio_prediction_intervals=(
+                portfolio_forecast.portfolio.prediction_intervals
+                if portfolio_forecast
+                else []
+            ),
+            portfolio_expected_sprints=(
+                portfolio_forecast.portfolio.expected_sprints
+                if portfolio_forecast
+                else None
+            ),
         )
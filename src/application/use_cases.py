@@ -1,16 +1,28 @@
 import logging
 import statistics
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from ..domain.entities import Issue, SimulationConfig, SimulationResult
+from ..domain.entities import Issue, SimulationConfig, SimulationResult, Sprint
 from ..domain.forecasting import (
+    BacklogItemForecast,
+    EpicScheduling,
+    ForecastingModel,
     ForecastingModelFactory,
+    ForecastResult,
+    ModelConfiguration,
     ModelType,
     MonteCarloConfiguration,
+    RandomSampling,
+    SimulationEngine,
+)
+from ..domain.repositories import (
+    IssueRepository,
+    SprintRepository,
+    VelocityPosteriorRepository,
 )
-from ..domain.repositories import IssueRepository, SprintRepository
 from ..domain.value_objects import DateRange, HistoricalData, VelocityMetrics
+from ..domain.velocity_posterior import NormalInverseGammaPosterior
 from .forecasting_use_cases import GenerateForecastUseCase
 
 logger = logging.getLogger(__name__)
@@ -48,6 +60,25 @@ class CalculateVelocityUseCase:
             # For very long histories, cap at 20 sprints (~5 months)
             return min(20, total_sprints // 3)
 
+    @staticmethod
+    def sprint_velocity(sprint: Sprint, velocity_field: str = "story_points") -> float:
+        """Velocity of one sprint, or 0 if it delivered nothing"""
+        # Use the sprint's velocity directly if available
+        if hasattr(sprint, "velocity") and sprint.velocity > 0:
+            return sprint.velocity
+        if hasattr(sprint, "completed_points") and sprint.completed_points > 0:
+            return sprint.completed_points
+        # Fall back to calculating from issues if available
+        sprint_velocity = 0.0
+        for issue in getattr(sprint, "completed_issues", []):
+            if velocity_field == "story_points" and issue.story_points:
+                sprint_velocity += issue.story_points
+            elif velocity_field == "time_estimate" and issue.time_estimate:
+                sprint_velocity += issue.time_estimate
+            elif velocity_field == "count":
+                sprint_velocity += 1
+        return sprint_velocity
+
     def execute(
         self, lookback_sprints: int = -1, velocity_field: str = "story_points"
     ) -> VelocityMetrics:
@@ -62,23 +93,9 @@ class CalculateVelocityUseCase:
                 logger.warning(f"Found dict instead of Sprint object: {sprint}")
                 continue
 
-            # Use the sprint's velocity directly if available
-            if hasattr(sprint, "velocity") and sprint.velocity > 0:
-                velocities.append(sprint.velocity)
-            elif hasattr(sprint, "completed_points") and sprint.completed_points > 0:
-                velocities.append(sprint.completed_points)
-            elif hasattr(sprint, "completed_issues"):
-                # Fall back to calculating from issues if available
-                sprint_velocity = 0.0
-                for issue in sprint.completed_issues:
-                    if velocity_field == "story_points" and issue.story_points:
-                        sprint_velocity += issue.story_points
-                    elif velocity_field == "time_estimate" and issue.time_estimate:
-                        sprint_velocity += issue.time_estimate
-                    elif velocity_field == "count":
-                        sprint_velocity += 1
-                if sprint_velocity > 0:
-                    velocities.append(sprint_velocity)
+            sprint_velocity = self.sprint_velocity(sprint, velocity_field)
+            if sprint_velocity > 0:
+                velocities.append(sprint_velocity)
 
         # Auto-detect optimal lookback if not specified
         if lookback_sprints == -1:
@@ -116,8 +133,81 @@ class CalculateVelocityUseCase:
             min_value=min(velocities),
             max_value=max(velocities),
             trend=trend,
+            samples=tuple(velocities),
+        )
+
+
+class UpdateVelocityPosteriorUseCase:
+    """Fold newly completed sprints into a project's persisted velocity posterior"""
+
+    def __init__(self, posterior_repo: VelocityPosteriorRepository):
+        self.posterior_repo = posterior_repo
+
+    def execute(
+        self,
+        project_id: str,
+        sprints: List[Sprint],
+        prior: NormalInverseGammaPosterior,
+        velocity_field: str = "story_points",
+    ) -> NormalInverseGammaPosterior:
+        """
+        Update the stored posterior with sprints it has not seen yet
+
+        Only sprints that ended after the newest sprint in the posterior and
+        before now are applied, each in O(1), so a daily refresh costs as
+        much as the sprints completed since the last one.
+
+        Args:
+            project_id: Key of the project's posterior
+            sprints: Sprints of the project, in any order
+            prior: Starting belief for a project without a stored posterior
+            velocity_field: Velocity field, as in CalculateVelocityUseCase
+        """
+        posterior = self.posterior_repo.load(project_id) or prior
+        now = datetime.now()
+        last_end = _naive(posterior.last_sprint_end)
+        new_sprints = sorted(
+            (
+                sprint
+                for sprint in sprints
+                if _naive(sprint.end_date) <= now
+                and (last_end is None or _naive(sprint.end_date) > last_end)
+            ),
+            key=lambda sprint: _naive(sprint.end_date),
         )
 
+        applied = 0
+        for sprint in new_sprints:
+            velocity = CalculateVelocityUseCase.sprint_velocity(sprint, velocity_field)
+            if velocity > 0:
+                posterior = posterior.update(velocity, _naive(sprint.end_date))
+                applied += 1
+
+        if applied:
+            logger.info(f"Applied {applied} new sprints to the velocity posterior")
+            self.posterior_repo.save(project_id, posterior)
+        return posterior
+
+
+def _naive(moment: Optional[datetime]) -> Optional[datetime]:
+    """Drop the time zone so sprint dates from any source compare"""
+    if moment is None or moment.tzinfo is None:
+        return moment
+    return moment.replace(tzinfo=None)
+
+
+def monte_carlo_configuration(config: SimulationConfig) -> MonteCarloConfiguration:
+    """Model configuration equivalent to a legacy simulation configuration"""
+    return MonteCarloConfiguration(
+        num_simulations=config.num_simulations,
+        confidence_levels=config.confidence_levels,
+        sprint_duration_days=config.sprint_duration_days,
+        engine=SimulationEngine.VECTORIZED,
+        random_seed=config.random_seed,
+        num_workers=config.num_workers,
+        random_sampling=RandomSampling(config.random_sampling),
+    )
+
 
 class RunMonteCarloSimulationUseCase:
     """Legacy use case for backward compatibility - delegates to new forecasting model"""
@@ -150,72 +240,15 @@ class RunMonteCarloSimulationUseCase:
         """Execute Monte Carlo simulation using new forecasting model"""
 
         # Convert legacy config to new model config
-        model_config = MonteCarloConfiguration(
-            num_simulations=config.num_simulations,
-            confidence_levels=config.confidence_levels,
-            sprint_duration_days=config.sprint_duration_days,
-        )
+        model_config = monte_carlo_configuration(config)
 
         # Run forecast using new model
         forecast_result = self.forecast_use_case.execute(
             remaining_work, velocity_metrics, model_config
         )
 
-        # Convert new ForecastResult to legacy SimulationResult
-        percentiles = {}
-        confidence_intervals = {}
-
-        for interval in forecast_result.prediction_intervals:
-            confidence = interval.confidence_level
-            percentiles[confidence] = interval.predicted_value
-            confidence_intervals[confidence] = (
-                interval.lower_bound,
-                interval.upper_bound,
-            )
-
-        # Convert probability distribution from dict to list format
-        # Legacy format uses 50-bin histogram
-        probability_distribution = []
-        if forecast_result.probability_distribution:
-            min_sprints = min(forecast_result.probability_distribution.keys())
-            max_sprints = max(forecast_result.probability_distribution.keys())
-            bins = 50
-            bin_width = (
-                (max_sprints - min_sprints) / bins if max_sprints > min_sprints else 1
-            )
-            hist = [0.0] * bins
-
-            # Populate histogram bins
-            for sprints, prob in forecast_result.probability_distribution.items():
-                bin_index = int((sprints - min_sprints) / bin_width)
-                bin_index = min(bin_index, bins - 1)
-                hist[bin_index] += prob
-
-            probability_distribution = hist
-
-        # Generate sample completion dates for visualization
-        today = datetime.now()
-        completion_dates = []
-        if forecast_result.sample_predictions:
-            completion_dates = [
-                today + timedelta(days=int(sprints * config.sprint_duration_days))
-                for sprints in forecast_result.sample_predictions[:100]
-            ]
-
-        # Return legacy format
-        return SimulationResult(
-            percentiles=percentiles,
-            mean_completion_date=forecast_result.expected_completion_date,
-            std_dev_days=(
-                statistics.stdev(forecast_result.sample_predictions)
-                if len(forecast_result.sample_predictions) > 1
-                else 0.0
-            ),
-            probability_distribution=probability_distribution,
-            completion_dates=completion_dates,
-            confidence_intervals=confidence_intervals,
-            completion_sprints=forecast_result.sample_predictions[:1000],
-        )
+        # Legacy SimulationResult view for the reports
+        return forecast_result.to_simulation_result(config.sprint_duration_days)
 
 
 class AnalyzeHistoricalDataUseCase:
@@ -273,6 +306,46 @@ class AnalyzeHistoricalDataUseCase:
         )
 
 
+class AnalyzeDailyThroughputUseCase:
+    """Completed issues per day, for the daily throughput model"""
+
+    def __init__(self, issue_repo: IssueRepository):
+        self.issue_repo = issue_repo
+
+    def execute(
+        self, lookback_days: int = 90, working_days_only: bool = True
+    ) -> Tuple[int, ...]:
+        """
+        Count issues resolved on each day of the lookback window
+
+        Days without completions count as 0, so the history keeps the idle
+        days a bootstrap must resample.
+
+        Returns:
+            Completed issues per day, oldest first (yesterday is the newest,
+            as today is not over)
+        """
+        today = datetime.now().date()
+        first_day = today - timedelta(days=lookback_days)
+        date_range = DateRange(
+            datetime.combine(first_day, datetime.min.time()),
+            datetime.combine(today, datetime.min.time()),
+        )
+
+        completed: Dict[date, int] = {}
+        for issue in self.issue_repo.get_completed_in_range(date_range):
+            if issue.resolved:
+                day = issue.resolved.date()
+                completed[day] = completed.get(day, 0) + 1
+
+        days = (first_day + timedelta(days=offset) for offset in range(lookback_days))
+        return tuple(
+            completed.get(day, 0)
+            for day in days
+            if not working_days_only or day.weekday() < 5
+        )
+
+
 class CalculateRemainingWorkUseCase:
     def __init__(self, issue_repo: IssueRepository):
         self.issue_repo = issue_repo
@@ -280,19 +353,31 @@ class CalculateRemainingWorkUseCase:
     def execute(
         self, todo_statuses: List[str], velocity_field: str = "story_points"
     ) -> float:
-        remaining_work = 0.0
+        return sum(
+            (
+                self.work_of(issue, velocity_field)
+                for issue in self.get_remaining_issues(todo_statuses)
+            ),
+            0.0,
+        )
 
+    def get_remaining_issues(self, todo_statuses: List[str]) -> List[Issue]:
+        """Remaining issues, grouped by status in the given order"""
+        issues = []
         for status in todo_statuses:
-            issues = self.issue_repo.get_by_status(status)
-            for issue in issues:
-                if velocity_field == "story_points" and issue.story_points:
-                    remaining_work += issue.story_points
-                elif velocity_field == "time_estimate" and issue.time_estimate:
-                    remaining_work += issue.time_estimate
-                elif velocity_field == "count":
-                    remaining_work += 1
-
-        return remaining_work
+            issues.extend(self.issue_repo.get_by_status(status))
+        return issues
+
+    @staticmethod
+    def work_of(issue: Issue, velocity_field: str = "story_points") -> float:
+        """Amount of work an issue contributes in the velocity unit"""
+        if velocity_field == "story_points" and issue.story_points:
+            return issue.story_points
+        if velocity_field == "time_estimate" and issue.time_estimate:
+            return issue.time_estimate
+        if velocity_field == "count":
+            return 1
+        return 0.0
 
     def get_story_size_breakdown(self, todo_statuses: List[str]) -> Dict[float, int]:
         """Get count of remaining stories grouped by story points"""
@@ -306,3 +391,179 @@ class CalculateRemainingWorkUseCase:
                     size_breakdown[size] = size_breakdown.get(size, 0) + 1
 
         return size_breakdown
+
+
+class ForecastBacklogItemsUseCase:
+    """Forecast when each item of a ranked backlog will be completed"""
+
+    def __init__(self, forecasting_model: ForecastingModel):
+        self.forecasting_model = forecasting_model
+
+    def execute(
+        self,
+        issues: List[Issue],
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        velocity_field: str = "story_points",
+    ) -> List[BacklogItemForecast]:
+        """
+        Forecast every item of the backlog in rank order
+
+        Item j is done once the work of items 1..j is delivered, so the
+        cumulative work per item gives the cut lines that are forecast
+        together on shared simulated paths.
+
+        Args:
+            issues: Remaining issues, highest ranked first
+            velocity_metrics: Historical velocity statistics
+            config: Model configuration
+            velocity_field: Work unit of the issues (as for remaining work)
+
+        Returns:
+            Forecast per issue, in rank order
+        """
+        if not issues:
+            return []
+
+        config_errors = config.validate()
+        if config_errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(config_errors)}")
+
+        cumulative_work = []
+        total = 0.0
+        for issue in issues:
+            total += CalculateRemainingWorkUseCase.work_of(issue, velocity_field)
+            cumulative_work.append(total)
+
+        logger.info(
+            f"Forecasting {len(issues)} backlog items "
+            f"({total:.1f} units of work) on shared paths"
+        )
+        forecasts = self.forecasting_model.forecast_cut_lines(
+            cumulative_work, velocity_metrics, config
+        )
+
+        return [
+            BacklogItemForecast(
+                issue_key=issue.key,
+                rank=rank,
+                cumulative_work=work,
+                forecast=forecast,
+            )
+            for rank, (issue, work, forecast) in enumerate(
+                zip(issues, cumulative_work, forecasts), start=1
+            )
+        ]
+
+
+class ForecastEpicsUseCase:
+    """Forecast when each epic of the remaining work will be completed"""
+
+    EPIC_FIELD = "epic_link"
+
+    def __init__(self, forecasting_model: ForecastingModel):
+        self.forecasting_model = forecasting_model
+
+    def execute(
+        self,
+        issues: List[Issue],
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        scheduling: EpicScheduling = EpicScheduling.PRIORITY,
+        shares: Optional[Mapping[str, float]] = None,
+        velocity_field: str = "story_points",
+    ) -> Dict[str, ForecastResult]:
+        """
+        Forecast every epic on shared simulated velocity paths
+
+        Either way an epic is done once the team's cumulative delivered work
+        reaches a threshold, so all epics are forecast as cut lines of one
+        simulation. In priority order the threshold is the work of the epic
+        and every epic before it. In parallel, each open epic receives its
+        share of the capacity and finished epics free theirs for the rest:
+        epic k, taken in order of work / share, is done at
+        sum(W_j, j <= k) + W_k / w_k * sum(w_j, j > k).
+
+        Args:
+            issues: Remaining issues, highest ranked first; issues without an
+                epic link are ignored
+            velocity_metrics: Historical velocity statistics
+            config: Model configuration
+            scheduling: How capacity is divided between epics
+            shares: Capacity share per epic for parallel scheduling
+                (default: equal shares)
+            velocity_field: Work unit of the issues (as for remaining work)
+
+        Returns:
+            Forecast per epic key, in priority order (first appearance)
+        """
+        work = self.remaining_work_by_epic(issues, velocity_field)
+        if not work:
+            return {}
+
+        config_errors = config.validate()
+        if config_errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(config_errors)}")
+
+        if scheduling == EpicScheduling.PRIORITY:
+            thresholds = self._priority_thresholds(work)
+        else:
+            thresholds = self._parallel_thresholds(work, shares)
+
+        epics = sorted(thresholds, key=thresholds.get)
+        logger.info(
+            f"Forecasting {len(epics)} epics ({sum(work.values()):.1f} units of "
+            f"work, {scheduling.value} scheduling) on shared paths"
+        )
+        forecasts = self.forecasting_model.forecast_cut_lines(
+            [thresholds[epic] for epic in epics], velocity_metrics, config
+        )
+        by_epic = dict(zip(epics, forecasts))
+        return {epic: by_epic[epic] for epic in work}
+
+    @classmethod
+    def remaining_work_by_epic(
+        cls, issues: List[Issue], velocity_field: str = "story_points"
+    ) -> Dict[str, float]:
+        """Remaining work per epic, in order of first appearance"""
+        work: Dict[str, float] = {}
+        for issue in issues:
+            epic = issue.custom_fields.get(cls.EPIC_FIELD)
+            if epic:
+                issue_work = CalculateRemainingWorkUseCase.work_of(issue, velocity_field)
+                work[epic] = work.get(epic, 0.0) + issue_work
+        return work
+
+    @staticmethod
+    def _priority_thresholds(work: Dict[str, float]) -> Dict[str, float]:
+        thresholds = {}
+        total = 0.0
+        for epic, epic_work in work.items():
+            total += epic_work
+            thresholds[epic] = total
+        return thresholds
+
+    @staticmethod
+    def _parallel_thresholds(
+        work: Dict[str, float], shares: Optional[Mapping[str, float]]
+    ) -> Dict[str, float]:
+        if shares is None:
+            shares = {epic: 1.0 for epic in work}
+        missing = [epic for epic in work if shares.get(epic, 0) <= 0]
+        if missing:
+            raise ValueError(
+                f"Epics need a positive capacity share: {', '.join(missing)}"
+            )
+
+        # Epics finish in order of work per unit of share
+        order = sorted(work, key=lambda epic: work[epic] / shares[epic])
+        remaining_share = sum(shares[epic] for epic in order)
+        thresholds = {}
+        finished_work = 0.0
+        for epic in order:
+            remaining_share = max(remaining_share - shares[epic], 0.0)
+            finished_work += work[epic]
+            thresholds[epic] = (
+                finished_work + work[epic] / shares[epic] * remaining_share
+            )
+        return thresholds
@@ -1,12 +1,21 @@
 """Use cases for velocity prediction and scenario modeling"""
 
 import logging
+import math
+from dataclasses import fields
+from datetime import datetime
 from typing import List, Optional, Tuple
 
+from ..domain.capacity_planning import CapacityLever, CapacitySolution
 from ..domain.entities import SimulationResult
-from ..domain.forecasting import ForecastingModel, ModelConfiguration
+from ..domain.forecasting import (
+    CompletionProbability,
+    ForecastingModel,
+    ModelConfiguration,
+)
 from ..domain.value_objects import VelocityMetrics
 from ..domain.velocity_adjustments import (
+    ProductivityCurve,
     ScenarioComparison,
     TeamChange,
     VelocityAdjustment,
@@ -34,17 +43,14 @@ class ApplyVelocityAdjustmentsUseCase:
         Generate baseline and (optionally) adjusted forecasts
         Returns: (baseline_result, adjusted_result)
         """
-        # Always generate baseline
-        logger.info("Generating baseline forecast")
-        baseline_result = self.forecasting_model.forecast(
-            remaining_work, velocity_metrics, config
-        )
-
         if not scenario:
+            logger.info("Generating baseline forecast")
+            baseline_result = self.forecasting_model.forecast(
+                remaining_work, velocity_metrics, config
+            )
             return baseline_result, None
 
-        # Generate adjusted forecast
-        logger.info(f"Applying scenario: {scenario.name}")
+        logger.info(f"Generating baseline forecast with scenario: {scenario.name}")
 
         # Create configuration with scenario
         if (
@@ -54,22 +60,24 @@ class ApplyVelocityAdjustmentsUseCase:
             # Import here to avoid circular dependency
             from ..domain.forecasting import MonteCarloConfigurationWithScenario
 
-            # Create extended configuration with scenario
+            # Create extended configuration with scenario, carrying over
+            # every base setting (engine, seed, ...)
             scenario_config = MonteCarloConfigurationWithScenario(
-                confidence_levels=config.confidence_levels,
-                sprint_duration_days=config.sprint_duration_days,
-                num_simulations=config.num_simulations,
-                use_historical_variance=config.use_historical_variance,
-                variance_multiplier=config.variance_multiplier,
+                **{f.name: getattr(config, f.name) for f in fields(config)},
                 velocity_scenario=scenario,
                 baseline_team_size=team_size,
             )
 
-            # Run forecast with scenario configuration
-            adjusted_result = self.forecasting_model.forecast(
-                remaining_work, velocity_metrics, scenario_config
+            # Forecast both together so the model can simulate them on the
+            # same random velocity paths (common random numbers)
+            results = self.forecasting_model.forecast_scenarios(
+                remaining_work, velocity_metrics, [config, scenario_config]
             )
+            baseline_result, adjusted_result = results
         else:
+            baseline_result = self.forecasting_model.forecast(
+                remaining_work, velocity_metrics, config
+            )
             # For non-Monte Carlo models, fall back to averaging approach
             adjusted_metrics = self._create_adjusted_metrics(
                 velocity_metrics, scenario, config, team_size
@@ -95,15 +103,8 @@ class ApplyVelocityAdjustmentsUseCase:
         # Calculate average adjustment factor across future sprints
         # This is a simplification for the initial implementation
         future_sprints = 10  # Look ahead 10 sprints
-        total_factor = 0.0
-
-        for sprint in range(1, future_sprints + 1):
-            adjusted_velocity, _ = scenario.get_adjusted_velocity(
-                sprint, base_metrics.average, team_size
-            )
-            total_factor += adjusted_velocity / base_metrics.average
-
-        avg_factor = total_factor / future_sprints
+        compiled = scenario.compile(team_size, horizon=future_sprints)
+        avg_factor = sum(compiled.factors) / future_sprints
 
         # Apply average factor to all metrics
         return VelocityMetrics(
@@ -113,6 +114,7 @@ class ApplyVelocityAdjustmentsUseCase:
             min_value=base_metrics.min_value * avg_factor,
             max_value=base_metrics.max_value * avg_factor,
             trend=base_metrics.trend,
+            samples=tuple(v * avg_factor for v in base_metrics.samples),
         )
 
 
@@ -133,18 +135,18 @@ class GenerateScenarioComparisonUseCase:
         adjusted_p50 = adjusted.percentiles.get(0.5, 0)
         adjusted_p85 = adjusted.percentiles.get(0.85, 0)
 
-        # Calculate velocity impact
-        # Use mean of completion sprints to estimate average
+        # Calculate velocity impact from the mean completion sprints. Paired
+        # results (common random numbers) hold sample i of both runs on the
+        # same velocity path, so every sample is used to cancel the noise
+        paired = min(len(baseline.completion_sprints), len(adjusted.completion_sprints))
         baseline_avg_sprints = (
-            sum(baseline.completion_sprints[:100])
-            / min(100, len(baseline.completion_sprints))
-            if baseline.completion_sprints
+            sum(baseline.completion_sprints[:paired]) / paired
+            if paired
             else baseline_p50
         )
         adjusted_avg_sprints = (
-            sum(adjusted.completion_sprints[:100])
-            / min(100, len(adjusted.completion_sprints))
-            if adjusted.completion_sprints
+            sum(adjusted.completion_sprints[:paired]) / paired
+            if paired
             else adjusted_p50
         )
         velocity_impact = (
@@ -180,3 +182,174 @@ class CreateVelocityScenarioUseCase:
         return VelocityScenario(
             name=name, adjustments=sorted_adjustments, team_changes=sorted_changes
         )
+
+
+class SolveCapacityForTargetDateUseCase:
+    """Find the smallest capacity change that meets a target date"""
+
+    # Search grids: (step, lowest, highest) of each lever's value
+    VELOCITY_FACTOR_GRID = (0.01, 0.1, 4.0)
+    TEAM_CHANGE_STEP = 0.5  # Part-time granularity
+    MAX_TEAM_GROWTH = 3.0  # Largest team change, as a multiple of the team size
+
+    def __init__(self, forecasting_model: ForecastingModel):
+        self.forecasting_model = forecasting_model
+
+    def execute(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        target_date: datetime,
+        confidence: float = 0.85,
+        lever: CapacityLever = CapacityLever.VELOCITY_FACTOR,
+        team_size: int = 5,
+        base_scenario: Optional[VelocityScenario] = None,
+        change_sprint: int = 1,
+        ramp_up_sprints: float = 3.0,
+        productivity_curve: ProductivityCurve = ProductivityCurve.LINEAR,
+        start_date: Optional[datetime] = None,
+    ) -> CapacitySolution:
+        """
+        Goal-seek the capacity change for a target date and confidence
+
+        The model evaluates every candidate on the same simulated velocity
+        paths (common random numbers), so the completion probability is
+        monotone in the capacity and a bisection over the lever's value grid
+        finds the smallest sufficient change in a handful of evaluations.
+
+        A velocity_factor result multiplies velocity, so a value below 1.0
+        means the target is met with capacity to spare. A team_change result
+        is the number of members to add, so a negative value means the team
+        could shrink by that many and still meet the target.
+
+        Args:
+            remaining_work: Amount of work remaining
+            velocity_metrics: Historical velocity statistics
+            config: Model configuration
+            target_date: Date by which the work should be done
+            confidence: Required probability of finishing by the target date
+            lever: Capacity change to solve for
+            team_size: Current team size, for team changes
+            base_scenario: Planned adjustments the change comes on top of
+            change_sprint: Sprint from which the change applies
+            ramp_up_sprints: Ramp-up of added team members
+            productivity_curve: Ramp-up curve of added team members
+            start_date: Start of the first sprint (default: now)
+
+        Returns:
+            CapacitySolution with the solved value and resulting scenario
+        """
+        start_date = start_date or datetime.now()
+        target_sprints = math.floor(
+            (target_date - start_date).days / config.sprint_duration_days
+        )
+        if target_sprints < 1:
+            logger.warning("Target date is before the end of the first sprint")
+            return CapacitySolution(lever, None, target_sprints, confidence, 0.0, 0.0)
+
+        evaluator = self.forecasting_model.completion_evaluator(
+            remaining_work, velocity_metrics, config, target_sprints
+        )
+
+        def candidate(value: float) -> VelocityScenario:
+            return self._scenario(
+                base_scenario,
+                lever,
+                value,
+                change_sprint,
+                ramp_up_sprints,
+                productivity_curve,
+            )
+
+        def probability(scenario: Optional[VelocityScenario]) -> float:
+            return self._probability(evaluator, scenario, team_size, target_sprints)
+
+        baseline_probability = probability(base_scenario)
+        step, lowest, highest = self._grid(lever, team_size)
+
+        # Bisect for the smallest grid index whose probability is sufficient
+        low, high = 0, round((highest - lowest) / step)
+        best = probability(candidate(lowest + high * step))
+        if best < confidence:
+            return CapacitySolution(
+                lever, None, target_sprints, confidence, baseline_probability, best
+            )
+        while low < high:
+            middle = (low + high) // 2
+            if probability(candidate(lowest + middle * step)) >= confidence:
+                high = middle
+            else:
+                low = middle + 1
+
+        value = round(lowest + high * step, 10)
+        scenario = candidate(value)
+        logger.info(
+            f"Solved {lever.value} = {value} for {confidence:.0%} confidence "
+            f"within {target_sprints} sprints"
+        )
+        return CapacitySolution(
+            lever=lever,
+            value=value,
+            target_sprints=target_sprints,
+            confidence=confidence,
+            baseline_probability=baseline_probability,
+            achieved_probability=probability(scenario),
+            scenario=scenario,
+        )
+
+    def _grid(self, lever: CapacityLever, team_size: int) -> Tuple[float, float, float]:
+        """Step and range of the lever's values"""
+        if lever == CapacityLever.VELOCITY_FACTOR:
+            return self.VELOCITY_FACTOR_GRID
+        step = self.TEAM_CHANGE_STEP
+        # Keep at least one step of the team
+        return step, step - team_size, team_size * self.MAX_TEAM_GROWTH
+
+    def _scenario(
+        self,
+        base_scenario: Optional[VelocityScenario],
+        lever: CapacityLever,
+        value: float,
+        change_sprint: int,
+        ramp_up_sprints: float,
+        productivity_curve: ProductivityCurve,
+    ) -> VelocityScenario:
+        """Base scenario with the candidate capacity change added last"""
+        adjustments = list(base_scenario.adjustments) if base_scenario else []
+        team_changes = list(base_scenario.team_changes) if base_scenario else []
+        if lever == CapacityLever.VELOCITY_FACTOR:
+            adjustments.append(
+                VelocityAdjustment(
+                    sprint_start=change_sprint,
+                    sprint_end=None,
+                    factor=value,
+                    reason="capacity needed for target date",
+                )
+            )
+        else:
+            # Applied after the planned changes so it cannot rescale them
+            team_changes.append(
+                TeamChange(
+                    sprint=change_sprint,
+                    change=value,
+                    ramp_up_sprints=ramp_up_sprints,
+                    productivity_curve=productivity_curve,
+                )
+            )
+        return VelocityScenario(
+            name=base_scenario.name if base_scenario else "Capacity goal",
+            adjustments=adjustments,
+            team_changes=team_changes,
+        )
+
+    def _probability(
+        self,
+        evaluator: CompletionProbability,
+        scenario: Optional[VelocityScenario],
+        team_size: int,
+        target_sprints: int,
+    ) -> float:
+        if scenario is None:
+            return evaluator([1.0] * target_sprints)
+        return evaluator(scenario.compile(team_size, horizon=target_sprints).factors)
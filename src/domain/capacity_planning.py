@@ -0,0 +1,49 @@
+"""Domain model for solving capacity plans that meet a target date"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+from .velocity_adjustments import VelocityScenario
+
+
+class CapacityLever(Enum):
+    """Capacity change a goal-seek solver may adjust"""
+
+    VELOCITY_FACTOR = "velocity_factor"  # Permanent velocity factor
+    TEAM_CHANGE = "team_change"  # Team members added (or removed), with ramp-up
+
+
+@dataclass
+class CapacitySolution:
+    """Smallest capacity change that meets a target date at a confidence level"""
+
+    lever: CapacityLever
+    value: Optional[float]  # Factor or FTE change; None if not achievable
+    target_sprints: int  # Full sprints before the target date
+    confidence: float
+    baseline_probability: float  # Without the capacity change
+    achieved_probability: float  # With the solved change (or the largest tried)
+    scenario: Optional[VelocityScenario] = None  # Scenario including the change
+
+    @property
+    def feasible(self) -> bool:
+        """Whether the target can be met within the search range"""
+        return self.value is not None
+
+    def get_summary(self, team_size: int = 5) -> str:
+        """Human-readable recommendation"""
+        if not self.feasible:
+            return (
+                f"Target not reachable at {self.confidence:.0%} confidence within "
+                f"the searched range (best: {self.achieved_probability:.0%})"
+            )
+        if self.scenario is None:
+            change = "No change needed"
+        else:
+            change = self.scenario.get_summary(team_size)
+        return (
+            f"{change}: {self.achieved_probability:.0%} probability of finishing "
+            f"within {self.target_sprints} sprints "
+            f"(baseline {self.baseline_probability:.0%})"
+        )
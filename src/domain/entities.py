@@ -108,6 +108,9 @@ class SimulationConfig:
     in_progress_statuses: List[str] = field(default_factory=lambda: ["In Progress"])
     todo_statuses: List[str] = field(default_factory=lambda: ["To Do", "Open"])
     sprint_duration_days: int = 14
+    random_seed: Optional[int] = None
+    num_workers: Optional[int] = 1  # None = all cores
+    random_sampling: str = "pseudo_random"  # A RandomSampling value
 
 
 @dataclass
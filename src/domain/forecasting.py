@@ -1,13 +1,19 @@
 """Domain interfaces and entities for forecasting models"""
 
+import statistics
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from .entities import SimulationResult
 from .value_objects import VelocityMetrics
 from .velocity_adjustments import VelocityScenario
+from .velocity_posterior import NormalInverseGammaPosterior
+
+# Probability of finishing in time under a per-sprint velocity factor table
+CompletionProbability = Callable[[Sequence[float]], float]
 
 
 class ModelType(Enum):
@@ -18,6 +24,44 @@ class ModelType(Enum):
     LINEAR_REGRESSION = "linear_regression"
     MACHINE_LEARNING = "machine_learning"
     BAYESIAN = "bayesian"
+    ANALYTICAL = "analytical"
+    THROUGHPUT = "throughput"
+
+
+class ForecastUnit(Enum):
+    """Time unit of the values in a forecast result"""
+
+    SPRINTS = "sprints"
+    DAYS = "days"
+
+
+class EpicScheduling(Enum):
+    """How a team divides its capacity between open epics"""
+
+    PRIORITY = "priority"  # One epic at a time, in priority order
+    PARALLEL = "parallel"  # All at once, each with a share of the capacity
+
+
+class SimulationEngine(Enum):
+    """Simulation engines available to the Monte Carlo model"""
+
+    LOOP = "loop"  # Reference implementation, one Python loop per trial
+    VECTORIZED = "vectorized"  # Block-wise NumPy simulation
+
+
+class VelocitySampling(Enum):
+    """How simulated sprint velocities are drawn"""
+
+    GAUSSIAN = "gaussian"  # Normal distribution fitted to mean/std_dev
+    BOOTSTRAP = "bootstrap"  # Resample the historical sprint velocities
+
+
+class RandomSampling(Enum):
+    """Source of the random numbers behind the simulated velocities"""
+
+    PSEUDO_RANDOM = "pseudo_random"  # Independent pseudo-random draws
+    ANTITHETIC = "antithetic"  # Mirrored pairs of draws (u and 1 - u)
+    SOBOL = "sobol"  # Scrambled Sobol low-discrepancy points
 
 
 @dataclass
@@ -25,9 +69,9 @@ class PredictionInterval:
     """Represents a prediction at a specific confidence level"""
 
     confidence_level: float  # 0.0 to 1.0
-    lower_bound: float  # In sprints
-    predicted_value: float  # In sprints
-    upper_bound: float  # In sprints
+    lower_bound: float  # In ForecastResult.unit (sprints by default)
+    predicted_value: float  # In ForecastResult.unit (sprints by default)
+    upper_bound: float  # In ForecastResult.unit (sprints by default)
 
     @property
     def range_width(self) -> float:
@@ -63,6 +107,25 @@ class MonteCarloConfiguration(ModelConfiguration):
     num_simulations: int = 10000
     use_historical_variance: bool = True
     variance_multiplier: float = 1.0  # For sensitivity analysis
+    engine: SimulationEngine = SimulationEngine.VECTORIZED
+    random_seed: Optional[int] = None  # Fixed seed for reproducible runs
+    velocity_sampling: VelocitySampling = VelocitySampling.GAUSSIAN
+    # Bootstrap only: sprints after which a velocity's weight halves (None = equal)
+    recency_half_life: Optional[float] = None
+    # Variance reduction for the vectorized engine; the loop engine always
+    # uses pseudo-random draws
+    random_sampling: RandomSampling = RandomSampling.PSEUDO_RANDOM
+    # Worker processes for the vectorized engine (None = all cores)
+    num_workers: Optional[int] = 1
+    # Adaptive mode: when precision_target is set, trials run in batches until
+    # the standard error of every requested percentile is at most
+    # precision_target sprints, or max_simulations is reached
+    precision_target: Optional[float] = None
+    adaptive_batch_size: int = 1000
+    max_simulations: int = 1_000_000
+    # Keep the cumulative delivered work of the trials for this many sprints,
+    # so "how much by date X" can be answered without simulating again
+    retained_path_sprints: Optional[int] = None
 
     def validate(self) -> List[str]:
         errors = super().validate()
@@ -70,6 +133,21 @@ class MonteCarloConfiguration(ModelConfiguration):
             errors.append("Number of simulations should be at least 100")
         if self.variance_multiplier <= 0:
             errors.append("Variance multiplier must be positive")
+        if self.recency_half_life is not None and self.recency_half_life <= 0:
+            errors.append("Recency half-life must be positive")
+        if self.num_workers is not None and self.num_workers < 1:
+            errors.append("Number of workers must be at least 1")
+        if self.retained_path_sprints is not None and self.retained_path_sprints < 1:
+            errors.append("Retained path sprints must be at least 1")
+        if self.precision_target is not None:
+            if self.precision_target <= 0:
+                errors.append("Precision target must be positive")
+            if self.adaptive_batch_size < 100:
+                errors.append("Adaptive batch size should be at least 100")
+            if self.max_simulations < self.adaptive_batch_size:
+                errors.append(
+                    "Maximum simulations must be at least the adaptive batch size"
+                )
         return errors
 
 
@@ -87,6 +165,170 @@ class MonteCarloConfigurationWithScenario(MonteCarloConfiguration):
         return errors
 
 
+@dataclass
+class AnalyticalConfiguration(ModelConfiguration):
+    """Configuration for the closed-form Gaussian forecasting model"""
+
+    use_historical_variance: bool = True
+    # The closed form treats sprint velocities as never clamped at the
+    # minimum velocity; above this clamp probability per sprint the model
+    # falls back to Monte Carlo simulation
+    max_clamp_probability: float = 0.02
+    fallback_num_simulations: int = 10000
+
+    def validate(self) -> List[str]:
+        errors = super().validate()
+        if not 0 <= self.max_clamp_probability < 1:
+            errors.append("Maximum clamp probability must be between 0 and 1")
+        if self.fallback_num_simulations < 100:
+            errors.append("Fallback simulations should be at least 100")
+        return errors
+
+
+@dataclass
+class BayesianConfiguration(ModelConfiguration):
+    """
+    Configuration for the Normal-Inverse-Gamma Bayesian model
+
+    Without prior_mean / prior_std_dev the model starts from an uninformative
+    prior, so the velocity metrics are its only evidence. The prior is not
+    fitted to the velocity metrics, since updating it with the same sprints
+    would count them twice and narrow the forecast.
+    """
+
+    num_simulations: int = 10000
+    random_seed: Optional[int] = None
+    num_workers: Optional[int] = 1  # None = all cores
+    # Incrementally maintained posterior; when set, it replaces the velocity
+    # metrics as the model's evidence
+    posterior: Optional[NormalInverseGammaPosterior] = None
+    # Prior used when no posterior is given, worth prior_strength sprints and
+    # centered on prior_mean / prior_std_dev (both None = uninformative)
+    prior_strength: float = 1.0
+    prior_mean: Optional[float] = None
+    prior_std_dev: Optional[float] = None
+    # Sprints assumed behind velocity metrics that carry no samples
+    summary_sprints: int = 6
+
+    def validate(self) -> List[str]:
+        errors = super().validate()
+        if self.num_simulations < 100:
+            errors.append("Number of simulations should be at least 100")
+        if self.num_workers is not None and self.num_workers < 1:
+            errors.append("Number of workers must be at least 1")
+        if self.prior_strength <= 0:
+            errors.append("Prior strength must be positive")
+        if (self.prior_mean is None) != (self.prior_std_dev is None):
+            errors.append("Prior mean and standard deviation must be set together")
+        if self.prior_std_dev is not None and self.prior_std_dev < 0:
+            errors.append("Prior standard deviation cannot be negative")
+        if self.summary_sprints < 1:
+            errors.append("Summary sprints must be at least 1")
+        return errors
+
+
+@dataclass
+class ThroughputConfiguration(ModelConfiguration):
+    """Configuration for the daily throughput (item count) model"""
+
+    num_simulations: int = 10000
+    random_seed: Optional[int] = None
+    num_workers: Optional[int] = 1  # None = all cores
+    # Completed items per day, oldest first, including days with none
+    daily_throughput: Tuple[int, ...] = ()
+    # Count only working days (Mon-Fri) in the history and the forecast
+    working_days_only: bool = True
+
+    def validate(self) -> List[str]:
+        errors = super().validate()
+        if self.num_simulations < 100:
+            errors.append("Number of simulations should be at least 100")
+        if self.num_workers is not None and self.num_workers < 1:
+            errors.append("Number of workers must be at least 1")
+        if any(count < 0 for count in self.daily_throughput):
+            errors.append("Daily throughput cannot be negative")
+        return errors
+
+
+class ForecastOutcomes(ABC):
+    """
+    Outcome distribution behind a forecast
+
+    Simulating models back it with compact arrays (the outcome histogram and
+    the retained samples) and ForecastResult derives its views from it.
+    """
+
+    @abstractmethod
+    def probabilities(self) -> Mapping[int, float]:
+        """Probability of each observed outcome"""
+
+    @abstractmethod
+    def samples(self) -> Sequence[float]:
+        """Retained sample of outcomes, for visualization"""
+
+    @abstractmethod
+    def sample_std_dev(self) -> float:
+        """Standard deviation of the retained samples"""
+
+    @abstractmethod
+    def histogram(self, bins: int) -> List[float]:
+        """Probabilities in equal-width bins from the lowest to the highest outcome"""
+
+
+class PlainForecastOutcomes(ForecastOutcomes):
+    """Outcomes held as a plain dict and list (non-simulating models)"""
+
+    def __init__(self, probabilities: Mapping[int, float], samples: Sequence[float]):
+        self._probabilities = probabilities
+        self._samples = samples
+
+    def probabilities(self) -> Mapping[int, float]:
+        return self._probabilities
+
+    def samples(self) -> Sequence[float]:
+        return self._samples
+
+    def sample_std_dev(self) -> float:
+        if len(self._samples) < 2:
+            return 0.0
+        return statistics.stdev(self._samples)
+
+    def histogram(self, bins: int) -> List[float]:
+        if not self._probabilities:
+            return []
+        low = min(self._probabilities)
+        high = max(self._probabilities)
+        bin_width = (high - low) / bins if high > low else 1
+        hist = [0.0] * bins
+        for outcome, probability in self._probabilities.items():
+            hist[min(int((outcome - low) / bin_width), bins - 1)] += probability
+        return hist
+
+
+class DeliveredWork(ABC):
+    """
+    Delivered-work distribution of a forecast, sprint by sprint
+
+    Answers "how much by when" queries for a fixed horizon of sprints. It is
+    read-only, so copies of a forecast share it.
+    """
+
+    @property
+    @abstractmethod
+    def horizon_sprints(self) -> int:
+        """Sprints the distribution covers"""
+
+    @abstractmethod
+    def scope_at_confidence(
+        self, sprints: int, confidence_levels: List[float]
+    ) -> Dict[float, float]:
+        """Work delivered after a number of sprints, per confidence level"""
+
+    @abstractmethod
+    def probability_of_delivering(self, work: float, sprints: int) -> float:
+        """Probability of delivering at least the given work in time"""
+
+
 @dataclass
 class ForecastResult:
     """Unified result from any forecasting model"""
@@ -97,7 +339,7 @@ class ForecastResult:
     expected_completion_date: datetime
 
     # Optional probability distribution
-    probability_distribution: Optional[Dict[int, float]] = (
+    probability_distribution: Optional[Mapping[int, float]] = (
         None  # sprints -> probability
     )
 
@@ -106,7 +348,111 @@ class ForecastResult:
     model_metadata: Dict[str, Any] = field(default_factory=dict)
 
     # Raw data for visualization (limited sample)
-    sample_predictions: List[float] = field(default_factory=list)  # In sprints
+    sample_predictions: Sequence[float] = field(default_factory=list)  # In sprints
+
+    # Unit of prediction_intervals, expected_sprints, probability_distribution
+    # and sample_predictions; throughput forecasts are in days
+    unit: ForecastUnit = ForecastUnit.SPRINTS
+
+    # Backing distribution; when given, probability_distribution and
+    # sample_predictions default to views of it instead of copies
+    outcomes: Optional[ForecastOutcomes] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Delivered work over the following sprints, when the model retains it;
+    # too large for model_metadata, which holds plain values
+    delivered_work: Optional[DeliveredWork] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Derived views, computed on first use
+    _views: Dict[Any, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.outcomes is None:
+            self.outcomes = PlainForecastOutcomes(
+                self.probability_distribution or {}, self.sample_predictions
+            )
+            return
+        if self.probability_distribution is None:
+            self.probability_distribution = self.outcomes.probabilities()
+        if not self.sample_predictions:
+            self.sample_predictions = self.outcomes.samples()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Views are cheap to derive again, and cached completion dates go stale
+        return {**self.__dict__, "_views": {}}
+
+    def _view(self, key: Any, compute: Callable[[], Any]) -> Any:
+        if key not in self._views:
+            self._views[key] = compute()
+        return self._views[key]
+
+    @property
+    def percentiles(self) -> Dict[float, float]:
+        """Predicted value per confidence level"""
+        return self._view(
+            "percentiles",
+            lambda: {
+                interval.confidence_level: interval.predicted_value
+                for interval in self.prediction_intervals
+            },
+        )
+
+    @property
+    def confidence_intervals(self) -> Dict[float, Tuple[float, float]]:
+        """(lower, upper) bounds per confidence level"""
+        return self._view(
+            "confidence_intervals",
+            lambda: {
+                interval.confidence_level: (interval.lower_bound, interval.upper_bound)
+                for interval in self.prediction_intervals
+            },
+        )
+
+    @property
+    def sample_std_dev(self) -> float:
+        """Standard deviation of sample_predictions"""
+        return self._view("sample_std_dev", self.outcomes.sample_std_dev)
+
+    def histogram(self, bins: int = 50) -> List[float]:
+        """Outcome probabilities in equal-width bins"""
+        return self._view(("histogram", bins), lambda: self.outcomes.histogram(bins))
+
+    def completion_dates(
+        self, sprint_duration_days: int = 14, limit: int = 100
+    ) -> List[datetime]:
+        """Completion dates of the first sample predictions"""
+
+        def compute() -> List[datetime]:
+            days_per_unit = (
+                1 if self.unit == ForecastUnit.DAYS else sprint_duration_days
+            )
+            today = datetime.now()
+            return [
+                today + timedelta(days=int(value * days_per_unit))
+                for value in self.sample_predictions[:limit]
+            ]
+
+        return self._view(("completion_dates", sprint_duration_days, limit), compute)
+
+    def to_simulation_result(self, sprint_duration_days: int = 14) -> SimulationResult:
+        """Legacy SimulationResult view used by the reports"""
+        return self._view(
+            ("simulation_result", sprint_duration_days),
+            lambda: SimulationResult(
+                percentiles=self.percentiles,
+                mean_completion_date=self.expected_completion_date,
+                std_dev_days=self.sample_std_dev,
+                probability_distribution=self.histogram(),
+                completion_dates=self.completion_dates(sprint_duration_days),
+                confidence_intervals=self.confidence_intervals,
+                completion_sprints=list(self.sample_predictions[:1000]),
+            ),
+        )
 
     def get_prediction_at_confidence(
         self, confidence: float
@@ -123,6 +469,46 @@ class ForecastResult:
         return interval.predicted_value if interval else None
 
 
+@dataclass
+class BacklogItemForecast:
+    """Completion forecast of one item of a ranked backlog"""
+
+    issue_key: str
+    rank: int  # 1 = top of the backlog
+    cumulative_work: float  # Work up to and including this item
+    forecast: ForecastResult
+
+
+@dataclass
+class PortfolioForecast:
+    """Joint completion forecast of several projects"""
+
+    portfolio: ForecastResult  # Completion of the last project to finish
+    projects: List[ForecastResult]  # Per project, in input order
+    correlated: bool = False  # Whether team velocities were correlated
+
+
+class ModelRunStatus(Enum):
+    """Outcome of one model in a model comparison"""
+
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    NOT_CONFIGURED = "not_configured"  # Needs inputs only the caller has
+
+
+@dataclass
+class ModelRun:
+    """Forecast of one model in a comparison, with its wall-clock time"""
+
+    model_type: ModelType
+    status: ModelRunStatus
+    # From start until done, or until its timeout (0 if it never started)
+    elapsed_seconds: float
+    result: Optional[ForecastResult] = None
+    error: Optional[str] = None
+
+
 @dataclass
 class ModelInfo:
     """Information about a forecasting model"""
@@ -190,6 +576,136 @@ class ForecastingModel(ABC):
         """
         pass
 
+    def configuration_errors(self, config: ModelConfiguration) -> List[str]:
+        """
+        Inputs the configuration lacks for this model to forecast at all
+
+        Models whose configuration carries data, not just settings, override
+        this so comparisons can skip them when run on default configurations.
+        """
+        return []
+
+    def completion_date(
+        self, expected_value: float, config: ModelConfiguration
+    ) -> datetime:
+        """
+        Date an expected outcome of this model's forecasts falls on, from today
+
+        The outcome is in the unit of the model's results, sprints unless the
+        model overrides this.
+        """
+        return datetime.now() + timedelta(
+            days=int(expected_value * config.sprint_duration_days)
+        )
+
+    def forecast_scenarios(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        configs: List[ModelConfiguration],
+    ) -> List[ForecastResult]:
+        """
+        Forecast the same work under several configurations, e.g. scenarios
+
+        Models that can share random draws between the runs override this so
+        differences between the results are not swamped by sampling noise.
+
+        Returns:
+            One ForecastResult per configuration, in order
+        """
+        return [
+            self.forecast(remaining_work, velocity_metrics, config)
+            for config in configs
+        ]
+
+    def forecast_cut_lines(
+        self,
+        cumulative_work: Sequence[float],
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> List[ForecastResult]:
+        """
+        Forecast when each cut line of a ranked backlog is reached
+
+        Cut line j is the cumulative work up to and including item j, so its
+        forecast is the completion forecast of that item. Models that can
+        evaluate all cut lines on shared simulated paths override this.
+
+        Args:
+            cumulative_work: Cumulative work per backlog item, ascending
+
+        Returns:
+            One ForecastResult per cut line, in order
+        """
+        return [
+            self.forecast(work, velocity_metrics, config) for work in cumulative_work
+        ]
+
+    def forecast_velocity_grid(
+        self,
+        remaining_work: float,
+        velocity_grid: List[VelocityMetrics],
+        config: ModelConfiguration,
+    ) -> List[ForecastResult]:
+        """
+        Forecast the same work under several velocity assumptions
+
+        Used for sensitivity sweeps. Models that can evaluate all assumptions
+        on shared random draws override this.
+
+        Returns:
+            One ForecastResult per entry of velocity_grid, in order
+        """
+        return [
+            self.forecast(remaining_work, velocity_metrics, config)
+            for velocity_metrics in velocity_grid
+        ]
+
+    def completion_evaluator(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        sprints: int,
+    ) -> CompletionProbability:
+        """
+        Probability of finishing within a number of sprints, per capacity plan
+
+        The returned function maps per-sprint velocity factors (factors[i]
+        applies to sprint i + 1, as in CompiledVelocityScenario) to the
+        probability of completing the work by the end of the given sprint.
+        Implementations should evaluate every call on the same random draws,
+        so the probability is monotone in the factors and cheap to query
+        repeatedly, e.g. by a goal-seek search.
+        """
+        raise NotImplementedError(
+            f"{self.get_model_info().name} does not support capacity evaluation"
+        )
+
+    def forecast_portfolio(
+        self,
+        remaining_work: Sequence[float],
+        velocity_metrics: Sequence[VelocityMetrics],
+        config: ModelConfiguration,
+        correlation: Optional[Sequence[Sequence[float]]] = None,
+    ) -> PortfolioForecast:
+        """
+        Forecast several projects jointly
+
+        The portfolio is complete when its last project is, so its forecast
+        is the distribution of the maximum completion over projects within
+        the same trial, which independent per-project forecasts cannot give.
+
+        Args:
+            remaining_work: Remaining work per project
+            velocity_metrics: Velocity statistics per project
+            correlation: Optional (projects x projects) correlation matrix of
+                team velocities; None = independent teams
+        """
+        raise NotImplementedError(
+            f"{self.get_model_info().name} does not support portfolio forecasts"
+        )
+
     def supports_confidence_level(self, confidence: float) -> bool:
         """Check if model supports a specific confidence level"""
         return True  # Most models support arbitrary confidence levels
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .entities import Issue, SimulationResult, Sprint
+from .forecasting import PredictionInterval
 from .value_objects import VelocityMetrics
 
 
@@ -81,6 +82,11 @@ class AggregatedMetrics:
     total_remaining_work: float
     combined_velocity: float  # Sum of all team velocities
     combined_simulation_result: Optional[SimulationResult] = None
+    # Joint simulation of all projects; the portfolio finishes with its last one
+    portfolio_prediction_intervals: List[PredictionInterval] = field(
+        default_factory=list
+    )
+    portfolio_expected_sprints: Optional[float] = None
 
     @property
     def overall_completion_percentage(self) -> float:
@@ -88,6 +94,15 @@ class AggregatedMetrics:
             return 0.0
         return (self.total_completed_issues / self.total_issues) * 100
 
+    def get_portfolio_prediction(
+        self, confidence: float
+    ) -> Optional[PredictionInterval]:
+        """Portfolio completion interval at a confidence level, if simulated"""
+        for interval in self.portfolio_prediction_intervals:
+            if abs(interval.confidence_level - confidence) < 0.001:
+                return interval
+        return None
+
 
 @dataclass
 class MultiProjectReport:
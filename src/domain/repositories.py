@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 
 from .entities import Issue, Sprint
 from .value_objects import DateRange, FieldMapping
+from .velocity_posterior import NormalInverseGammaPosterior
 
 
 class IssueRepository(ABC):
@@ -63,3 +64,15 @@ class ConfigRepository(ABC):
     @abstractmethod
     def load_status_mapping(self) -> Optional[Dict[str, List[str]]]:
         pass
+
+
+class VelocityPosteriorRepository(ABC):
+    """Persistent velocity posteriors, one per project"""
+
+    @abstractmethod
+    def load(self, project_id: str) -> Optional[NormalInverseGammaPosterior]:
+        pass
+
+    @abstractmethod
+    def save(self, project_id: str, posterior: NormalInverseGammaPosterior) -> None:
+        pass
@@ -0,0 +1,96 @@
+"""Domain model for sensitivity analysis of forecasts to velocity assumptions"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional
+
+from .forecasting import ForecastResult
+from .value_objects import VelocityMetrics
+
+SENSITIVITY_PARAMETERS = ("variance_multiplier", "mean_shift", "lookback_sprints")
+
+
+@dataclass(frozen=True)
+class SensitivityPoint:
+    """One combination of velocity assumptions in a sensitivity sweep"""
+
+    variance_multiplier: float = 1.0
+    mean_shift: float = 0.0  # Relative change of mean velocity, -0.1 = 10% slower
+    lookback_sprints: Optional[int] = None  # None = baseline velocity window
+
+    def apply(self, velocity_metrics: VelocityMetrics) -> VelocityMetrics:
+        """
+        Velocity metrics under these assumptions
+
+        The mean moves by mean_shift and every value's distance from the mean
+        is scaled by variance_multiplier, so samples, median and range stay
+        consistent with the adjusted mean and standard deviation.
+        """
+        mean = velocity_metrics.average
+        shifted_mean = mean * (1 + self.mean_shift)
+
+        def adjust(value: float) -> float:
+            return shifted_mean + (value - mean) * self.variance_multiplier
+
+        return replace(
+            velocity_metrics,
+            average=shifted_mean,
+            median=adjust(velocity_metrics.median),
+            std_dev=velocity_metrics.std_dev * self.variance_multiplier,
+            min_value=adjust(velocity_metrics.min_value),
+            max_value=adjust(velocity_metrics.max_value),
+            samples=tuple(adjust(value) for value in velocity_metrics.samples),
+        )
+
+
+@dataclass
+class SensitivityOutcome:
+    """Forecast at one point of a sensitivity sweep"""
+
+    point: SensitivityPoint
+    velocity_metrics: VelocityMetrics
+    forecast: ForecastResult
+
+
+@dataclass
+class TornadoBar:
+    """Range of outcomes when one parameter varies and the others stay at baseline"""
+
+    parameter: str
+    low_value: Any  # Parameter value giving the earliest completion
+    high_value: Any  # Parameter value giving the latest completion
+    low_outcome: float  # In sprints
+    high_outcome: float  # In sprints
+
+    @property
+    def swing(self) -> float:
+        """Width of the bar"""
+        return self.high_outcome - self.low_outcome
+
+
+@dataclass
+class SensitivityAnalysis:
+    """Result of a sensitivity sweep over velocity assumptions"""
+
+    baseline: SensitivityOutcome
+    outcomes: List[SensitivityOutcome]
+    tornado: List[TornadoBar]  # Widest bar first
+    tornado_confidence: float  # Confidence level of the tornado outcomes
+
+    def table(self) -> List[Dict[str, Any]]:
+        """Tidy table: one row per grid point and confidence level"""
+        rows = []
+        for outcome in self.outcomes:
+            for interval in outcome.forecast.prediction_intervals:
+                rows.append(
+                    {
+                        "variance_multiplier": outcome.point.variance_multiplier,
+                        "mean_shift": outcome.point.mean_shift,
+                        "lookback_sprints": outcome.point.lookback_sprints,
+                        "velocity_mean": outcome.velocity_metrics.average,
+                        "velocity_std_dev": outcome.velocity_metrics.std_dev,
+                        "expected_sprints": outcome.forecast.expected_sprints,
+                        "confidence_level": interval.confidence_level,
+                        "predicted_sprints": interval.predicted_value,
+                    }
+                )
+        return rows
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -32,6 +32,7 @@ class VelocityMetrics:
     min_value: float
     max_value: float
     trend: float  # Positive for increasing, negative for decreasing
+    samples: Tuple[float, ...] = ()  # Per-sprint velocities used, oldest first
 
 
 @dataclass(frozen=True)
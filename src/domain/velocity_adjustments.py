@@ -1,5 +1,6 @@
 """Domain models for velocity adjustments and team capacity changes"""
 
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Tuple
@@ -143,14 +144,63 @@ class VelocityScenario:
         Calculate adjusted velocity for a given sprint
         Returns: (adjusted_velocity, reason_description)
         """
-        adjusted_velocity = base_velocity
-        reasons = []
+        factor, reasons = self._evaluate_sprint(sprint_number, team_size, True)
+        reason_desc = "; ".join(reasons) if reasons else "No adjustments"
+        return base_velocity * factor, reason_desc
+
+    def get_velocity_factor(self, sprint_number: int, team_size: int) -> float:
+        """Multiplicative velocity factor for a sprint, without reason strings"""
+        return self._evaluate_sprint(sprint_number, team_size, False)[0]
+
+    def get_steady_state_sprint(self) -> int:
+        """First sprint from which the velocity factor no longer changes"""
+        steady_state = 1
+        for adjustment in self.adjustments:
+            steady_state = max(steady_state, adjustment.sprint_start)
+            if adjustment.sprint_end is not None:
+                steady_state = max(steady_state, adjustment.sprint_end + 1)
+        for change in self.team_changes:
+            steady_state = max(
+                steady_state, change.sprint + math.ceil(change.ramp_up_sprints)
+            )
+        return steady_state
+
+    def compile(
+        self, team_size: int, horizon: Optional[int] = None
+    ) -> "CompiledVelocityScenario":
+        """
+        Precompute the per-sprint velocity factors of this scenario
+
+        Args:
+            team_size: Baseline team size for team change calculations
+            horizon: Number of sprints to tabulate (default: up to steady state)
+        """
+        steady_state = self.get_steady_state_sprint()
+        tabulated = steady_state if horizon is None else min(horizon, steady_state)
+        factors = [
+            self.get_velocity_factor(sprint, team_size)
+            for sprint in range(1, tabulated + 1)
+        ]
+        # The factor is constant from the steady-state sprint onwards
+        if horizon is not None and horizon > tabulated:
+            factors.extend([factors[-1]] * (horizon - tabulated))
+        return CompiledVelocityScenario(
+            scenario=self, team_size=team_size, factors=tuple(factors)
+        )
+
+    def _evaluate_sprint(
+        self, sprint_number: int, team_size: int, with_reasons: bool
+    ) -> Tuple[float, List[str]]:
+        """Compute the velocity factor (and optionally reasons) for a sprint"""
+        factor = 1.0
+        reasons: List[str] = []
 
         # Apply velocity adjustments
         for adjustment in self.adjustments:
             if adjustment.applies_to_sprint(sprint_number):
-                adjusted_velocity *= adjustment.factor
-                reasons.append(adjustment.get_description())
+                factor *= adjustment.factor
+                if with_reasons:
+                    reasons.append(adjustment.get_description())
 
         # Apply team changes
         current_team_size = team_size
@@ -165,26 +215,26 @@ class VelocityScenario:
                     # Calculate velocity impact
                     new_capacity = change.change * productivity
                     team_factor = (current_team_size + new_capacity) / current_team_size
-                    adjusted_velocity *= team_factor
+                    factor *= team_factor
 
-                    if sprints_since < change.ramp_up_sprints:
+                    if with_reasons and sprints_since < change.ramp_up_sprints:
                         reasons.append(
                             f"New team member(s) at {int(productivity * 100)}% productivity"
                         )
-                    else:
+                    elif with_reasons:
                         reasons.append(f"Team scaled up by {change.change}")
                 else:
                     # Removing team members
                     team_factor = (
                         current_team_size + change.change
                     ) / current_team_size
-                    adjusted_velocity *= team_factor
-                    reasons.append(f"Team reduced by {abs(change.change)}")
+                    factor *= team_factor
+                    if with_reasons:
+                        reasons.append(f"Team reduced by {abs(change.change)}")
 
                 current_team_size += change.change
 
-        reason_desc = "; ".join(reasons) if reasons else "No adjustments"
-        return adjusted_velocity, reason_desc
+        return factor, reasons
 
     def get_summary(self, team_size: int = 2) -> str:
         """Get a summary of all adjustments in this scenario"""
@@ -234,6 +284,32 @@ class VelocityScenario:
         return " • ".join(summaries)
 
 
+@dataclass(frozen=True)
+class CompiledVelocityScenario:
+    """Velocity scenario precompiled into a dense per-sprint factor table"""
+
+    scenario: VelocityScenario
+    team_size: int
+    factors: Tuple[float, ...]  # factors[i] applies to sprint i + 1
+
+    @property
+    def horizon(self) -> int:
+        """Number of tabulated sprints"""
+        return len(self.factors)
+
+    def get_factor(self, sprint_number: int) -> float:
+        """Factor for a sprint; sprints past the table use the last factor"""
+        if not self.factors:
+            return 1.0
+        return self.factors[min(sprint_number, len(self.factors)) - 1]
+
+    def get_reason(self, sprint_number: int) -> str:
+        """Reason description for a sprint, only built when reporting"""
+        return self.scenario.get_adjusted_velocity(
+            sprint_number, 1.0, self.team_size
+        )[1]
+
+
 @dataclass
 class ScenarioComparison:
     """Comparison between baseline and adjusted scenarios"""
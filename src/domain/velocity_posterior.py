@@ -0,0 +1,123 @@
+"""Normal-Inverse-Gamma posterior over sprint velocity"""
+
+import math
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+
+@dataclass(frozen=True)
+class NormalInverseGammaPosterior:
+    """
+    Conjugate belief about the mean and variance of sprint velocity
+
+    Velocity is modeled as Normal(mu, sigma^2) with
+    sigma^2 ~ InverseGamma(alpha, beta) and mu | sigma^2 ~ Normal(mean,
+    sigma^2 / kappa). Observing a sprint updates the four parameters in
+    closed form, so appending a sprint costs O(1) regardless of history.
+    """
+
+    mean: float  # Location of mu
+    kappa: float  # Pseudo-sprints behind the mean
+    alpha: float  # Shape of the variance
+    beta: float  # Scale of the variance
+    observations: int = 0  # Sprints incorporated since the prior
+    last_sprint_end: Optional[datetime] = None  # End of the newest sprint seen
+
+    @classmethod
+    def prior(
+        cls, mean: float, std_dev: float, strength: float = 1.0
+    ) -> "NormalInverseGammaPosterior":
+        """
+        Prior worth `strength` sprints, centered on a mean and spread
+
+        The expected variance under the prior is std_dev^2.
+        """
+        if strength <= 0:
+            raise ValueError("Prior strength must be positive")
+        alpha = 1.0 + strength / 2
+        return cls(
+            mean=mean, kappa=strength, alpha=alpha, beta=std_dev**2 * (alpha - 1)
+        )
+
+    @classmethod
+    def uninformative(cls) -> "NormalInverseGammaPosterior":
+        """
+        Vague prior worth no sprints
+
+        The limit of kappa, alpha and beta going to zero, so a posterior
+        updated from it depends on the observed sprints alone. Its predictive
+        distribution has no spread until two sprints have been observed.
+        """
+        return cls(mean=0.0, kappa=0.0, alpha=0.0, beta=0.0)
+
+    def update(
+        self, velocity: float, sprint_end: Optional[datetime] = None
+    ) -> "NormalInverseGammaPosterior":
+        """Posterior after observing one more sprint"""
+        kappa = self.kappa + 1
+        return replace(
+            self,
+            mean=(self.kappa * self.mean + velocity) / kappa,
+            kappa=kappa,
+            alpha=self.alpha + 0.5,
+            beta=self.beta + self.kappa * (velocity - self.mean) ** 2 / (2 * kappa),
+            observations=self.observations + 1,
+            last_sprint_end=sprint_end or self.last_sprint_end,
+        )
+
+    def update_all(self, velocities: Iterable[float]) -> "NormalInverseGammaPosterior":
+        """Posterior after observing several sprints, oldest first"""
+        posterior = self
+        for velocity in velocities:
+            posterior = posterior.update(velocity)
+        return posterior
+
+    def update_summary(
+        self, count: int, mean: float, std_dev: float
+    ) -> "NormalInverseGammaPosterior":
+        """Posterior after sprints known only by their count, mean and spread"""
+        if count <= 0:
+            return self
+        kappa = self.kappa + count
+        sum_squares = std_dev**2 * max(count - 1, 0)
+        return replace(
+            self,
+            mean=(self.kappa * self.mean + count * mean) / kappa,
+            kappa=kappa,
+            alpha=self.alpha + count / 2,
+            beta=self.beta
+            + sum_squares / 2
+            + self.kappa * count * (mean - self.mean) ** 2 / (2 * kappa),
+            observations=self.observations + count,
+        )
+
+    @property
+    def predictive_degrees_of_freedom(self) -> float:
+        """Degrees of freedom of the Student-t predictive of one sprint"""
+        return 2 * self.alpha
+
+    @property
+    def predictive_scale(self) -> float:
+        """Scale of the Student-t predictive of one sprint"""
+        return math.sqrt(self.beta * (self.kappa + 1) / (self.alpha * self.kappa))
+
+    @property
+    def expected_variance(self) -> Optional[float]:
+        """Posterior mean of sigma^2 (None while alpha <= 1)"""
+        if self.alpha <= 1:
+            return None
+        return self.beta / (self.alpha - 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        if self.last_sprint_end is not None:
+            data["last_sprint_end"] = self.last_sprint_end.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NormalInverseGammaPosterior":
+        data = dict(data)
+        if data.get("last_sprint_end"):
+            data["last_sprint_end"] = datetime.fromisoformat(data["last_sprint_end"])
+        return cls(**data)
@@ -0,0 +1,287 @@
+"""Closed-form forecasting model for Gaussian velocities without scenarios"""
+
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..domain.forecasting import (
+    AnalyticalConfiguration,
+    CompletionProbability,
+    ForecastingModel,
+    ForecastResult,
+    ModelConfiguration,
+    ModelInfo,
+    ModelType,
+    MonteCarloConfiguration,
+    MonteCarloConfigurationWithScenario,
+    PortfolioForecast,
+    PredictionInterval,
+    SimulationEngine,
+    VelocitySampling,
+)
+from ..domain.value_objects import VelocityMetrics
+from .monte_carlo_model import MonteCarloModel
+from .vectorized_simulation import MAX_SIMULATED_SPRINTS
+from .velocity_samplers import MIN_VELOCITY
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_SIZE = 1000  # Quantile samples returned for visualization
+TAIL_PROBABILITY = 1e-9  # Completion probability mass left out of the distribution
+
+
+def _normal_cdf(x: float) -> float:
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def _normal_pdf(x: float) -> float:
+    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
+
+
+class AnalyticalModel(ForecastingModel):
+    """
+    Closed-form completion forecast for normally distributed velocities
+
+    Sprint velocities are positive, so delivered work only grows and the
+    backlog is finished within n sprints exactly when the cumulative
+    velocity S_n reaches it: P(N <= n) = P(S_n >= W). S_n is the sum of n
+    independent velocities and is normal, which gives the whole completion
+    distribution in O(sprints) without simulation. Velocities below the
+    minimum are clamped like in the simulation, and the clamped moments are
+    used; the sum is then only approximately normal, so when clamping is
+    common (or a scenario or bootstrap sampling is configured) the forecast
+    is delegated to MonteCarloModel.
+    """
+
+    def __init__(self, fallback_model: Optional[ForecastingModel] = None):
+        self.fallback_model = fallback_model or MonteCarloModel()
+
+    def forecast(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> ForecastResult:
+        """Compute the completion distribution analytically when accurate"""
+        errors = config.validate()
+        if errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(errors)}")
+
+        raw_mean, raw_std_dev = self._velocity_parameters(velocity_metrics, config)
+        reason = self._fallback_reason(remaining_work, raw_mean, raw_std_dev, config)
+        if reason:
+            logger.info(f"Analytical forecast not accurate ({reason}); simulating")
+            result = self.fallback_model.forecast(
+                remaining_work, velocity_metrics, self._fallback_config(config)
+            )
+            result.model_metadata["analytical_fallback"] = reason
+            return result
+
+        mean, std_dev = self._clamped_moments(raw_mean, raw_std_dev)
+        distribution = self._completion_distribution(remaining_work, mean, std_dev)
+        cumulative = self._cumulative(distribution)
+        expected_sprints = sum(sprints * p for sprints, p in distribution.items())
+        expected_completion_date = datetime.now() + timedelta(
+            days=int(expected_sprints * config.sprint_duration_days)
+        )
+
+        return ForecastResult(
+            prediction_intervals=[
+                self._prediction_interval(cumulative, confidence)
+                for confidence in config.confidence_levels
+            ],
+            expected_sprints=expected_sprints,
+            expected_completion_date=expected_completion_date,
+            probability_distribution=distribution,
+            model_type=ModelType.ANALYTICAL,
+            model_metadata={
+                "velocity_mean": velocity_metrics.average,
+                "velocity_std_dev": velocity_metrics.std_dev,
+                "clamped_velocity_mean": mean,
+                "clamped_velocity_std_dev": std_dev,
+            },
+            sample_predictions=self._quantile_samples(cumulative),
+        )
+
+    def completion_evaluator(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        sprints: int,
+    ) -> CompletionProbability:
+        """Capacity plans change velocity per sprint; simulate them instead"""
+        return self.fallback_model.completion_evaluator(
+            remaining_work, velocity_metrics, self._fallback_config(config), sprints
+        )
+
+    def forecast_portfolio(
+        self,
+        remaining_work: Sequence[float],
+        velocity_metrics: Sequence[VelocityMetrics],
+        config: ModelConfiguration,
+        correlation: Optional[Sequence[Sequence[float]]] = None,
+    ) -> PortfolioForecast:
+        """The maximum over projects has no closed form here; simulate it"""
+        return self.fallback_model.forecast_portfolio(
+            remaining_work, velocity_metrics, self._fallback_config(config), correlation
+        )
+
+    def get_model_info(self) -> ModelInfo:
+        """Get information about the analytical model"""
+        return ModelInfo(
+            model_type=ModelType.ANALYTICAL,
+            name="Analytical Forecast",
+            description=(
+                "Computes the completion distribution in closed form from a "
+                "normal velocity distribution"
+            ),
+            supports_probability_distribution=True,
+            required_historical_periods=3,
+            configuration_class=AnalyticalConfiguration,
+            methodology_description=(
+                "Treats cumulative velocity as a sum of normally distributed "
+                "sprints and computes the probability of finishing by each sprint "
+                "directly, falling back to Monte Carlo simulation when that "
+                "approximation is not accurate."
+            ),
+        )
+
+    def validate_inputs(
+        self, remaining_work: float, velocity_metrics: VelocityMetrics
+    ) -> List[str]:
+        """Validate inputs for the analytical forecast"""
+        return self.fallback_model.validate_inputs(remaining_work, velocity_metrics)
+
+    def _velocity_parameters(
+        self, velocity_metrics: VelocityMetrics, config: ModelConfiguration
+    ) -> Tuple[float, float]:
+        """Mean and standard deviation of the simulated sprint velocity"""
+        std_dev = velocity_metrics.std_dev * getattr(config, "variance_multiplier", 1.0)
+        if not getattr(config, "use_historical_variance", True):
+            std_dev = 0.0
+        return velocity_metrics.average, std_dev
+
+    def _clamped_moments(self, mean: float, std_dev: float) -> Tuple[float, float]:
+        """Mean and standard deviation of max(V, MIN_VELOCITY), V ~ N(mean, std)"""
+        if std_dev == 0:
+            return max(mean, MIN_VELOCITY), 0.0
+
+        alpha = (MIN_VELOCITY - mean) / std_dev
+        clamped = _normal_cdf(alpha)
+        density = _normal_pdf(alpha)
+        first = MIN_VELOCITY * clamped + mean * (1 - clamped) + std_dev * density
+        second = (
+            MIN_VELOCITY**2 * clamped
+            + (mean**2 + std_dev**2) * (1 - clamped)
+            + std_dev * (mean + MIN_VELOCITY) * density
+        )
+        return first, math.sqrt(max(second - first**2, 0.0))
+
+    def _fallback_reason(
+        self,
+        remaining_work: float,
+        mean: float,
+        std_dev: float,
+        config: ModelConfiguration,
+    ) -> Optional[str]:
+        """Why the closed form would be inaccurate here, if it would"""
+        if (
+            isinstance(config, MonteCarloConfigurationWithScenario)
+            and config.velocity_scenario
+        ):
+            return "velocity scenario configured"
+        if (
+            isinstance(config, MonteCarloConfiguration)
+            and config.velocity_sampling == VelocitySampling.BOOTSTRAP
+        ):
+            return "bootstrap sampling configured"
+        if remaining_work / max(mean, MIN_VELOCITY) > MAX_SIMULATED_SPRINTS:
+            return f"more than {MAX_SIMULATED_SPRINTS} sprints expected"
+
+        if std_dev > 0:
+            max_clamp_probability = getattr(
+                config,
+                "max_clamp_probability",
+                AnalyticalConfiguration.max_clamp_probability,
+            )
+            clamp_probability = _normal_cdf((MIN_VELOCITY - mean) / std_dev)
+            if clamp_probability > max_clamp_probability:
+                return f"{clamp_probability:.1%} of sprint velocities clamped"
+        return None
+
+    def _fallback_config(self, config: ModelConfiguration) -> ModelConfiguration:
+        """Monte Carlo configuration equivalent to the analytical request"""
+        if isinstance(config, MonteCarloConfiguration):
+            return config
+        return MonteCarloConfiguration(
+            confidence_levels=config.confidence_levels,
+            sprint_duration_days=config.sprint_duration_days,
+            num_simulations=getattr(
+                config,
+                "fallback_num_simulations",
+                AnalyticalConfiguration.fallback_num_simulations,
+            ),
+            use_historical_variance=getattr(config, "use_historical_variance", True),
+            engine=SimulationEngine.VECTORIZED,
+        )
+
+    def _completion_distribution(
+        self, remaining_work: float, mean: float, std_dev: float
+    ) -> Dict[int, float]:
+        """P(N = n) for every sprint count with non-negligible probability"""
+        if std_dev == 0:
+            return {max(1, math.ceil(remaining_work / mean)): 1.0}
+
+        distribution = {}
+        previous = 0.0
+        sprints = 1
+        while previous < 1 - TAIL_PROBABILITY and sprints <= MAX_SIMULATED_SPRINTS:
+            # P(S_n >= W) with S_n ~ N(n * mean, n * std_dev^2)
+            done = _normal_cdf(
+                (sprints * mean - remaining_work) / (std_dev * math.sqrt(sprints))
+            )
+            if done - previous > TAIL_PROBABILITY:
+                distribution[sprints] = done - previous
+            previous = max(previous, done)
+            sprints += 1
+
+        total = sum(distribution.values())
+        return {sprints: p / total for sprints, p in distribution.items()}
+
+    def _cumulative(self, distribution: Dict[int, float]) -> List[Tuple[int, float]]:
+        cumulative, total = [], 0.0
+        for sprints in sorted(distribution):
+            total += distribution[sprints]
+            cumulative.append((sprints, total))
+        return cumulative
+
+    def _quantile(self, cumulative: List[Tuple[int, float]], level: float) -> int:
+        """Smallest sprint count whose completion probability exceeds level"""
+        for sprints, probability in cumulative:
+            if probability > level:
+                return sprints
+        return cumulative[-1][0]
+
+    def _quantile_samples(self, cumulative: List[Tuple[int, float]]) -> List[float]:
+        """Evenly spaced quantiles, a noise-free stand-in for simulated samples"""
+        samples = []
+        position = 0
+        for i in range(SAMPLE_SIZE):
+            level = (i + 0.5) / SAMPLE_SIZE
+            while position < len(cumulative) - 1 and cumulative[position][1] <= level:
+                position += 1
+            samples.append(float(cumulative[position][0]))
+        return samples
+
+    def _prediction_interval(
+        self, cumulative: List[Tuple[int, float]], confidence: float
+    ) -> PredictionInterval:
+        alpha = 1 - confidence
+        return PredictionInterval(
+            confidence_level=confidence,
+            lower_bound=float(self._quantile(cumulative, alpha / 2)),
+            predicted_value=float(self._quantile(cumulative, confidence)),
+            upper_bound=float(self._quantile(cumulative, 1 - alpha / 2)),
+        )
@@ -0,0 +1,161 @@
+"""Bayesian forecasting model with a conjugate posterior over sprint velocity"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List
+
+from ..domain.forecasting import (
+    BayesianConfiguration,
+    ForecastingModel,
+    ForecastResult,
+    ModelConfiguration,
+    ModelInfo,
+    ModelType,
+    PredictionInterval,
+)
+from ..domain.value_objects import VelocityMetrics
+from ..domain.velocity_posterior import NormalInverseGammaPosterior
+from .forecast_outcomes import ArrayForecastOutcomes
+from .sharded_simulation import run_sharded_posterior_simulation
+
+logger = logging.getLogger(__name__)
+
+# Sprints the uninformative prior needs before velocity has a spread
+MIN_OBSERVATIONS = 2
+
+
+class BayesianModel(ForecastingModel):
+    """
+    Forecast from the posterior predictive of a Normal-Inverse-Gamma model
+
+    The velocity mean and variance are uncertain. Every trial draws its own
+    (mu, sigma^2) from the posterior and then all of its sprints from
+    Normal(mu, sigma^2), so short histories give wider forecasts than a
+    Gaussian fitted to the same sprints. The posterior comes from the
+    configuration when it is maintained incrementally, otherwise it is
+    computed from the velocity metrics.
+    """
+
+    def forecast(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> ForecastResult:
+        """Simulate completion from the posterior predictive distribution"""
+        bayes_config = self._prepare_config(config)
+        posterior = self.posterior_for(velocity_metrics, bayes_config)
+
+        accumulator = run_sharded_posterior_simulation(
+            remaining_work,
+            posterior,
+            bayes_config.num_simulations,
+            random_seed=bayes_config.random_seed,
+            num_workers=bayes_config.num_workers,
+        )
+
+        expected_sprints = accumulator.mean
+        expected_completion_date = datetime.now() + timedelta(
+            days=int(expected_sprints * bayes_config.sprint_duration_days)
+        )
+        return ForecastResult(
+            prediction_intervals=[
+                PredictionInterval(
+                    confidence, *accumulator.prediction_bounds(confidence)
+                )
+                for confidence in bayes_config.confidence_levels
+            ],
+            expected_sprints=expected_sprints,
+            expected_completion_date=expected_completion_date,
+            model_type=ModelType.BAYESIAN,
+            model_metadata={
+                "num_simulations": accumulator.total,
+                "velocity_mean": posterior.mean,
+                "velocity_std_dev": posterior.predictive_scale,
+                "posterior_observations": posterior.observations,
+                "posterior_kappa": posterior.kappa,
+                "posterior_alpha": posterior.alpha,
+                "posterior_beta": posterior.beta,
+                "predictive_degrees_of_freedom": (
+                    posterior.predictive_degrees_of_freedom
+                ),
+            },
+            outcomes=ArrayForecastOutcomes.from_accumulator(accumulator),
+        )
+
+    def posterior_for(
+        self, velocity_metrics: VelocityMetrics, config: BayesianConfiguration
+    ) -> NormalInverseGammaPosterior:
+        """Configured posterior, or the prior updated with the velocity metrics"""
+        if config.posterior is not None:
+            return config.posterior
+
+        if config.prior_mean is None:
+            # A prior fitted to the same sprints would count them twice
+            prior = NormalInverseGammaPosterior.uninformative()
+        else:
+            prior = NormalInverseGammaPosterior.prior(
+                config.prior_mean, config.prior_std_dev, config.prior_strength
+            )
+        if velocity_metrics.samples:
+            posterior = prior.update_all(velocity_metrics.samples)
+        else:
+            posterior = prior.update_summary(
+                config.summary_sprints,
+                velocity_metrics.average,
+                velocity_metrics.std_dev,
+            )
+
+        # One sprint says nothing about the spread of velocity
+        if config.prior_mean is None and posterior.observations < MIN_OBSERVATIONS:
+            raise ValueError(
+                f"Bayesian forecast needs at least {MIN_OBSERVATIONS} sprints "
+                f"of history without a configured prior"
+            )
+        return posterior
+
+    def _prepare_config(self, config: ModelConfiguration) -> BayesianConfiguration:
+        """Convert to a Bayesian configuration and validate it"""
+        if not isinstance(config, BayesianConfiguration):
+            config = BayesianConfiguration(
+                confidence_levels=config.confidence_levels,
+                sprint_duration_days=config.sprint_duration_days,
+            )
+
+        errors = config.validate()
+        if errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(errors)}")
+        return config
+
+    def get_model_info(self) -> ModelInfo:
+        """Get information about the Bayesian model"""
+        return ModelInfo(
+            model_type=ModelType.BAYESIAN,
+            name="Bayesian Forecast",
+            description=(
+                "Simulates completion from the posterior predictive of a "
+                "Normal-Inverse-Gamma model of sprint velocity"
+            ),
+            supports_probability_distribution=True,
+            required_historical_periods=MIN_OBSERVATIONS,
+            configuration_class=BayesianConfiguration,
+            methodology_description=(
+                "Treats the mean and variance of sprint velocity as uncertain, "
+                "updates a conjugate Normal-Inverse-Gamma belief with every "
+                "completed sprint, and simulates outcomes that include the "
+                "remaining uncertainty about the team's true velocity."
+            ),
+        )
+
+    def validate_inputs(
+        self, remaining_work: float, velocity_metrics: VelocityMetrics
+    ) -> List[str]:
+        """Validate inputs for the Bayesian model"""
+        errors = []
+        if remaining_work <= 0:
+            errors.append("Remaining work must be positive")
+        if velocity_metrics.average <= 0:
+            errors.append("Average velocity must be positive")
+        if velocity_metrics.std_dev < 0:
+            errors.append("Standard deviation cannot be negative")
+        return errors
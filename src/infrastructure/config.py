@@ -2,10 +2,12 @@
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
+from ..domain.reporting_capabilities import ReportType
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -23,6 +25,27 @@ class JiraConfig:
     )
     history_jql: Optional[str] = None
     forecast_jql: Optional[str] = None
+    # Fetch issues matching the forecast or history JQL once and split them
+    # locally, instead of fetching each query separately
+    union_fetch: bool = True
+    # Search pages fetched at once after the first; 1 fetches them serially.
+    # Ignored on Jira Cloud, which has deprecated the offset search.
+    fetch_concurrency: int = 1
+    # Refresh a local issue snapshot with updated-since deltas instead of
+    # refetching every issue when the cache expires
+    incremental_sync: bool = False
+    # Hours between key-only checks for issues deleted or moved out of the JQL;
+    # 0 checks on every delta sync, so such issues never linger
+    reconcile_hours: float = 0.0
+    # Retries of a throttled, failed or dropped request before giving up
+    max_retries: int = 5
+    # Request rate shared by all fetchers of a data source; 0 for no limit
+    requests_per_second: float = 0.0
+    # Reports to fetch fields for (ReportType values); None enables all. The
+    # forecast, velocity and story size reports are always included.
+    reports: Optional[List[str]] = None
+    # Request every field and the changelog instead of only the planned fields
+    fetch_all_fields: bool = False
 
     @classmethod
     def from_env(cls) -> "JiraConfig":
@@ -56,6 +79,21 @@ class JiraConfig:
             jql_filter=jql_filter,
             history_jql=history_jql,
             forecast_jql=forecast_jql,
+            union_fetch=os.getenv("JIRA_UNION_FETCH", "true").lower()
+            in ("1", "true", "yes"),
+            fetch_concurrency=int(os.getenv("JIRA_FETCH_CONCURRENCY", "1")),
+            incremental_sync=os.getenv("JIRA_INCREMENTAL_SYNC", "").lower()
+            in ("1", "true", "yes"),
+            reconcile_hours=float(os.getenv("JIRA_RECONCILE_HOURS", "0")),
+            max_retries=int(os.getenv("JIRA_MAX_RETRIES", "5")),
+            requests_per_second=float(os.getenv("JIRA_REQUESTS_PER_SECOND", "0")),
+            reports=(
+                [report.strip() for report in os.getenv("JIRA_REPORTS").split(",")]
+                if os.getenv("JIRA_REPORTS")
+                else None
+            ),
+            fetch_all_fields=os.getenv("JIRA_FETCH_ALL_FIELDS", "").lower()
+            in ("1", "true", "yes"),
         )
 
     def validate(self) -> None:
@@ -67,3 +105,29 @@ class JiraConfig:
             raise ValueError(
                 "JIRA_USERNAME should be an email address for Atlassian Cloud"
             )
+
+        if self.fetch_concurrency < 1:
+            raise ValueError("JIRA_FETCH_CONCURRENCY must be at least 1")
+
+        if self.reconcile_hours < 0:
+            raise ValueError("JIRA_RECONCILE_HOURS cannot be negative")
+
+        if self.max_retries < 0:
+            raise ValueError("JIRA_MAX_RETRIES cannot be negative")
+
+        if self.requests_per_second < 0:
+            raise ValueError("JIRA_REQUESTS_PER_SECOND cannot be negative")
+
+        known_reports = {report.value for report in ReportType}
+        unknown_reports = set(self.reports or []) - known_reports
+        if unknown_reports:
+            raise ValueError(
+                f"Unknown JIRA_REPORTS: {', '.join(sorted(unknown_reports))}"
+            )
+
+    @property
+    def report_types(self) -> Optional[List[ReportType]]:
+        """Enabled reports as report types, None when all are enabled"""
+        if self.reports is None:
+            return None
+        return [ReportType(report) for report in self.reports]
@@ -0,0 +1,228 @@
+"""Retained simulated burn-up paths for "how much by when" queries"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..domain.forecasting import DeliveredWork
+from .vectorized_simulation import MAX_BLOCK_CELLS, MAX_SIMULATED_SPRINTS
+from .velocity_samplers import VelocitySampler
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on retained cells (trials x sprints); 16 MB as float32
+MAX_RETAINED_CELLS = 4_000_000
+
+# Spawn key of the path stream, distinct from the shard streams of a seed
+PATHS_SPAWN_KEY = 2**31
+
+
+def retained_trials(num_trials: int, horizon_sprints: int) -> int:
+    """Trials whose paths fit MAX_RETAINED_CELLS at the given horizon"""
+    if not 1 <= horizon_sprints <= MAX_SIMULATED_SPRINTS + 1:
+        raise ValueError(
+            f"Path horizon must be between 1 and {MAX_SIMULATED_SPRINTS + 1} " "sprints"
+        )
+    retained = max(1, min(num_trials, MAX_RETAINED_CELLS // horizon_sprints))
+    if retained < num_trials:
+        logger.info(
+            f"Retaining {retained} of {num_trials} paths over "
+            f"{horizon_sprints} sprints"
+        )
+    return retained
+
+
+class DeliveredWorkPaths(DeliveredWork):
+    """
+    Cumulative delivered work of simulated trials, sprint by sprint
+
+    Row i holds the work trial i has delivered after each sprint, so the
+    delivered-work distribution at any horizon is one column and every query
+    costs O(trials) without simulating again. Values are stored as float32,
+    and the number of retained trials is reduced so the matrix stays within
+    MAX_RETAINED_CELLS. The matrix is read-only, so copies of a forecast
+    share it instead of duplicating up to 16 MB.
+    """
+
+    def __init__(self, cumulative: np.ndarray):
+        self.cumulative = np.array(cumulative, dtype=np.float32)
+        self.cumulative.setflags(write=False)
+        self._sprint_velocities: Optional[np.ndarray] = None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DeliveredWorkPaths":
+        return self
+
+    @classmethod
+    def simulate(
+        cls,
+        sampler: VelocitySampler,
+        num_trials: int,
+        horizon_sprints: int,
+        rng: np.random.Generator,
+        sprint_factors: Optional[np.ndarray] = None,
+    ) -> "DeliveredWorkPaths":
+        """
+        Simulate and retain delivered work over a fixed number of sprints
+
+        Args:
+            sampler: Source of per-sprint base velocities
+            num_trials: Requested trials, reduced to fit MAX_RETAINED_CELLS
+            horizon_sprints: Sprints to simulate per trial
+            rng: NumPy random generator
+            sprint_factors: Optional sprint factor table, in the format of
+                simulate_completion_sprints
+        """
+        retained = retained_trials(num_trials, horizon_sprints)
+        return cls.complete(
+            np.full((retained, horizon_sprints), np.nan, dtype=np.float32),
+            sampler,
+            rng,
+            sprint_factors,
+        )
+
+    @classmethod
+    def complete(
+        cls,
+        partial: np.ndarray,
+        sampler: VelocitySampler,
+        rng: np.random.Generator,
+        sprint_factors: Optional[np.ndarray] = None,
+    ) -> "DeliveredWorkPaths":
+        """
+        Draw the sprints a simulation left out of its retained paths
+
+        A completion simulation stops drawing for a trial once it has
+        finished, leaving the rest of its row NaN. The missing sprints are
+        drawn here and added to the work delivered before them.
+
+        Args:
+            partial: Delivered work per trial and sprint, NaN where not drawn
+            sampler: Source of per-sprint base velocities
+            rng: NumPy random generator of the missing sprints
+            sprint_factors: Optional sprint factor table, in the format of
+                simulate_completion_sprints
+        """
+        num_trials, horizon_sprints = partial.shape
+        cumulative = np.empty(partial.shape, dtype=np.float32)
+        trials_per_chunk = max(1, MAX_BLOCK_CELLS // horizon_sprints)
+        for start in range(0, num_trials, trials_per_chunk):
+            stop = min(num_trials, start + trials_per_chunk)
+            chunk = partial[start:stop]
+            # Drawn sprints are a prefix of every row
+            drawn = np.count_nonzero(~np.isnan(chunk), axis=1)
+            first = int(drawn.min())
+            cumulative[start:stop] = chunk
+            if first == horizon_sprints:
+                continue
+
+            velocities = sampler.draw(rng, (stop - start, horizon_sprints - first))
+            if sprint_factors is not None:
+                velocities *= sprint_factors[first:horizon_sprints]
+            missing = np.arange(first, horizon_sprints) >= drawn[:, np.newaxis]
+            velocities[~missing] = 0.0
+            carried = np.where(
+                drawn > 0, chunk[np.arange(stop - start), np.maximum(drawn, 1) - 1], 0.0
+            )
+            # Sum in float64 so rounding does not accumulate along the path
+            continued = np.cumsum(velocities, axis=1) + carried[:, np.newaxis]
+            cumulative[start:stop, first:] = np.where(
+                missing, continued, chunk[:, first:]
+            )
+        return cls(cumulative)
+
+    @property
+    def num_trials(self) -> int:
+        return self.cumulative.shape[0]
+
+    @property
+    def horizon_sprints(self) -> int:
+        return self.cumulative.shape[1]
+
+    def delivered_by(self, sprints: int) -> np.ndarray:
+        """Work delivered by every trial after a number of sprints"""
+        if sprints > self.horizon_sprints:
+            raise ValueError(
+                f"{sprints} sprints is beyond the retained horizon of "
+                f"{self.horizon_sprints} sprints"
+            )
+        if sprints <= 0:
+            return np.zeros(self.num_trials, dtype=np.float32)
+        return self.cumulative[:, sprints - 1]
+
+    def delivered_with_factors(self, factors: Sequence[float]) -> np.ndarray:
+        """
+        Work delivered by every trial with velocity factors applied
+
+        The paths are differenced back into per-sprint velocities, which are
+        weighted by factors[i] for sprint i + 1. The horizon is the length of
+        the factor table.
+        """
+        factors = np.asarray(factors, dtype=np.float32)
+        if factors.size > self.horizon_sprints:
+            raise ValueError(
+                f"{factors.size} sprints is beyond the retained horizon of "
+                f"{self.horizon_sprints} sprints"
+            )
+        if factors.size == 0:
+            return np.zeros(self.num_trials, dtype=np.float32)
+        return self.sprint_velocities[:, : factors.size] @ factors
+
+    @property
+    def sprint_velocities(self) -> np.ndarray:
+        """Per-sprint velocities of every trial, recovered from the paths"""
+        if self._sprint_velocities is None:
+            self._sprint_velocities = np.diff(self.cumulative, axis=1, prepend=0)
+        return self._sprint_velocities
+
+    def scope_at_confidence(
+        self, sprints: int, confidence_levels: List[float]
+    ) -> Dict[float, float]:
+        """
+        Work delivered after a number of sprints, per confidence level
+
+        The scope at 0.85 is delivered in at least 85% of the trials.
+        """
+        delivered = self.delivered_by(sprints)
+        ranks = {
+            confidence: min(int(delivered.size * (1 - confidence)), delivered.size - 1)
+            for confidence in confidence_levels
+        }
+        ordered = np.partition(delivered, sorted(set(ranks.values())))
+        return {confidence: float(ordered[rank]) for confidence, rank in ranks.items()}
+
+    def probability_of_delivering(self, work: float, sprints: int) -> float:
+        """Share of trials that deliver at least the given work in time"""
+        return float(np.mean(self.delivered_by(sprints) >= work))
+
+    def scope_by_dates(
+        self,
+        target_dates: Sequence[datetime],
+        confidence_levels: List[float],
+        sprint_duration_days: int = 14,
+        start_date: Optional[datetime] = None,
+    ) -> Dict[datetime, Dict[float, float]]:
+        """
+        Deliverable scope per target date and confidence level
+
+        Only sprints that end on or before a target date count towards it.
+
+        Args:
+            target_dates: Dates to answer for
+            confidence_levels: Confidence levels, as in scope_at_confidence
+            sprint_duration_days: Length of a sprint
+            start_date: Start of the first simulated sprint (default: now)
+
+        Returns:
+            Target date -> confidence level -> deliverable work
+        """
+        start_date = start_date or datetime.now()
+        return {
+            target: self.scope_at_confidence(
+                math.floor((target - start_date).days / sprint_duration_days),
+                confidence_levels,
+            )
+            for target in target_dates
+        }
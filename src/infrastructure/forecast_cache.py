@@ -0,0 +1,405 @@
+"""Memoization of forecasts keyed by their inputs and configuration"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Union
+
+from ..domain.forecasting import (
+    CompletionProbability,
+    ForecastingModel,
+    ForecastResult,
+    ModelConfiguration,
+    ModelInfo,
+    MonteCarloConfiguration,
+    PortfolioForecast,
+    SimulationEngine,
+)
+from ..domain.value_objects import VelocityMetrics
+
+logger = logging.getLogger(__name__)
+
+# Bump when forecast semantics change so stale disk entries are not reused
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / ".sprint-radar" / "cache" / "forecasts"
+
+
+@dataclass
+class ForecastCacheStats:
+    """Hit and miss counts of a forecast cache"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-serializable form of configuration values"""
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {"__type__": type(value).__name__, **_canonical(asdict(value))}
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def _ignored_fields(config: ModelConfiguration) -> List[str]:
+    """Configuration fields that cannot change the forecast"""
+    # Shards are seeded independently of the workers that run them
+    ignored = ["num_workers"]
+    if isinstance(config, MonteCarloConfiguration):
+        if config.precision_target is None:
+            ignored += ["adaptive_batch_size", "max_simulations"]
+            if config.engine == SimulationEngine.LOOP:
+                ignored.append("random_sampling")
+        else:
+            # Adaptive runs are always vectorized and size their own batches
+            ignored.append("engine")
+            if config.retained_path_sprints is None:
+                ignored.append("num_simulations")
+    return ignored
+
+
+def _canonical_config(
+    config: Union[ModelConfiguration, List[ModelConfiguration]],
+) -> Any:
+    """Canonical configuration without the fields the forecast ignores"""
+    if isinstance(config, list):
+        return [_canonical_config(item) for item in config]
+    canonical = _canonical(config)
+    if isinstance(canonical, dict):
+        for name in _ignored_fields(config):
+            canonical.pop(name, None)
+    return canonical
+
+
+def forecast_key(
+    model_name: str,
+    remaining_work: Union[float, Sequence[float]],
+    velocity_metrics: Union[VelocityMetrics, List[VelocityMetrics]],
+    config: Union[ModelConfiguration, List[ModelConfiguration]],
+) -> str:
+    """
+    Stable hash of everything a forecast depends on
+
+    Settings that do not change the result, such as the worker count, are
+    left out so forecasts that differ only in them share an entry.
+    """
+    payload = {
+        "version": CACHE_VERSION,
+        "model": model_name,
+        "remaining_work": _canonical(remaining_work),
+        "velocity_metrics": _canonical(velocity_metrics),
+        "config": _canonical_config(config),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ForecastCache:
+    """
+    Two-tier forecast cache: an in-process LRU and an optional disk tier
+
+    The disk tier stores one pickle per forecast and evicts the least
+    recently used files once the directory exceeds max_disk_bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        cache_dir: Optional[Path] = None,
+        max_disk_bytes: int = 100 * 1024 * 1024,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Forecasts kept in memory
+            cache_dir: Directory of the disk tier (None = memory only)
+            max_disk_bytes: Size bound of the disk tier
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = ForecastCacheStats()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached forecast (or group of forecasts) for a key, or None"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.stats.memory_hits += 1
+            return self._entries[key]
+
+        result = self._read_disk(key)
+        if result is not None:
+            self._remember(key, result)
+            self.stats.disk_hits += 1
+            return result
+
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: str, result: Any) -> None:
+        """Store a forecast in every tier"""
+        self._remember(key, result)
+        self._write_disk(key, result)
+
+    def clear(self) -> None:
+        """Remove all cached forecasts"""
+        self._entries.clear()
+        if self.cache_dir is not None:
+            self.clear_dir(self.cache_dir)
+
+    @staticmethod
+    def clear_dir(cache_dir: Path) -> None:
+        """Remove the forecasts of a disk tier, without creating its directory"""
+        for path in Path(cache_dir).glob("*.forecast"):
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, result: Any) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.forecast"
+
+    def _read_disk(self, key: str) -> Optional[Any]:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)  # Mark as recently used for eviction
+            return result
+        except Exception as e:
+            logger.error(f"Error reading cached forecast {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, key: str, result: Any) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            with open(self._path(key), "wb") as f:
+                pickle.dump(result, f)
+        except Exception as e:
+            logger.error(f"Error writing cached forecast {key}: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the tier fits its bound"""
+        files = []
+        for path in self.cache_dir.glob("*.forecast"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda entry: entry[0]):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class CachingForecastingModel(ForecastingModel):
+    """Forecasting model decorator that serves repeated forecasts from a cache"""
+
+    def __init__(self, model: ForecastingModel, cache: ForecastCache):
+        self.model = model
+        self.cache = cache
+
+    def forecast(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> ForecastResult:
+        """Return the cached forecast for these inputs, computing it once"""
+        key = forecast_key(
+            type(self.model).__name__, remaining_work, velocity_metrics, config
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            result = self.model.forecast(remaining_work, velocity_metrics, config)
+            self.cache.set(key, copy.deepcopy(result))
+            return result
+
+        logger.info("Forecast served from cache")
+        return self._refreshed(cached, config)
+
+    def forecast_scenarios(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        configs: List[ModelConfiguration],
+    ) -> List[ForecastResult]:
+        """Cache scenario forecasts as one group to keep them paired"""
+        key = forecast_key(
+            f"{type(self.model).__name__}.scenarios",
+            remaining_work,
+            velocity_metrics,
+            configs,
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            results = self.model.forecast_scenarios(
+                remaining_work, velocity_metrics, configs
+            )
+            self.cache.set(key, copy.deepcopy(results))
+            return results
+
+        logger.info("Scenario forecasts served from cache")
+        return [
+            self._refreshed(result, config) for result, config in zip(cached, configs)
+        ]
+
+    def forecast_cut_lines(
+        self,
+        cumulative_work: Sequence[float],
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> List[ForecastResult]:
+        """Cache the forecasts of all cut lines of a backlog as one group"""
+        cut_lines = [float(work) for work in cumulative_work]
+        key = forecast_key(
+            f"{type(self.model).__name__}.cut_lines",
+            cut_lines,
+            velocity_metrics,
+            config,
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            results = self.model.forecast_cut_lines(cut_lines, velocity_metrics, config)
+            self.cache.set(key, copy.deepcopy(results))
+            return results
+
+        logger.info("Cut line forecasts served from cache")
+        return [self._refreshed(result, config) for result in cached]
+
+    def forecast_velocity_grid(
+        self,
+        remaining_work: float,
+        velocity_grid: List[VelocityMetrics],
+        config: ModelConfiguration,
+    ) -> List[ForecastResult]:
+        """Cache a sensitivity grid as one group to keep its points paired"""
+        key = forecast_key(
+            f"{type(self.model).__name__}.velocity_grid",
+            remaining_work,
+            velocity_grid,
+            config,
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            results = self.model.forecast_velocity_grid(
+                remaining_work, velocity_grid, config
+            )
+            self.cache.set(key, copy.deepcopy(results))
+            return results
+
+        logger.info("Sensitivity grid forecasts served from cache")
+        return [self._refreshed(result, config) for result in cached]
+
+    def forecast_portfolio(
+        self,
+        remaining_work: Sequence[float],
+        velocity_metrics: Sequence[VelocityMetrics],
+        config: ModelConfiguration,
+        correlation: Optional[Sequence[Sequence[float]]] = None,
+    ) -> PortfolioForecast:
+        """Cache a portfolio forecast as one group to keep its projects paired"""
+        key = forecast_key(
+            f"{type(self.model).__name__}.portfolio",
+            [float(work) for work in remaining_work],
+            list(velocity_metrics),
+            {"config": config, "correlation": correlation},
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            result = self.model.forecast_portfolio(
+                remaining_work, velocity_metrics, config, correlation
+            )
+            self.cache.set(key, copy.deepcopy(result))
+            return result
+
+        logger.info("Portfolio forecast served from cache")
+        return PortfolioForecast(
+            portfolio=self._refreshed(cached.portfolio, config),
+            projects=[self._refreshed(result, config) for result in cached.projects],
+            correlated=cached.correlated,
+        )
+
+    def _refreshed(
+        self, cached: ForecastResult, config: ModelConfiguration
+    ) -> ForecastResult:
+        """Private copy of a cached forecast with its date relative to today"""
+        result = copy.deepcopy(cached)
+        # The model knows the unit of its results, e.g. days for throughput
+        result.expected_completion_date = self.model.completion_date(
+            result.expected_sprints, config
+        )
+        return result
+
+    def configuration_errors(self, config: ModelConfiguration) -> List[str]:
+        return self.model.configuration_errors(config)
+
+    def completion_date(
+        self, expected_value: float, config: ModelConfiguration
+    ) -> datetime:
+        return self.model.completion_date(expected_value, config)
+
+    def completion_evaluator(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        sprints: int,
+    ) -> CompletionProbability:
+        return self.model.completion_evaluator(
+            remaining_work, velocity_metrics, config, sprints
+        )
+
+    def get_model_info(self) -> ModelInfo:
+        return self.model.get_model_info()
+
+    def validate_inputs(
+        self, remaining_work: float, velocity_metrics: VelocityMetrics
+    ) -> List[str]:
+        return self.model.validate_inputs(remaining_work, velocity_metrics)
+
+    def supports_confidence_level(self, confidence: float) -> bool:
+        return self.model.supports_confidence_level(confidence)
@@ -0,0 +1,100 @@
+"""Array-backed outcome distributions for simulated forecasts"""
+
+from typing import Any, Iterator, List, Mapping, Sequence
+
+import numpy as np
+
+from ..domain.forecasting import ForecastOutcomes
+from .simulation_accumulator import SimulationAccumulator
+
+
+class ArrayForecastOutcomes(ForecastOutcomes):
+    """
+    Outcomes held as the integer histogram and reservoir of a simulation
+
+    The arrays are shared with the accumulator, not copied, and the dict and
+    list views a ForecastResult exposes read from them on access.
+    """
+
+    def __init__(self, counts: np.ndarray, samples: np.ndarray):
+        self.counts = counts
+        self.samples_array = samples
+        self.total = int(counts.sum())
+
+    @classmethod
+    def from_accumulator(
+        cls, accumulator: SimulationAccumulator
+    ) -> "ArrayForecastOutcomes":
+        return cls(accumulator.counts, accumulator.samples)
+
+    def probabilities(self) -> Mapping[int, float]:
+        return OutcomeProbabilities(self.counts, self.total)
+
+    def samples(self) -> Sequence[float]:
+        return OutcomeSamples(self.samples_array)
+
+    def sample_std_dev(self) -> float:
+        if self.samples_array.size < 2:
+            return 0.0
+        return float(np.std(self.samples_array, ddof=1))
+
+    def histogram(self, bins: int) -> List[float]:
+        outcomes = np.flatnonzero(self.counts)
+        if outcomes.size == 0:
+            return []
+        low, high = outcomes[0], outcomes[-1]
+        bin_width = (high - low) / bins if high > low else 1
+        bin_index = np.minimum(
+            ((outcomes - low) / bin_width).astype(np.int64), bins - 1
+        )
+        return np.bincount(
+            bin_index, weights=self.counts[outcomes] / self.total, minlength=bins
+        ).tolist()
+
+
+class OutcomeProbabilities(Mapping[int, float]):
+    """Read-only outcome -> probability mapping over a histogram"""
+
+    def __init__(self, counts: np.ndarray, total: int):
+        self._counts = counts
+        self._total = total
+
+    def __getitem__(self, outcome: int) -> float:
+        if not 0 <= outcome < self._counts.size or not self._counts[outcome]:
+            raise KeyError(outcome)
+        return float(self._counts[outcome] / self._total)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(np.flatnonzero(self._counts).tolist())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._counts))
+
+    def __repr__(self) -> str:
+        return f"OutcomeProbabilities({dict(self)})"
+
+
+class OutcomeSamples(Sequence[float]):
+    """Read-only list view over retained outcome samples"""
+
+    def __init__(self, values: np.ndarray):
+        self._values = values
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return self._values[index].tolist()
+        return self._values[index].item()
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values.tolist())
+
+    def __len__(self) -> int:
+        return int(self._values.size)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"OutcomeSamples({self._values.tolist()})"
@@ -4,14 +4,21 @@ import logging
 from typing import Dict, List, Optional, Type
 
 from ..domain.forecasting import (
+    AnalyticalConfiguration,
+    BayesianConfiguration,
     ForecastingModel,
     ForecastingModelFactory,
     ModelConfiguration,
     ModelInfo,
     ModelType,
     MonteCarloConfiguration,
+    ThroughputConfiguration,
 )
+from .analytical_model import AnalyticalModel
+from .bayesian_model import BayesianModel
+from .forecast_cache import CachingForecastingModel, ForecastCache
 from .monte_carlo_model import MonteCarloModel
+from .throughput_model import ThroughputModel
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +26,20 @@ logger = logging.getLogger(__name__)
 class DefaultModelFactory(ForecastingModelFactory):
     """Default implementation of forecasting model factory"""
 
-    def __init__(self):
+    def __init__(self, forecast_cache: Optional[ForecastCache] = None):
+        """
+        Args:
+            forecast_cache: When given, created models serve repeated
+                forecasts from this cache
+        """
+        self.forecast_cache = forecast_cache
+
         # Registry of available models
         self._models: Dict[ModelType, Type[ForecastingModel]] = {
             ModelType.MONTE_CARLO: MonteCarloModel,
+            ModelType.ANALYTICAL: AnalyticalModel,
+            ModelType.BAYESIAN: BayesianModel,
+            ModelType.THROUGHPUT: ThroughputModel,
             # Future models can be registered here
             # ModelType.PERT: PERTModel,
             # ModelType.LINEAR_REGRESSION: LinearRegressionModel,
@@ -31,6 +48,9 @@ class DefaultModelFactory(ForecastingModelFactory):
         # Default configurations for each model type
         self._default_configs: Dict[ModelType, ModelConfiguration] = {
             ModelType.MONTE_CARLO: MonteCarloConfiguration(),
+            ModelType.ANALYTICAL: AnalyticalConfiguration(),
+            ModelType.BAYESIAN: BayesianConfiguration(),
+            ModelType.THROUGHPUT: ThroughputConfiguration(),
         }
 
     def create(
@@ -42,6 +62,8 @@ class DefaultModelFactory(ForecastingModelFactory):
 
         model_class = self._models[model_type]
         model = model_class()
+        if self.forecast_cache is not None:
+            model = CachingForecastingModel(model, self.forecast_cache)
 
         # Log model creation
         logger.info(f"Created {model_type.value} forecasting model")
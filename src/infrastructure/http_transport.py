@@ -0,0 +1,293 @@
+"""Shared HTTP transport with connection pooling, retries and rate limiting"""
+
+import logging
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: throttling and transient server or gateway errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods safe to resend after a 5xx or a dropped connection
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+DEFAULT_POOL_SIZE = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every request of one or more transports
+
+    Each request takes a token; tokens refill at `rate` per second up to
+    `capacity`, which bounds bursts. pause() holds back all callers, so a 429
+    seen by one fetcher slows down every other one too. Without a rate only
+    pauses apply.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(rate or 1.0, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, blocking until one is available; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                delay = self._delay(now)
+                if delay <= 0:
+                    if self.rate is not None:
+                        self._tokens -= 1
+                    return waited
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for some seconds, e.g. after a 429"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            # Tokens do not accrue while paused, so no burst follows the pause
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, self._paused_until)
+
+    def _delay(self, now: float) -> float:
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate is None:
+            return 0.0
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None or now <= self._updated:
+            return
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """One logical request, including all of its retries"""
+
+    method: str
+    url: str
+    status: Optional[int]  # None when the connection failed for good
+    seconds: float  # Wall time from first attempt to final response
+    attempts: int
+    waited_seconds: float  # Time spent in the rate limiter and backing off
+
+
+class TransportMetrics:
+    """Thread-safe counters and recent timings of a transport's requests"""
+
+    def __init__(self, history: int = 1000):
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0  # 429 responses
+        self.failures = 0  # Requests that ended in an error status or exception
+        self.total_seconds = 0.0
+        self.waited_seconds = 0.0
+        self.recent: Deque[RequestTiming] = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming, throttled: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.retries += timing.attempts - 1
+            self.throttled += throttled
+            if timing.status is None or timing.status >= 400:
+                self.failures += 1
+            self.total_seconds += timing.seconds
+            self.waited_seconds += timing.waited_seconds
+            self.recent.append(timing)
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters plus latency percentiles over the recent requests"""
+        with self._lock:
+            seconds = sorted(timing.seconds for timing in self.recent)
+            summary = {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "failures": self.failures,
+                "total_seconds": self.total_seconds,
+                "waited_seconds": self.waited_seconds,
+            }
+        if seconds:
+            summary.update(
+                mean_seconds=statistics.fmean(seconds),
+                p50_seconds=seconds[len(seconds) // 2],
+                p95_seconds=seconds[min(int(len(seconds) * 0.95), len(seconds) - 1)],
+                max_seconds=seconds[-1],
+            )
+        return summary
+
+    def describe(self) -> str:
+        summary = self.summary()
+        text = (
+            f"{summary['requests']} requests, {summary['retries']} retries, "
+            f"{summary['throttled']} throttled"
+        )
+        if "mean_seconds" in summary:
+            text += (
+                f", mean {summary['mean_seconds'] * 1000:.0f} ms, "
+                f"p95 {summary['p95_seconds'] * 1000:.0f} ms"
+            )
+        return text
+
+
+class HttpTransport(requests.Session):
+    """
+    Session shared by all requests to one service
+
+    Keeps connections alive in a pool sized for the concurrent fetchers,
+    asks for gzip-compressed bodies, paces requests through a shared token
+    bucket and retries throttled, failed or dropped requests with capped
+    exponential backoff and full jitter. A Retry-After header replaces the
+    backoff and, for 429s, pauses every request sharing the rate limiter.
+    As a Session it can be handed to client libraries directly.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        max_delay: float = 60.0,
+        rate_limiter: Optional[TokenBucket] = None,
+        timeout: Any = (10, 120),
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self.headers["Accept-Encoding"] = "gzip, deflate"
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_delay = max_delay
+        self.rate_limiter = rate_limiter or TokenBucket(sleep=sleep)
+        self.timeout = timeout
+        self.metrics = TransportMetrics()
+        self._sleep = sleep
+        self._random = random.Random()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying it until it succeeds or retries run out"""
+        kwargs.setdefault("timeout", self.timeout)
+        resend_safe = method.upper() in IDEMPOTENT_METHODS
+        started = time.perf_counter()
+        waited = 0.0
+        throttled = 0
+        attempt = 0
+
+        while True:
+            waited += self.rate_limiter.acquire()
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not resend_safe or attempt >= self.max_retries:
+                    self._record(method, url, None, started, attempt, waited, throttled)
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"{method} {url} failed ({e}), retry {attempt + 1} in {delay:.1f}s"
+                )
+            else:
+                status = response.status_code
+                # A 429 was not processed, so any method may be resent
+                retryable = status == 429 or (status in RETRY_STATUSES and resend_safe)
+                if not retryable or attempt >= self.max_retries:
+                    self._record(
+                        method, url, status, started, attempt, waited, throttled
+                    )
+                    return response
+
+                retry_after = self._retry_after(response)
+                delay = self._backoff(attempt) if retry_after is None else retry_after
+                if status == 429:
+                    throttled += 1
+                    self.rate_limiter.pause(delay)
+                logger.warning(
+                    f"{method} {url} returned {status}, "
+                    f"retry {attempt + 1} in {delay:.1f}s"
+                )
+                response.close()
+
+            attempt += 1
+            self._sleep(delay)
+            waited += delay
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay before a retry"""
+        ceiling = min(self.max_delay, self.backoff_base * 2**attempt)
+        return self._random.uniform(0, ceiling)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds the server asked us to wait, capped at max_delay"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(seconds, 0.0), self.max_delay)
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int],
+        started: float,
+        retries: int,
+        waited: float,
+        throttled: int,
+    ) -> None:
+        self.metrics.record(
+            RequestTiming(
+                method=method.upper(),
+                url=url,
+                status=status,
+                seconds=time.perf_counter() - started,
+                attempts=retries + 1,
+                waited_seconds=waited,
+            ),
+            throttled,
+        )
@@ -0,0 +1,69 @@
+"""Local issue snapshots for incremental Jira synchronisation"""
+
+import logging
+import pickle
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..domain.entities import Issue, Sprint
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IssueSnapshot:
+    """Issues and sprints of one JQL query, as of the last sync"""
+
+    jql: str
+    issues: Dict[str, Issue] = field(default_factory=dict)  # By key, search order
+    sprints: Dict[str, Sprint] = field(default_factory=dict)  # By name
+    # Start of the last sync (UTC); the next sync fetches issues updated since
+    high_water_mark: Optional[datetime] = None
+    # Last time deleted issues were reconciled against the full key list (UTC)
+    last_reconciled: Optional[datetime] = None
+
+    def issue_list(self) -> List[Issue]:
+        return list(self.issues.values())
+
+    def sprint_list(self) -> List[Sprint]:
+        """Sprints in chronological order, as extracted from full fetches"""
+        return sorted(self.sprints.values(), key=lambda s: s.start_date or datetime.min)
+
+
+class IssueSnapshotStore:
+    """Issue snapshots stored as one pickle file per key"""
+
+    def __init__(self, snapshot_dir: Optional[Path] = None):
+        if snapshot_dir is None:
+            snapshot_dir = Path.home() / ".sprint-radar" / "snapshots"
+        self.snapshot_dir = Path(snapshot_dir)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+        return self.snapshot_dir / f"{safe_key}.snapshot"
+
+    def load(self, key: str) -> Optional[IssueSnapshot]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.error(f"Error loading issue snapshot {key}: {e}")
+            return None
+
+    def save(self, key: str, snapshot: IssueSnapshot) -> None:
+        path = self._path(key)
+        # Write then rename so a crash never leaves a truncated snapshot
+        temporary = path.with_suffix(".tmp")
+        with open(temporary, "wb") as f:
+            pickle.dump(snapshot, f)
+        temporary.replace(path)
+
+    def clear(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
@@ -1,10 +1,13 @@
 """Jira API data source implementation"""
 
+import hashlib
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-import requests
 from atlassian import Jira
 from requests.auth import HTTPBasicAuth
 
@@ -12,9 +15,15 @@ from ..domain.entities import Issue, Sprint
 from ..domain.exceptions import ProcessingError
 from .cache import APICache
 from .config import JiraConfig
+from .http_transport import DEFAULT_POOL_SIZE, HttpTransport, TokenBucket
+from .issue_snapshot import IssueSnapshot, IssueSnapshotStore
+from .jira_field_plan import JiraFieldPlan, requirements_for_reports
 
 logger = logging.getLogger(__name__)
 
+# Overlap of consecutive delta queries, covering clock skew with the server
+SYNC_OVERLAP = timedelta(minutes=5)
+
 
 class JiraApiDataSource:
     """
@@ -25,7 +34,10 @@ class JiraApiDataSource:
     """
 
     def __init__(
-        self, config: Optional[JiraConfig] = None, cache_ttl_hours: float = 1.0
+        self,
+        config: Optional[JiraConfig] = None,
+        cache_ttl_hours: float = 1.0,
+        snapshot_store: Optional[IssueSnapshotStore] = None,
     ):
         """
         Initialize Jira API connection.
@@ -33,12 +45,22 @@ class JiraApiDataSource:
         Args:
             config: JiraConfig object. If None, will load from environment.
             cache_ttl_hours: Cache time-to-live in hours. Default is 1 hour.
+            snapshot_store: Issue snapshots for incremental sync. Defaults to
+                ~/.sprint-radar/snapshots/ when config.incremental_sync is set.
         """
         self.config = config or JiraConfig.from_env()
         self.config.validate()
 
         # Determine if this is a cloud instance
         self.is_cloud = "atlassian.net" in self.config.url
+        if self.is_cloud and self.config.fetch_concurrency > 1:
+            logger.warning(
+                "Concurrent page fetching needs the offset search, which Jira "
+                "Cloud has deprecated; fetching pages one at a time"
+            )
+
+        # One pooled, retrying, rate-limited session for every request
+        self.transport = self._create_transport()
 
         # Initialize Jira client
         self.jira = Jira(
@@ -46,14 +68,26 @@ class JiraApiDataSource:
             username=self.config.username,
             password=self.config.api_token,
             cloud=self.is_cloud,
+            session=self.transport,
         )
 
         # Cache for field metadata
         self._field_map: Optional[Dict[str, str]] = None
         self._custom_field_map: Optional[Dict[str, str]] = None
 
+        # Data the enabled reports need; None requests every field
+        self._field_requirements = (
+            None
+            if self.config.fetch_all_fields
+            else requirements_for_reports(self.config.report_types)
+        )
+        self._field_plan: Optional[JiraFieldPlan] = None
+
         # Initialize API cache
         self.cache = APICache(ttl_hours=cache_ttl_hours)
+        if snapshot_store is None and self.config.incremental_sync:
+            snapshot_store = IssueSnapshotStore()
+        self.snapshot_store = snapshot_store
 
         # Store project info
         self._project_info: Optional[Dict[str, str]] = None
@@ -72,7 +106,8 @@ class JiraApiDataSource:
             Tuple of (issues, sprints)
         """
         try:
-            import hashlib
+            if self.config.incremental_sync:
+                return self._parse_incremental()
 
             # Check if we should use dual-query approach
             if self.config.history_jql:
@@ -80,11 +115,16 @@ class JiraApiDataSource:
                     "Using dual-query approach (separate history and forecast JQLs)"
                 )
 
+                if self.config.union_fetch:
+                    return self._parse_union(
+                        self._build_forecast_jql(), self._build_history_jql()
+                    )
+
                 # Fetch forecast items (backlog to predict)
                 forecast_jql = self._build_forecast_jql()
                 logger.info(f"Fetching forecast items with JQL: {forecast_jql}")
 
-                forecast_hash = hashlib.sha256(forecast_jql.encode()).hexdigest()[:16]
+                forecast_hash = self._query_hash(forecast_jql)
                 forecast_cache_key = f"jira_forecast_{self.config.url.replace('https://', '').replace('/', '_')}_{forecast_hash}"
 
                 # Check cache for forecast items
@@ -102,7 +142,7 @@ class JiraApiDataSource:
                 history_jql = self._build_history_jql()
                 logger.info(f"Fetching historical items with JQL: {history_jql}")
 
-                history_hash = hashlib.sha256(history_jql.encode()).hexdigest()[:16]
+                history_hash = self._query_hash(history_jql)
                 history_cache_key = f"jira_history_{self.config.url.replace('https://', '').replace('/', '_')}_{history_hash}"
 
                 # Check cache for historical data
@@ -136,7 +176,7 @@ class JiraApiDataSource:
                 jql = self._build_jql_query()
                 logger.info(f"Fetching issues with JQL: {jql}")
 
-                jql_hash = hashlib.sha256(jql.encode()).hexdigest()[:16]
+                jql_hash = self._query_hash(jql)
                 cache_key = f"jira_issues_{self.config.url.replace('https://', '').replace('/', '_')}_{jql_hash}"
 
                 # Check cache first
@@ -168,6 +208,194 @@ class JiraApiDataSource:
                 logger.error(f"Jira API error: {e}")
             raise ProcessingError(f"Failed to fetch data from Jira: {e}")
 
+    def _parse_union(
+        self, forecast_jql: str, history_jql: str
+    ) -> Tuple[List[Issue], List[Sprint]]:
+        """
+        Forecast issues and history sprints from one fetch of both queries.
+
+        Issues matching either JQL are fetched once, and key-only searches of
+        each JQL split them into the forecast and history views, so issues in
+        both are downloaded and cached a single time.
+        """
+        union_jql = self._union_jql(forecast_jql, history_jql)
+        host = self.config.url.replace("https://", "").replace("/", "_")
+        cache_key = f"jira_union_{host}_{self._query_hash(union_jql)}"
+
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached forecast and history data")
+        else:
+            logger.info(f"Cache miss, fetching union of both JQLs: {union_jql}")
+            issues = self._fetch_all_issues(union_jql)
+            forecast_keys = self._fetch_issue_keys(forecast_jql)
+            history_keys = self._fetch_issue_keys(history_jql)
+            history_issues = [issue for issue in issues if issue.key in history_keys]
+            sprints = self._extract_sprints(history_issues)
+            logger.info(
+                f"Fetched {len(issues)} issues once for {len(forecast_keys)} "
+                f"forecast and {len(history_keys)} historical items, "
+                f"{len(sprints)} sprints"
+            )
+            cached = {
+                "issues": issues,
+                "forecast_keys": forecast_keys,
+                "history_keys": history_keys,
+                "sprints": sprints,
+            }
+            self.cache.set(cache_key, cached)
+
+        forecast_issues = [
+            issue for issue in cached["issues"] if issue.key in cached["forecast_keys"]
+        ]
+        return forecast_issues, cached["sprints"]
+
+    def _parse_incremental(self) -> Tuple[List[Issue], List[Sprint]]:
+        """Issues and sprints from snapshots refreshed with deltas"""
+        if self.config.history_jql:
+            forecast = self._sync_snapshot(self._build_forecast_jql())
+            history = self._sync_snapshot(self._build_history_jql())
+            return forecast.issue_list(), history.sprint_list()
+
+        snapshot = self._sync_snapshot(self._build_jql_query())
+        return snapshot.issue_list(), snapshot.sprint_list()
+
+    def _sync_snapshot(self, jql: str) -> IssueSnapshot:
+        """
+        Bring the local snapshot of a JQL query up to date.
+
+        The first sync fetches every issue. Later syncs fetch only issues
+        updated since the previous sync started (plus SYNC_OVERLAP) and merge
+        them by key. The delta only sees issues that still match the JQL, so
+        issues that were deleted, or changed so they no longer match (e.g.
+        became Done), are dropped by a key-only reconciliation after each
+        delta, or every config.reconcile_hours if that is set. Only the
+        sprints of added, changed or removed issues are recomputed.
+        """
+        key = self._snapshot_key(jql)
+        snapshot = self.snapshot_store.load(key)
+        if snapshot is None or snapshot.jql != jql:
+            snapshot = IssueSnapshot(jql=jql)
+        sync_started = datetime.now(timezone.utc)
+        touched_sprints = set()
+        reconcile_due = False
+
+        if snapshot.high_water_mark is None:
+            logger.info(f"Initial sync, fetching all issues for: {jql}")
+            changed = self._fetch_all_issues(jql)
+            snapshot.issues = {}
+            snapshot.sprints = {}
+            snapshot.last_reconciled = sync_started
+        else:
+            # Relative JQL dates avoid the Jira user's time zone
+            minutes = math.ceil(
+                (sync_started - snapshot.high_water_mark + SYNC_OVERLAP).total_seconds()
+                / 60
+            )
+            changed = self._fetch_all_issues(
+                self._jql_with_condition(jql, f"updated >= -{minutes}m")
+            )
+            logger.info(f"Delta sync: {len(changed)} issues updated in {minutes}m")
+            reconcile_due = snapshot.last_reconciled is None or (
+                sync_started - snapshot.last_reconciled
+                >= timedelta(hours=self.config.reconcile_hours)
+            )
+
+        for issue in changed:
+            previous = snapshot.issues.get(issue.key)
+            if previous is not None:
+                touched_sprints.add(previous.custom_fields.get("sprint"))
+            touched_sprints.add(issue.custom_fields.get("sprint"))
+            snapshot.issues[issue.key] = issue
+
+        if reconcile_due:
+            current_keys = self._fetch_issue_keys(jql)
+            removed = [k for k in snapshot.issues if k not in current_keys]
+            for issue_key in removed:
+                issue = snapshot.issues.pop(issue_key)
+                touched_sprints.add(issue.custom_fields.get("sprint"))
+            snapshot.last_reconciled = sync_started
+            logger.info(f"Reconciled keys: {len(removed)} issues removed")
+
+        touched_sprints.discard(None)
+        if touched_sprints:
+            self._recompute_sprints(snapshot, touched_sprints)
+
+        snapshot.high_water_mark = sync_started
+        self.snapshot_store.save(key, snapshot)
+        return snapshot
+
+    def _recompute_sprints(self, snapshot: IssueSnapshot, sprint_names: Set[str]):
+        """Rebuild the named sprints of a snapshot from its issues"""
+        for name in sprint_names:
+            snapshot.sprints.pop(name, None)
+        sprint_issues = [
+            issue
+            for issue in snapshot.issues.values()
+            if issue.custom_fields.get("sprint") in sprint_names
+        ]
+        for sprint in self._extract_sprints(sprint_issues):
+            snapshot.sprints[sprint.name] = sprint
+        logger.info(f"Recomputed {len(sprint_names)} touched sprints")
+
+    def _snapshot_key(self, jql: str) -> str:
+        host = self.config.url.replace("https://", "").replace("/", "_")
+        return f"jira_snapshot_{host}_{self._query_hash(jql)}"
+
+    def _query_hash(self, jql: str) -> str:
+        """Hash of a JQL and the data requested for it, for cache keys"""
+        if self._field_requirements is None:
+            fetched = "*all"
+        else:
+            fetched = ",".join(sorted(r.value for r in self._field_requirements))
+        return hashlib.sha256(f"{jql}|{fetched}".encode()).hexdigest()[:16]
+
+    @property
+    def field_plan(self) -> JiraFieldPlan:
+        """Fields and expand options requested by every issue search"""
+        if self._field_plan is None:
+            if self._field_requirements is None:
+                self._field_plan = JiraFieldPlan.everything()
+            else:
+                if not self._field_map:
+                    self._initialize_field_mapping()
+                self._field_plan = JiraFieldPlan.for_requirements(
+                    self._field_requirements, self._custom_field_map
+                )
+                logger.info(
+                    f"Fetching {len(self._field_plan.fields)} planned fields: "
+                    f"{self._field_plan.fields_param}"
+                )
+        return self._field_plan
+
+    @staticmethod
+    def _split_order_by(jql: str) -> Tuple[str, Optional[str]]:
+        """Split a JQL query into its filter and its ORDER BY clause, if any"""
+        parts = re.split(
+            r"(?:^|\s+)order\s+by\s+", jql, maxsplit=1, flags=re.IGNORECASE
+        )
+        return parts[0].strip(), parts[1] if len(parts) > 1 else None
+
+    @classmethod
+    def _jql_with_condition(cls, jql: str, condition: str) -> str:
+        """Add a condition to a JQL query, keeping its ORDER BY clause last"""
+        query, order_by = cls._split_order_by(jql)
+        query = f"({query}) AND {condition}" if query else condition
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        return query
+
+    @classmethod
+    def _union_jql(cls, forecast_jql: str, history_jql: str) -> str:
+        """JQL matching either query, in the order of the forecast query"""
+        forecast, order_by = cls._split_order_by(forecast_jql)
+        history, _ = cls._split_order_by(history_jql)
+        # A query without a filter already matches everything
+        query = f"({forecast}) OR ({history})" if forecast and history else ""
+        if order_by:
+            query = f"{query} ORDER BY {order_by}".strip()
+        return query
+
     def _build_jql_query(self) -> str:
         """Build JQL query based on configuration"""
         if self.config.jql_filter:
@@ -219,6 +447,12 @@ class JiraApiDataSource:
         if not self._field_map:
             self._initialize_field_mapping()
 
+        # Cloud has deprecated the offset search the concurrent pages need
+        if self.config.fetch_concurrency > 1 and not self.is_cloud:
+            return self._fetch_all_issues_concurrent(jql)
+
+        plan = self.field_plan
+
         if self.is_cloud:
             # Use token-based pagination for Jira Cloud
             logger.info("Using token-based pagination for Jira Cloud")
@@ -236,7 +470,11 @@ class JiraApiDataSource:
                 try:
                     # The jql method should work with start parameter
                     result = self.jira.jql(
-                        jql, start=start, limit=100, expand="changelog"
+                        jql,
+                        fields=plan.fields_param,
+                        start=start,
+                        limit=100,
+                        expand=plan.expand,
                     )
                 except ValueError as e:
                     if "deprecated" in str(e) and page_num == 1:
@@ -244,7 +482,9 @@ class JiraApiDataSource:
                         logger.info(
                             "JQL deprecated, trying enhanced_jql for first batch"
                         )
-                        result = self.jira.enhanced_jql(jql)
+                        result = self.jira.enhanced_jql(
+                            jql, fields=plan.fields_param, expand=plan.expand
+                        )
                         batch_issues = result.get("issues", [])
                         if batch_issues:
                             issues.extend(self._parse_issues(batch_issues))
@@ -298,7 +538,11 @@ class JiraApiDataSource:
 
             while True:
                 result = self.jira.jql(
-                    jql, start=start, limit=limit, expand="changelog"
+                    jql,
+                    fields=plan.fields_param,
+                    start=start,
+                    limit=limit,
+                    expand=plan.expand,
                 )
 
                 batch_issues = result.get("issues", [])
@@ -325,12 +569,11 @@ class JiraApiDataSource:
         Used when the atlassian-python-api methods fail.
         """
         logger.info("Using direct REST API for pagination")
+        plan = self.field_plan
         all_issues = []
         start_at = 0
         max_results = 100
 
-        auth = HTTPBasicAuth(self.config.username, self.config.api_token)
-        headers = {"Accept": "application/json", "Content-Type": "application/json"}
         base_url = f"{self.config.url}/rest/api/2"
 
         while True:
@@ -339,14 +582,15 @@ class JiraApiDataSource:
                 "jql": jql,
                 "startAt": start_at,
                 "maxResults": max_results,
-                "expand": "changelog",
-                "fields": "*all",
+                "fields": plan.fields_param,
             }
+            if plan.expand:
+                params["expand"] = plan.expand
 
             logger.info(f"REST API: Fetching issues at offset {start_at}")
 
             try:
-                response = requests.get(url, auth=auth, headers=headers, params=params)
+                response = self.transport.get(url, params=params)
                 response.raise_for_status()
 
                 data = response.json()
@@ -375,6 +619,135 @@ class JiraApiDataSource:
 
         return all_issues
 
+    def _fetch_all_issues_concurrent(self, jql: str) -> List[Issue]:
+        """
+        Fetch all issues with offset pages downloaded in parallel.
+
+        Pages are parsed in order as they arrive, while later pages are still
+        downloading.
+        """
+        issues = []
+        plan = self.field_plan
+        for page in self._search_pages(
+            jql, fields=plan.fields_param, expand=plan.expand
+        ):
+            issues.extend(self._parse_issues(page.get("issues", [])))
+
+        logger.info(f"REST API: Fetched {len(issues)} issues")
+        return issues
+
+    def _fetch_issue_keys(self, jql: str) -> Set[str]:
+        """Keys of all issues matching the JQL, without fields or changelogs"""
+        if self.is_cloud:
+            return self._fetch_issue_keys_cloud(jql)
+        return {
+            raw_issue["key"]
+            for page in self._search_pages(
+                jql, max_results=1000, fields="key", expand=None
+            )
+            for raw_issue in page.get("issues", [])
+        }
+
+    def _fetch_issue_keys_cloud(self, jql: str) -> Set[str]:
+        """
+        Keys of all issues matching the JQL on Jira Cloud.
+
+        The offset search is deprecated on Cloud, so keys are paged through
+        the enhanced search with its next page tokens.
+        """
+        keys = set()
+        next_page_token = None
+        while True:
+            result = self.jira.enhanced_jql(
+                jql, fields="key", nextPageToken=next_page_token, limit=1000
+            )
+            keys.update(raw_issue["key"] for raw_issue in result.get("issues", []))
+            next_page_token = result.get("nextPageToken")
+            if result.get("isLast") or not next_page_token:
+                break
+        return keys
+
+    def _search_pages(
+        self,
+        jql: str,
+        fields: str,
+        expand: Optional[str],
+        max_results: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the offset pages of a REST search in order.
+
+        The first page gives the total, then the remaining offsets are fetched
+        by up to config.fetch_concurrency workers sharing the transport.
+        """
+        first_page = self._fetch_search_page(jql, 0, max_results, fields, expand)
+        yield first_page
+
+        total = first_page.get("total", 0)
+        # The server may cap maxResults below the requested page size
+        page_size = first_page.get("maxResults") or max_results
+        offsets = range(page_size, total, page_size)
+        logger.info(
+            f"REST API: {total} issues, fetching {len(offsets)} more pages "
+            f"with {self.config.fetch_concurrency} workers"
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=self.config.fetch_concurrency,
+            thread_name_prefix="jira-page",
+        )
+        try:
+            yield from executor.map(
+                lambda start: self._fetch_search_page(
+                    jql, start, page_size, fields, expand
+                ),
+                offsets,
+            )
+        finally:
+            # Do not wait for pages nobody will read after a failure
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"REST API: {self.transport.metrics.describe()}")
+
+    def _fetch_search_page(
+        self,
+        jql: str,
+        start_at: int,
+        max_results: int,
+        fields: str,
+        expand: Optional[str],
+    ) -> Dict[str, Any]:
+        """Fetch one offset page of a JQL search via the REST API"""
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": fields,
+        }
+        if expand:
+            params["expand"] = expand
+        try:
+            response = self.transport.get(
+                f"{self.config.url}/rest/api/2/search", params=params
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error(f"REST API error at offset {start_at}: {e}")
+            raise ProcessingError(f"Failed to fetch issues via REST API: {e}")
+
+    def _create_transport(self) -> HttpTransport:
+        """Authenticated transport whose pool fits the concurrent page workers"""
+        rate = self.config.requests_per_second
+        transport = HttpTransport(
+            pool_size=max(self.config.fetch_concurrency, DEFAULT_POOL_SIZE),
+            max_retries=self.config.max_retries,
+            rate_limiter=TokenBucket(rate) if rate else None,
+        )
+        transport.auth = HTTPBasicAuth(self.config.username, self.config.api_token)
+        transport.headers.update(
+            {"Accept": "application/json", "Content-Type": "application/json"}
+        )
+        return transport
+
     def _initialize_field_mapping(self):
         """Initialize field ID mapping for custom fields"""
         try:
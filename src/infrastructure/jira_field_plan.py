@@ -0,0 +1,108 @@
+"""Minimal Jira field lists for the reports a run produces"""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from ..domain.reporting_capabilities import (
+    REPORT_REQUIREMENTS,
+    DataRequirement,
+    ReportType,
+)
+
+# Reports every run produces, whatever else is enabled
+CORE_REPORTS = frozenset(
+    {
+        ReportType.MONTE_CARLO_FORECAST,
+        ReportType.VELOCITY_TREND,
+        ReportType.STORY_SIZE_BREAKDOWN,
+    }
+)
+
+# Fields every parsed Issue and sprint extraction reads
+BASE_FIELDS = ("summary", "issuetype", "status", "created", "updated", "resolutiondate")
+
+# Jira system fields behind each data requirement
+SYSTEM_FIELDS: Dict[DataRequirement, Tuple[str, ...]] = {
+    DataRequirement.STATUS: ("status",),
+    DataRequirement.CREATED_DATE: ("created",),
+    DataRequirement.RESOLVED_DATE: ("resolutiondate",),
+    DataRequirement.UPDATED_DATE: ("updated",),
+    DataRequirement.TIME_ESTIMATE: ("timeoriginalestimate",),
+    DataRequirement.TIME_SPENT: ("timespent",),
+    DataRequirement.ASSIGNEE: ("assignee",),
+    DataRequirement.LABELS: ("labels",),
+    DataRequirement.BLOCKED_STATUS: ("status", "labels"),
+    DataRequirement.ISSUE_TYPE: ("issuetype",),
+}
+
+# Custom fields, by their _custom_field_map name, behind each data requirement
+CUSTOM_FIELDS: Dict[DataRequirement, Tuple[str, ...]] = {
+    DataRequirement.STORY_POINTS: ("story_points",),
+    DataRequirement.SPRINT: ("sprint",),
+    DataRequirement.SPRINT_DATES: ("sprint",),
+}
+
+# Epic links are always fetched for epic rollup forecasts
+ALWAYS_CUSTOM_FIELDS = ("epic_link",)
+
+
+@dataclass(frozen=True)
+class JiraFieldPlan:
+    """Fields and expand options requested by every issue search"""
+
+    fields: Tuple[str, ...]
+    expand: Optional[str] = None
+
+    @property
+    def fields_param(self) -> str:
+        return ",".join(self.fields)
+
+    @classmethod
+    def everything(cls) -> "JiraFieldPlan":
+        """All fields with changelogs, as requested before field planning"""
+        return cls(fields=("*all",), expand="changelog")
+
+    @classmethod
+    def for_requirements(
+        cls,
+        requirements: Iterable[DataRequirement],
+        custom_field_map: Optional[Dict[str, str]] = None,
+    ) -> "JiraFieldPlan":
+        """
+        Smallest field list covering the requirements
+
+        Custom fields are resolved to their IDs through the custom field map;
+        ones the instance does not have are left out. No report reads the
+        changelog, so it is never expanded.
+        """
+        custom_field_map = custom_field_map or {}
+        requirements = set(requirements)
+
+        fields = list(BASE_FIELDS)
+        custom_names = list(ALWAYS_CUSTOM_FIELDS)
+        for requirement in sorted(requirements, key=lambda r: r.value):
+            fields.extend(SYSTEM_FIELDS.get(requirement, ()))
+            custom_names.extend(CUSTOM_FIELDS.get(requirement, ()))
+        fields.extend(
+            custom_field_map[name] for name in custom_names if name in custom_field_map
+        )
+        return cls(fields=tuple(dict.fromkeys(fields)))
+
+
+def requirements_for_reports(
+    report_types: Optional[Iterable[ReportType]] = None,
+) -> FrozenSet[DataRequirement]:
+    """
+    Data requirements of the enabled reports plus the core reports
+
+    All reports are enabled by default.
+    """
+    enabled = set(ReportType if report_types is None else report_types)
+    enabled |= CORE_REPORTS
+
+    requirements = {DataRequirement.STORY_POINTS}  # Story size breakdown
+    for report_type in enabled:
+        capability = REPORT_REQUIREMENTS.get(report_type)
+        if capability is not None:
+            requirements |= capability.required_fields | capability.optional_fields
+    return frozenset(requirements)
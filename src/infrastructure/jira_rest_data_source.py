@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from ..domain.data_sources import DataSource, DataSourceInfo, DataSourceType
 from ..domain.entities import Issue, Sprint
 from ..domain.value_objects import FieldMapping
+from .http_transport import HttpTransport
 
 logger = logging.getLogger(__name__)
 
@@ -147,10 +148,8 @@ class JiraRESTDataSource(DataSource):
 
     # Private helper methods
     def _init_session(self):
-        """Initialize HTTP session with authentication"""
-        import requests
-
-        self._session = requests.Session()
+        """Initialize the pooled, retrying HTTP transport with authentication"""
+        self._session = HttpTransport()
         self._session.headers.update(
             {
                 "Authorization": f"Bearer {self.auth_token}",
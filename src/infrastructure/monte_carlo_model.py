@@ -2,11 +2,14 @@
 
 import logging
 import random
-import statistics
+from dataclasses import fields, replace
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..domain.forecasting import (
+    CompletionProbability,
     ForecastingModel,
     ForecastResult,
     ModelConfiguration,
@@ -14,9 +17,38 @@ from ..domain.forecasting import (
     ModelType,
     MonteCarloConfiguration,
     MonteCarloConfigurationWithScenario,
+    PortfolioForecast,
     PredictionInterval,
+    RandomSampling,
+    SimulationEngine,
+    VelocitySampling,
 )
 from ..domain.value_objects import VelocityMetrics
+from .delivered_work_paths import (
+    PATHS_SPAWN_KEY,
+    DeliveredWorkPaths,
+    retained_trials,
+)
+from .forecast_outcomes import ArrayForecastOutcomes
+from .sharded_simulation import (
+    AdaptiveSimulationResult,
+    run_adaptive_simulation,
+    run_sharded_cut_line_simulation,
+    run_sharded_gaussian_grid_simulation,
+    run_sharded_path_simulation,
+    run_sharded_portfolio_simulation,
+    run_sharded_scenario_simulation,
+    run_sharded_simulation,
+)
+from .simulation_accumulator import SimulationAccumulator
+from .vectorized_simulation import MAX_SIMULATED_SPRINTS
+from .velocity_samplers import (
+    AntitheticVelocitySampler,
+    BootstrapVelocitySampler,
+    GaussianVelocitySampler,
+    SobolVelocitySampler,
+    VelocitySampler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +64,318 @@ class MonteCarloModel(ForecastingModel):
     ) -> ForecastResult:
         """Run Monte Carlo simulation to forecast completion"""
 
+        mc_config = self._prepare_config(config)
+        bootstrap = self._check_bootstrap(velocity_metrics, mc_config)
+
+        # Run simulations, retaining delivered-work paths of their own draws
+        adaptive_metadata = {}
+        delivered_work = None
+        if mc_config.precision_target is not None:
+            adaptive_result = self._run_adaptive_simulations(
+                remaining_work, velocity_metrics, mc_config
+            )
+            accumulator = adaptive_result.accumulator
+            delivered_work = adaptive_result.delivered_work
+            adaptive_metadata = {
+                "adaptive": True,
+                "precision_target": mc_config.precision_target,
+                "percentile_standard_errors": adaptive_result.standard_errors,
+                "converged": adaptive_result.converged,
+            }
+        elif mc_config.retained_path_sprints is not None:
+            accumulator, delivered_work = self._run_path_simulations(
+                remaining_work, velocity_metrics, mc_config
+            )
+        else:
+            accumulator = self._run_simulations(
+                remaining_work, velocity_metrics, mc_config
+            )
+
+        result = self._build_result(
+            accumulator, velocity_metrics, mc_config, bootstrap, adaptive_metadata
+        )
+        result.delivered_work = delivered_work
+        return result
+
+    def forecast_scenarios(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        configs: List[ModelConfiguration],
+    ) -> List[ForecastResult]:
+        """
+        Forecast several scenarios on common random numbers
+
+        When the configurations differ only in their velocity scenario, every
+        scenario is applied to one shared set of simulated base-velocity
+        paths, and sample_predictions[i] of each result comes from the same
+        path. Other combinations run as independent forecasts.
+        """
+        mc_configs = [self._prepare_config(config) for config in configs]
+        if not self._can_share_paths(mc_configs):
+            return super().forecast_scenarios(remaining_work, velocity_metrics, configs)
+
+        base_config = mc_configs[0]
+        bootstrap = self._check_bootstrap(velocity_metrics, base_config)
+        scenario_factors = [
+            self._compile_sprint_factors(config) for config in mc_configs
+        ]
+        accumulators = run_sharded_scenario_simulation(
+            remaining_work,
+            self._build_sampler(velocity_metrics, base_config),
+            base_config.num_simulations,
+            [
+                None if factors is None else np.asarray(factors)
+                for factors in scenario_factors
+            ],
+            random_seed=base_config.random_seed,
+            num_workers=base_config.num_workers,
+        )
+        return [
+            self._build_result(
+                accumulator,
+                velocity_metrics,
+                config,
+                bootstrap,
+                {"common_random_numbers": True},
+            )
+            for accumulator, config in zip(accumulators, mc_configs)
+        ]
+
+    def forecast_cut_lines(
+        self,
+        cumulative_work: Sequence[float],
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> List[ForecastResult]:
+        """
+        Forecast every cut line of a ranked backlog in one simulation
+
+        The velocity paths are simulated once, up to the last cut line, and
+        every cut line is read off the same paths, so a 500-item backlog costs
+        about as much as forecasting the whole backlog. This always uses the
+        vectorized engine with the configured number of simulations; the
+        results carry histograms but no sample_predictions.
+        """
+        mc_config = replace(
+            self._prepare_config(config), engine=SimulationEngine.VECTORIZED
+        )
+        bootstrap = self._check_bootstrap(velocity_metrics, mc_config)
+        if mc_config.precision_target is not None:
+            logger.warning(
+                "Adaptive precision is not supported for cut line forecasts; "
+                f"running {mc_config.num_simulations} simulations"
+            )
+
+        sprint_factors = self._compile_sprint_factors(mc_config)
+        accumulators = run_sharded_cut_line_simulation(
+            cumulative_work,
+            self._build_sampler(velocity_metrics, mc_config),
+            mc_config.num_simulations,
+            random_seed=mc_config.random_seed,
+            sprint_factors=(
+                None if sprint_factors is None else np.asarray(sprint_factors)
+            ),
+            num_workers=mc_config.num_workers,
+        )
+        return [
+            self._build_result(
+                accumulator,
+                velocity_metrics,
+                mc_config,
+                bootstrap,
+                {"cut_line": float(work), "common_random_numbers": True},
+            )
+            for accumulator, work in zip(accumulators, cumulative_work)
+        ]
+
+    def forecast_velocity_grid(
+        self,
+        remaining_work: float,
+        velocity_grid: List[VelocityMetrics],
+        config: ModelConfiguration,
+    ) -> List[ForecastResult]:
+        """
+        Forecast a grid of velocity assumptions on shared normal draws
+
+        With Gaussian pseudo-random sampling and no scenario, each grid point
+        is an affine transform of the same standard normal draws, and all
+        points are simulated in one batched pass with the vectorized engine.
+        Other configurations run as independent forecasts.
+        """
+        mc_config = replace(
+            self._prepare_config(config), engine=SimulationEngine.VECTORIZED
+        )
+        batched = (
+            mc_config.velocity_sampling == VelocitySampling.GAUSSIAN
+            and mc_config.random_sampling == RandomSampling.PSEUDO_RANDOM
+            and mc_config.precision_target is None
+            and self._compile_sprint_factors(mc_config) is None
+        )
+        if not batched:
+            return super().forecast_velocity_grid(remaining_work, velocity_grid, config)
+
+        samplers = [
+            self._build_sampler(velocity_metrics, mc_config)
+            for velocity_metrics in velocity_grid
+        ]
+        accumulators = run_sharded_gaussian_grid_simulation(
+            remaining_work,
+            [sampler.velocity_mean for sampler in samplers],
+            [sampler.velocity_std_dev for sampler in samplers],
+            mc_config.num_simulations,
+            random_seed=mc_config.random_seed,
+            num_workers=mc_config.num_workers,
+        )
+        return [
+            self._build_result(
+                accumulator,
+                velocity_metrics,
+                mc_config,
+                False,
+                {"common_random_numbers": True},
+            )
+            for accumulator, velocity_metrics in zip(accumulators, velocity_grid)
+        ]
+
+    def forecast_portfolio(
+        self,
+        remaining_work: Sequence[float],
+        velocity_metrics: Sequence[VelocityMetrics],
+        config: ModelConfiguration,
+        correlation: Optional[Sequence[Sequence[float]]] = None,
+    ) -> PortfolioForecast:
+        """
+        Simulate all projects of a portfolio jointly on the vectorized engine
+
+        Every trial simulates every project, with team velocities correlated
+        through the optional correlation matrix, and the portfolio completes
+        with its last project in that trial. Project velocities are Gaussian
+        with pseudo-random draws; a scenario and adaptive precision are not
+        applied.
+        """
+        if len(remaining_work) != len(velocity_metrics):
+            raise ValueError("One velocity per project is required")
+        if not remaining_work:
+            raise ValueError("A portfolio needs at least one project")
+        mc_config = self._prepare_config(config)
+        ignored = [
+            option
+            for option, applies in (
+                (
+                    "bootstrap sampling",
+                    mc_config.velocity_sampling == VelocitySampling.BOOTSTRAP,
+                ),
+                (
+                    f"{mc_config.random_sampling.value} sampling",
+                    mc_config.random_sampling != RandomSampling.PSEUDO_RANDOM,
+                ),
+                ("adaptive precision", mc_config.precision_target is not None),
+                (
+                    "velocity scenario",
+                    self._compile_sprint_factors(mc_config) is not None,
+                ),
+            )
+            if applies
+        ]
+        if ignored:
+            logger.warning(
+                f"Portfolio forecasts ignore {', '.join(ignored)}; using Gaussian "
+                "pseudo-random velocities"
+            )
+        mc_config = replace(
+            mc_config,
+            engine=SimulationEngine.VECTORIZED,
+            velocity_sampling=VelocitySampling.GAUSSIAN,
+            random_sampling=RandomSampling.PSEUDO_RANDOM,
+        )
+
+        samplers = [
+            self._build_sampler(metrics, mc_config) for metrics in velocity_metrics
+        ]
+        means = [sampler.velocity_mean for sampler in samplers]
+        std_devs = [sampler.velocity_std_dev for sampler in samplers]
+        portfolio, projects = run_sharded_portfolio_simulation(
+            [float(work) for work in remaining_work],
+            means,
+            std_devs,
+            mc_config.num_simulations,
+            random_seed=mc_config.random_seed,
+            correlation=correlation,
+            num_workers=mc_config.num_workers,
+        )
+
+        correlated = correlation is not None
+        # Spread of the combined velocity, sqrt(s' C s)
+        combined_variance = np.dot(std_devs, std_devs)
+        if correlated:
+            combined_variance = np.dot(std_devs, np.asarray(correlation) @ std_devs)
+        portfolio_metadata = {
+            "num_projects": len(samplers),
+            "correlated_velocities": correlated,
+            "common_random_numbers": True,
+        }
+        return PortfolioForecast(
+            portfolio=self._build_result(
+                portfolio,
+                velocity_metrics[0],
+                mc_config,
+                False,
+                {
+                    **portfolio_metadata,
+                    "velocity_mean": float(sum(means)),
+                    "velocity_std_dev": float(np.sqrt(combined_variance)),
+                },
+            ),
+            projects=[
+                self._build_result(
+                    accumulator, metrics, mc_config, False, portfolio_metadata
+                )
+                for accumulator, metrics in zip(projects, velocity_metrics)
+            ],
+            correlated=correlated,
+        )
+
+    def completion_evaluator(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+        sprints: int,
+    ) -> CompletionProbability:
+        """
+        Probability of finishing in time, evaluated on one set of paths
+
+        Base-velocity paths are simulated once for the given number of
+        sprints; each evaluation only weights their sprint velocities with
+        the factor table, so trial i sees the same draws in every call. A
+        velocity scenario in the configuration is ignored: the factor table
+        passed to the evaluator replaces it. Paths end at the simulation
+        horizon, as forecasts do, so work left after it counts as unfinished.
+        """
+        mc_config = self._prepare_config(config)
+        self._check_bootstrap(velocity_metrics, mc_config)
+        paths = DeliveredWorkPaths.simulate(
+            self._build_sampler(velocity_metrics, mc_config),
+            mc_config.num_simulations,
+            min(sprints, MAX_SIMULATED_SPRINTS + 1),
+            self._paths_rng(mc_config),
+        )
+
+        def probability(factors: Sequence[float]) -> float:
+            delivered = paths.delivered_with_factors(factors[: paths.horizon_sprints])
+            return float(np.mean(delivered >= remaining_work))
+
+        return probability
+
+    def _paths_rng(self, config: MonteCarloConfiguration) -> np.random.Generator:
+        """Generator of retained paths, on its own stream of the seed"""
+        return np.random.default_rng(
+            np.random.SeedSequence(config.random_seed, spawn_key=(PATHS_SPAWN_KEY,))
+        )
+
+    def _prepare_config(self, config: ModelConfiguration) -> MonteCarloConfiguration:
+        """Convert to a Monte Carlo configuration and validate it"""
         # Ensure we have Monte Carlo specific config
         if not isinstance(config, MonteCarloConfiguration):
             # Convert to Monte Carlo config with defaults
@@ -47,23 +391,65 @@ class MonteCarloModel(ForecastingModel):
         if errors:
             raise ValueError(f"Invalid configuration: {'; '.join(errors)}")
 
-        # Run simulations
-        completion_sprints = self._run_simulations(
-            remaining_work, velocity_metrics, mc_config
-        )
+        return mc_config
 
-        # Calculate prediction intervals
-        prediction_intervals = self._calculate_prediction_intervals(
-            completion_sprints, mc_config.confidence_levels
+    def _check_bootstrap(
+        self, velocity_metrics: VelocityMetrics, config: MonteCarloConfiguration
+    ) -> bool:
+        """Whether bootstrap sampling applies, warning about ignored options"""
+        bootstrap = self._uses_bootstrap(velocity_metrics, config)
+        if config.velocity_sampling == VelocitySampling.BOOTSTRAP and not bootstrap:
+            logger.warning(
+                "Bootstrap sampling requested but no historical velocities "
+                "available; falling back to Gaussian sampling"
+            )
+        if (
+            self._engine(config) == SimulationEngine.LOOP
+            and config.random_sampling != RandomSampling.PSEUDO_RANDOM
+        ):
+            logger.warning(
+                f"{config.random_sampling.value} sampling requires the vectorized "
+                "engine; the loop engine uses pseudo-random draws"
+            )
+        return bootstrap
+
+    def _engine(self, config: MonteCarloConfiguration) -> SimulationEngine:
+        """Engine that runs a forecast; adaptive runs are always vectorized"""
+        if config.precision_target is not None:
+            return SimulationEngine.VECTORIZED
+        return config.engine
+
+    def _can_share_paths(self, configs: List[MonteCarloConfiguration]) -> bool:
+        """Whether configurations differ only in their velocity scenario"""
+        base_fields = [f.name for f in fields(MonteCarloConfiguration)]
+        first = configs[0]
+        return (
+            first.engine == SimulationEngine.VECTORIZED
+            and first.precision_target is None
+            and all(
+                getattr(config, name) == getattr(first, name)
+                for config in configs[1:]
+                for name in base_fields
+            )
         )
 
-        # Calculate probability distribution
-        probability_distribution = self._calculate_probability_distribution(
-            completion_sprints
-        )
+    def _build_result(
+        self,
+        accumulator: SimulationAccumulator,
+        velocity_metrics: VelocityMetrics,
+        mc_config: MonteCarloConfiguration,
+        bootstrap: bool,
+        extra_metadata: dict,
+    ) -> ForecastResult:
+        """Summarise simulated completion sprints as a forecast result"""
+        engine = self._engine(mc_config)
+        prediction_intervals = [
+            PredictionInterval(confidence, *accumulator.prediction_bounds(confidence))
+            for confidence in mc_config.confidence_levels
+        ]
 
         # Calculate expected values
-        expected_sprints = statistics.mean(completion_sprints)
+        expected_sprints = accumulator.mean
         today = datetime.now()
         expected_completion_date = today + timedelta(
             days=int(expected_sprints * mc_config.sprint_duration_days)
@@ -74,17 +460,26 @@ class MonteCarloModel(ForecastingModel):
             prediction_intervals=prediction_intervals,
             expected_sprints=expected_sprints,
             expected_completion_date=expected_completion_date,
-            probability_distribution=probability_distribution,
             model_type=ModelType.MONTE_CARLO,
             model_metadata={
-                "num_simulations": mc_config.num_simulations,
+                "num_simulations": accumulator.total,
                 "velocity_mean": velocity_metrics.average,
                 "velocity_std_dev": velocity_metrics.std_dev,
                 "variance_multiplier": mc_config.variance_multiplier,
+                "engine": engine.value,
+                "velocity_sampling": (
+                    VelocitySampling.BOOTSTRAP.value
+                    if bootstrap
+                    else VelocitySampling.GAUSSIAN.value
+                ),
+                "random_sampling": (
+                    mc_config.random_sampling.value
+                    if engine == SimulationEngine.VECTORIZED
+                    else RandomSampling.PSEUDO_RANDOM.value
+                ),
+                **extra_metadata,
             },
-            sample_predictions=completion_sprints[
-                :1000
-            ],  # Store sample for visualization
+            outcomes=ArrayForecastOutcomes.from_accumulator(accumulator),
         )
 
     def get_model_info(self) -> ModelInfo:
@@ -134,28 +529,197 @@ class MonteCarloModel(ForecastingModel):
         remaining_work: float,
         velocity_metrics: VelocityMetrics,
         config: MonteCarloConfiguration,
-    ) -> List[float]:
-        """Run the Monte Carlo simulations"""
-        completion_sprints = []
+    ) -> SimulationAccumulator:
+        """Run the Monte Carlo simulations with the configured engine"""
+        if config.engine == SimulationEngine.VECTORIZED:
+            return self._run_vectorized_simulations(
+                remaining_work, velocity_metrics, config
+            )
+        return self._run_loop_simulations(remaining_work, velocity_metrics, config)
+
+    def _run_path_simulations(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: MonteCarloConfiguration,
+    ) -> Tuple[SimulationAccumulator, DeliveredWorkPaths]:
+        """Run the simulations, retaining the delivered work of leading trials"""
+        sprint_factors = self._compile_sprint_factors(config)
+        sprint_factors = None if sprint_factors is None else np.asarray(sprint_factors)
+        sampler = self._build_sampler(velocity_metrics, config)
+        if config.engine == SimulationEngine.VECTORIZED:
+            return run_sharded_path_simulation(
+                remaining_work,
+                sampler,
+                config.num_simulations,
+                config.retained_path_sprints,
+                random_seed=config.random_seed,
+                sprint_factors=sprint_factors,
+                num_workers=config.num_workers,
+            )
+
+        partial_paths = np.full(
+            (
+                retained_trials(config.num_simulations, config.retained_path_sprints),
+                config.retained_path_sprints,
+            ),
+            np.nan,
+            dtype=np.float32,
+        )
+        accumulator = self._run_loop_simulations(
+            remaining_work, velocity_metrics, config, retained=partial_paths
+        )
+        paths = DeliveredWorkPaths.complete(
+            partial_paths, sampler, self._paths_rng(config), sprint_factors
+        )
+        return accumulator, paths
+
+    def _run_vectorized_simulations(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: MonteCarloConfiguration,
+    ) -> SimulationAccumulator:
+        """Run the simulations as seeded NumPy shards, optionally in parallel"""
+        sprint_factors = self._compile_sprint_factors(config)
+
+        return run_sharded_simulation(
+            remaining_work,
+            self._build_sampler(velocity_metrics, config),
+            config.num_simulations,
+            random_seed=config.random_seed,
+            sprint_factors=(
+                None if sprint_factors is None else np.asarray(sprint_factors)
+            ),
+            num_workers=config.num_workers,
+        )
+
+    def _run_adaptive_simulations(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: MonteCarloConfiguration,
+    ) -> AdaptiveSimulationResult:
+        """Run vectorized batches until the percentiles reach the precision target"""
+        sprint_factors = self._compile_sprint_factors(config)
+
+        return run_adaptive_simulation(
+            remaining_work,
+            self._build_sampler(velocity_metrics, config),
+            config.confidence_levels,
+            config.precision_target,
+            config.adaptive_batch_size,
+            config.max_simulations,
+            random_seed=config.random_seed,
+            sprint_factors=(
+                None if sprint_factors is None else np.asarray(sprint_factors)
+            ),
+            num_workers=config.num_workers,
+            retained_path_sprints=config.retained_path_sprints,
+        )
+
+    def _build_sampler(
+        self, velocity_metrics: VelocityMetrics, config: MonteCarloConfiguration
+    ) -> VelocitySampler:
+        """Create the velocity sampler for the configured sampling methods"""
+        sampler: VelocitySampler
+        if self._uses_bootstrap(velocity_metrics, config):
+            sampler = self._build_bootstrap_sampler(velocity_metrics, config)
+        else:
+            adjusted_std_dev = velocity_metrics.std_dev * config.variance_multiplier
+            if not config.use_historical_variance:
+                adjusted_std_dev = 0.0
+            sampler = GaussianVelocitySampler(
+                velocity_metrics.average, adjusted_std_dev
+            )
+
+        if config.random_sampling == RandomSampling.ANTITHETIC:
+            return AntitheticVelocitySampler(sampler)
+        if config.random_sampling == RandomSampling.SOBOL:
+            return SobolVelocitySampler(sampler)
+        return sampler
+
+    def _build_bootstrap_sampler(
+        self, velocity_metrics: VelocityMetrics, config: MonteCarloConfiguration
+    ) -> BootstrapVelocitySampler:
+        """Resample historical velocities, scaling their spread for sensitivity"""
+        mean = velocity_metrics.average
+        velocities = [
+            mean + (velocity - mean) * config.variance_multiplier
+            for velocity in velocity_metrics.samples
+        ]
+        return BootstrapVelocitySampler.from_history(
+            velocities, config.recency_half_life
+        )
+
+    def _uses_bootstrap(
+        self, velocity_metrics: VelocityMetrics, config: MonteCarloConfiguration
+    ) -> bool:
+        """Whether bootstrap sampling is requested and historical data exists"""
+        return config.velocity_sampling == VelocitySampling.BOOTSTRAP and bool(
+            velocity_metrics.samples
+        )
+
+    def _compile_sprint_factors(
+        self, config: MonteCarloConfiguration
+    ) -> Optional[Tuple[float, ...]]:
+        """Dense per-sprint velocity factors of the configured scenario, if any"""
+        if not (
+            isinstance(config, MonteCarloConfigurationWithScenario)
+            and config.velocity_scenario
+        ):
+            return None
+        compiled = config.velocity_scenario.compile(
+            config.baseline_team_size, horizon=MAX_SIMULATED_SPRINTS + 1
+        )
+        return compiled.factors
+
+    def _run_loop_simulations(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: MonteCarloConfiguration,
+        retained: Optional[np.ndarray] = None,
+    ) -> SimulationAccumulator:
+        """
+        Run the simulations one trial at a time (reference implementation)
+
+        Args:
+            retained: Optional NaN-filled array receiving the delivered work
+                of the leading trials, as in simulate_completion_sprints
+        """
+        accumulator = SimulationAccumulator(
+            rng=np.random.default_rng(config.random_seed)
+        )
+        rng = (
+            random.Random(config.random_seed)
+            if config.random_seed is not None
+            else random
+        )
 
         # Apply variance multiplier for sensitivity analysis
         adjusted_std_dev = velocity_metrics.std_dev * config.variance_multiplier
 
-        # Check if we have a velocity scenario
-        velocity_scenario = None
-        baseline_team_size = 5
-        if isinstance(config, MonteCarloConfigurationWithScenario):
-            velocity_scenario = config.velocity_scenario
-            baseline_team_size = config.baseline_team_size
+        # Historical velocities to resample in bootstrap mode
+        bootstrap = None
+        if self._uses_bootstrap(velocity_metrics, config):
+            bootstrap = self._build_bootstrap_sampler(velocity_metrics, config)
+
+        # Precompiled velocity scenario factors, if any
+        sprint_factors = self._compile_sprint_factors(config)
 
-        for _ in range(config.num_simulations):
+        for trial in range(config.num_simulations):
             sprints = 0
             work_remaining = remaining_work
 
             while work_remaining > 0:
-                # Sample base velocity from normal distribution
-                if config.use_historical_variance and adjusted_std_dev > 0:
-                    base_velocity = random.gauss(
+                # Sample base velocity from history or a normal distribution
+                if bootstrap:
+                    base_velocity = rng.choices(
+                        bootstrap.velocities, weights=bootstrap.weights
+                    )[0]
+                elif config.use_historical_variance and adjusted_std_dev > 0:
+                    base_velocity = rng.gauss(
                         velocity_metrics.average, adjusted_std_dev
                     )
                 else:
@@ -166,16 +730,18 @@ class MonteCarloModel(ForecastingModel):
                 base_velocity = max(0.1, base_velocity)
 
                 # Apply velocity scenario adjustments if available
-                if velocity_scenario:
-                    # Sprint numbers start at 1
-                    adjusted_velocity, _ = velocity_scenario.get_adjusted_velocity(
-                        sprints + 1, base_velocity, baseline_team_size
-                    )
-                    velocity = adjusted_velocity
+                if sprint_factors:
+                    velocity = base_velocity * sprint_factors[sprints]
                 else:
                     velocity = base_velocity
 
                 work_remaining -= velocity
+                if (
+                    retained is not None
+                    and trial < retained.shape[0]
+                    and sprints < retained.shape[1]
+                ):
+                    retained[trial, sprints] = remaining_work - work_remaining
                 sprints += 1
 
                 # Safety check to prevent infinite loops
@@ -183,55 +749,6 @@ class MonteCarloModel(ForecastingModel):
                     logger.warning("Simulation exceeded 1000 sprints, breaking")
                     break
 
-            completion_sprints.append(sprints)
-
-        return completion_sprints
-
-    def _calculate_prediction_intervals(
-        self, completion_sprints: List[float], confidence_levels: List[float]
-    ) -> List[PredictionInterval]:
-        """Calculate prediction intervals from simulation results"""
-        sorted_sprints = sorted(completion_sprints)
-        n = len(sorted_sprints)
-        intervals = []
-
-        for confidence in confidence_levels:
-            # Calculate percentile index
-            percentile_idx = int(n * confidence)
-            percentile_idx = min(percentile_idx, n - 1)
-
-            # Calculate confidence interval bounds
-            alpha = 1 - confidence
-            lower_idx = int(n * alpha / 2)
-            upper_idx = int(n * (1 - alpha / 2))
-
-            # Ensure valid indices
-            lower_idx = max(0, min(lower_idx, n - 1))
-            upper_idx = max(0, min(upper_idx, n - 1))
-
-            interval = PredictionInterval(
-                confidence_level=confidence,
-                lower_bound=sorted_sprints[lower_idx],
-                predicted_value=sorted_sprints[percentile_idx],
-                upper_bound=sorted_sprints[upper_idx],
-            )
-            intervals.append(interval)
-
-        return intervals
-
-    def _calculate_probability_distribution(
-        self, completion_sprints: List[float]
-    ) -> Dict[int, float]:
-        """Calculate probability distribution of completion sprints"""
-        from collections import Counter
-
-        # Count occurrences of each sprint count
-        sprint_counts = Counter(int(s) for s in completion_sprints)
-        total = len(completion_sprints)
-
-        # Convert to probabilities
-        distribution = {
-            sprints: count / total for sprints, count in sprint_counts.items()
-        }
+            accumulator.add(sprints)
 
-        return distribution
+        return accumulator
@@ -0,0 +1,158 @@
+"""Low-discrepancy point sets and inverse-CDF helpers for Monte Carlo sampling"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+# Sobol direction number initialisation (Joe & Kuo) for dimensions 2 onwards:
+# (degree of the primitive polynomial, its inner coefficients, initial m values).
+# Dimension 1 is the van der Corput sequence.
+SOBOL_PARAMETERS: Tuple[Tuple[int, int, Tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+SOBOL_MAX_DIMENSIONS = len(SOBOL_PARAMETERS) + 1
+SOBOL_BITS = 32
+
+
+def _direction_numbers(dimension: int) -> np.ndarray:
+    """Direction numbers v_1..v_SOBOL_BITS of one dimension, as 32-bit integers"""
+    m = [1] * SOBOL_BITS
+    if dimension > 0:
+        degree, coefficients, initial = SOBOL_PARAMETERS[dimension - 1]
+        m[:degree] = initial
+        for k in range(degree, SOBOL_BITS):
+            value = m[k - degree] ^ (m[k - degree] << degree)
+            for j in range(1, degree):
+                if (coefficients >> (degree - 1 - j)) & 1:
+                    value ^= m[k - j] << j
+            m[k] = value
+    return np.array(
+        [m[k] << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)], dtype=np.uint64
+    )
+
+
+_DIRECTION_NUMBERS: List[np.ndarray] = [
+    _direction_numbers(dimension) for dimension in range(SOBOL_MAX_DIMENSIONS)
+]
+
+
+def scrambled_sobol(
+    num_points: int, dimensions: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Randomized Sobol points in (0, 1)
+
+    Each call applies a fresh linear matrix scramble and digital shift, so
+    every point is uniformly distributed while the set as a whole keeps the
+    Sobol stratification. Independent calls give independent point sets.
+
+    Args:
+        num_points: Number of points (rows)
+        dimensions: Number of coordinates, at most SOBOL_MAX_DIMENSIONS
+
+    Returns:
+        (num_points x dimensions) array of uniforms
+    """
+    if dimensions > SOBOL_MAX_DIMENSIONS:
+        raise ValueError(
+            f"Sobol sequences support at most {SOBOL_MAX_DIMENSIONS} dimensions"
+        )
+    indices = np.arange(num_points, dtype=np.uint64)
+    gray_codes = indices ^ (indices >> np.uint64(1))
+    bits = max(1, int(num_points).bit_length())
+
+    points = np.zeros((num_points, dimensions), dtype=np.uint64)
+    for dimension in range(dimensions):
+        directions = _scramble(_DIRECTION_NUMBERS[dimension], rng)
+        column = np.zeros(num_points, dtype=np.uint64)
+        for bit in range(bits):
+            mask = ((gray_codes >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+            column[mask] ^= directions[bit]
+        shift = np.uint64(rng.integers(0, 2**SOBOL_BITS, dtype=np.uint64))
+        points[:, dimension] = column ^ shift
+
+    # Centre each point in its cell of width 2^-32 so no coordinate is 0 or 1
+    return (points.astype(float) + 0.5) / 2.0**SOBOL_BITS
+
+
+def _scramble(directions: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Multiply direction numbers by a random lower-triangular unit bit matrix"""
+    # Row r of the matrix mixes output bit r (0 = most significant) with the
+    # more significant bits above it
+    lower = np.tril(rng.integers(0, 2, size=(SOBOL_BITS, SOBOL_BITS)), k=-1)
+    np.fill_diagonal(lower, 1)
+    weights = np.uint64(1) << np.arange(SOBOL_BITS - 1, -1, -1, dtype=np.uint64)
+
+    direction_bits = (directions[:, np.newaxis] & weights).astype(bool)
+    scrambled_bits = (direction_bits.astype(np.int64) @ lower.T) % 2
+    return (scrambled_bits.astype(np.uint64) * weights).sum(axis=1).astype(np.uint64)
+
+
+# Coefficients of Acklam's rational approximation to the normal quantile
+_PPF_A = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_PPF_B = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+)
+_PPF_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_PPF_D = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+)
+_PPF_LOW = 0.02425
+
+
+def normal_ppf(uniforms: np.ndarray) -> np.ndarray:
+    """Standard normal quantiles of uniforms (relative error below 1.2e-9)"""
+    u = np.clip(np.asarray(uniforms, dtype=float), 1e-300, 1 - 1e-16)
+    result = np.empty_like(u)
+
+    central = (u >= _PPF_LOW) & (u <= 1 - _PPF_LOW)
+    q = u[central] - 0.5
+    r = q * q
+    result[central] = q * np.polyval(_PPF_A, r) / (r * np.polyval(_PPF_B, r) + 1.0)
+
+    tails = ~central
+    q = np.sqrt(-2 * np.log(np.minimum(u[tails], 1 - u[tails])))
+    tail_values = np.polyval(_PPF_C, q) / (q * np.polyval(_PPF_D, q) + 1.0)
+    result[tails] = np.where(u[tails] < 0.5, tail_values, -tail_values)
+    return result
@@ -5,8 +5,14 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..domain.entities import Issue, Sprint
-from ..domain.repositories import ConfigRepository, IssueRepository, SprintRepository
+from ..domain.repositories import (
+    ConfigRepository,
+    IssueRepository,
+    SprintRepository,
+    VelocityPosteriorRepository,
+)
 from ..domain.value_objects import DateRange, FieldMapping
+from ..domain.velocity_posterior import NormalInverseGammaPosterior
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +144,44 @@ class FileConfigRepository(ConfigRepository):
             return None
 
 
+class FileVelocityPosteriorRepository(VelocityPosteriorRepository):
+    """Velocity posteriors stored as one JSON file per project"""
+
+    def __init__(
+        self, posterior_dir: Path = Path.home() / ".sprint-radar" / "posteriors"
+    ):
+        self.posterior_dir = posterior_dir
+        self.posterior_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, project_id: str) -> Path:
+        safe_id = "".join(c if c.isalnum() or c in "-_." else "_" for c in project_id)
+        return self.posterior_dir / f"{safe_id}.json"
+
+    def load(self, project_id: str) -> Optional[NormalInverseGammaPosterior]:
+        path = self._path(project_id)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r") as f:
+                return NormalInverseGammaPosterior.from_dict(json.load(f))
+        except Exception as e:
+            logger.error(f"Error loading velocity posterior: {str(e)}")
+            return None
+
+    def save(self, project_id: str, posterior: NormalInverseGammaPosterior) -> None:
+        path = self._path(project_id)
+        try:
+            # Write then rename so a crash never leaves a truncated posterior
+            temporary = path.with_suffix(".tmp")
+            with open(temporary, "w") as f:
+                json.dump(posterior.to_dict(), f, indent=2)
+            temporary.replace(path)
+        except Exception as e:
+            logger.error(f"Error saving velocity posterior: {str(e)}")
+            raise
+
+
 class SprintExtractor:
     @staticmethod
     def extract_sprints_from_issues(
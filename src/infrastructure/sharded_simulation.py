@@ -0,0 +1,616 @@
+"""Sharded multi-process execution of vectorized Monte Carlo simulations"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, reduce
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+from ..domain.velocity_posterior import NormalInverseGammaPosterior
+from .delivered_work_paths import (
+    PATHS_SPAWN_KEY,
+    DeliveredWorkPaths,
+    retained_trials,
+)
+from .simulation_accumulator import SimulationAccumulator
+from .vectorized_simulation import (
+    simulate_completion_sprints,
+    simulate_cut_line_histograms,
+    simulate_daily_throughput_completion_days,
+    simulate_gaussian_grid_completion_sprints,
+    simulate_portfolio_completion_sprints,
+    simulate_scenario_completion_sprints,
+    simulate_trial_gaussian_completion_sprints,
+)
+from .velocity_samplers import VelocitySampler
+
+logger = logging.getLogger(__name__)
+
+# Trials per shard. The shard layout depends only on the number of
+# simulations, never on the worker count, so a seed always maps to the same
+# shard streams and therefore to bit-identical results.
+SHARD_SIZE = 25_000
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SimulationShard:
+    """One independent slice of the trials with its own random stream"""
+
+    num_simulations: int
+    seed_sequence: np.random.SeedSequence
+    remaining_work: float
+    sampler: Optional[VelocitySampler]  # None for kernels with their own draws
+    sprint_factors: Optional[np.ndarray] = None
+    retained_trials: int = 0  # Leading trials whose delivered-work paths are kept
+
+
+def run_shard(shard: SimulationShard) -> SimulationAccumulator:
+    """Simulate one shard and summarise it in an accumulator"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    completion_sprints = simulate_completion_sprints(
+        shard.remaining_work,
+        shard.sampler,
+        shard.num_simulations,
+        rng,
+        shard.sprint_factors,
+    )
+    # The reservoir continues the shard's stream, keeping it reproducible
+    return SimulationAccumulator.from_values(completion_sprints, rng=rng)
+
+
+def run_path_shard(
+    shard: SimulationShard, horizon_sprints: int
+) -> Tuple[SimulationAccumulator, DeliveredWorkPaths]:
+    """Simulate one shard, keeping the paths of its retained trials"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    partial_paths = np.full(
+        (shard.retained_trials, horizon_sprints), np.nan, dtype=np.float32
+    )
+    completion_sprints = simulate_completion_sprints(
+        shard.remaining_work,
+        shard.sampler,
+        shard.num_simulations,
+        rng,
+        shard.sprint_factors,
+        retained=partial_paths,
+    )
+    accumulator = SimulationAccumulator.from_values(completion_sprints, rng=rng)
+    # Sprints after a trial finished come from a stream of their own, so the
+    # paths never shift the completion draws or the reservoir
+    paths_rng = np.random.default_rng(
+        np.random.SeedSequence(
+            shard.seed_sequence.entropy,
+            spawn_key=shard.seed_sequence.spawn_key + (PATHS_SPAWN_KEY,),
+        )
+    )
+    paths = DeliveredWorkPaths.complete(
+        partial_paths, shard.sampler, paths_rng, shard.sprint_factors
+    )
+    return accumulator, paths
+
+
+def run_scenario_shard(
+    shard: SimulationShard, scenario_factors: Sequence[Optional[np.ndarray]]
+) -> List[SimulationAccumulator]:
+    """Simulate one shard for every scenario on shared base-velocity paths"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    outcomes = simulate_scenario_completion_sprints(
+        shard.remaining_work,
+        shard.sampler,
+        shard.num_simulations,
+        rng,
+        scenario_factors,
+    )
+    return _paired_accumulators(outcomes, rng)
+
+
+def run_cut_line_shard(shard: SimulationShard, cut_lines: np.ndarray) -> np.ndarray:
+    """Simulate one shard's burn-up paths against every backlog cut line"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    return simulate_cut_line_histograms(
+        cut_lines, shard.sampler, shard.num_simulations, rng, shard.sprint_factors
+    )
+
+
+def run_gaussian_grid_shard(
+    shard: SimulationShard, means: Sequence[float], std_devs: Sequence[float]
+) -> List[SimulationAccumulator]:
+    """Simulate one shard for every Gaussian grid point on shared draws"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    outcomes = simulate_gaussian_grid_completion_sprints(
+        shard.remaining_work, means, std_devs, shard.num_simulations, rng
+    )
+    return _paired_accumulators(outcomes, rng)
+
+
+def run_portfolio_shard(
+    shard: SimulationShard,
+    remaining_work: Sequence[float],
+    means: Sequence[float],
+    std_devs: Sequence[float],
+    correlation: Optional[Sequence[Sequence[float]]],
+) -> List[SimulationAccumulator]:
+    """Simulate one shard of a portfolio; the first accumulator is the portfolio"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    outcomes = simulate_portfolio_completion_sprints(
+        remaining_work, means, std_devs, shard.num_simulations, rng, correlation
+    )
+    return _paired_accumulators([outcomes.max(axis=0), *outcomes], rng)
+
+
+def run_posterior_shard(
+    shard: SimulationShard, posterior: NormalInverseGammaPosterior
+) -> SimulationAccumulator:
+    """Simulate one shard from the posterior predictive of sprint velocity"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    # Each trial draws its own (mu, sigma^2), then every sprint from them
+    size = shard.num_simulations
+    variances = posterior.beta / rng.gamma(posterior.alpha, size=size)
+    mean_std_devs = np.sqrt(variances / posterior.kappa)
+    means = posterior.mean + mean_std_devs * rng.standard_normal(size)
+    completion_sprints = simulate_trial_gaussian_completion_sprints(
+        shard.remaining_work, means, np.sqrt(variances), rng
+    )
+    return SimulationAccumulator.from_values(completion_sprints, rng=rng)
+
+
+def run_throughput_shard(
+    shard: SimulationShard, daily_throughput: Sequence[int]
+) -> SimulationAccumulator:
+    """Simulate one shard of completion days from daily throughput history"""
+    rng = np.random.default_rng(shard.seed_sequence)
+    completion_days = simulate_daily_throughput_completion_days(
+        int(shard.remaining_work), daily_throughput, shard.num_simulations, rng
+    )
+    return SimulationAccumulator.from_values(completion_days, rng=rng)
+
+
+def plan_shards(
+    remaining_work: float,
+    sampler: Optional[VelocitySampler],
+    num_simulations: int,
+    random_seed: Optional[int],
+    sprint_factors: Optional[np.ndarray] = None,
+    retained_trials: int = 0,
+) -> List[SimulationShard]:
+    """
+    Split the trials into shards with streams spawned from one master seed
+
+    The first retained_trials trials keep their delivered-work paths, taken
+    from the leading shards.
+    """
+    num_shards = max(1, -(-num_simulations // SHARD_SIZE))
+    seed_sequences = np.random.SeedSequence(random_seed).spawn(num_shards)
+
+    shards = []
+    for index, seed_sequence in enumerate(seed_sequences):
+        start = index * SHARD_SIZE
+        shards.append(
+            SimulationShard(
+                num_simulations=min(SHARD_SIZE, num_simulations - start),
+                seed_sequence=seed_sequence,
+                remaining_work=remaining_work,
+                sampler=sampler,
+                sprint_factors=sprint_factors,
+                retained_trials=min(SHARD_SIZE, max(0, retained_trials - start)),
+            )
+        )
+    return shards
+
+
+def run_sharded_simulation(
+    remaining_work: float,
+    sampler: VelocitySampler,
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    sprint_factors: Optional[np.ndarray] = None,
+    num_workers: Optional[int] = 1,
+) -> SimulationAccumulator:
+    """
+    Run the simulation as independent shards and merge their accumulators
+
+    Args:
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+
+    Returns:
+        Merged accumulator of all trials
+    """
+    shards = plan_shards(
+        remaining_work,
+        sampler,
+        num_simulations,
+        random_seed,
+        sprint_factors,
+    )
+    partials = _map_shards(run_shard, shards, num_workers)
+
+    # Merge in shard order so samples do not depend on scheduling
+    return reduce(lambda merged, other: merged.merge(other), partials)
+
+
+def run_sharded_path_simulation(
+    remaining_work: float,
+    sampler: VelocitySampler,
+    num_simulations: int,
+    horizon_sprints: int,
+    random_seed: Optional[int] = None,
+    sprint_factors: Optional[np.ndarray] = None,
+    num_workers: Optional[int] = 1,
+) -> Tuple[SimulationAccumulator, DeliveredWorkPaths]:
+    """
+    Run the simulation as run_sharded_simulation does, retaining paths
+
+    The leading trials keep the delivered work of their own draws for
+    horizon_sprints sprints, as many as fit MAX_RETAINED_CELLS. The
+    completion sprints are the same as without retained paths.
+
+    Returns:
+        Merged accumulator of all trials and the retained paths
+    """
+    shards = plan_shards(
+        remaining_work,
+        sampler,
+        num_simulations,
+        random_seed,
+        sprint_factors,
+        retained_trials(num_simulations, horizon_sprints),
+    )
+    partials = _map_shards(
+        partial(run_path_shard, horizon_sprints=horizon_sprints),
+        shards,
+        num_workers,
+    )
+
+    accumulators, paths = zip(*partials)
+    return (
+        reduce(lambda merged, other: merged.merge(other), accumulators),
+        _concatenate_paths(paths),
+    )
+
+
+def run_sharded_scenario_simulation(
+    remaining_work: float,
+    sampler: VelocitySampler,
+    num_simulations: int,
+    scenario_factors: Sequence[Optional[np.ndarray]],
+    random_seed: Optional[int] = None,
+    num_workers: Optional[int] = 1,
+) -> List[SimulationAccumulator]:
+    """
+    Run several velocity scenarios on common random numbers
+
+    Each shard draws its base-velocity paths once and applies every
+    scenario's factors to them. The accumulators of all scenarios keep the
+    same trials in their samples, so sample i of each scenario is a pair.
+
+    Args:
+        scenario_factors: Sprint factor table per scenario (None = unadjusted)
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+
+    Returns:
+        Merged accumulator per scenario
+    """
+    shards = plan_shards(remaining_work, sampler, num_simulations, random_seed)
+    partials = _map_shards(
+        partial(run_scenario_shard, scenario_factors=scenario_factors),
+        shards,
+        num_workers,
+    )
+
+    return _merge_partials(partials)
+
+
+def run_sharded_cut_line_simulation(
+    cut_lines: Sequence[float],
+    sampler: VelocitySampler,
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    sprint_factors: Optional[np.ndarray] = None,
+    num_workers: Optional[int] = 1,
+) -> List[SimulationAccumulator]:
+    """
+    Forecast every cut line of a ranked backlog from shared burn-up paths
+
+    Args:
+        cut_lines: Cumulative work up to and including each item, ascending
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+
+    Returns:
+        Accumulator per cut line (histograms only, without samples)
+    """
+    cut_lines = np.asarray(cut_lines, dtype=float)
+    shards = plan_shards(
+        float(cut_lines[-1]) if cut_lines.size else 0.0,
+        sampler,
+        num_simulations,
+        random_seed,
+        sprint_factors,
+    )
+    histograms = sum(
+        _map_shards(
+            partial(run_cut_line_shard, cut_lines=cut_lines), shards, num_workers
+        )
+    )
+    return [SimulationAccumulator.from_counts(counts) for counts in histograms]
+
+
+def run_sharded_gaussian_grid_simulation(
+    remaining_work: float,
+    means: Sequence[float],
+    std_devs: Sequence[float],
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    num_workers: Optional[int] = 1,
+) -> List[SimulationAccumulator]:
+    """
+    Run a grid of Gaussian velocity assumptions on common random numbers
+
+    Args:
+        means: Velocity mean per grid point
+        std_devs: Velocity standard deviation per grid point
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+
+    Returns:
+        Merged accumulator per grid point
+    """
+    shards = plan_shards(remaining_work, None, num_simulations, random_seed)
+    partials = _map_shards(
+        partial(run_gaussian_grid_shard, means=means, std_devs=std_devs),
+        shards,
+        num_workers,
+    )
+
+    return _merge_partials(partials)
+
+
+def run_sharded_portfolio_simulation(
+    remaining_work: Sequence[float],
+    means: Sequence[float],
+    std_devs: Sequence[float],
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    correlation: Optional[Sequence[Sequence[float]]] = None,
+    num_workers: Optional[int] = 1,
+) -> Tuple[SimulationAccumulator, List[SimulationAccumulator]]:
+    """
+    Run a portfolio of projects jointly, with optionally correlated velocities
+
+    Args:
+        remaining_work: Remaining work per project
+        means: Velocity mean per project
+        std_devs: Velocity standard deviation per project
+        correlation: Optional correlation matrix of team velocities
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+
+    Returns:
+        Merged accumulator of the portfolio completion (the last project to
+        finish) and merged accumulator per project
+    """
+    shards = plan_shards(sum(remaining_work), None, num_simulations, random_seed)
+    partials = _map_shards(
+        partial(
+            run_portfolio_shard,
+            remaining_work=remaining_work,
+            means=means,
+            std_devs=std_devs,
+            correlation=correlation,
+        ),
+        shards,
+        num_workers,
+    )
+
+    merged = _merge_partials(partials)
+    return merged[0], merged[1:]
+
+
+def run_sharded_posterior_simulation(
+    remaining_work: float,
+    posterior: NormalInverseGammaPosterior,
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    num_workers: Optional[int] = 1,
+) -> SimulationAccumulator:
+    """
+    Run a posterior predictive simulation as independent shards
+
+    Args:
+        posterior: Belief about the mean and variance of sprint velocity
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+    """
+    shards = plan_shards(remaining_work, None, num_simulations, random_seed)
+    partials = _map_shards(
+        partial(run_posterior_shard, posterior=posterior), shards, num_workers
+    )
+    return reduce(lambda merged, other: merged.merge(other), partials)
+
+
+def run_sharded_throughput_simulation(
+    remaining_items: int,
+    daily_throughput: Sequence[int],
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    num_workers: Optional[int] = 1,
+) -> SimulationAccumulator:
+    """
+    Run a daily throughput simulation as independent shards
+
+    Args:
+        remaining_items: Items left in the backlog
+        daily_throughput: Completed items per historical day
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+
+    Returns:
+        Merged accumulator of completion days
+    """
+    shards = plan_shards(remaining_items, None, num_simulations, random_seed)
+    partials = _map_shards(
+        partial(run_throughput_shard, daily_throughput=tuple(daily_throughput)),
+        shards,
+        num_workers,
+    )
+    return reduce(lambda merged, other: merged.merge(other), partials)
+
+
+def _paired_accumulators(
+    outcomes: Sequence[np.ndarray], rng: np.random.Generator
+) -> List[SimulationAccumulator]:
+    """Accumulators of outcomes of the same trials, sampling the same trials"""
+    # Reservoir decisions depend only on positions and the generator, so equal
+    # generators keep the same trials in every accumulator's sample
+    reservoir_seed = int(rng.integers(2**63))
+    return [
+        SimulationAccumulator.from_values(
+            values, rng=np.random.default_rng(reservoir_seed)
+        )
+        for values in outcomes
+    ]
+
+
+def _merge_partials(
+    partials: List[List[SimulationAccumulator]],
+) -> List[SimulationAccumulator]:
+    """Merge per-shard lists of accumulators position by position, in shard order"""
+    merged = partials[0]
+    for shard_partials in partials[1:]:
+        for accumulator, other in zip(merged, shard_partials):
+            accumulator.merge(other)
+    return merged
+
+
+def _concatenate_paths(paths: Sequence[DeliveredWorkPaths]) -> DeliveredWorkPaths:
+    """Retained paths of several shards or batches, in their order"""
+    return DeliveredWorkPaths(np.concatenate([part.cumulative for part in paths]))
+
+
+def _map_shards(
+    function: Callable[[SimulationShard], T],
+    shards: List[SimulationShard],
+    num_workers: Optional[int],
+) -> List[T]:
+    """Run shards in-process or on a process pool, keeping shard order"""
+    workers = min(num_workers or os.cpu_count() or 1, len(shards))
+    if workers <= 1:
+        return [function(shard) for shard in shards]
+
+    logger.info(f"Running {len(shards)} shards on {workers} processes")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, shards))
+
+
+@dataclass
+class AdaptiveSimulationResult:
+    """Outcome of an adaptive simulation run"""
+
+    accumulator: SimulationAccumulator
+    standard_errors: Dict[float, float] = field(default_factory=dict)
+    converged: bool = False
+    delivered_work: Optional[DeliveredWorkPaths] = None
+
+
+def run_adaptive_simulation(
+    remaining_work: float,
+    sampler: VelocitySampler,
+    confidence_levels: List[float],
+    precision_target: float,
+    batch_size: int,
+    max_simulations: int,
+    random_seed: Optional[int] = None,
+    sprint_factors: Optional[np.ndarray] = None,
+    num_workers: Optional[int] = 1,
+    retained_path_sprints: Optional[int] = None,
+) -> AdaptiveSimulationResult:
+    """
+    Simulate in batches until every percentile is precise enough
+
+    Batch k always uses the k-th stream spawned from the master seed, and
+    convergence is checked after each batch in order, so the number of trials
+    and the result do not depend on the worker count. Workers only compute
+    several upcoming batches at once.
+
+    Args:
+        confidence_levels: Percentiles that must reach the precision target
+        precision_target: Maximum standard error per percentile, in sprints
+        batch_size: Trials per batch
+        max_simulations: Trial budget
+        num_workers: Worker processes (None = all cores, 1 = in-process)
+        retained_path_sprints: Optional horizon of delivered-work paths kept
+            from the leading trials, as in run_sharded_path_simulation
+    """
+    root_seed = np.random.SeedSequence(random_seed)
+    max_batches = max(1, max_simulations // batch_size)
+    workers = min(num_workers or os.cpu_count() or 1, max_batches)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    run_batch: Callable[[SimulationShard], object] = run_shard
+    paths_to_retain = 0
+    if retained_path_sprints is not None:
+        run_batch = partial(run_path_shard, horizon_sprints=retained_path_sprints)
+        paths_to_retain = retained_trials(max_simulations, retained_path_sprints)
+
+    accumulator: Optional[SimulationAccumulator] = None
+    result: Optional[AdaptiveSimulationResult] = None
+    paths: List[DeliveredWorkPaths] = []
+    batches_run = 0
+    try:
+        while batches_run < max_batches and not (result and result.converged):
+            round_size = min(workers, max_batches - batches_run)
+            shards = [
+                SimulationShard(
+                    num_simulations=batch_size,
+                    seed_sequence=seed_sequence,
+                    remaining_work=remaining_work,
+                    sampler=sampler,
+                    sprint_factors=sprint_factors,
+                    retained_trials=min(
+                        batch_size,
+                        max(0, paths_to_retain - (batches_run + index) * batch_size),
+                    ),
+                )
+                for index, seed_sequence in enumerate(root_seed.spawn(round_size))
+            ]
+            if executor is None:
+                partials = [run_batch(shard) for shard in shards]
+            else:
+                partials = list(executor.map(run_batch, shards))
+
+            for shard_result in partials:
+                if retained_path_sprints is not None:
+                    shard_result, shard_paths = shard_result
+                    paths.append(shard_paths)
+                accumulator = (
+                    shard_result
+                    if accumulator is None
+                    else accumulator.merge(shard_result)
+                )
+                batches_run += 1
+                standard_errors = {
+                    confidence: accumulator.percentile_standard_error(confidence)
+                    for confidence in confidence_levels
+                }
+                # At least two batches, so a lucky first batch cannot stop the run
+                converged = batches_run >= 2 and all(
+                    error <= precision_target for error in standard_errors.values()
+                )
+                result = AdaptiveSimulationResult(
+                    accumulator=accumulator,
+                    standard_errors=standard_errors,
+                    converged=converged,
+                )
+                if converged:
+                    break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if paths:
+        result.delivered_work = _concatenate_paths(paths)
+    logger.info(
+        f"Adaptive simulation ran {accumulator.total} trials "
+        f"({'converged' if result.converged else 'budget reached'})"
+    )
+    return result
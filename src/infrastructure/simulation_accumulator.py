@@ -0,0 +1,180 @@
+"""Constant-memory, mergeable summaries of Monte Carlo simulation outcomes"""
+
+import math
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+SAMPLE_SIZE = 1000  # Completion values kept for visualization
+
+
+class SimulationAccumulator:
+    """
+    Streaming summary of integer completion sprints
+
+    Keeps an exact histogram (counts[k] = trials that completed in k sprints)
+    and a uniform reservoir sample of the outcomes. Completion sprints are
+    integers, so the histogram is lossless: every percentile and moment of the
+    full result is read back from it in O(bins) memory, and accumulators from
+    independent shards merge by adding counts.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = SAMPLE_SIZE,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        self.sample_size = sample_size
+        self.counts = np.zeros(0, dtype=np.int64)
+        # Preallocated reservoir, of which the first _filled slots are in use
+        self._reservoir = np.empty(sample_size, dtype=np.int64)
+        self._filled = 0
+        self._rng = rng if rng is not None else np.random.default_rng()
+
+    @classmethod
+    def from_values(
+        cls,
+        completion_sprints: Sequence[float],
+        sample_size: int = SAMPLE_SIZE,
+        rng: Optional[np.random.Generator] = None,
+    ) -> "SimulationAccumulator":
+        """Build an accumulator from per-trial completion sprints"""
+        accumulator = cls(sample_size, rng)
+        accumulator.add_batch(np.asarray(completion_sprints))
+        return accumulator
+
+    @classmethod
+    def from_counts(cls, counts: np.ndarray) -> "SimulationAccumulator":
+        """Build a sample-free accumulator from a completion sprint histogram"""
+        accumulator = cls(sample_size=0)
+        accumulator.counts = np.trim_zeros(np.asarray(counts, dtype=np.int64), "b")
+        return accumulator
+
+    def add(self, completion_sprint: int) -> None:
+        """Record a single trial"""
+        seen = self.total
+        self._grow(completion_sprint + 1)
+        self.counts[completion_sprint] += 1
+
+        # Reservoir sampling (Algorithm R)
+        if seen < self.sample_size:
+            self._reservoir[self._filled] = completion_sprint
+            self._filled += 1
+        else:
+            slot = self._rng.integers(0, seen + 1)
+            if slot < self.sample_size:
+                self._reservoir[slot] = completion_sprint
+
+    def add_batch(self, completion_sprints: np.ndarray) -> None:
+        """Record a batch of trials"""
+        values = completion_sprints.astype(np.int64)
+        if values.size == 0:
+            return
+        seen = self.total
+        batch_counts = np.bincount(values)
+        self._grow(batch_counts.size)
+        self.counts[: batch_counts.size] += batch_counts
+
+        # Fill the reservoir, then replace slots with Algorithm R probabilities
+        fill = values[: max(0, self.sample_size - seen)]
+        self._reservoir[self._filled : self._filled + fill.size] = fill
+        self._filled += fill.size
+        rest = values[fill.size :]
+        if rest.size:
+            positions = np.arange(seen + fill.size, seen + values.size)
+            slots = self._rng.integers(0, positions + 1)
+            accepted = slots < self.sample_size
+            self._reservoir[slots[accepted]] = rest[accepted]
+
+    def merge(self, other: "SimulationAccumulator") -> "SimulationAccumulator":
+        """Fold another accumulator into this one and return self"""
+        own_total, other_total = self.total, other.total
+        self._grow(other.counts.size)
+        self.counts[: other.counts.size] += other.counts
+
+        # A uniform sample of the union takes a hypergeometric share of each
+        size = min(self.sample_size, own_total + other_total)
+        if other_total and size:
+            from_own = int(self._rng.hypergeometric(own_total, other_total, size))
+            from_own = min(from_own, self.samples.size)
+            from_other = min(size - from_own, other.samples.size)
+            combined = np.concatenate(
+                [
+                    self._rng.permutation(self.samples)[:from_own],
+                    self._rng.permutation(other.samples)[:from_other],
+                ]
+            )
+            self._reservoir[: combined.size] = combined
+            self._filled = combined.size
+        return self
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Uniform sample of the completion sprints, at most sample_size long"""
+        return self._reservoir[: self._filled]
+
+    @property
+    def total(self) -> int:
+        """Number of simulated trials"""
+        return int(self.counts.sum())
+
+    @property
+    def mean(self) -> float:
+        """Mean completion sprint"""
+        return float(np.dot(np.arange(self.counts.size), self.counts) / self.total)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation of the completion sprints"""
+        n = self.total
+        if n < 2:
+            return 0.0
+        deviations = np.arange(self.counts.size) - self.mean
+        return float(math.sqrt(np.dot(deviations**2, self.counts) / (n - 1)))
+
+    def value_at_rank(self, rank: int) -> float:
+        """Value at a zero-based position of the sorted completion sprints"""
+        cumulative = np.cumsum(self.counts)
+        return float(np.searchsorted(cumulative, rank, side="right"))
+
+    def prediction_bounds(self, confidence: float) -> Tuple[float, float, float]:
+        """
+        (lower, predicted, upper) values at a confidence level
+
+        The predicted value is the confidence percentile; the bounds enclose
+        the central confidence share of the outcomes.
+        """
+        n = self.total
+        alpha = 1 - confidence
+
+        def at(position: float) -> float:
+            return self.value_at_rank(max(0, min(int(position), n - 1)))
+
+        return at(n * alpha / 2), at(n * confidence), at(n * (1 - alpha / 2))
+
+    def percentile_standard_error(self, confidence: float) -> float:
+        """
+        Standard error of the percentile at a confidence level, in sprints
+
+        Uses the asymptotic variance of a sample quantile,
+        p (1 - p) / (n f(q)^2), with the density f(q) read from the histogram
+        as the share of trials in the percentile's sprint bin.
+        """
+        n = self.total
+        rank = min(int(n * confidence), n - 1)
+        density = self.counts[int(self.value_at_rank(rank))] / n
+        return float((confidence * (1 - confidence) / n) ** 0.5 / density)
+
+    def distribution(self) -> Dict[int, float]:
+        """Probability of completing in each observed number of sprints"""
+        total = self.total
+        return {
+            int(sprints): float(self.counts[sprints] / total)
+            for sprints in np.flatnonzero(self.counts)
+        }
+
+    def _grow(self, size: int) -> None:
+        if size > self.counts.size:
+            self.counts = np.concatenate(
+                [self.counts, np.zeros(size - self.counts.size, dtype=np.int64)]
+            )
@@ -0,0 +1,141 @@
+"""Daily throughput forecasting model for item-count (Kanban-style) backlogs"""
+
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+
+from ..domain.forecasting import (
+    ForecastingModel,
+    ForecastResult,
+    ForecastUnit,
+    ModelConfiguration,
+    ModelInfo,
+    ModelType,
+    PredictionInterval,
+    ThroughputConfiguration,
+)
+from ..domain.value_objects import VelocityMetrics
+from .forecast_outcomes import ArrayForecastOutcomes
+from .sharded_simulation import run_sharded_throughput_simulation
+
+logger = logging.getLogger(__name__)
+
+
+class ThroughputModel(ForecastingModel):
+    """
+    Forecast the days needed to finish a number of items
+
+    Each simulated day bootstraps the completed-item count of a random
+    historical day from ThroughputConfiguration.daily_throughput, including
+    days without completions, until the remaining items are done. Remaining
+    work is read as an item count, velocity metrics are not used, and every
+    value of the result is in days (working days when working_days_only).
+    """
+
+    def forecast(
+        self,
+        remaining_work: float,
+        velocity_metrics: VelocityMetrics,
+        config: ModelConfiguration,
+    ) -> ForecastResult:
+        """Simulate completion days from the daily throughput history"""
+        throughput_config = self._prepare_config(config)
+        history = throughput_config.daily_throughput
+        remaining_items = math.ceil(remaining_work)
+
+        accumulator = run_sharded_throughput_simulation(
+            remaining_items,
+            history,
+            throughput_config.num_simulations,
+            random_seed=throughput_config.random_seed,
+            num_workers=throughput_config.num_workers,
+        )
+
+        expected_days = accumulator.mean
+        return ForecastResult(
+            prediction_intervals=[
+                PredictionInterval(
+                    confidence, *accumulator.prediction_bounds(confidence)
+                )
+                for confidence in throughput_config.confidence_levels
+            ],
+            expected_sprints=expected_days,
+            expected_completion_date=self.completion_date(
+                expected_days, throughput_config
+            ),
+            model_type=ModelType.THROUGHPUT,
+            model_metadata={
+                "num_simulations": accumulator.total,
+                "remaining_items": remaining_items,
+                "history_days": len(history),
+                "mean_daily_throughput": float(np.mean(history)),
+                "working_days_only": throughput_config.working_days_only,
+            },
+            outcomes=ArrayForecastOutcomes.from_accumulator(accumulator),
+            unit=ForecastUnit.DAYS,
+        )
+
+    def completion_date(
+        self, expected_value: float, config: ModelConfiguration
+    ) -> datetime:
+        """Date after a number of days from today, working days if configured"""
+        today = datetime.now()
+        if not getattr(config, "working_days_only", False):
+            return today + timedelta(days=expected_value)
+        end = np.busday_offset(
+            np.datetime64(today.date()), math.ceil(expected_value), roll="forward"
+        )
+        return datetime.combine(end.astype(datetime), today.time())
+
+    def configuration_errors(self, config: ModelConfiguration) -> List[str]:
+        """The daily throughput history must come with the configuration"""
+        if not isinstance(config, ThroughputConfiguration):
+            return [
+                "The throughput model needs a ThroughputConfiguration with the "
+                "daily throughput history"
+            ]
+        if not any(config.daily_throughput):
+            return ["Daily throughput history needs at least one completion"]
+        return []
+
+    def _prepare_config(self, config: ModelConfiguration) -> ThroughputConfiguration:
+        """Check the configuration carries a usable throughput history"""
+        missing = self.configuration_errors(config)
+        if missing:
+            raise ValueError(missing[0])
+
+        errors = config.validate()
+        if errors:
+            raise ValueError(f"Invalid configuration: {'; '.join(errors)}")
+        return config
+
+    def get_model_info(self) -> ModelInfo:
+        """Get information about the throughput model"""
+        return ModelInfo(
+            model_type=ModelType.THROUGHPUT,
+            name="Daily Throughput Forecast",
+            description=(
+                "Bootstraps historical daily completed-item counts to forecast "
+                "completion in days"
+            ),
+            supports_probability_distribution=True,
+            required_historical_periods=10,  # Days of history
+            configuration_class=ThroughputConfiguration,
+            methodology_description=(
+                "Resamples the number of items completed on historical days, "
+                "including days without completions, to simulate thousands of "
+                "possible futures day by day until the backlog is empty."
+            ),
+        )
+
+    def validate_inputs(
+        self, remaining_work: float, velocity_metrics: VelocityMetrics
+    ) -> List[str]:
+        """Validate inputs for the throughput model"""
+        errors = []
+        if remaining_work <= 0:
+            errors.append("Remaining items must be positive")
+        return errors
@@ -0,0 +1,630 @@
+"""Vectorized NumPy engine for Monte Carlo completion simulations"""
+
+import logging
+import math
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from .velocity_samplers import MIN_VELOCITY, VelocitySampler
+
+logger = logging.getLogger(__name__)
+
+# Same safety cap as the reference loop: a trial that is still running after
+# MAX_SIMULATED_SPRINTS sprints is recorded as MAX_SIMULATED_SPRINTS + 1
+MAX_SIMULATED_SPRINTS = 1000
+
+# Upper bound on the size of a single drawn velocity block (trials x sprints)
+MAX_BLOCK_CELLS = 4_000_000
+MIN_BLOCK_SPRINTS = 8
+
+# Cap of the daily throughput engine, about ten years of working days; a
+# trial still running after MAX_SIMULATED_DAYS is recorded one day later
+MAX_SIMULATED_DAYS = 2600
+
+# Simulates periods offset + 1 to offset + width of a chunk's running trials
+# and returns how many are still running
+BlockStep = Callable[[int, int], int]
+
+
+def _first_block_width(expected_periods: float, period_cap: int) -> int:
+    """Width of a chunk's first block, so most trials finish within it"""
+    return int(
+        min(period_cap, max(MIN_BLOCK_SPRINTS, math.ceil(expected_periods * 1.5) + 2))
+    )
+
+
+def _simulate_in_blocks(
+    num_trials: int,
+    block_width: int,
+    period_cap: int,
+    start_chunk: Callable[[np.ndarray], BlockStep],
+    cells_per_period: int = 1,
+    period_name: str = "sprints",
+) -> None:
+    """
+    Run a block simulation over chunks of trials
+
+    Trials are split into chunks whose first block stays within
+    MAX_BLOCK_CELLS. start_chunk sets up the state of a chunk's trial indices
+    and returns its step, which is called with ever wider blocks until every
+    trial has finished or period_cap periods are simulated.
+
+    Args:
+        num_trials: Number of trials
+        block_width: Periods in the first block of every chunk
+        period_cap: Periods after which running trials are stopped
+        start_chunk: Returns the step of a chunk of trial indices
+        cells_per_period: Values drawn per trial and period, for chunk sizes
+        period_name: Unit of the periods, for the warning about capped trials
+    """
+    trials_per_chunk = max(1, MAX_BLOCK_CELLS // (block_width * cells_per_period))
+    capped = 0
+
+    for chunk_start in range(0, num_trials, trials_per_chunk):
+        trials = np.arange(chunk_start, min(num_trials, chunk_start + trials_per_chunk))
+        step = start_chunk(trials)
+        running = trials.size
+        offset = 0
+        width = block_width
+
+        while running and offset < period_cap:
+            width = min(width, period_cap - offset)
+            running = step(offset, width)
+            offset += width
+            # Stragglers are few; grow the block so they finish in few rounds
+            width *= 2
+
+        capped += running
+
+    if capped:
+        logger.warning(f"{capped} simulations exceeded {period_cap - 1} {period_name}")
+
+
+def _retain_paths(
+    retained: np.ndarray,
+    trials: np.ndarray,
+    sprint_offset: int,
+    cumulative: np.ndarray,
+) -> None:
+    """Copy a block's delivered work of retained trials within the path horizon"""
+    width = min(cumulative.shape[1], retained.shape[1] - sprint_offset)
+    kept = trials < retained.shape[0]
+    if width > 0 and kept.any():
+        retained[trials[kept], sprint_offset : sprint_offset + width] = cumulative[
+            kept, :width
+        ]
+
+
+def simulate_completion_sprints(
+    remaining_work: float,
+    sampler: VelocitySampler,
+    num_simulations: int,
+    rng: np.random.Generator,
+    sprint_factors: Optional[np.ndarray] = None,
+    retained: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Simulate the number of sprints needed to complete the remaining work
+
+    Velocities are drawn as (trials x sprints) blocks. Cumulative sums along
+    the sprint axis give the delivered work after each sprint, and the first
+    sprint where it reaches the remaining work is the completion sprint.
+    Trials that have not finished at the end of a block carry their delivered
+    work into the next block; finished trials are dropped from further draws.
+
+    Args:
+        remaining_work: Amount of work remaining
+        sampler: Source of per-sprint base velocities
+        num_simulations: Number of trials
+        rng: NumPy random generator
+        sprint_factors: Optional dense table of velocity factors, where
+            sprint_factors[i] applies to sprint i + 1; must cover
+            MAX_SIMULATED_SPRINTS + 1 sprints
+        retained: Optional (trials x sprints) array filled with NaN; row i
+            receives the delivered work of trial i after each drawn sprint
+
+    Returns:
+        Integer array with the completion sprint of every trial
+    """
+    return simulate_scenario_completion_sprints(
+        remaining_work, sampler, num_simulations, rng, [sprint_factors], retained
+    )[0]
+
+
+def simulate_scenario_completion_sprints(
+    remaining_work: float,
+    sampler: VelocitySampler,
+    num_simulations: int,
+    rng: np.random.Generator,
+    scenario_factors: Sequence[Optional[np.ndarray]],
+    retained: Optional[np.ndarray] = None,
+) -> List[np.ndarray]:
+    """
+    Simulate several velocity scenarios on common random numbers
+
+    Every scenario applies its sprint factors to the same drawn base-velocity
+    paths, so trial i of each scenario differs only by the scenario itself.
+    Differences between scenarios then carry far less noise than independent
+    runs, and N scenarios cost one draw plus N cheap transforms. A trial keeps
+    drawing sprints until it has finished in every scenario.
+
+    Args:
+        scenario_factors: Sprint factor table per scenario (None = unadjusted),
+            in the format of simulate_completion_sprints
+        retained: Optional array receiving the delivered work of the first
+            scenario, as in simulate_completion_sprints. Sprints a trial never
+            drew, because it had finished, stay NaN.
+
+    Returns:
+        Completion sprints of every trial, one array per scenario
+    """
+    sprint_cap = MAX_SIMULATED_SPRINTS + 1
+    num_scenarios = len(scenario_factors)
+    results = np.full((num_scenarios, num_simulations), sprint_cap, dtype=np.int64)
+
+    def start_chunk(trials: np.ndarray) -> BlockStep:
+        active = trials
+        delivered = np.zeros((num_scenarios, active.size))
+        pending = np.ones((num_scenarios, active.size), dtype=bool)
+
+        def step(sprint_offset: int, width: int) -> int:
+            nonlocal active, delivered, pending
+            base_velocities = sampler.draw(rng, (active.size, width))
+
+            for scenario, sprint_factors in enumerate(scenario_factors):
+                rows = np.flatnonzero(pending[scenario])
+                if not rows.size:
+                    continue
+                # A lone scenario may scale the drawn block in place
+                velocities = (
+                    base_velocities if num_scenarios == 1 else base_velocities[rows]
+                )
+                if sprint_factors is not None:
+                    velocities *= sprint_factors[sprint_offset : sprint_offset + width]
+
+                cumulative = np.cumsum(velocities, axis=1)
+                cumulative += delivered[scenario, rows, np.newaxis]
+                if retained is not None and scenario == 0:
+                    _retain_paths(retained, active[rows], sprint_offset, cumulative)
+
+                # First sprint in the block where delivered work covers the backlog
+                reached = cumulative >= remaining_work
+                finished = reached.any(axis=1)
+                crossing = reached.argmax(axis=1)
+
+                results[scenario, active[rows[finished]]] = (
+                    sprint_offset + crossing[finished] + 1
+                )
+                delivered[scenario, rows] = cumulative[:, -1]
+                pending[scenario, rows[finished]] = False
+
+            running = pending.any(axis=0)
+            active = active[running]
+            delivered = delivered[:, running]
+            pending = pending[:, running]
+            return active.size
+
+        return step
+
+    expected_sprints = remaining_work / max(sampler.mean, MIN_VELOCITY)
+    _simulate_in_blocks(
+        num_simulations,
+        _first_block_width(expected_sprints, sprint_cap),
+        sprint_cap,
+        start_chunk,
+    )
+    return list(results)
+
+
+def simulate_cut_line_histograms(
+    cut_lines: Sequence[float],
+    sampler: VelocitySampler,
+    num_simulations: int,
+    rng: np.random.Generator,
+    sprint_factors: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Simulate the completion sprint of every cut line of a ranked backlog
+
+    Each trial draws one burn-up path, simulated until it covers the last cut
+    line. Sorting the path into the ascending cut lines gives, per sprint, how
+    many items are finished by then; the items finished in sprint n are those
+    between the counts of sprint n - 1 and n. These ranges are recorded as +1
+    and -1 marks of a difference table whose running sum over the items is the
+    histogram of every cut line, so the cost depends on trials x sprints and
+    not on the number of items.
+
+    Args:
+        cut_lines: Cumulative work up to and including each backlog item,
+            in ascending order
+        sampler: Source of per-sprint base velocities
+        num_simulations: Number of trials
+        rng: NumPy random generator
+        sprint_factors: Optional sprint factor table, in the format of
+            simulate_completion_sprints
+
+    Returns:
+        (cut lines x sprints) counts, where counts[j, k] is the number of trials
+        that finished item j in k sprints
+    """
+    cut_lines = np.asarray(cut_lines, dtype=float)
+    if cut_lines.ndim != 1 or cut_lines.size == 0:
+        raise ValueError("At least one cut line required")
+    if np.any(np.diff(cut_lines) < 0):
+        raise ValueError("Cut lines must be in ascending order")
+
+    sprint_cap = MAX_SIMULATED_SPRINTS + 1
+    num_cuts = cut_lines.size
+    total_work = float(cut_lines[-1])
+    columns = sprint_cap + 1
+    marks = np.zeros((num_cuts + 1) * columns, dtype=np.int64)
+
+    def start_chunk(trials: np.ndarray) -> BlockStep:
+        delivered = np.zeros(trials.size)
+        covered = np.zeros(trials.size, dtype=np.int64)
+
+        def step(sprint_offset: int, width: int) -> int:
+            nonlocal delivered, covered
+            velocities = sampler.draw(rng, (delivered.size, width))
+            if sprint_factors is not None:
+                velocities *= sprint_factors[sprint_offset : sprint_offset + width]
+            cumulative = np.cumsum(velocities, axis=1)
+            cumulative += delivered[:, np.newaxis]
+
+            # Items finished by the end of each sprint, and before it
+            block_covered = np.searchsorted(cut_lines, cumulative, side="right")
+            previous = np.empty_like(block_covered)
+            previous[:, 0] = covered
+            previous[:, 1:] = block_covered[:, :-1]
+
+            sprints = np.arange(sprint_offset + 1, sprint_offset + width + 1)
+            marks[:] += np.bincount(
+                (previous * columns + sprints).ravel(), minlength=marks.size
+            )
+            marks[:] -= np.bincount(
+                (block_covered * columns + sprints).ravel(), minlength=marks.size
+            )
+
+            covered = block_covered[:, -1]
+            running = covered < num_cuts
+            delivered = cumulative[running, -1]
+            covered = covered[running]
+
+            if delivered.size and sprint_offset + width == sprint_cap:
+                # Items a capped trial never finished are recorded at the cap
+                marks[:] += np.bincount(
+                    covered * columns + sprint_cap, minlength=marks.size
+                )
+                marks[num_cuts * columns + sprint_cap] -= delivered.size
+            return delivered.size
+
+        return step
+
+    # Same block sizing as simulate_completion_sprints for the whole backlog
+    expected_sprints = total_work / max(sampler.mean, MIN_VELOCITY)
+    _simulate_in_blocks(
+        num_simulations,
+        _first_block_width(expected_sprints, sprint_cap),
+        sprint_cap,
+        start_chunk,
+    )
+    return np.cumsum(marks.reshape(num_cuts + 1, columns), axis=0)[:num_cuts]
+
+
+def simulate_gaussian_grid_completion_sprints(
+    remaining_work: float,
+    means: Sequence[float],
+    std_devs: Sequence[float],
+    num_simulations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Simulate a grid of Gaussian velocity assumptions in one batched pass
+
+    Standard normal draws are shared by every grid point and mapped to
+    velocities by the affine transform mean + std_dev * z, clamped like
+    GaussianVelocitySampler. All points are evaluated together as a
+    (points x trials x sprints) block, so a grid costs one set of draws, and
+    differences between points are not blurred by sampling noise.
+
+    Args:
+        remaining_work: Amount of work remaining
+        means: Velocity mean per grid point
+        std_devs: Velocity standard deviation per grid point
+        num_simulations: Number of trials
+        rng: NumPy random generator
+
+    Returns:
+        (points x trials) completion sprints
+    """
+    point_means = np.asarray(means, dtype=float)[:, np.newaxis, np.newaxis]
+    point_std_devs = np.asarray(std_devs, dtype=float)[:, np.newaxis, np.newaxis]
+    num_points = point_means.shape[0]
+    sprint_cap = MAX_SIMULATED_SPRINTS + 1
+    results = np.full((num_points, num_simulations), sprint_cap, dtype=np.int64)
+
+    def start_chunk(trials: np.ndarray) -> BlockStep:
+        active = trials
+        delivered = np.zeros((num_points, active.size))
+        pending = np.ones((num_points, active.size), dtype=bool)
+
+        def step(sprint_offset: int, width: int) -> int:
+            nonlocal active, delivered, pending
+            normals = rng.standard_normal((active.size, width))
+            velocities = point_means + point_std_devs * normals
+            np.maximum(velocities, MIN_VELOCITY, out=velocities)
+            cumulative = np.cumsum(velocities, axis=2)
+            cumulative += delivered[:, :, np.newaxis]
+
+            reached = cumulative >= remaining_work
+            finished = reached[:, :, -1] & pending
+            crossing = reached.argmax(axis=2)
+            points, rows = np.nonzero(finished)
+            results[points, active[rows]] = sprint_offset + crossing[points, rows] + 1
+
+            pending &= ~finished
+            running = pending.any(axis=0)
+            active = active[running]
+            delivered = cumulative[:, running, -1]
+            pending = pending[:, running]
+            return active.size
+
+        return step
+
+    # Size the first block for the slowest grid point
+    slowest = max(float(point_means.min()), MIN_VELOCITY)
+    _simulate_in_blocks(
+        num_simulations,
+        _first_block_width(remaining_work / slowest, sprint_cap),
+        sprint_cap,
+        start_chunk,
+        cells_per_period=num_points,
+    )
+    return results
+
+
+def correlation_factor(correlation: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Factor L of a correlation matrix with L @ L.T == correlation
+
+    Cholesky is used when the matrix is positive definite; semidefinite
+    matrices, e.g. with perfectly correlated teams, fall back to an
+    eigendecomposition.
+    """
+    matrix = np.asarray(correlation, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Correlation matrix must be square")
+    if not np.allclose(matrix, matrix.T):
+        raise ValueError("Correlation matrix must be symmetric")
+    if not np.allclose(np.diag(matrix), 1.0):
+        raise ValueError("Correlation matrix must have a unit diagonal")
+    if np.any(np.abs(matrix) > 1.0 + 1e-9):
+        raise ValueError("Correlations must be between -1 and 1")
+
+    try:
+        return np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues.min() < -1e-8:
+            raise ValueError("Correlation matrix must be positive semidefinite")
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+def simulate_portfolio_completion_sprints(
+    remaining_work: Sequence[float],
+    means: Sequence[float],
+    std_devs: Sequence[float],
+    num_simulations: int,
+    rng: np.random.Generator,
+    correlation: Optional[Sequence[Sequence[float]]] = None,
+) -> np.ndarray:
+    """
+    Simulate the projects of a portfolio jointly, trial by trial
+
+    Every project has its own Gaussian velocity and remaining work, and all
+    projects are simulated together as a (projects x trials x sprints) block.
+    With a correlation matrix, the standard normal draws of one sprint are
+    correlated across projects, so a trial where one team is slow tends to be
+    slow for correlated teams as well. The portfolio completes in the sprint
+    its last project completes, i.e. the maximum over the projects axis.
+
+    Args:
+        remaining_work: Remaining work per project
+        means: Velocity mean per project
+        std_devs: Velocity standard deviation per project
+        num_simulations: Number of trials
+        rng: NumPy random generator
+        correlation: Optional (projects x projects) correlation matrix of
+            team velocities; None = independent teams
+
+    Returns:
+        (projects x trials) completion sprints
+    """
+    project_work = np.asarray(remaining_work, dtype=float)[:, np.newaxis, np.newaxis]
+    project_means = np.asarray(means, dtype=float)[:, np.newaxis, np.newaxis]
+    project_std_devs = np.asarray(std_devs, dtype=float)[:, np.newaxis, np.newaxis]
+    num_projects = project_work.shape[0]
+    factor = None
+    if correlation is not None:
+        factor = correlation_factor(correlation)
+        if factor.shape[0] != num_projects:
+            raise ValueError(
+                f"Correlation matrix is {factor.shape[0]}x{factor.shape[0]} "
+                f"but the portfolio has {num_projects} projects"
+            )
+
+    sprint_cap = MAX_SIMULATED_SPRINTS + 1
+    results = np.full((num_projects, num_simulations), sprint_cap, dtype=np.int64)
+    # Projects without remaining work are done before the first sprint
+    results[project_work[:, 0, 0] <= 0] = 0
+
+    if not (project_work > 0).any():
+        return results
+
+    def start_chunk(trials: np.ndarray) -> BlockStep:
+        active = trials
+        delivered = np.zeros((num_projects, active.size))
+        pending = np.repeat(project_work[:, :, 0] > 0, active.size, axis=1)
+
+        def step(sprint_offset: int, width: int) -> int:
+            nonlocal active, delivered, pending
+            normals = rng.standard_normal((num_projects, active.size, width))
+            if factor is not None:
+                normals = np.tensordot(factor, normals, axes=1)
+            velocities = project_means + project_std_devs * normals
+            np.maximum(velocities, MIN_VELOCITY, out=velocities)
+            cumulative = np.cumsum(velocities, axis=2)
+            cumulative += delivered[:, :, np.newaxis]
+
+            reached = cumulative >= project_work
+            finished = reached[:, :, -1] & pending
+            crossing = reached.argmax(axis=2)
+            projects, rows = np.nonzero(finished)
+            results[projects, active[rows]] = (
+                sprint_offset + crossing[projects, rows] + 1
+            )
+
+            pending &= ~finished
+            running = pending.any(axis=0)
+            active = active[running]
+            delivered = cumulative[:, running, -1]
+            pending = pending[:, running]
+            return active.size
+
+        return step
+
+    # Size the first block for the project expected to take longest
+    expected = project_work / np.maximum(project_means, MIN_VELOCITY)
+    _simulate_in_blocks(
+        num_simulations,
+        _first_block_width(float(expected.max()), sprint_cap),
+        sprint_cap,
+        start_chunk,
+        cells_per_period=num_projects,
+    )
+    return results
+
+
+def simulate_trial_gaussian_completion_sprints(
+    remaining_work: float,
+    trial_means: np.ndarray,
+    trial_std_devs: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Simulate trials whose Gaussian velocity parameters differ per trial
+
+    Trial i draws every sprint from Normal(trial_means[i], trial_std_devs[i]),
+    clamped like GaussianVelocitySampler. Drawing the parameters once per
+    trial (e.g. from a posterior) keeps them fixed along the trial's path, so
+    parameter uncertainty does not average out over the sprints.
+
+    Returns:
+        Integer array with the completion sprint of every trial
+    """
+    trial_means = np.asarray(trial_means, dtype=float)
+    trial_std_devs = np.asarray(trial_std_devs, dtype=float)
+    num_simulations = trial_means.size
+    sprint_cap = MAX_SIMULATED_SPRINTS + 1
+    results = np.full(num_simulations, sprint_cap, dtype=np.int64)
+    if num_simulations == 0:
+        return results
+
+    def start_chunk(trials: np.ndarray) -> BlockStep:
+        active = trials
+        delivered = np.zeros(active.size)
+
+        def step(sprint_offset: int, width: int) -> int:
+            nonlocal active, delivered
+            velocities = rng.standard_normal((active.size, width))
+            velocities *= trial_std_devs[active, np.newaxis]
+            velocities += trial_means[active, np.newaxis]
+            np.maximum(velocities, MIN_VELOCITY, out=velocities)
+            cumulative = np.cumsum(velocities, axis=1)
+            cumulative += delivered[:, np.newaxis]
+
+            reached = cumulative >= remaining_work
+            finished = reached[:, -1]
+            crossing = reached[finished].argmax(axis=1)
+            results[active[finished]] = sprint_offset + crossing + 1
+
+            active = active[~finished]
+            delivered = cumulative[~finished, -1]
+            return active.size
+
+        return step
+
+    typical = max(float(np.median(trial_means)), MIN_VELOCITY)
+    _simulate_in_blocks(
+        num_simulations,
+        _first_block_width(remaining_work / typical, sprint_cap),
+        sprint_cap,
+        start_chunk,
+    )
+    return results
+
+
+def simulate_daily_throughput_completion_days(
+    remaining_items: int,
+    daily_throughput: Sequence[int],
+    num_simulations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Simulate the days needed to finish a number of items by bootstrapping
+
+    Every simulated day resamples one historical day's completed-item count,
+    days without completions included. Days are drawn as (trials x days)
+    integer blocks and accumulated with an integer cumsum; trials that have
+    finished are masked out of further blocks, and the block grows for the
+    few that remain.
+
+    Args:
+        remaining_items: Items left in the backlog
+        daily_throughput: Completed items per historical day
+        num_simulations: Number of trials
+        rng: NumPy random generator
+
+    Returns:
+        Integer array with the completion day of every trial
+    """
+    history = np.asarray(daily_throughput, dtype=np.int32)
+    if history.size == 0 or not history.any():
+        raise ValueError("Daily throughput history needs at least one completion")
+
+    day_cap = MAX_SIMULATED_DAYS + 1
+    results = np.full(num_simulations, day_cap, dtype=np.int64)
+    if remaining_items <= 0:
+        results[:] = 0
+        return results
+
+    def start_chunk(trials: np.ndarray) -> BlockStep:
+        active = trials
+        delivered = np.zeros(active.size, dtype=np.int32)
+
+        def step(day_offset: int, width: int) -> int:
+            nonlocal active, delivered
+            days = rng.integers(0, history.size, size=(active.size, width))
+            cumulative = np.cumsum(history[days], axis=1, dtype=np.int32)
+            cumulative += delivered[:, np.newaxis]
+
+            reached = cumulative >= remaining_items
+            finished = reached[:, -1]
+            crossing = reached[finished].argmax(axis=1)
+            results[active[finished]] = day_offset + crossing + 1
+
+            active = active[~finished]
+            delivered = cumulative[~finished, -1]
+            return active.size
+
+        return step
+
+    _simulate_in_blocks(
+        num_simulations,
+        _first_block_width(remaining_items / history.mean(), day_cap),
+        day_cap,
+        start_chunk,
+        period_name="days",
+    )
+    return results
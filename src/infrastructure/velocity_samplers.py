@@ -0,0 +1,152 @@
+"""Velocity samplers used by the vectorized simulation engine"""
+
+from dataclasses import dataclass
+from typing import Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from .quasi_random import SOBOL_MAX_DIMENSIONS, normal_ppf, scrambled_sobol
+
+MIN_VELOCITY = 0.1
+
+
+class VelocitySampler(Protocol):
+    """Draws blocks of per-sprint base velocities"""
+
+    @property
+    def mean(self) -> float:
+        """Expected velocity, used to size simulation blocks"""
+        ...
+
+    def draw(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        """Draw a (trials x sprints) block of velocities"""
+        ...
+
+    def from_uniforms(self, uniforms: np.ndarray) -> np.ndarray:
+        """Map uniforms in (0, 1) to velocities by inverse transform"""
+        ...
+
+
+@dataclass(frozen=True)
+class GaussianVelocitySampler:
+    """Draws sprint velocities from a normal distribution clamped at MIN_VELOCITY"""
+
+    velocity_mean: float
+    velocity_std_dev: float  # 0 = fixed velocity
+
+    @property
+    def mean(self) -> float:
+        return self.velocity_mean
+
+    def draw(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        if self.velocity_std_dev > 0:
+            velocities = rng.normal(self.velocity_mean, self.velocity_std_dev, shape)
+            np.maximum(velocities, MIN_VELOCITY, out=velocities)
+            return velocities
+        return np.full(shape, max(MIN_VELOCITY, self.velocity_mean))
+
+    def from_uniforms(self, uniforms: np.ndarray) -> np.ndarray:
+        velocities = self.velocity_mean + self.velocity_std_dev * normal_ppf(uniforms)
+        return np.maximum(velocities, MIN_VELOCITY)
+
+
+@dataclass(frozen=True)
+class BootstrapVelocitySampler:
+    """Resamples historical sprint velocities, optionally weighted by recency"""
+
+    velocities: Tuple[float, ...]  # Oldest first
+    weights: Optional[Tuple[float, ...]] = None  # Normalized; None = uniform
+
+    @classmethod
+    def from_history(
+        cls, velocities: Sequence[float], recency_half_life: Optional[float] = None
+    ) -> "BootstrapVelocitySampler":
+        """
+        Build a sampler from historical velocities
+
+        Args:
+            velocities: Per-sprint velocities, oldest first
+            recency_half_life: Sprints after which a velocity's weight halves
+                (None = all sprints weighted equally)
+        """
+        if not velocities:
+            raise ValueError("Bootstrap sampling requires historical velocities")
+        if recency_half_life is None:
+            return cls(velocities=tuple(velocities))
+        ages = np.arange(len(velocities) - 1, -1, -1)
+        weights = 0.5 ** (ages / recency_half_life)
+        return cls(
+            velocities=tuple(velocities),
+            weights=tuple((weights / weights.sum()).tolist()),
+        )
+
+    @property
+    def mean(self) -> float:
+        return float(np.average(self.velocities, weights=self.weights))
+
+    def draw(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        if self.weights is None:
+            values = np.maximum(np.asarray(self.velocities, dtype=float), MIN_VELOCITY)
+            return values[rng.integers(0, values.size, size=shape)]
+        return self.from_uniforms(rng.random(shape))
+
+    def from_uniforms(self, uniforms: np.ndarray) -> np.ndarray:
+        values = np.maximum(np.asarray(self.velocities, dtype=float), MIN_VELOCITY)
+        weights = self.weights or (1.0 / values.size,) * values.size
+        cumulative = np.cumsum(weights)
+        indices = np.searchsorted(cumulative, uniforms * cumulative[-1])
+        return values[np.minimum(indices, values.size - 1)]
+
+
+@dataclass(frozen=True)
+class AntitheticVelocitySampler:
+    """
+    Pairs every drawn path with its mirror image
+
+    The second half of each block uses the uniforms 1 - u of the first half,
+    so a fast path is matched by a slow one and their errors partly cancel.
+    """
+
+    base: VelocitySampler
+
+    @property
+    def mean(self) -> float:
+        return self.base.mean
+
+    def draw(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        uniforms = rng.random(shape)
+        half = shape[0] // 2
+        uniforms[half : 2 * half] = 1.0 - uniforms[:half]
+        return self.from_uniforms(uniforms)
+
+    def from_uniforms(self, uniforms: np.ndarray) -> np.ndarray:
+        return self.base.from_uniforms(uniforms)
+
+
+@dataclass(frozen=True)
+class SobolVelocitySampler:
+    """
+    Draws the first sprints of each block from a scrambled Sobol point set
+
+    Trials are the points and sprints the coordinates, so the early sprints,
+    which decide most completion times, cover the velocity distribution far
+    more evenly than pseudo-random draws. Sprints beyond
+    SOBOL_MAX_DIMENSIONS fall back to pseudo-random uniforms.
+    """
+
+    base: VelocitySampler
+
+    @property
+    def mean(self) -> float:
+        return self.base.mean
+
+    def draw(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        trials, sprints = shape
+        dimensions = min(sprints, SOBOL_MAX_DIMENSIONS)
+        uniforms = np.empty(shape)
+        uniforms[:, :dimensions] = scrambled_sobol(trials, dimensions, rng)
+        uniforms[:, dimensions:] = rng.random((trials, sprints - dimensions))
+        return self.from_uniforms(uniforms)
+
+    def from_uniforms(self, uniforms: np.ndarray) -> np.ndarray:
+        return self.base.from_uniforms(uniforms)
@@ -1,5 +1,6 @@
 import logging
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -39,7 +40,13 @@ from ..application.velocity_prediction_use_cases import (
 )
 from ..domain.data_sources import DataSourceType
 from ..domain.entities import SimulationConfig
-from ..domain.forecasting import ModelType, MonteCarloConfiguration
+from ..domain.forecasting import (
+    AnalyticalConfiguration,
+    ModelType,
+    MonteCarloConfiguration,
+    RandomSampling,
+    SimulationEngine,
+)
 from ..domain.project_identity import generate_csv_project_id, generate_project_id
 from ..domain.reporting_capabilities import REPORT_REQUIREMENTS
 from ..domain.value_objects import FieldMapping
@@ -99,6 +106,25 @@ logger = logging.getLogger(__name__)
 @click.option(
     "--num-simulations", "-n", default=10000, help="Number of Monte Carlo simulations"
 )
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="Random seed for reproducible simulations (default: random)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Worker processes for large simulation runs (default: 1, 0 = all cores)",
+)
+@click.option(
+    "--sampling",
+    type=click.Choice([sampling.value for sampling in RandomSampling]),
+    default=RandomSampling.PSEUDO_RANDOM.value,
+    help="Random sampling for simulations: antithetic and sobol reach the "
+    "same accuracy with fewer simulations (default: pseudo_random)",
+)
 @click.option(
     "--output",
     "-o",
@@ -200,9 +226,10 @@ logger = logging.getLogger(__name__)
 )
 @click.option(
     "--model",
-    type=click.Choice(["monte_carlo"]),
+    type=click.Choice(["monte_carlo", "analytical"]),
     default="monte_carlo",
-    help="Forecasting model to use (default: monte_carlo)",
+    help="Forecasting model to use; analytical computes Gaussian forecasts "
+    "without simulation (default: monte_carlo)",
 )
 @click.option(
     "--exclude-process-health",
@@ -234,6 +261,11 @@ logger = logging.getLogger(__name__)
     is_flag=True,
     help="Show cache information and exit",
 )
+@click.option(
+    "--forecast-cache",
+    is_flag=True,
+    help="Reuse cached forecasts when inputs and configuration are unchanged",
+)
 @click.option(
     "--enable-ml",
     is_flag=True,
@@ -247,6 +279,9 @@ logger = logging.getLogger(__name__)
 def main(
     csv_files: tuple,
     num_simulations: int,
+    seed: Optional[int],
+    workers: int,
+    sampling: str,
     output: str,
     theme: str,
     data_format: str,
@@ -273,6 +308,7 @@ def main(
     team_change: tuple,
     clear_cache: bool,
     cache_info: bool,
+    forecast_cache: bool,
     enable_ml: bool,
     use_react: bool,
 ):
@@ -315,7 +351,10 @@ def main(
             return
 
         if clear_cache:
+            from ..infrastructure.forecast_cache import DEFAULT_CACHE_DIR, ForecastCache
+
             cache.clear()
+            ForecastCache.clear_dir(DEFAULT_CACHE_DIR)
             console.print("[green]✓ Cache cleared[/green]")
             if not csv_files:
                 return
@@ -574,10 +613,17 @@ def main(
     model_type = ModelType.MONTE_CARLO  # Default
     if model == "monte_carlo":
         model_type = ModelType.MONTE_CARLO
+    elif model == "analytical":
+        model_type = ModelType.ANALYTICAL
     # Add more model types as they become available
 
     # Create forecasting model factory
-    model_factory = DefaultModelFactory()
+    cached_forecasts = None
+    if forecast_cache:
+        from ..infrastructure.forecast_cache import DEFAULT_CACHE_DIR, ForecastCache
+
+        cached_forecasts = ForecastCache(cache_dir=DEFAULT_CACHE_DIR)
+    model_factory = DefaultModelFactory(forecast_cache=cached_forecasts)
 
     # Run simulation
     model_info = model_factory.create(model_type).get_model_info()
@@ -652,6 +698,9 @@ def main(
             in_progress_statuses=status_mapping.get("in_progress", []),
             todo_statuses=status_mapping.get("todo", []),
             sprint_duration_days=sprint_duration,
+            random_seed=seed,
+            num_workers=workers or None,
+            random_sampling=sampling,
         )
 
         # For now, use the new model abstraction for velocity scenarios
@@ -666,6 +715,10 @@ def main(
             model_config = MonteCarloConfiguration(
                 num_simulations=num_simulations,
                 confidence_levels=[0.5, 0.7, 0.85, 0.95],
+                engine=SimulationEngine.VECTORIZED,
+                random_seed=seed,
+                num_workers=workers or None,
+                random_sampling=RandomSampling(sampling),
             )
 
             # Apply velocity adjustments
@@ -682,48 +735,14 @@ def main(
             forecast_result = adjusted_result
 
             # Convert both results to legacy SimulationResult format
-            import statistics
-            from datetime import datetime, timedelta
-
-            from ..domain.entities import SimulationResult
-
-            # Helper function to convert forecast result
-            def convert_to_legacy(forecast_result):
-                percentiles = {}
-                confidence_intervals = {}
-                for interval in forecast_result.prediction_intervals:
-                    percentiles[interval.confidence_level] = interval.predicted_value
-                    confidence_intervals[interval.confidence_level] = (
-                        interval.lower_bound,
-                        interval.upper_bound,
-                    )
-
-                today = datetime.now()
-                completion_dates = [
-                    today + timedelta(days=int(s * sprint_duration))
-                    for s in forecast_result.sample_predictions[:100]
-                ]
-
-                return SimulationResult(
-                    percentiles=percentiles,
-                    mean_completion_date=forecast_result.expected_completion_date,
-                    std_dev_days=(
-                        statistics.stdev(forecast_result.sample_predictions)
-                        if len(forecast_result.sample_predictions) > 1
-                        else 0.0
-                    ),
-                    probability_distribution=[],
-                    completion_dates=completion_dates,
-                    confidence_intervals=confidence_intervals,
-                    completion_sprints=forecast_result.sample_predictions[:1000],
-                )
-
-            baseline_results = convert_to_legacy(baseline_forecast)
-            adjusted_results = convert_to_legacy(adjusted_forecast)
+            baseline_results = baseline_forecast.to_simulation_result(sprint_duration)
+            adjusted_results = adjusted_forecast.to_simulation_result(sprint_duration)
             results = adjusted_results  # Use adjusted as primary
             model_info = forecasting_model.get_model_info()
         else:
-            simulation_use_case = RunMonteCarloSimulationUseCase(issue_repo)
+            simulation_use_case = RunMonteCarloSimulationUseCase(
+                issue_repo, model_factory
+            )
             results = simulation_use_case.execute(
                 remaining_work, velocity_metrics, config
             )
@@ -736,6 +755,12 @@ def main(
         if isinstance(model_config, MonteCarloConfiguration):
             model_config.num_simulations = num_simulations
             model_config.sprint_duration_days = sprint_duration
+            model_config.random_seed = seed
+            model_config.num_workers = workers or None
+            model_config.random_sampling = RandomSampling(sampling)
+        elif isinstance(model_config, AnalyticalConfiguration):
+            model_config.sprint_duration_days = sprint_duration
+            model_config.fallback_num_simulations = num_simulations
 
         forecast_use_case = GenerateForecastUseCase(forecasting_model, issue_repo)
         forecast_result = forecast_use_case.execute(
@@ -743,41 +768,14 @@ def main(
         )
 
         # Convert to legacy SimulationResult format for report compatibility
-        import statistics
-        from datetime import datetime, timedelta
-
-        from ..domain.entities import SimulationResult
-
-        # Convert prediction intervals to percentiles
-        percentiles = {}
-        confidence_intervals = {}
-        for interval in forecast_result.prediction_intervals:
-            percentiles[interval.confidence_level] = interval.predicted_value
-            confidence_intervals[interval.confidence_level] = (
-                interval.lower_bound,
-                interval.upper_bound,
-            )
+        results = forecast_result.to_simulation_result(sprint_duration)
 
-        # Generate sample completion dates
-        today = datetime.now()
-        completion_dates = [
-            today + timedelta(days=int(s * sprint_duration))
-            for s in forecast_result.sample_predictions[:100]
-        ]
-
-        # Create legacy result
-        results = SimulationResult(
-            percentiles=percentiles,
-            mean_completion_date=forecast_result.expected_completion_date,
-            std_dev_days=(
-                statistics.stdev(forecast_result.sample_predictions)
-                if len(forecast_result.sample_predictions) > 1
-                else 0.0
-            ),
-            probability_distribution=[],  # Simplified for now
-            completion_dates=completion_dates,
-            confidence_intervals=confidence_intervals,
-            completion_sprints=forecast_result.sample_predictions[:1000],
+    if cached_forecasts is not None:
+        stats = cached_forecasts.stats
+        console.print(
+            f"[dim]Forecast cache: {stats.hits} hits "
+            f"({stats.memory_hits} memory, {stats.disk_hits} disk), "
+            f"{stats.misses} misses[/dim]"
         )
 
     # Analyze historical data
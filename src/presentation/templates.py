@@ -1084,7 +1084,10 @@ class ReportTemplates:
     <div class="metric-card">
         <div class="label">85% Confidence</div>
         <div class="value">
-            {% if multi_report.aggregated_metrics.combined_simulation_result %}
+            {% set portfolio_85 = multi_report.aggregated_metrics.get_portfolio_prediction(0.85) %}
+            {% if portfolio_85 %}
+                {{ portfolio_85.predicted_value|int }} sprints
+            {% elif multi_report.aggregated_metrics.combined_simulation_result %}
                 {{ multi_report.aggregated_metrics.combined_simulation_result.percentiles.get(0.85, 0)|int }} sprints
             {% else %}
                 N/A
@@ -0,0 +1,154 @@
+"""Tests for the closed-form analytical forecasting model"""
+
+import pytest
+
+from src.domain.forecasting import (
+    AnalyticalConfiguration,
+    ModelType,
+    MonteCarloConfiguration,
+    MonteCarloConfigurationWithScenario,
+    SimulationEngine,
+    VelocitySampling,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_adjustments import VelocityAdjustment, VelocityScenario
+from src.infrastructure.analytical_model import AnalyticalModel
+from src.infrastructure.forecasting_model_factory import DefaultModelFactory
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+
+PROFILES = [
+    (200.0, VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)),
+    (120.0, VelocityMetrics(8.0, 7.0, 3.0, 1.0, 20.0, 0.0)),
+    (600.0, VelocityMetrics(15.0, 14.0, 6.0, 3.0, 30.0, 0.0)),
+    (15.0, VelocityMetrics(10.0, 7.0, 4.0, 1.0, 20.0, 0.0)),
+]
+
+
+def _total_variation(first, second):
+    keys = set(first) | set(second)
+    return 0.5 * sum(abs(first.get(k, 0.0) - second.get(k, 0.0)) for k in keys)
+
+
+class TestAnalyticalModel:
+    @pytest.mark.parametrize("remaining_work,velocity_metrics", PROFILES)
+    def test_matches_monte_carlo(self, remaining_work, velocity_metrics):
+        analytical = AnalyticalModel().forecast(
+            remaining_work, velocity_metrics, AnalyticalConfiguration()
+        )
+        simulated = MonteCarloModel().forecast(
+            remaining_work,
+            velocity_metrics,
+            MonteCarloConfiguration(
+                num_simulations=200_000,
+                engine=SimulationEngine.VECTORIZED,
+                random_seed=1,
+            ),
+        )
+
+        assert analytical.model_type == ModelType.ANALYTICAL
+        assert "analytical_fallback" not in analytical.model_metadata
+        assert analytical.expected_sprints == pytest.approx(
+            simulated.expected_sprints, abs=0.02
+        )
+        assert (
+            _total_variation(
+                analytical.probability_distribution,
+                simulated.probability_distribution,
+            )
+            < 0.01
+        )
+        for analytical_interval, simulated_interval in zip(
+            analytical.prediction_intervals, simulated.prediction_intervals
+        ):
+            assert (
+                abs(
+                    analytical_interval.predicted_value
+                    - simulated_interval.predicted_value
+                )
+                <= 1
+            )
+
+    def test_result_shape(self):
+        result = AnalyticalModel().forecast(*PROFILES[0], AnalyticalConfiguration())
+
+        assert sum(result.probability_distribution.values()) == pytest.approx(1.0)
+        assert len(result.sample_predictions) == 1000
+        assert result.sample_predictions == sorted(result.sample_predictions)
+        assert [i.confidence_level for i in result.prediction_intervals] == [
+            0.5,
+            0.7,
+            0.85,
+            0.95,
+        ]
+
+    def test_no_variance_is_exact(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 5.0, 15.0, 25.0, 0.0)
+        config = AnalyticalConfiguration(use_historical_variance=False)
+
+        result = AnalyticalModel().forecast(90.0, velocity_metrics, config)
+
+        assert result.probability_distribution == {5: 1.0}
+        assert result.get_percentile(0.95) == 5
+
+    def test_falls_back_when_velocities_are_often_clamped(self):
+        volatile = VelocityMetrics(8.0, 7.0, 6.0, 1.0, 20.0, 0.0)
+        config = AnalyticalConfiguration(fallback_num_simulations=500)
+
+        result = AnalyticalModel().forecast(120.0, volatile, config)
+
+        assert result.model_type == ModelType.MONTE_CARLO
+        assert "clamped" in result.model_metadata["analytical_fallback"]
+        assert result.model_metadata["num_simulations"] == 500
+
+    def test_falls_back_for_scenarios_and_bootstrap(self):
+        remaining_work, velocity_metrics = PROFILES[0]
+        scenario = VelocityScenario(
+            name="Holidays",
+            adjustments=[VelocityAdjustment(1, 2, 0.5, "Holidays")],
+            team_changes=[],
+        )
+        model = AnalyticalModel()
+
+        with_scenario = model.forecast(
+            remaining_work,
+            velocity_metrics,
+            MonteCarloConfigurationWithScenario(
+                num_simulations=500, velocity_scenario=scenario
+            ),
+        )
+        with_bootstrap = model.forecast(
+            remaining_work,
+            velocity_metrics,
+            MonteCarloConfiguration(
+                num_simulations=500, velocity_sampling=VelocitySampling.BOOTSTRAP
+            ),
+        )
+
+        assert (
+            with_scenario.model_metadata["analytical_fallback"]
+            == "velocity scenario configured"
+        )
+        assert (
+            with_bootstrap.model_metadata["analytical_fallback"]
+            == "bootstrap sampling configured"
+        )
+
+    def test_invalid_configuration(self):
+        config = AnalyticalConfiguration(
+            max_clamp_probability=1.5, fallback_num_simulations=10
+        )
+
+        errors = config.validate()
+
+        assert "Maximum clamp probability must be between 0 and 1" in errors
+        assert "Fallback simulations should be at least 100" in errors
+
+    def test_registered_in_factory(self):
+        factory = DefaultModelFactory()
+
+        model = factory.create(ModelType.ANALYTICAL)
+
+        assert isinstance(model, AnalyticalModel)
+        assert isinstance(
+            factory.get_default_config(ModelType.ANALYTICAL), AnalyticalConfiguration
+        )
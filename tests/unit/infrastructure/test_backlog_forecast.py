@@ -0,0 +1,165 @@
+"""Tests for ranked-backlog cut line forecasts on shared simulated paths"""
+
+import numpy as np
+import pytest
+
+from src.domain.forecasting import (
+    MonteCarloConfiguration,
+    MonteCarloConfigurationWithScenario,
+    SimulationEngine,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_adjustments import VelocityAdjustment, VelocityScenario
+from src.infrastructure.forecast_cache import CachingForecastingModel, ForecastCache
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.sharded_simulation import (
+    SHARD_SIZE,
+    run_sharded_cut_line_simulation,
+)
+from src.infrastructure.vectorized_simulation import (
+    MAX_SIMULATED_SPRINTS,
+    simulate_completion_sprints,
+    simulate_cut_line_histograms,
+)
+from src.infrastructure.velocity_samplers import GaussianVelocitySampler
+
+SAMPLER = GaussianVelocitySampler(20.0, 6.0)
+VELOCITY = VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)
+
+
+class TestCutLineSimulation:
+    def test_last_cut_line_matches_whole_backlog_simulation(self):
+        cut_lines = [5.0, 40.0, 41.0, 130.0, 300.0]
+
+        histograms = simulate_cut_line_histograms(
+            cut_lines, SAMPLER, 20_000, np.random.default_rng(3)
+        )
+        completion = simulate_completion_sprints(
+            300.0, SAMPLER, 20_000, np.random.default_rng(3)
+        )
+
+        expected = np.bincount(completion, minlength=histograms.shape[1])
+        assert np.array_equal(histograms[-1], expected)
+
+    def test_every_cut_line_matches_its_own_forecast(self):
+        cut_lines = np.cumsum(np.random.default_rng(0).choice([1, 2, 3, 5, 8], 200))
+
+        histograms = simulate_cut_line_histograms(
+            cut_lines, SAMPLER, 20_000, np.random.default_rng(1)
+        )
+
+        sprints = np.arange(histograms.shape[1])
+        assert (histograms.sum(axis=1) == 20_000).all()
+        for index in (0, 50, 120):
+            single = simulate_completion_sprints(
+                float(cut_lines[index]), SAMPLER, 20_000, np.random.default_rng(2)
+            )
+            mean = (histograms[index] * sprints).sum() / 20_000
+            assert abs(mean - single.mean()) < 0.05
+
+    def test_completion_is_monotone_in_rank(self):
+        cut_lines = [10.0, 10.0, 60.0, 200.0]
+
+        histograms = simulate_cut_line_histograms(
+            cut_lines, SAMPLER, 5000, np.random.default_rng(4)
+        )
+
+        cumulative = np.cumsum(histograms, axis=1)
+        assert np.array_equal(histograms[0], histograms[1])
+        assert (np.diff(cumulative, axis=0) <= 0).all()
+
+    def test_capped_trials_are_recorded_at_the_cap(self):
+        slow = GaussianVelocitySampler(0.1, 0.0)
+
+        histograms = simulate_cut_line_histograms(
+            [0.45, 500.0], slow, 10, np.random.default_rng(0)
+        )
+
+        assert histograms[0][5] == 10
+        assert histograms[1][MAX_SIMULATED_SPRINTS + 1] == 10
+
+    def test_cut_lines_must_be_ascending(self):
+        with pytest.raises(ValueError, match="ascending"):
+            simulate_cut_line_histograms(
+                [10.0, 5.0], SAMPLER, 10, np.random.default_rng(0)
+            )
+
+    def test_sharded_results_do_not_depend_on_workers(self):
+        cut_lines = [20.0, 90.0, 200.0]
+        runs = [
+            run_sharded_cut_line_simulation(
+                cut_lines, SAMPLER, SHARD_SIZE + 500, random_seed=7, num_workers=w
+            )
+            for w in (1, 2)
+        ]
+
+        for single, parallel in zip(*runs):
+            assert np.array_equal(single.counts, parallel.counts)
+            assert single.total == SHARD_SIZE + 500
+
+
+class TestForecastCutLines:
+    def _config(self, **overrides):
+        settings = dict(
+            num_simulations=5000,
+            confidence_levels=[0.5, 0.85],
+            engine=SimulationEngine.VECTORIZED,
+            random_seed=11,
+        )
+        settings.update(overrides)
+        return MonteCarloConfiguration(**settings)
+
+    def test_last_cut_line_equals_whole_backlog_forecast(self):
+        model = MonteCarloModel()
+        config = self._config()
+
+        results = model.forecast_cut_lines([30.0, 100.0, 250.0], VELOCITY, config)
+        whole = model.forecast(250.0, VELOCITY, config)
+
+        assert len(results) == 3
+        assert results[-1].probability_distribution == whole.probability_distribution
+        assert results[-1].get_percentile(0.85) == whole.get_percentile(0.85)
+        assert results[0].get_percentile(0.5) <= results[1].get_percentile(0.5)
+        assert results[1].model_metadata["cut_line"] == 100.0
+
+    def test_loop_engine_configuration_uses_shared_paths(self):
+        results = MonteCarloModel().forecast_cut_lines(
+            [30.0, 250.0], VELOCITY, self._config(engine=SimulationEngine.LOOP)
+        )
+
+        assert results[0].model_metadata["engine"] == "vectorized"
+        assert results[0].model_metadata["common_random_numbers"] is True
+
+    def test_scenario_slows_every_cut_line(self):
+        scenario = VelocityScenario(
+            name="Half capacity",
+            adjustments=[
+                VelocityAdjustment(sprint_start=1, sprint_end=None, factor=0.5)
+            ],
+            team_changes=[],
+        )
+        config = MonteCarloConfigurationWithScenario(
+            num_simulations=5000,
+            engine=SimulationEngine.VECTORIZED,
+            random_seed=11,
+            velocity_scenario=scenario,
+        )
+        model = MonteCarloModel()
+
+        adjusted = model.forecast_cut_lines([50.0, 200.0], VELOCITY, config)
+        baseline = model.forecast_cut_lines([50.0, 200.0], VELOCITY, self._config())
+
+        for slow, fast in zip(adjusted, baseline):
+            assert slow.expected_sprints > fast.expected_sprints
+
+    def test_cached_cut_lines(self):
+        model = CachingForecastingModel(MonteCarloModel(), ForecastCache())
+        config = self._config()
+
+        first = model.forecast_cut_lines([30.0, 100.0], VELOCITY, config)
+        second = model.forecast_cut_lines([30.0, 100.0], VELOCITY, config)
+
+        assert model.cache.stats.memory_hits == 1
+        assert [r.expected_sprints for r in first] == [
+            r.expected_sprints for r in second
+        ]
@@ -0,0 +1,156 @@
+"""Tests for the Bayesian forecasting model"""
+
+import statistics
+
+import pytest
+
+from src.domain.forecasting import (
+    BayesianConfiguration,
+    ModelConfiguration,
+    ModelType,
+    MonteCarloConfiguration,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_posterior import NormalInverseGammaPosterior
+from src.infrastructure.bayesian_model import BayesianModel
+from src.infrastructure.forecasting_model_factory import DefaultModelFactory
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+
+VELOCITIES = [18.0, 22.0, 25.0, 17.0, 21.0, 24.0, 19.0, 23.0]
+
+
+def _metrics(velocities):
+    return VelocityMetrics(
+        average=statistics.mean(velocities),
+        median=statistics.median(velocities),
+        std_dev=statistics.stdev(velocities),
+        min_value=min(velocities),
+        max_value=max(velocities),
+        trend=0.0,
+        samples=tuple(velocities),
+    )
+
+
+class TestBayesianConfiguration:
+    def test_validation(self):
+        assert BayesianConfiguration().validate() == []
+        errors = BayesianConfiguration(
+            num_simulations=10, prior_strength=0, summary_sprints=0
+        ).validate()
+        assert len(errors) == 3
+
+    def test_prior_mean_and_std_dev_set_together(self):
+        assert BayesianConfiguration(prior_mean=20.0, prior_std_dev=5.0).validate() == []
+        assert len(BayesianConfiguration(prior_mean=20.0).validate()) == 1
+
+
+class TestBayesianModel:
+    def test_forecast_is_reproducible(self):
+        model = BayesianModel()
+        config = BayesianConfiguration(num_simulations=2000, random_seed=7)
+
+        first = model.forecast(200.0, _metrics(VELOCITIES), config)
+        second = model.forecast(200.0, _metrics(VELOCITIES), config)
+
+        assert first.model_type == ModelType.BAYESIAN
+        assert first.probability_distribution == second.probability_distribution
+        assert first.model_metadata["posterior_observations"] == len(VELOCITIES)
+
+    def test_short_history_widens_forecast(self):
+        velocity_metrics = _metrics(VELOCITIES[:3])
+        bayesian = BayesianModel().forecast(
+            300.0,
+            velocity_metrics,
+            BayesianConfiguration(num_simulations=20_000, random_seed=1),
+        )
+        gaussian = MonteCarloModel().forecast(
+            300.0,
+            velocity_metrics,
+            MonteCarloConfiguration(num_simulations=20_000, random_seed=1),
+        )
+
+        # Uncertainty about the true velocity adds to the sprint-to-sprint noise
+        assert bayesian.get_percentile(0.95) >= gaussian.get_percentile(0.95)
+        assert bayesian.get_percentile(0.5) == pytest.approx(
+            gaussian.get_percentile(0.5), abs=1
+        )
+
+    def test_uses_configured_posterior(self):
+        posterior = NormalInverseGammaPosterior.prior(10.0, 1.0, strength=50.0)
+        config = BayesianConfiguration(
+            num_simulations=2000, random_seed=3, posterior=posterior
+        )
+
+        result = BayesianModel().forecast(100.0, _metrics(VELOCITIES), config)
+
+        assert result.model_metadata["velocity_mean"] == 10.0
+        assert result.get_percentile(0.5) == pytest.approx(10, abs=1)
+
+    def test_sprints_are_counted_once(self):
+        posterior = BayesianModel().posterior_for(
+            _metrics(VELOCITIES), BayesianConfiguration()
+        )
+
+        n = len(VELOCITIES)
+        assert posterior.observations == n
+        assert posterior.kappa == pytest.approx(n)
+        assert posterior.alpha == pytest.approx(n / 2)
+        assert posterior.mean == pytest.approx(statistics.mean(VELOCITIES))
+        assert posterior.beta == pytest.approx(
+            statistics.variance(VELOCITIES) * (n - 1) / 2
+        )
+
+    def test_one_sprint_needs_a_configured_prior(self):
+        one_sprint = VelocityMetrics(10.0, 10.0, 0.0, 10.0, 10.0, 0.0, samples=(10.0,))
+
+        with pytest.raises(ValueError, match="at least 2 sprints"):
+            BayesianModel().forecast(100.0, one_sprint, BayesianConfiguration())
+
+        config = BayesianConfiguration(prior_mean=10.0, prior_std_dev=3.0)
+        result = BayesianModel().forecast(100.0, one_sprint, config)
+        assert result.model_metadata["velocity_std_dev"] > 0
+
+    def test_two_sprints_give_a_spread(self):
+        result = BayesianModel().forecast(
+            100.0,
+            _metrics([8.0, 12.0]),
+            BayesianConfiguration(num_simulations=2000, random_seed=4),
+        )
+
+        assert result.model_metadata["velocity_std_dev"] > 0
+        interval = result.prediction_intervals[-1]
+        assert interval.lower_bound < interval.upper_bound
+
+    def test_configured_prior_is_updated_with_metrics(self):
+        config = BayesianConfiguration(
+            prior_mean=30.0, prior_std_dev=10.0, prior_strength=2.0
+        )
+
+        posterior = BayesianModel().posterior_for(_metrics(VELOCITIES), config)
+
+        prior = NormalInverseGammaPosterior.prior(30.0, 10.0, strength=2.0)
+        assert posterior == prior.update_all(VELOCITIES)
+
+    def test_metrics_without_samples_use_summary(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 4.0, 14.0, 26.0, 0.0)
+        config = BayesianConfiguration(summary_sprints=5)
+
+        posterior = BayesianModel().posterior_for(velocity_metrics, config)
+
+        assert posterior.observations == 5
+        assert posterior.mean == pytest.approx(20.0)
+
+    def test_accepts_base_configuration(self):
+        result = BayesianModel().forecast(
+            100.0, _metrics(VELOCITIES), ModelConfiguration(confidence_levels=[0.8])
+        )
+
+        assert [i.confidence_level for i in result.prediction_intervals] == [0.8]
+
+    def test_registered_in_factory(self):
+        factory = DefaultModelFactory()
+
+        assert isinstance(factory.create(ModelType.BAYESIAN), BayesianModel)
+        assert isinstance(
+            factory.get_default_config(ModelType.BAYESIAN), BayesianConfiguration
+        )
@@ -0,0 +1,226 @@
+"""Tests for retained delivered-work paths and scope-by-date queries"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.forecasting import MonteCarloConfiguration, SimulationEngine
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.delivered_work_paths import (
+    MAX_RETAINED_CELLS,
+    DeliveredWorkPaths,
+)
+from src.infrastructure.forecast_cache import CachingForecastingModel, ForecastCache
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.sharded_simulation import (
+    run_sharded_path_simulation,
+    run_sharded_simulation,
+)
+from src.infrastructure.vectorized_simulation import simulate_completion_sprints
+from src.infrastructure.velocity_samplers import GaussianVelocitySampler
+
+SAMPLER = GaussianVelocitySampler(20.0, 5.0)
+VELOCITY = VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)
+
+
+class TestDeliveredWorkPaths:
+    def _paths(self, trials=20_000, horizon=30):
+        return DeliveredWorkPaths.simulate(
+            SAMPLER, trials, horizon, np.random.default_rng(0)
+        )
+
+    def test_paths_are_compact_and_cumulative(self):
+        paths = self._paths()
+
+        assert paths.cumulative.dtype == np.float32
+        assert paths.cumulative.shape == (20_000, 30)
+        assert (np.diff(paths.cumulative, axis=1) > 0).all()
+
+    def test_delivered_distribution_matches_normal_sum(self):
+        delivered = self._paths().delivered_by(10)
+
+        assert abs(delivered.mean() - 200.0) < 1.0
+        assert abs(delivered.std() - 5.0 * np.sqrt(10)) < 0.5
+
+    def test_scope_at_confidence(self):
+        paths = self._paths()
+
+        scope = paths.scope_at_confidence(10, [0.5, 0.85])
+
+        # 85% of trials deliver at least the 85% scope
+        assert scope[0.85] < scope[0.5]
+        assert abs(scope[0.5] - 200.0) < 1.0
+        assert abs(paths.probability_of_delivering(scope[0.85], 10) - 0.85) < 0.01
+
+    def test_scope_by_dates_counts_finished_sprints(self):
+        paths = self._paths()
+        start = datetime(2024, 1, 1)
+        dates = [start + timedelta(days=days) for days in (13, 14, 70, 75)]
+
+        scopes = paths.scope_by_dates(dates, [0.85], start_date=start)
+
+        assert scopes[dates[0]][0.85] == 0.0
+        assert scopes[dates[1]] == paths.scope_at_confidence(1, [0.85])
+        assert scopes[dates[2]] == scopes[dates[3]]
+        assert scopes[dates[2]] == paths.scope_at_confidence(5, [0.85])
+
+    def test_horizon_bounds(self):
+        paths = self._paths(horizon=5)
+
+        with pytest.raises(ValueError, match="beyond the retained horizon"):
+            paths.delivered_by(6)
+        with pytest.raises(ValueError, match="Path horizon"):
+            DeliveredWorkPaths.simulate(SAMPLER, 10, 0, np.random.default_rng(0))
+
+    def test_retained_trials_are_bounded(self):
+        horizon = 1000
+
+        paths = self._paths(trials=10_000, horizon=horizon)
+
+        assert paths.num_trials == MAX_RETAINED_CELLS // horizon
+
+    def test_completion_draws_are_retained_and_continued(self):
+        partial = np.full((500, 20), np.nan, dtype=np.float32)
+        completion_sprints = simulate_completion_sprints(
+            100.0, SAMPLER, 1000, np.random.default_rng(0), retained=partial
+        )
+
+        paths = DeliveredWorkPaths.complete(partial, SAMPLER, np.random.default_rng(1))
+
+        drawn = ~np.isnan(partial)
+        assert np.array_equal(paths.cumulative[drawn], partial[drawn])
+        assert (np.diff(paths.cumulative, axis=1) > 0).all()
+        # Each path reaches the backlog in its trial's completion sprint
+        crossing = (paths.cumulative >= 100.0).argmax(axis=1) + 1
+        assert np.array_equal(crossing, completion_sprints[:500])
+
+
+class TestForecastWithRetainedPaths:
+    def _config(self, **overrides):
+        overrides.setdefault("engine", SimulationEngine.VECTORIZED)
+        return MonteCarloConfiguration(
+            num_simulations=5000,
+            random_seed=3,
+            **overrides,
+        )
+
+    def test_paths_are_opt_in(self):
+        result = MonteCarloModel().forecast(200.0, VELOCITY, self._config())
+
+        assert result.delivered_work is None
+
+    def test_forecast_retains_reproducible_paths(self):
+        config = self._config(retained_path_sprints=20)
+
+        first = MonteCarloModel().forecast(200.0, VELOCITY, config)
+        second = MonteCarloModel().forecast(200.0, VELOCITY, config)
+        plain = MonteCarloModel().forecast(200.0, VELOCITY, self._config())
+
+        paths = first.delivered_work
+        assert paths.horizon_sprints == 20
+        assert np.array_equal(paths.cumulative, second.delivered_work.cumulative)
+        # Metadata stays plain values
+        assert "delivered_work_paths" not in first.model_metadata
+        # Retaining paths does not change the forecast itself
+        assert first.probability_distribution == plain.probability_distribution
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"engine": SimulationEngine.LOOP},
+            {"precision_target": 0.5, "max_simulations": 5000},
+        ],
+    )
+    def test_paths_are_the_forecast_trials(self, overrides):
+        config = self._config(retained_path_sprints=40, **overrides)
+
+        result = MonteCarloModel().forecast(200.0, VELOCITY, config)
+
+        # Every retained trial finishes within the forecast's range
+        paths = result.delivered_work
+        crossing = (paths.cumulative >= 200.0).argmax(axis=1) + 1
+        sprints = result.probability_distribution
+        assert min(sprints) <= crossing.min()
+        assert crossing.max() <= max(sprints)
+
+    def test_scope_is_consistent_with_completion_forecast(self):
+        config = self._config(retained_path_sprints=20)
+
+        result = MonteCarloModel().forecast(200.0, VELOCITY, config)
+
+        paths = result.delivered_work
+        p85 = int(result.get_percentile(0.85))
+        assert paths.probability_of_delivering(200.0, p85) >= 0.8
+
+    def test_cached_forecast_keeps_paths(self):
+        model = CachingForecastingModel(MonteCarloModel(), ForecastCache())
+        config = self._config(retained_path_sprints=10)
+
+        model.forecast(200.0, VELOCITY, config)
+        cached = model.forecast(200.0, VELOCITY, config)
+
+        assert model.cache.stats.memory_hits == 1
+        assert cached.delivered_work.horizon_sprints == 10
+        # The read-only paths are shared rather than copied on every hit
+        assert (
+            cached.delivered_work
+            is model.forecast(200.0, VELOCITY, config).delivered_work
+        )
+        assert not cached.delivered_work.cumulative.flags.writeable
+
+    def test_invalid_horizon(self):
+        errors = self._config(retained_path_sprints=0).validate()
+
+        assert "Retained path sprints must be at least 1" in errors
+
+
+class TestShardedPathSimulation:
+    def test_paths_leave_the_completion_sprints_unchanged(self):
+        accumulator, paths = run_sharded_path_simulation(
+            200.0, SAMPLER, 60_000, 10, random_seed=4
+        )
+        plain = run_sharded_simulation(200.0, SAMPLER, 60_000, random_seed=4)
+
+        assert accumulator.distribution() == plain.distribution()
+        assert np.array_equal(accumulator.samples, plain.samples)
+        assert paths.num_trials == 60_000
+        assert paths.horizon_sprints == 10
+
+    def test_paths_do_not_depend_on_the_worker_count(self):
+        _, serial = run_sharded_path_simulation(
+            200.0, SAMPLER, 30_000, 10, random_seed=4
+        )
+        _, parallel = run_sharded_path_simulation(
+            200.0, SAMPLER, 30_000, 10, random_seed=4, num_workers=2
+        )
+
+        assert np.array_equal(serial.cumulative, parallel.cumulative)
+
+
+class TestCapacityEvaluation:
+    def test_unit_factors_reproduce_the_paths(self):
+        paths = DeliveredWorkPaths.simulate(SAMPLER, 1000, 12, np.random.default_rng(0))
+
+        delivered = paths.delivered_with_factors([1.0] * 12)
+
+        assert np.allclose(delivered, paths.delivered_by(12), rtol=1e-5)
+
+    def test_factors_weight_each_sprint(self):
+        paths = DeliveredWorkPaths(np.array([[10.0, 30.0, 60.0]]))
+
+        delivered = paths.delivered_with_factors([1.0, 0.5, 2.0])
+
+        assert delivered[0] == pytest.approx(10.0 + 10.0 + 60.0)
+
+    def test_evaluator_is_monotone_in_capacity(self):
+        config = MonteCarloConfiguration(num_simulations=5000, random_seed=2)
+        evaluate = MonteCarloModel().completion_evaluator(200.0, VELOCITY, config, 10)
+
+        probabilities = [evaluate([factor] * 10) for factor in (0.8, 1.0, 1.2)]
+
+        assert probabilities == sorted(probabilities)
+        assert 0.3 < probabilities[1] < 0.7
+        # Same paths on every call
+        assert evaluate([1.0] * 10) == probabilities[1]
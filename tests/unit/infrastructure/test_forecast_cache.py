@@ -0,0 +1,223 @@
+"""Tests for the forecast result cache"""
+
+import os
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from src.application.forecasting_use_cases import GenerateForecastUseCase
+from src.domain.forecasting import (
+    ModelType,
+    MonteCarloConfiguration,
+    MonteCarloConfigurationWithScenario,
+    RandomSampling,
+    SimulationEngine,
+    ThroughputConfiguration,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_adjustments import VelocityAdjustment, VelocityScenario
+from src.infrastructure.forecast_cache import (
+    CachingForecastingModel,
+    ForecastCache,
+    forecast_key,
+)
+from src.infrastructure.forecasting_model_factory import DefaultModelFactory
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.throughput_model import ThroughputModel
+
+VELOCITY_METRICS = VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)
+CONFIG = MonteCarloConfiguration(
+    num_simulations=500, engine=SimulationEngine.VECTORIZED, random_seed=1
+)
+
+
+class CountingModel(MonteCarloModel):
+    def __init__(self):
+        self.calls = 0
+
+    def forecast(self, remaining_work, velocity_metrics, config):
+        self.calls += 1
+        return super().forecast(remaining_work, velocity_metrics, config)
+
+
+class TestForecastKey:
+    def test_key_is_stable(self):
+        first = forecast_key("model", 100.0, VELOCITY_METRICS, CONFIG)
+        second = forecast_key(
+            "model", 100.0, replace(VELOCITY_METRICS), replace(CONFIG)
+        )
+
+        assert first == second
+
+    def test_key_ignores_settings_that_do_not_change_results(self):
+        def key(config):
+            return forecast_key("model", 100.0, VELOCITY_METRICS, config)
+
+        loop = replace(CONFIG, engine=SimulationEngine.LOOP)
+        adaptive = replace(CONFIG, precision_target=0.1)
+        sobol = RandomSampling.SOBOL
+
+        assert key(CONFIG) == key(replace(CONFIG, num_workers=4))
+        assert key(CONFIG) == key(replace(CONFIG, max_simulations=5000))
+        assert key(loop) == key(replace(loop, random_sampling=sobol))
+        assert key(adaptive) == key(
+            replace(adaptive, engine=SimulationEngine.LOOP, num_simulations=800)
+        )
+        # Still distinct where the setting matters
+        assert key(CONFIG) != key(replace(CONFIG, num_simulations=800))
+        assert key(CONFIG) != key(replace(CONFIG, random_sampling=sobol))
+
+    def test_key_covers_inputs_seed_and_scenario(self):
+        scenario_config = MonteCarloConfigurationWithScenario(
+            num_simulations=500,
+            velocity_scenario=VelocityScenario(
+                "Holidays", [VelocityAdjustment(1, 2, 0.5, "Holidays")], []
+            ),
+        )
+        keys = {
+            forecast_key("model", 100.0, VELOCITY_METRICS, CONFIG),
+            forecast_key("other", 100.0, VELOCITY_METRICS, CONFIG),
+            forecast_key("model", 101.0, VELOCITY_METRICS, CONFIG),
+            forecast_key(
+                "model", 100.0, replace(VELOCITY_METRICS, std_dev=6.0), CONFIG
+            ),
+            forecast_key(
+                "model", 100.0, VELOCITY_METRICS, replace(CONFIG, random_seed=2)
+            ),
+            forecast_key("model", 100.0, VELOCITY_METRICS, scenario_config),
+            forecast_key(
+                "model",
+                100.0,
+                VELOCITY_METRICS,
+                replace(
+                    scenario_config,
+                    velocity_scenario=VelocityScenario(
+                        "Holidays", [VelocityAdjustment(1, 2, 0.6, "Holidays")], []
+                    ),
+                ),
+            ),
+        }
+
+        assert len(keys) == 7
+
+
+class TestCachingForecastingModel:
+    def test_repeated_forecast_is_served_from_memory(self):
+        inner = CountingModel()
+        cache = ForecastCache()
+        model = CachingForecastingModel(inner, cache)
+
+        first = model.forecast(100.0, VELOCITY_METRICS, CONFIG)
+        second = model.forecast(100.0, VELOCITY_METRICS, CONFIG)
+        model.forecast(100.0, VELOCITY_METRICS, replace(CONFIG, random_seed=2))
+
+        assert inner.calls == 2
+        assert second.probability_distribution == first.probability_distribution
+        assert (cache.stats.memory_hits, cache.stats.misses) == (1, 2)
+
+    def test_hits_are_private_copies_with_fresh_dates(self):
+        cache = ForecastCache()
+        model = CachingForecastingModel(MonteCarloModel(), cache)
+        model.forecast(100.0, VELOCITY_METRICS, CONFIG)
+        key = forecast_key("MonteCarloModel", 100.0, VELOCITY_METRICS, CONFIG)
+        cache.get(key).expected_completion_date = datetime(2000, 1, 1)
+
+        result = model.forecast(100.0, VELOCITY_METRICS, CONFIG)
+        result.model_metadata["changed"] = True
+
+        assert result.expected_completion_date > datetime.now() + timedelta(days=1)
+        assert "changed" not in cache.get(key).model_metadata
+
+    def test_hits_keep_throughput_dates_in_days(self):
+        config = ThroughputConfiguration(
+            daily_throughput=(1, 0, 2, 1, 1), working_days_only=False, random_seed=1
+        )
+        model = CachingForecastingModel(ThroughputModel(), ForecastCache())
+        computed = model.forecast(20, VELOCITY_METRICS, config)
+
+        cached = model.forecast(20, VELOCITY_METRICS, config)
+
+        assert model.cache.stats.memory_hits == 1
+        drift = cached.expected_completion_date - computed.expected_completion_date
+        assert abs(drift) < timedelta(minutes=1)
+
+    def test_disk_tier_survives_new_process(self, tmp_path):
+        CachingForecastingModel(
+            CountingModel(), ForecastCache(cache_dir=tmp_path)
+        ).forecast(100.0, VELOCITY_METRICS, CONFIG)
+        inner = CountingModel()
+        cache = ForecastCache(cache_dir=tmp_path)
+
+        CachingForecastingModel(inner, cache).forecast(100.0, VELOCITY_METRICS, CONFIG)
+
+        assert inner.calls == 0
+        assert cache.stats.disk_hits == 1
+
+    def test_memory_tier_is_lru_bounded(self):
+        cache = ForecastCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        cache.get("b")
+        cache.set("d", "d")
+
+        assert list(cache._entries) == ["b", "d"]
+
+    def test_disk_tier_evicts_least_recently_used(self, tmp_path):
+        cache = ForecastCache(cache_dir=tmp_path, max_disk_bytes=10_000)
+        payload = "x" * 4000
+        for index, key in enumerate(("a", "b")):
+            cache.set(key, payload)
+            os.utime(tmp_path / f"{key}.forecast", (index, index))
+
+        cache.set("c", payload)
+
+        assert sorted(path.stem for path in tmp_path.glob("*.forecast")) == ["b", "c"]
+
+    def test_corrupted_disk_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "broken.forecast").write_bytes(b"not a pickle")
+        cache = ForecastCache(cache_dir=tmp_path)
+
+        assert cache.get("broken") is None
+        assert not (tmp_path / "broken.forecast").exists()
+
+    def test_clear_dir_does_not_create_the_directory(self, tmp_path):
+        ForecastCache(cache_dir=tmp_path).set("a", "a")
+
+        ForecastCache.clear_dir(tmp_path)
+        ForecastCache.clear_dir(tmp_path / "missing")
+
+        assert not list(tmp_path.glob("*.forecast"))
+        assert not (tmp_path / "missing").exists()
+
+    def test_factory_wraps_models_for_use_case(self):
+        cache = ForecastCache()
+        factory = DefaultModelFactory(forecast_cache=cache)
+        use_case = GenerateForecastUseCase(factory.create(ModelType.MONTE_CARLO))
+
+        use_case.execute(100.0, VELOCITY_METRICS, CONFIG)
+        use_case.execute(100.0, VELOCITY_METRICS, CONFIG)
+
+        assert cache.stats.hits == 1
+
+    def test_scenario_groups_stay_paired(self):
+        model = CachingForecastingModel(MonteCarloModel(), ForecastCache())
+        scenario_config = MonteCarloConfigurationWithScenario(
+            num_simulations=500,
+            engine=SimulationEngine.VECTORIZED,
+            random_seed=1,
+            velocity_scenario=VelocityScenario(
+                "Holidays", [VelocityAdjustment(1, 2, 0.5, "Holidays")], []
+            ),
+        )
+
+        first = model.forecast_scenarios(
+            100.0, VELOCITY_METRICS, [CONFIG, scenario_config]
+        )
+        second = model.forecast_scenarios(
+            100.0, VELOCITY_METRICS, [CONFIG, scenario_config]
+        )
+
+        assert first[1].model_metadata["common_random_numbers"] is True
+        assert [r.sample_predictions for r in second] == [
+            r.sample_predictions for r in first
+        ]
+        assert model.cache.stats.hits == 1
@@ -0,0 +1,129 @@
+"""Tests for array-backed forecast outcomes and the lazy ForecastResult views"""
+
+import pickle
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.forecasting import (
+    ForecastResult,
+    ForecastUnit,
+    PlainForecastOutcomes,
+    PredictionInterval,
+)
+from src.infrastructure.forecast_outcomes import ArrayForecastOutcomes
+from src.infrastructure.simulation_accumulator import SimulationAccumulator
+
+VALUES = [3, 4, 4, 5, 5, 5, 6, 6, 9, 12]
+
+
+def _accumulator():
+    return SimulationAccumulator.from_values(VALUES, rng=np.random.default_rng(1))
+
+
+def _result(**overrides):
+    return ForecastResult(
+        **{
+            "prediction_intervals": [PredictionInterval(0.85, 4.0, 6.0, 9.0)],
+            "expected_sprints": 5.9,
+            "expected_completion_date": datetime(2030, 1, 1),
+            **overrides,
+        }
+    )
+
+
+class TestArrayForecastOutcomes:
+    def test_views_match_accumulator(self):
+        accumulator = _accumulator()
+        outcomes = ArrayForecastOutcomes.from_accumulator(accumulator)
+
+        assert outcomes.probabilities() == accumulator.distribution()
+        assert list(outcomes.samples()) == accumulator.samples.tolist()
+        assert outcomes.sample_std_dev() == pytest.approx(np.std(VALUES, ddof=1))
+
+    def test_views_share_the_accumulator_arrays(self):
+        accumulator = _accumulator()
+        outcomes = ArrayForecastOutcomes.from_accumulator(accumulator)
+
+        assert outcomes.counts is accumulator.counts
+        assert np.shares_memory(outcomes.samples_array, accumulator.samples)
+
+    def test_probability_mapping(self):
+        probabilities = ArrayForecastOutcomes.from_accumulator(
+            _accumulator()
+        ).probabilities()
+
+        assert len(probabilities) == 6
+        assert probabilities[5] == 0.3
+        assert 7 not in probabilities
+        with pytest.raises(KeyError):
+            probabilities[100]
+
+    def test_histogram_matches_plain_outcomes(self):
+        accumulator = _accumulator()
+        array = ArrayForecastOutcomes.from_accumulator(accumulator)
+        plain = PlainForecastOutcomes(accumulator.distribution(), VALUES)
+
+        for bins in (1, 5, 50):
+            assert array.histogram(bins) == pytest.approx(plain.histogram(bins))
+
+    def test_empty_outcomes(self):
+        outcomes = ArrayForecastOutcomes.from_accumulator(SimulationAccumulator())
+
+        assert outcomes.histogram(50) == []
+        assert outcomes.sample_std_dev() == 0.0
+        assert len(outcomes.samples()) == 0
+
+
+class TestForecastResultViews:
+    def test_outcomes_back_distribution_and_samples(self):
+        result = _result(
+            outcomes=ArrayForecastOutcomes.from_accumulator(_accumulator())
+        )
+
+        assert result.probability_distribution[5] == 0.3
+        assert result.sample_predictions == VALUES
+        assert result.sample_predictions[:3] == VALUES[:3]
+
+    def test_plain_fields_still_work(self):
+        result = _result(probability_distribution={5: 1.0}, sample_predictions=[5, 5])
+
+        assert isinstance(result.outcomes, PlainForecastOutcomes)
+        assert result.histogram(2) == [1.0, 0.0]
+        assert result.sample_std_dev == 0.0
+
+    def test_simulation_result_is_cached(self):
+        result = _result(
+            outcomes=ArrayForecastOutcomes.from_accumulator(_accumulator())
+        )
+
+        legacy = result.to_simulation_result(14)
+
+        assert result.to_simulation_result(14) is legacy
+        assert legacy.percentiles == {0.85: 6.0}
+        assert legacy.confidence_intervals == {0.85: (4.0, 9.0)}
+        assert legacy.completion_sprints == VALUES
+        assert len(legacy.probability_distribution) == 50
+        assert len(legacy.completion_dates) == len(VALUES)
+
+    def test_completion_dates_follow_the_unit(self):
+        sprints = _result(sample_predictions=[2])
+        days = _result(sample_predictions=[2], unit=ForecastUnit.DAYS)
+
+        sprint_date = sprints.completion_dates(sprint_duration_days=14)[0]
+        day_date = days.completion_dates(sprint_duration_days=14)[0]
+
+        assert sprint_date.date() - day_date.date() == timedelta(days=26)
+
+    def test_pickle_drops_cached_views(self):
+        result = _result(
+            outcomes=ArrayForecastOutcomes.from_accumulator(_accumulator())
+        )
+        result.to_simulation_result()
+
+        restored = pickle.loads(pickle.dumps(result))
+
+        assert restored._views == {}
+        assert restored.probability_distribution == result.probability_distribution
+        assert restored.sample_predictions == result.sample_predictions
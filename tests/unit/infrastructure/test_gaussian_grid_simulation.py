@@ -0,0 +1,120 @@
+"""Tests for batched simulation of Gaussian velocity grids"""
+
+import numpy as np
+
+from src.domain.forecasting import (
+    MonteCarloConfiguration,
+    RandomSampling,
+    SimulationEngine,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.sharded_simulation import (
+    SHARD_SIZE,
+    run_sharded_gaussian_grid_simulation,
+)
+from src.infrastructure.vectorized_simulation import (
+    simulate_completion_sprints,
+    simulate_gaussian_grid_completion_sprints,
+)
+from src.infrastructure.velocity_samplers import GaussianVelocitySampler
+
+
+def _metrics(mean, std_dev):
+    return VelocityMetrics(mean, mean, std_dev, mean - std_dev, mean + std_dev, 0.0)
+
+
+class TestGaussianGridSimulation:
+    def test_single_point_matches_gaussian_engine(self):
+        grid = simulate_gaussian_grid_completion_sprints(
+            300.0, [20.0], [5.0], 10_000, np.random.default_rng(3)
+        )
+        single = simulate_completion_sprints(
+            300.0, GaussianVelocitySampler(20.0, 5.0), 10_000, np.random.default_rng(3)
+        )
+
+        assert np.array_equal(grid[0], single)
+
+    def test_points_share_draws(self):
+        grid = simulate_gaussian_grid_completion_sprints(
+            300.0, [20.0, 20.0, 25.0], [5.0, 5.0, 5.0], 5000, np.random.default_rng(1)
+        )
+
+        assert np.array_equal(grid[0], grid[1])
+        # A faster team finishes no later on the same draws
+        assert (grid[2] <= grid[0]).all()
+
+    def test_each_point_matches_its_distribution(self):
+        means, std_devs = [15.0, 20.0, 25.0], [8.0, 2.0, 5.0]
+
+        grid = simulate_gaussian_grid_completion_sprints(
+            200.0, means, std_devs, 20_000, np.random.default_rng(2)
+        )
+
+        for outcomes, mean, std_dev in zip(grid, means, std_devs):
+            single = simulate_completion_sprints(
+                200.0,
+                GaussianVelocitySampler(mean, std_dev),
+                20_000,
+                np.random.default_rng(9),
+            )
+            assert abs(outcomes.mean() - single.mean()) < 0.1
+
+    def test_sharded_grid_is_independent_of_workers(self):
+        runs = [
+            run_sharded_gaussian_grid_simulation(
+                200.0,
+                [18.0, 22.0],
+                [4.0, 6.0],
+                SHARD_SIZE + 100,
+                random_seed=5,
+                num_workers=workers,
+            )
+            for workers in (1, 2)
+        ]
+
+        for single, parallel in zip(*runs):
+            assert np.array_equal(single.counts, parallel.counts)
+            assert np.array_equal(single.samples, parallel.samples)
+
+
+class TestForecastVelocityGrid:
+    def test_grid_point_matches_forecast(self):
+        config = MonteCarloConfiguration(
+            num_simulations=5000, engine=SimulationEngine.VECTORIZED, random_seed=4
+        )
+        grid = [_metrics(20.0, 5.0), _metrics(16.0, 5.0)]
+
+        results = MonteCarloModel().forecast_velocity_grid(200.0, grid, config)
+        single = MonteCarloModel().forecast(200.0, grid[0], config)
+
+        assert results[0].model_metadata["common_random_numbers"] is True
+        assert results[1].expected_sprints > results[0].expected_sprints
+        assert abs(results[0].expected_sprints - single.expected_sprints) < 0.1
+
+    def test_variance_multiplier_of_config_applies(self):
+        grid = [_metrics(20.0, 5.0)]
+        base = MonteCarloConfiguration(num_simulations=5000, random_seed=4)
+        wide = MonteCarloConfiguration(
+            num_simulations=5000, random_seed=4, variance_multiplier=3.0
+        )
+
+        narrow_result = MonteCarloModel().forecast_velocity_grid(200.0, grid, base)[0]
+        wide_result = MonteCarloModel().forecast_velocity_grid(200.0, grid, wide)[0]
+
+        assert wide_result.get_percentile(0.95) > narrow_result.get_percentile(0.95)
+
+    def test_other_sampling_falls_back_to_forecasts(self):
+        config = MonteCarloConfiguration(
+            num_simulations=1000,
+            engine=SimulationEngine.VECTORIZED,
+            random_seed=4,
+            random_sampling=RandomSampling.ANTITHETIC,
+        )
+
+        results = MonteCarloModel().forecast_velocity_grid(
+            200.0, [_metrics(20.0, 5.0)], config
+        )
+
+        assert "common_random_numbers" not in results[0].model_metadata
+        assert results[0].model_metadata["random_sampling"] == "antithetic"
@@ -0,0 +1,190 @@
+"""Tests for the shared HTTP transport"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.infrastructure.http_transport import (
+    HttpTransport,
+    TokenBucket,
+    TransportMetrics,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only advances when something sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def response(status, headers=None):
+    result = Mock(spec=requests.Response)
+    result.status_code = status
+    result.headers = headers or {}
+    return result
+
+
+class TestTokenBucket:
+    """Shared request pacing"""
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2:] == pytest.approx([0.5, 0.5])
+        assert clock.now == pytest.approx(1.0)
+
+    def test_pause_holds_back_callers(self):
+        clock = FakeClock()
+        bucket = TokenBucket(clock=clock, sleep=clock.sleep)
+
+        bucket.pause(3.0)
+
+        assert bucket.acquire() == pytest.approx(3.0)
+        assert bucket.acquire() == 0.0
+
+    def test_no_burst_after_pause(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=5, clock=clock, sleep=clock.sleep)
+
+        bucket.pause(10.0)
+        bucket.acquire()
+
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestHttpTransport:
+    """Retries, backoff and metrics of the shared session"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def transport(self, clock):
+        return HttpTransport(
+            max_retries=3,
+            rate_limiter=TokenBucket(clock=clock, sleep=clock.sleep),
+            sleep=clock.sleep,
+        )
+
+    def _send(self, transport, responses, method="GET"):
+        with patch.object(requests.Session, "request", side_effect=responses) as send:
+            result = transport.request(method, "https://jira.test/rest/api/2/search")
+        return result, send
+
+    def test_pooled_gzip_session(self):
+        transport = HttpTransport(pool_size=16)
+
+        adapter = transport.get_adapter("https://jira.test")
+        assert adapter._pool_maxsize == 16
+        assert "gzip" in transport.headers["Accept-Encoding"]
+
+    def test_server_errors_are_retried_with_backoff(self, transport, clock):
+        result, send = self._send(
+            transport, [response(503), response(502), response(200)]
+        )
+
+        assert result.status_code == 200
+        assert send.call_count == 3
+        assert len(clock.sleeps) == 2
+        assert 0 <= clock.sleeps[0] <= 0.5
+        assert 0 <= clock.sleeps[1] <= 1.0
+
+    def test_retry_after_is_honored_and_shared(self, transport, clock):
+        result, _ = self._send(
+            transport, [response(429, {"Retry-After": "7"}), response(200)]
+        )
+
+        assert result.status_code == 200
+        assert clock.sleeps == [7.0]
+        assert transport.metrics.throttled == 1
+
+    def test_retry_after_http_date(self, transport):
+        later = datetime.now(timezone.utc) + timedelta(seconds=30)
+        throttled = response(429, {"Retry-After": format_datetime(later)})
+
+        assert 25 <= transport._retry_after(throttled) <= 30
+
+    def test_retry_after_is_capped(self, transport):
+        throttled = response(429, {"Retry-After": "3600"})
+
+        assert transport._retry_after(throttled) == transport.max_delay
+
+    def test_last_response_returned_when_retries_run_out(self, transport):
+        result, send = self._send(transport, [response(500)] * 4)
+
+        assert result.status_code == 500
+        assert send.call_count == 4
+        assert transport.metrics.failures == 1
+
+    def test_post_is_not_resent_after_server_error(self, transport):
+        result, send = self._send(transport, [response(500)], method="POST")
+
+        assert result.status_code == 500
+        assert send.call_count == 1
+
+    def test_post_is_resent_after_throttling(self, transport):
+        result, send = self._send(
+            transport, [response(429), response(201)], method="POST"
+        )
+
+        assert result.status_code == 201
+        assert send.call_count == 2
+
+    def test_connection_errors_are_retried(self, transport):
+        result, send = self._send(
+            transport, [requests.ConnectionError("reset"), response(200)]
+        )
+
+        assert result.status_code == 200
+        assert transport.metrics.retries == 1
+
+    def test_connection_error_raised_when_retries_run_out(self, transport):
+        with pytest.raises(requests.ConnectionError):
+            self._send(transport, [requests.ConnectionError("reset")] * 4)
+
+        assert transport.metrics.failures == 1
+
+    def test_default_timeout_is_applied(self, transport):
+        _, send = self._send(transport, [response(200)])
+
+        assert send.call_args.kwargs["timeout"] == transport.timeout
+
+    def test_metrics_record_each_request(self, transport):
+        self._send(transport, [response(503), response(200)])
+        self._send(transport, [response(200)])
+
+        summary = transport.metrics.summary()
+        assert summary["requests"] == 2
+        assert summary["retries"] == 1
+        assert [timing.attempts for timing in transport.metrics.recent] == [2, 1]
+        assert summary["p95_seconds"] >= summary["p50_seconds"]
+
+
+class TestTransportMetrics:
+    def test_empty_summary(self):
+        metrics = TransportMetrics()
+
+        assert metrics.summary()["requests"] == 0
+        assert "mean_seconds" not in metrics.summary()
+        assert metrics.describe() == "0 requests, 0 retries, 0 throttled"
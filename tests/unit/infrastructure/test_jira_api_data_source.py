@@ -1,13 +1,19 @@
 """Tests for Jira API data source"""
 
+import json
+import threading
+import time
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
 from src.domain.entities import Issue, Sprint
 from src.domain.exceptions import ProcessingError
 from src.infrastructure.config import JiraConfig
+from src.infrastructure.issue_snapshot import IssueSnapshotStore
 from src.infrastructure.jira_api_data_source import JiraApiDataSource
 
 
@@ -58,6 +64,7 @@ class TestJiraApiDataSource:
                     username="test@example.com",
                     password="test-token",
                     cloud=True,
+                    session=data_source.transport,
                 )
 
     def test_build_jql_query_with_project(self, jira_data_source):
@@ -110,8 +117,7 @@ class TestJiraApiDataSource:
         assert sprints == cached_sprints
         jira_data_source.cache.set.assert_not_called()
 
-    @patch("src.infrastructure.jira_api_data_source.requests.get")
-    def test_fetch_all_issues_rest(self, mock_get, jira_data_source):
+    def test_fetch_all_issues_rest(self, jira_data_source):
         """Test REST API fallback for fetching issues"""
         # Setup mock responses
         response1 = Mock()
@@ -146,19 +152,18 @@ class TestJiraApiDataSource:
             ],
         }
 
-        mock_get.side_effect = [response1, response2]
-
-        issues = jira_data_source._fetch_all_issues_rest("project = TEST")
+        with patch.object(
+            jira_data_source.transport, "get", side_effect=[response1, response2]
+        ):
+            issues = jira_data_source._fetch_all_issues_rest("project = TEST")
 
         assert len(issues) == 2
         assert issues[0]["key"] == "TEST-1"
         assert issues[1]["key"] == "TEST-2"
 
         # Verify authentication
-        calls = mock_get.call_args_list
-        for call in calls:
-            assert call[1]["auth"].username == "test@example.com"
-            assert call[1]["auth"].password == "test-token"
+        assert jira_data_source.transport.auth.username == "test@example.com"
+        assert jira_data_source.transport.auth.password == "test-token"
 
     def test_parse_issue_basic_fields(self, jira_data_source):
         """Test parsing of basic issue fields"""
@@ -308,3 +313,550 @@ class TestJiraApiDataSource:
         # Verify sprint duration is 14 days
         duration = (sprint.end_date - sprint.start_date).days
         assert duration == 13  # 14 days inclusive
+
+
+class StubJiraServer:
+    """Local HTTP server answering Jira REST searches from canned issues"""
+
+    def __init__(
+        self,
+        num_issues,
+        page_limit=100,
+        latency=None,
+        fail_at=None,
+        failures=None,
+        fail_status=500,
+        retry_after=None,
+    ):
+        self.issues = [
+            {
+                "key": f"TEST-{i}",
+                "fields": {
+                    "summary": f"Issue {i}",
+                    "issuetype": {"name": "Story"},
+                    "status": {"name": "Done"},
+                    "created": "2024-01-01T10:00:00.000+0000",
+                },
+            }
+            for i in range(num_issues)
+        ]
+        self.page_limit = page_limit
+        self.latency = latency or (lambda start_at: 0.0)
+        self.fail_at = fail_at
+        self.failures = failures  # Failed answers at fail_at, None for all
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.requests = []
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}
+        )
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _should_fail(self):
+        with self._lock:
+            if self.failures is None:
+                return True
+            if self.failures > 0:
+                self.failures -= 1
+                return True
+            return False
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                start_at = int(query["startAt"][0])
+                max_results = min(int(query["maxResults"][0]), stub.page_limit)
+                with stub._lock:
+                    stub.requests.append(start_at)
+                    stub.queries.append(query)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.latency(start_at))
+                    if start_at == stub.fail_at and stub._should_fail():
+                        self.send_response(stub.fail_status)
+                        if stub.retry_after is not None:
+                            self.send_header("Retry-After", stub.retry_after)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    body = json.dumps(
+                        {
+                            "startAt": start_at,
+                            "maxResults": max_results,
+                            "total": len(stub.issues),
+                            "issues": stub.issues[start_at : start_at + max_results],
+                        }
+                    ).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class TestConcurrentPageFetching:
+    """Concurrent offset pagination against a stub Jira server"""
+
+    def _data_source(self, url, concurrency):
+        config = JiraConfig(
+            url=url,
+            username="test@example.com",
+            api_token="test-token",
+            fetch_concurrency=concurrency,
+        )
+        with patch("src.infrastructure.jira_api_data_source.Jira") as jira_class:
+            jira_class.return_value.get_all_fields.return_value = []
+            with patch("src.infrastructure.jira_api_data_source.APICache"):
+                data_source = JiraApiDataSource(config)
+        data_source.transport.backoff_base = 0.001
+        return data_source
+
+    def test_pages_keep_search_order(self):
+        # Later pages answer first, so completion order is the reverse
+        with StubJiraServer(
+            950, latency=lambda start_at: 0.05 - start_at / 50_000
+        ) as server:
+            data_source = self._data_source(server.url, concurrency=4)
+
+            issues = data_source._fetch_all_issues("project = TEST")
+
+        assert [issue.key for issue in issues] == [f"TEST-{i}" for i in range(950)]
+        assert sorted(server.requests) == list(range(0, 1000, 100))
+
+    def test_concurrency_cap_is_respected(self):
+        with StubJiraServer(1000, latency=lambda start_at: 0.05) as server:
+            data_source = self._data_source(server.url, concurrency=3)
+
+            data_source._fetch_all_issues("project = TEST")
+
+        assert 1 < server.max_in_flight <= 3
+
+    def test_page_size_follows_server_limit(self):
+        with StubJiraServer(120, page_limit=50) as server:
+            data_source = self._data_source(server.url, concurrency=2)
+
+            issues = data_source._fetch_all_issues("project = TEST")
+
+        assert len(issues) == 120
+        assert sorted(server.requests) == [0, 50, 100]
+
+    def test_pages_are_parsed_while_downloading(self):
+        with StubJiraServer(1000, latency=lambda start_at: 0.02) as server:
+            data_source = self._data_source(server.url, concurrency=2)
+            requests_at_parse = []
+            parse_issues = data_source._parse_issues
+
+            def recording_parse(raw_issues):
+                requests_at_parse.append(len(server.requests))
+                return parse_issues(raw_issues)
+
+            with patch.object(data_source, "_parse_issues", recording_parse):
+                data_source._fetch_all_issues("project = TEST")
+
+        assert requests_at_parse[1] < len(server.requests)
+
+    def test_failed_page_raises(self):
+        with StubJiraServer(500, fail_at=300) as server:
+            data_source = self._data_source(server.url, concurrency=2)
+
+            with pytest.raises(ProcessingError):
+                data_source._fetch_all_issues("project = TEST")
+
+        # The page was retried before the fetch gave up
+        assert server.requests.count(300) == 1 + data_source.config.max_retries
+
+    def test_pages_request_planned_fields_only(self):
+        with StubJiraServer(250) as server:
+            data_source = self._data_source(server.url, concurrency=2)
+
+            data_source._fetch_all_issues("project = TEST")
+
+        plan = data_source.field_plan
+        assert plan.expand is None
+        assert {query["fields"][0] for query in server.queries} == {plan.fields_param}
+        assert not any("expand" in query for query in server.queries)
+
+    def test_all_fields_on_request(self):
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            fetch_all_fields=True,
+        )
+        with patch("src.infrastructure.jira_api_data_source.Jira"):
+            with patch("src.infrastructure.jira_api_data_source.APICache"):
+                data_source = JiraApiDataSource(config)
+
+        assert data_source.field_plan.fields_param == "*all"
+        assert data_source.field_plan.expand == "changelog"
+
+    def test_field_plan_is_part_of_cache_key(self, mock_config):
+        with patch("src.infrastructure.jira_api_data_source.Jira"):
+            with patch("src.infrastructure.jira_api_data_source.APICache"):
+                planned = JiraApiDataSource(mock_config)
+                mock_config.fetch_all_fields = True
+                everything = JiraApiDataSource(mock_config)
+
+        jql = "project = TEST"
+        assert planned._query_hash(jql) != everything._query_hash(jql)
+
+    def test_transient_page_failure_is_retried(self):
+        with StubJiraServer(500, fail_at=300, failures=2) as server:
+            data_source = self._data_source(server.url, concurrency=2)
+
+            issues = data_source._fetch_all_issues("project = TEST")
+
+        assert [issue.key for issue in issues] == [f"TEST-{i}" for i in range(500)]
+        assert server.requests.count(300) == 3
+        assert data_source.transport.metrics.retries == 2
+
+    def test_throttled_page_is_retried_after_pause(self):
+        with StubJiraServer(
+            500, fail_at=200, failures=1, fail_status=429, retry_after="0"
+        ) as server:
+            data_source = self._data_source(server.url, concurrency=3)
+
+            issues = data_source._fetch_all_issues("project = TEST")
+
+        assert len(issues) == 500
+        assert data_source.transport.metrics.throttled == 1
+
+    def test_cloud_pages_are_fetched_serially(self):
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            fetch_concurrency=4,
+        )
+        with patch("src.infrastructure.jira_api_data_source.Jira") as jira_class:
+            jira_class.return_value.get_all_fields.return_value = []
+            jira_class.return_value.jql.return_value = {
+                "issues": [
+                    {
+                        "key": f"TEST-{i}",
+                        "fields": {
+                            "summary": f"Issue {i}",
+                            "issuetype": {"name": "Story"},
+                            "status": {"name": "Done"},
+                            "created": "2024-01-01T10:00:00.000+0000",
+                        },
+                    }
+                    for i in range(3)
+                ],
+                "isLast": True,
+            }
+            with patch("src.infrastructure.jira_api_data_source.APICache"):
+                data_source = JiraApiDataSource(config)
+        data_source._search_pages = Mock()
+
+        issues = data_source._fetch_all_issues("project = TEST")
+
+        assert [issue.key for issue in issues] == ["TEST-0", "TEST-1", "TEST-2"]
+        data_source._search_pages.assert_not_called()
+
+    def test_serial_fetch_by_default(self):
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+        )
+
+        assert config.fetch_concurrency == 1
+        with pytest.raises(ValueError):
+            JiraConfig(
+                url="https://test.atlassian.net",
+                username="test@example.com",
+                api_token="test-token",
+                fetch_concurrency=0,
+            ).validate()
+
+
+class TestIncrementalSync:
+    """Snapshot refreshes with updated-since deltas"""
+
+    def _issue(self, key, sprint=None, points=3.0):
+        return Issue(
+            key=key,
+            summary=key,
+            issue_type="Story",
+            status="Done",
+            created=datetime(2024, 1, 1),
+            resolved=datetime(2024, 1, 5),
+            story_points=points,
+            custom_fields={"sprint": sprint} if sprint else {},
+        )
+
+    @pytest.fixture
+    def data_source(self, mock_config, mock_jira_client, tmp_path):
+        mock_config.incremental_sync = True
+        with patch("src.infrastructure.jira_api_data_source.APICache"):
+            data_source = JiraApiDataSource(
+                mock_config, snapshot_store=IssueSnapshotStore(tmp_path)
+            )
+        data_source._fetch_sprint_data = Mock(return_value={})
+        data_source._fetch_issue_keys = Mock()
+        return data_source
+
+    def test_initial_sync_fetches_everything(self, data_source):
+        issues = [self._issue("TEST-1", "Sprint 1"), self._issue("TEST-2")]
+        data_source._fetch_all_issues = Mock(return_value=issues)
+
+        synced, sprints = data_source.parse()
+
+        assert synced == issues
+        assert [s.name for s in sprints] == ["Sprint 1"]
+        data_source._fetch_all_issues.assert_called_once_with(
+            "project = TEST ORDER BY created DESC"
+        )
+        data_source._fetch_issue_keys.assert_not_called()
+
+    def test_delta_sync_merges_by_key(self, data_source):
+        data_source._fetch_all_issues = Mock(
+            return_value=[
+                self._issue("TEST-1", "Sprint 1"),
+                self._issue("TEST-2", "Sprint 2"),
+            ]
+        )
+        data_source.parse()
+
+        changed = self._issue("TEST-1", "Sprint 1", points=8.0)
+        added = self._issue("TEST-3", "Sprint 3")
+        data_source._fetch_all_issues = Mock(return_value=[changed, added])
+        data_source._fetch_issue_keys.return_value = {"TEST-1", "TEST-2", "TEST-3"}
+        data_source._extract_sprints = Mock(wraps=data_source._extract_sprints)
+
+        issues, sprints = data_source.parse()
+
+        delta_jql = data_source._fetch_all_issues.call_args.args[0]
+        assert delta_jql.startswith("(project = TEST) AND updated >= -")
+        assert delta_jql.endswith("m ORDER BY created DESC")
+        assert [i.key for i in issues] == ["TEST-1", "TEST-2", "TEST-3"]
+        assert issues[0].story_points == 8.0
+        by_name = {s.name: s for s in sprints}
+        assert by_name["Sprint 1"].completed_points == 8.0
+        assert set(by_name) == {"Sprint 1", "Sprint 2", "Sprint 3"}
+        # Sprint 2 was not touched, so its issues were not regrouped
+        recomputed = data_source._extract_sprints.call_args.args[0]
+        assert {i.key for i in recomputed} == {"TEST-1", "TEST-3"}
+
+    def test_issues_leaving_the_jql_are_dropped_on_next_sync(self, data_source):
+        data_source._fetch_all_issues = Mock(
+            return_value=[
+                self._issue("TEST-1", "Sprint 1"),
+                self._issue("TEST-2", "Sprint 2"),
+            ]
+        )
+        data_source.parse()
+
+        # TEST-2 changed so it no longer matches, so the delta cannot see it
+        data_source._fetch_all_issues = Mock(return_value=[])
+        data_source._fetch_issue_keys.return_value = {"TEST-1"}
+        issues, sprints = data_source.parse()
+
+        data_source._fetch_issue_keys.assert_called_once_with(
+            "project = TEST ORDER BY created DESC"
+        )
+        assert [i.key for i in issues] == ["TEST-1"]
+        assert [s.name for s in sprints] == ["Sprint 1"]
+
+    def test_reconciliation_interval(self, data_source):
+        data_source.config.reconcile_hours = 24
+        data_source._fetch_all_issues = Mock(
+            return_value=[
+                self._issue("TEST-1", "Sprint 1"),
+                self._issue("TEST-2", "Sprint 2"),
+            ]
+        )
+        data_source.parse()
+
+        data_source._fetch_all_issues = Mock(return_value=[])
+        data_source.parse()
+        data_source._fetch_issue_keys.assert_not_called()
+
+        data_source.config.reconcile_hours = 0
+        data_source._fetch_issue_keys.return_value = {"TEST-1"}
+        issues, sprints = data_source.parse()
+
+        assert [i.key for i in issues] == ["TEST-1"]
+        assert [s.name for s in sprints] == ["Sprint 1"]
+
+    def test_snapshot_persists_between_instances(
+        self, data_source, mock_config, tmp_path
+    ):
+        data_source._fetch_all_issues = Mock(return_value=[self._issue("TEST-1")])
+        data_source.parse()
+
+        with patch("src.infrastructure.jira_api_data_source.APICache"):
+            restarted = JiraApiDataSource(
+                mock_config, snapshot_store=IssueSnapshotStore(tmp_path)
+            )
+        restarted._fetch_all_issues = Mock(return_value=[])
+        restarted._fetch_issue_keys = Mock(return_value={"TEST-1"})
+
+        issues, _ = restarted.parse()
+
+        assert [i.key for i in issues] == ["TEST-1"]
+        assert "updated >=" in restarted._fetch_all_issues.call_args.args[0]
+
+    @pytest.mark.parametrize(
+        "jql, expected",
+        [
+            ("project = A", "(project = A) AND updated >= -5m"),
+            (
+                "project = A order by rank",
+                "(project = A) AND updated >= -5m ORDER BY rank",
+            ),
+            ("ORDER BY created", "updated >= -5m ORDER BY created"),
+        ],
+    )
+    def test_jql_with_condition(self, jql, expected):
+        assert JiraApiDataSource._jql_with_condition(jql, "updated >= -5m") == expected
+
+
+class TestUnionFetch:
+    """One fetch for overlapping forecast and history queries"""
+
+    FORECAST_JQL = "project = TEST AND statusCategory != Done ORDER BY rank"
+    HISTORY_JQL = "project = TEST AND statusCategory = Done"
+
+    def _issue(self, key, sprint=None):
+        return Issue(
+            key=key,
+            summary=key,
+            issue_type="Story",
+            status="Done" if sprint else "To Do",
+            created=datetime(2024, 1, 1),
+            resolved=datetime(2024, 1, 5) if sprint else None,
+            story_points=3.0,
+            custom_fields={"sprint": sprint} if sprint else {},
+        )
+
+    @pytest.fixture
+    def data_source(self, jira_data_source):
+        jira_data_source.config.forecast_jql = self.FORECAST_JQL
+        jira_data_source.config.history_jql = self.HISTORY_JQL
+        union = [
+            self._issue("TEST-3"),
+            self._issue("TEST-1", sprint="Sprint 1"),
+            self._issue("TEST-2", sprint="Sprint 2"),
+            self._issue("TEST-4"),
+        ]
+        keys = {
+            self.FORECAST_JQL: {"TEST-3", "TEST-4"},
+            self.HISTORY_JQL: {"TEST-1", "TEST-2"},
+        }
+        jira_data_source._fetch_all_issues = Mock(return_value=union)
+        jira_data_source._fetch_issue_keys = Mock(side_effect=keys.__getitem__)
+        return jira_data_source
+
+    def test_union_jql(self):
+        assert JiraApiDataSource._union_jql(self.FORECAST_JQL, self.HISTORY_JQL) == (
+            "(project = TEST AND statusCategory != Done) OR "
+            "(project = TEST AND statusCategory = Done) ORDER BY rank"
+        )
+
+    def test_union_jql_without_filter_matches_everything(self):
+        union = JiraApiDataSource._union_jql("ORDER BY created", self.HISTORY_JQL)
+
+        assert union == "ORDER BY created"
+
+    def test_issues_fetched_once_and_split(self, data_source):
+        issues, sprints = data_source.parse()
+
+        data_source._fetch_all_issues.assert_called_once_with(
+            JiraApiDataSource._union_jql(self.FORECAST_JQL, self.HISTORY_JQL)
+        )
+        assert [issue.key for issue in issues] == ["TEST-3", "TEST-4"]
+        assert sorted(sprint.name for sprint in sprints) == ["Sprint 1", "Sprint 2"]
+
+    def test_one_cache_entry_with_both_views(self, data_source):
+        data_source.parse()
+
+        data_source.cache.set.assert_called_once()
+        key, cached = data_source.cache.set.call_args.args
+        assert key.startswith("jira_union_")
+        assert len(cached["issues"]) == 4
+        assert cached["forecast_keys"] == {"TEST-3", "TEST-4"}
+
+        data_source.cache.get.return_value = cached
+        issues, _ = data_source.parse()
+
+        assert [issue.key for issue in issues] == ["TEST-3", "TEST-4"]
+        data_source._fetch_all_issues.assert_called_once()
+
+    def test_separate_fetches_when_disabled(self, data_source):
+        data_source.config.union_fetch = False
+
+        data_source.parse()
+
+        fetched = [
+            call.args[0] for call in data_source._fetch_all_issues.call_args_list
+        ]
+        assert fetched == [self.FORECAST_JQL, self.HISTORY_JQL]
+        data_source._fetch_issue_keys.assert_not_called()
+
+    def test_cloud_split_uses_enhanced_search(self, jira_data_source):
+        # Jira Cloud has deprecated the offset search
+        assert jira_data_source.is_cloud is True
+        jira_data_source.config.forecast_jql = self.FORECAST_JQL
+        jira_data_source.config.history_jql = self.HISTORY_JQL
+        jira_data_source._fetch_all_issues = Mock(
+            return_value=[self._issue("TEST-1", sprint="Sprint 1"), self._issue("TEST-2")]
+        )
+        pages = {
+            (self.FORECAST_JQL, None): {
+                "issues": [{"key": "TEST-2"}],
+                "isLast": True,
+            },
+            (self.HISTORY_JQL, None): {
+                "issues": [{"key": "TEST-1"}],
+                "nextPageToken": "page-2",
+                "isLast": False,
+            },
+            (self.HISTORY_JQL, "page-2"): {"issues": [{"key": "TEST-9"}]},
+        }
+        jira_data_source.jira.enhanced_jql.side_effect = (
+            lambda jql, fields, nextPageToken, limit: pages[(jql, nextPageToken)]
+        )
+        jira_data_source._search_pages = Mock()
+
+        issues, sprints = jira_data_source.parse()
+
+        assert [issue.key for issue in issues] == ["TEST-2"]
+        assert [sprint.name for sprint in sprints] == ["Sprint 1"]
+        assert jira_data_source.jira.enhanced_jql.call_count == 3
+        assert all(
+            call.kwargs["fields"] == "key"
+            for call in jira_data_source.jira.enhanced_jql.call_args_list
+        )
+        jira_data_source._search_pages.assert_not_called()
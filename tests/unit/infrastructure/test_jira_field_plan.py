@@ -0,0 +1,94 @@
+"""Tests for Jira field planning"""
+
+import pytest
+
+from src.domain.reporting_capabilities import DataRequirement, ReportType
+from src.infrastructure.config import JiraConfig
+from src.infrastructure.jira_field_plan import (
+    JiraFieldPlan,
+    requirements_for_reports,
+)
+
+CUSTOM_FIELD_MAP = {
+    "story_points": "customfield_10016",
+    "sprint": "customfield_10020",
+    "epic_link": "customfield_10014",
+}
+
+
+class TestRequirementsForReports:
+    def test_all_reports_by_default(self):
+        requirements = requirements_for_reports()
+
+        assert DataRequirement.TIME_SPENT in requirements
+        assert DataRequirement.LABELS in requirements
+
+    def test_core_reports_always_included(self):
+        requirements = requirements_for_reports([ReportType.CYCLE_TIME_DISTRIBUTION])
+
+        assert DataRequirement.STORY_POINTS in requirements
+        assert DataRequirement.SPRINT in requirements
+        assert DataRequirement.RESOLVED_DATE in requirements
+        assert DataRequirement.TIME_SPENT not in requirements
+
+
+class TestJiraFieldPlan:
+    def test_minimal_fields_without_changelog(self):
+        plan = JiraFieldPlan.for_requirements(
+            {DataRequirement.STORY_POINTS, DataRequirement.SPRINT}, CUSTOM_FIELD_MAP
+        )
+
+        assert plan.expand is None
+        assert "*all" not in plan.fields
+        assert "description" not in plan.fields
+        assert {"status", "created", "resolutiondate"} <= set(plan.fields)
+        assert {"customfield_10016", "customfield_10020"} <= set(plan.fields)
+        # Epic links are always requested for epic rollups
+        assert "customfield_10014" in plan.fields
+
+    def test_requirements_map_to_system_fields(self):
+        plan = JiraFieldPlan.for_requirements(
+            {DataRequirement.TIME_SPENT, DataRequirement.ASSIGNEE}
+        )
+
+        assert {"timespent", "assignee"} <= set(plan.fields)
+        assert "timeoriginalestimate" not in plan.fields
+
+    def test_missing_custom_fields_are_left_out(self):
+        plan = JiraFieldPlan.for_requirements({DataRequirement.STORY_POINTS}, {})
+
+        assert not any(field.startswith("customfield_") for field in plan.fields)
+
+    def test_fields_are_unique(self):
+        plan = JiraFieldPlan.for_requirements(
+            requirements_for_reports(), CUSTOM_FIELD_MAP
+        )
+
+        assert len(plan.fields) == len(set(plan.fields))
+        assert plan.fields_param == ",".join(plan.fields)
+
+    def test_everything(self):
+        plan = JiraFieldPlan.everything()
+
+        assert plan.fields_param == "*all"
+        assert plan.expand == "changelog"
+
+
+class TestReportsConfiguration:
+    def _config(self, **kwargs):
+        return JiraConfig(
+            url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            **kwargs,
+        )
+
+    def test_report_types(self):
+        config = self._config(reports=["throughput_trend"])
+
+        assert config.report_types == [ReportType.THROUGHPUT_TREND]
+        assert self._config().report_types is None
+
+    def test_unknown_report_rejected(self):
+        with pytest.raises(ValueError, match="JIRA_REPORTS"):
+            self._config(reports=["burndown"]).validate()
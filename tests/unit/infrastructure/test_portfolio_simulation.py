@@ -0,0 +1,208 @@
+"""Tests for joint simulation of project portfolios"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.application.forecasting_use_cases import ForecastPortfolioUseCase
+from src.domain.forecasting import MonteCarloConfiguration
+from src.domain.multi_project import ProjectData
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.sharded_simulation import (
+    SHARD_SIZE,
+    run_sharded_portfolio_simulation,
+)
+from src.infrastructure.vectorized_simulation import (
+    correlation_factor,
+    simulate_gaussian_grid_completion_sprints,
+    simulate_portfolio_completion_sprints,
+)
+
+
+def _metrics(mean, std_dev):
+    return VelocityMetrics(mean, mean, std_dev, mean - std_dev, mean + std_dev, 0.0)
+
+
+def _config(**overrides):
+    return MonteCarloConfiguration(
+        **{"num_simulations": 5000, "random_seed": 42, **overrides}
+    )
+
+
+class TestCorrelationFactor:
+    def test_factor_reproduces_matrix(self):
+        correlation = [[1.0, 0.6, 0.2], [0.6, 1.0, 0.4], [0.2, 0.4, 1.0]]
+
+        factor = correlation_factor(correlation)
+
+        assert np.allclose(factor @ factor.T, correlation)
+
+    def test_perfect_correlation_is_accepted(self):
+        factor = correlation_factor([[1.0, 1.0], [1.0, 1.0]])
+
+        assert np.allclose(factor @ factor.T, 1.0)
+
+    @pytest.mark.parametrize(
+        "correlation",
+        [
+            [[1.0, 0.5]],
+            [[1.0, 0.5], [0.4, 1.0]],
+            [[0.9, 0.5], [0.5, 1.0]],
+            [[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]],
+        ],
+    )
+    def test_invalid_matrix_raises(self, correlation):
+        with pytest.raises(ValueError):
+            correlation_factor(correlation)
+
+
+class TestPortfolioSimulation:
+    def test_single_project_matches_grid_engine(self):
+        portfolio = simulate_portfolio_completion_sprints(
+            [300.0], [20.0], [5.0], 10_000, np.random.default_rng(3)
+        )
+        grid = simulate_gaussian_grid_completion_sprints(
+            300.0, [20.0], [5.0], 10_000, np.random.default_rng(3)
+        )
+
+        assert np.array_equal(portfolio, grid)
+
+    def test_projects_without_work_complete_immediately(self):
+        outcomes = simulate_portfolio_completion_sprints(
+            [0.0, 100.0], [10.0, 10.0], [2.0, 2.0], 1000, np.random.default_rng(1)
+        )
+
+        assert (outcomes[0] == 0).all()
+        assert (outcomes[1] > 0).all()
+
+    def test_perfect_correlation_gives_identical_paths(self):
+        outcomes = simulate_portfolio_completion_sprints(
+            [200.0, 200.0],
+            [20.0, 20.0],
+            [6.0, 6.0],
+            5000,
+            np.random.default_rng(5),
+            correlation=[[1.0, 1.0], [1.0, 1.0]],
+        )
+
+        assert np.array_equal(outcomes[0], outcomes[1])
+
+    def test_correlation_widens_the_portfolio_spread(self):
+        def portfolio_std(correlation):
+            outcomes = simulate_portfolio_completion_sprints(
+                [200.0] * 3,
+                [20.0] * 3,
+                [8.0] * 3,
+                20_000,
+                np.random.default_rng(7),
+                correlation=correlation,
+            )
+            return outcomes.max(axis=0).std()
+
+        correlated = [[1.0, 0.9, 0.9], [0.9, 1.0, 0.9], [0.9, 0.9, 1.0]]
+
+        # Independent teams rarely are all fast together; shared risk is wider
+        assert portfolio_std(correlated) > portfolio_std(None)
+
+    def test_correlation_size_must_match(self):
+        with pytest.raises(ValueError, match="2 projects"):
+            simulate_portfolio_completion_sprints(
+                [100.0, 100.0],
+                [10.0, 10.0],
+                [2.0, 2.0],
+                100,
+                np.random.default_rng(1),
+                correlation=np.eye(3),
+            )
+
+
+class TestShardedPortfolioSimulation:
+    def test_portfolio_is_last_project(self):
+        portfolio, projects = run_sharded_portfolio_simulation(
+            [150.0, 300.0], [20.0, 25.0], [5.0, 5.0], 3000, random_seed=1
+        )
+
+        assert len(projects) == 2
+        assert portfolio.total == 3000
+        assert portfolio.mean >= max(project.mean for project in projects)
+        assert np.array_equal(
+            portfolio.samples,
+            np.maximum(projects[0].samples, projects[1].samples),
+        )
+
+    def test_results_do_not_depend_on_worker_count(self):
+        runs = [
+            run_sharded_portfolio_simulation(
+                [200.0, 250.0],
+                [20.0, 22.0],
+                [5.0, 6.0],
+                2 * SHARD_SIZE + 10,
+                random_seed=11,
+                correlation=[[1.0, 0.5], [0.5, 1.0]],
+                num_workers=workers,
+            )
+            for workers in (1, 2)
+        ]
+
+        assert runs[0][0].distribution() == runs[1][0].distribution()
+        assert np.array_equal(runs[0][0].samples, runs[1][0].samples)
+
+
+class TestMonteCarloPortfolioForecast:
+    def test_portfolio_forecast(self):
+        forecast = MonteCarloModel().forecast_portfolio(
+            [100.0, 200.0],
+            [_metrics(20.0, 5.0), _metrics(20.0, 5.0)],
+            _config(),
+            correlation=[[1.0, 0.3], [0.3, 1.0]],
+        )
+
+        assert forecast.correlated
+        assert len(forecast.projects) == 2
+        assert forecast.portfolio.model_metadata["num_projects"] == 2
+        assert forecast.portfolio.model_metadata["velocity_mean"] == 40.0
+        portfolio_85 = forecast.portfolio.get_percentile(0.85)
+        assert portfolio_85 >= forecast.projects[1].get_percentile(0.85)
+
+    def test_mismatched_inputs_raise(self):
+        with pytest.raises(ValueError):
+            MonteCarloModel().forecast_portfolio(
+                [100.0, 200.0], [_metrics(20.0, 5.0)], _config()
+            )
+
+
+class TestForecastPortfolioUseCase:
+    def _project(self, name, remaining_work, velocity_metrics):
+        return ProjectData(
+            name=name,
+            file_path=Path(f"{name}.csv"),
+            remaining_work=remaining_work,
+            velocity_metrics=velocity_metrics,
+        )
+
+    def test_skips_projects_that_cannot_delay_or_be_forecast(self):
+        projects = [
+            self._project("done", 0.0, _metrics(10.0, 2.0)),
+            self._project("a", 100.0, _metrics(20.0, 5.0)),
+            self._project("no-velocity", 50.0, None),
+            self._project("b", 200.0, _metrics(20.0, 5.0)),
+        ]
+        correlation = np.eye(4)
+        correlation[1, 3] = correlation[3, 1] = 1.0
+
+        forecast = ForecastPortfolioUseCase(MonteCarloModel()).execute(
+            projects, _config(), correlation.tolist()
+        )
+
+        assert len(forecast.projects) == 2
+        assert forecast.portfolio.model_metadata["velocity_std_dev"] == 10.0
+
+    def test_returns_none_without_forecastable_projects(self):
+        projects = [self._project("done", 0.0, _metrics(10.0, 2.0))]
+
+        assert (
+            ForecastPortfolioUseCase(MonteCarloModel()).execute(projects, _config())
+            is None
+        )
@@ -0,0 +1,72 @@
+"""Tests for low-discrepancy point sets and the normal quantile function"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from src.infrastructure.quasi_random import (
+    SOBOL_MAX_DIMENSIONS,
+    SOBOL_PARAMETERS,
+    normal_ppf,
+    scrambled_sobol,
+)
+
+
+def _is_primitive(degree, coefficients):
+    polynomial = (1 << degree) | (coefficients << 1) | 1
+    value = 1
+    for order in range(1, 2**degree):
+        value <<= 1
+        if value >> degree & 1:
+            value ^= polynomial
+        if value == 1:
+            return order == 2**degree - 1
+    return False
+
+
+class TestScrambledSobol:
+    def test_parameters_are_valid(self):
+        for degree, coefficients, initial in SOBOL_PARAMETERS:
+            assert _is_primitive(degree, coefficients)
+            assert all(m % 2 == 1 and m < 2 ** (k + 1) for k, m in enumerate(initial))
+
+    def test_every_coordinate_is_stratified(self):
+        points = scrambled_sobol(1024, SOBOL_MAX_DIMENSIONS, np.random.default_rng(0))
+
+        assert points.shape == (1024, SOBOL_MAX_DIMENSIONS)
+        assert np.all((points > 0) & (points < 1))
+        for dimension in range(SOBOL_MAX_DIMENSIONS):
+            cells = np.floor(points[:, dimension] * 1024)
+            assert np.unique(cells).size == 1024
+
+    def test_first_two_coordinates_fill_every_square(self):
+        points = scrambled_sobol(256, 2, np.random.default_rng(0))
+
+        cells = np.floor(points[:, 0] * 16) * 16 + np.floor(points[:, 1] * 16)
+
+        assert np.unique(cells).size == 256
+
+    def test_scrambles_differ_between_generators(self):
+        first = scrambled_sobol(64, 3, np.random.default_rng(1))
+        second = scrambled_sobol(64, 3, np.random.default_rng(2))
+
+        assert not np.allclose(first, second)
+
+    def test_dimension_limit(self):
+        with pytest.raises(ValueError):
+            scrambled_sobol(8, SOBOL_MAX_DIMENSIONS + 1, np.random.default_rng(0))
+
+
+class TestNormalPpf:
+    def test_matches_reference_quantiles(self):
+        uniforms = np.array(
+            [1e-12, 1e-6, 0.01, 0.02425, 0.2, 0.5, 0.9, 0.999, 1 - 1e-9]
+        )
+
+        expected = [NormalDist().inv_cdf(u) for u in uniforms]
+
+        assert normal_ppf(uniforms) == pytest.approx(expected, rel=1e-8, abs=1e-8)
+
+    def test_extremes_stay_finite(self):
+        assert np.all(np.isfinite(normal_ppf(np.array([0.0, 1.0]))))
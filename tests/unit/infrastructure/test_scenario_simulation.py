@@ -0,0 +1,145 @@
+"""Tests for scenario comparisons on common random numbers"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from src.application.velocity_prediction_use_cases import (
+    ApplyVelocityAdjustmentsUseCase,
+)
+from src.domain.forecasting import (
+    MonteCarloConfiguration,
+    MonteCarloConfigurationWithScenario,
+    SimulationEngine,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_adjustments import VelocityAdjustment, VelocityScenario
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.sharded_simulation import (
+    SHARD_SIZE,
+    run_sharded_scenario_simulation,
+)
+from src.infrastructure.vectorized_simulation import (
+    MAX_SIMULATED_SPRINTS,
+    simulate_completion_sprints,
+    simulate_scenario_completion_sprints,
+)
+from src.infrastructure.velocity_samplers import GaussianVelocitySampler
+
+SAMPLER = GaussianVelocitySampler(20.0, 6.0)
+VELOCITY_METRICS = VelocityMetrics(20.0, 20.0, 6.0, 8.0, 32.0, 0.0)
+HOLIDAYS = VelocityScenario(
+    name="Holidays",
+    adjustments=[VelocityAdjustment(2, 4, 0.5, "Holidays")],
+    team_changes=[],
+)
+
+
+def _factors(slowdown_sprints, factor):
+    sprint_factors = np.ones(MAX_SIMULATED_SPRINTS + 1)
+    sprint_factors[:slowdown_sprints] = factor
+    return sprint_factors
+
+
+class TestScenarioSimulation:
+    def test_single_scenario_matches_plain_simulation(self):
+        plain = simulate_completion_sprints(
+            300.0, SAMPLER, 2000, np.random.default_rng(5)
+        )
+        (shared,) = simulate_scenario_completion_sprints(
+            300.0, SAMPLER, 2000, np.random.default_rng(5), [None]
+        )
+
+        assert np.array_equal(plain, shared)
+
+    def test_scenarios_share_velocity_paths(self):
+        baseline, neutral, slowdown = simulate_scenario_completion_sprints(
+            300.0,
+            SAMPLER,
+            5000,
+            np.random.default_rng(5),
+            [None, _factors(3, 1.0), _factors(3, 0.5)],
+        )
+
+        # Same paths: a neutral scenario is identical and a slowdown is never
+        # faster on any trial
+        assert np.array_equal(baseline, neutral)
+        assert np.all(slowdown >= baseline)
+
+    def test_samples_are_paired_and_worker_independent(self):
+        factors = [None, _factors(3, 0.5)]
+
+        single = run_sharded_scenario_simulation(
+            300.0, SAMPLER, SHARD_SIZE + 5000, factors, random_seed=3
+        )
+        parallel = run_sharded_scenario_simulation(
+            300.0, SAMPLER, SHARD_SIZE + 5000, factors, random_seed=3, num_workers=2
+        )
+
+        baseline, adjusted = single
+        assert baseline.total == adjusted.total == SHARD_SIZE + 5000
+        assert np.all(adjusted.samples >= baseline.samples)
+        for first, second in zip(single, parallel):
+            assert np.array_equal(first.counts, second.counts)
+            assert np.array_equal(first.samples, second.samples)
+
+
+class TestApplyVelocityAdjustmentsWithCommonRandomNumbers:
+    def _config(self, **overrides):
+        config = MonteCarloConfiguration(
+            num_simulations=2000, engine=SimulationEngine.VECTORIZED, random_seed=1
+        )
+        return replace(config, **overrides)
+
+    def test_baseline_and_scenario_share_paths(self):
+        use_case = ApplyVelocityAdjustmentsUseCase(MonteCarloModel())
+
+        baseline, adjusted = use_case.execute(
+            200.0, VELOCITY_METRICS, HOLIDAYS, self._config()
+        )
+
+        assert adjusted.model_metadata["common_random_numbers"] is True
+        assert all(
+            a >= b
+            for a, b in zip(adjusted.sample_predictions, baseline.sample_predictions)
+        )
+        assert adjusted.expected_sprints > baseline.expected_sprints
+
+    def test_delta_is_less_noisy_than_independent_runs(self):
+        model = MonteCarloModel()
+        use_case = ApplyVelocityAdjustmentsUseCase(model)
+
+        paired_deltas, independent_deltas = [], []
+        for seed in range(8):
+            baseline, adjusted = use_case.execute(
+                200.0, VELOCITY_METRICS, HOLIDAYS, self._config(random_seed=seed)
+            )
+            paired_deltas.append(adjusted.expected_sprints - baseline.expected_sprints)
+
+            independent_adjusted = model.forecast(
+                200.0,
+                VELOCITY_METRICS,
+                MonteCarloConfigurationWithScenario(
+                    num_simulations=2000,
+                    engine=SimulationEngine.VECTORIZED,
+                    random_seed=seed + 100,
+                    velocity_scenario=HOLIDAYS,
+                ),
+            )
+            independent_deltas.append(
+                independent_adjusted.expected_sprints - baseline.expected_sprints
+            )
+
+        assert np.std(paired_deltas) < np.std(independent_deltas) / 2
+
+    def test_loop_engine_runs_independently(self):
+        use_case = ApplyVelocityAdjustmentsUseCase(MonteCarloModel())
+
+        _, adjusted = use_case.execute(
+            200.0,
+            VELOCITY_METRICS,
+            HOLIDAYS,
+            self._config(engine=SimulationEngine.LOOP),
+        )
+
+        assert "common_random_numbers" not in adjusted.model_metadata
@@ -0,0 +1,156 @@
+"""Tests for sharded Monte Carlo execution and histogram merging"""
+
+import numpy as np
+
+from src.domain.forecasting import MonteCarloConfiguration, SimulationEngine
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.sharded_simulation import (
+    SHARD_SIZE,
+    plan_shards,
+    run_sharded_simulation,
+)
+from src.infrastructure.simulation_accumulator import SimulationAccumulator
+from src.infrastructure.velocity_samplers import GaussianVelocitySampler
+
+SAMPLER = GaussianVelocitySampler(20.0, 6.0)
+
+
+class TestShardedSimulation:
+    def test_shard_layout_is_independent_of_workers(self):
+        shards = plan_shards(100.0, SAMPLER, 2 * SHARD_SIZE + 10, random_seed=5)
+
+        assert [s.num_simulations for s in shards] == [SHARD_SIZE, SHARD_SIZE, 10]
+
+    def test_results_are_bit_identical_across_worker_counts(self):
+        num_simulations = 2 * SHARD_SIZE + 5000
+
+        results = [
+            run_sharded_simulation(
+                300.0, SAMPLER, num_simulations, random_seed=42, num_workers=workers
+            )
+            for workers in (1, 2, 3)
+        ]
+
+        for result in results[1:]:
+            assert np.array_equal(result.counts, results[0].counts)
+            assert np.array_equal(result.samples, results[0].samples)
+        assert results[0].total == num_simulations
+
+    def test_different_seeds_give_different_streams(self):
+        first = run_sharded_simulation(300.0, SAMPLER, 5000, random_seed=1)
+        second = run_sharded_simulation(300.0, SAMPLER, 5000, random_seed=2)
+
+        assert not np.array_equal(first.samples, second.samples)
+
+    def test_forecast_with_workers(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)
+        config = MonteCarloConfiguration(
+            num_simulations=2 * SHARD_SIZE,
+            engine=SimulationEngine.VECTORIZED,
+            random_seed=9,
+            num_workers=2,
+        )
+
+        result = MonteCarloModel().forecast(200.0, velocity_metrics, config)
+
+        assert len(result.sample_predictions) == 1000
+        assert abs(sum(result.probability_distribution.values()) - 1.0) < 1e-9
+        assert 9 <= result.expected_sprints <= 12
+
+    def test_vectorized_by_default(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 3.0, 15.0, 25.0, 0.0)
+
+        result = MonteCarloModel().forecast(
+            200.0, velocity_metrics, MonteCarloConfiguration(num_simulations=1000)
+        )
+
+        assert result.model_metadata["engine"] == "vectorized"
+
+    def test_invalid_worker_count(self):
+        config = MonteCarloConfiguration(num_workers=0)
+
+        assert "Number of workers must be at least 1" in config.validate()
+
+
+class TestAdaptiveSimulation:
+    def _forecast(self, velocity_metrics, **overrides):
+        config = MonteCarloConfiguration(
+            confidence_levels=[0.5, 0.85],
+            engine=SimulationEngine.VECTORIZED,
+            random_seed=4,
+            precision_target=0.05,
+            adaptive_batch_size=200,
+            max_simulations=200_000,
+        )
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        return MonteCarloModel().forecast(300.0, velocity_metrics, config)
+
+    def test_standard_error_shrinks_with_trials(self):
+        values = np.random.default_rng(3).integers(5, 15, size=4000)
+        small = SimulationAccumulator.from_values(values[:1000])
+        large = SimulationAccumulator.from_values(values)
+
+        ratio = large.percentile_standard_error(0.85) / small.percentile_standard_error(
+            0.85
+        )
+
+        assert 0.4 < ratio < 0.6
+
+    def test_low_variance_team_stops_early(self):
+        stable = VelocityMetrics(40.0, 40.0, 1.0, 38.0, 42.0, 0.0)
+
+        result = self._forecast(stable)
+
+        metadata = result.model_metadata
+        assert metadata["adaptive"] is True
+        assert metadata["converged"] is True
+        assert metadata["num_simulations"] < 2000
+        assert all(
+            error <= 0.05 for error in metadata["percentile_standard_errors"].values()
+        )
+
+    def test_high_variance_team_gets_more_trials(self):
+        stable = VelocityMetrics(40.0, 40.0, 1.0, 38.0, 42.0, 0.0)
+        volatile = VelocityMetrics(20.0, 18.0, 12.0, 2.0, 50.0, 0.0)
+
+        stable_trials = self._forecast(stable).model_metadata["num_simulations"]
+        volatile_trials = self._forecast(volatile).model_metadata["num_simulations"]
+
+        assert volatile_trials > stable_trials
+
+    def test_budget_limits_trials(self):
+        volatile = VelocityMetrics(20.0, 18.0, 12.0, 2.0, 50.0, 0.0)
+
+        result = self._forecast(volatile, precision_target=1e-3, max_simulations=2000)
+
+        assert result.model_metadata["converged"] is False
+        assert result.model_metadata["num_simulations"] == 2000
+
+    def test_independent_of_worker_count(self):
+        volatile = VelocityMetrics(20.0, 18.0, 12.0, 2.0, 50.0, 0.0)
+
+        single = self._forecast(volatile, max_simulations=20_000)
+        parallel = self._forecast(volatile, max_simulations=20_000, num_workers=3)
+
+        assert single.probability_distribution == parallel.probability_distribution
+        assert single.sample_predictions == parallel.sample_predictions
+
+    def test_reports_the_vectorized_engine(self):
+        stable = VelocityMetrics(40.0, 40.0, 1.0, 38.0, 42.0, 0.0)
+
+        result = self._forecast(stable, engine=SimulationEngine.LOOP)
+
+        assert result.model_metadata["engine"] == "vectorized"
+
+    def test_adaptive_configuration_validation(self):
+        config = MonteCarloConfiguration(
+            precision_target=0, adaptive_batch_size=50, max_simulations=10
+        )
+
+        errors = config.validate()
+
+        assert "Precision target must be positive" in errors
+        assert "Adaptive batch size should be at least 100" in errors
+        assert "Maximum simulations must be at least the adaptive batch size" in errors
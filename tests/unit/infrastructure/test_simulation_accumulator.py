@@ -0,0 +1,86 @@
+"""Tests for streaming simulation accumulators"""
+
+import numpy as np
+import pytest
+
+from src.infrastructure.simulation_accumulator import SimulationAccumulator
+
+
+class TestSimulationAccumulator:
+    def test_value_at_rank_matches_sorted_values(self):
+        values = np.random.default_rng(0).integers(1, 30, size=999)
+        accumulator = SimulationAccumulator.from_values(values)
+        sorted_values = np.sort(values)
+
+        for rank in (0, 1, 250, 500, 998):
+            assert accumulator.value_at_rank(rank) == sorted_values[rank]
+        assert accumulator.mean == pytest.approx(sorted_values.mean())
+        assert accumulator.std_dev == pytest.approx(sorted_values.std(ddof=1))
+
+    def test_streaming_matches_batch(self):
+        values = np.random.default_rng(1).integers(1, 30, size=5000)
+        streamed = SimulationAccumulator()
+        for value in values:
+            streamed.add(int(value))
+
+        batched = SimulationAccumulator.from_values(values)
+
+        assert np.array_equal(streamed.counts, batched.counts)
+        assert streamed.distribution() == batched.distribution()
+
+    def test_reservoir_fills_in_stream_order(self):
+        accumulator = SimulationAccumulator(sample_size=4)
+        for value in (3, 5, 7):
+            accumulator.add(value)
+
+        assert accumulator.samples.tolist() == [3, 5, 7]
+
+        accumulator.add_batch(np.array([9, 11, 13]))
+
+        assert accumulator.samples.size == 4
+        assert set(accumulator.samples.tolist()) <= {3, 5, 7, 9, 11, 13}
+
+    def test_merge_equals_combined_counts(self):
+        rng = np.random.default_rng(1)
+        first = rng.integers(1, 10, size=6000)
+        second = rng.integers(5, 40, size=7000)
+
+        merged = SimulationAccumulator.from_values(first).merge(
+            SimulationAccumulator.from_values(second)
+        )
+        combined = SimulationAccumulator.from_values(np.concatenate([first, second]))
+
+        assert np.array_equal(merged.counts, combined.counts)
+        assert merged.samples.size == 1000
+        assert set(merged.samples.tolist()) <= set(first) | set(second)
+
+    def test_reservoir_is_uniform_over_stream(self):
+        # First half of the stream is all 1s, second half all 2s
+        values = np.repeat([1, 2], 50_000)
+        accumulator = SimulationAccumulator.from_values(
+            values, rng=np.random.default_rng(5)
+        )
+
+        share_of_twos = np.mean(accumulator.samples == 2)
+
+        assert accumulator.samples.size == 1000
+        assert 0.44 < share_of_twos < 0.56
+
+    def test_merged_reservoir_is_proportional(self):
+        small = SimulationAccumulator.from_values(np.ones(1000, dtype=int))
+        large = SimulationAccumulator.from_values(np.full(9000, 2))
+
+        merged = small.merge(large)
+
+        assert merged.samples.size == 1000
+        assert 0.05 < np.mean(merged.samples == 1) < 0.15
+
+    def test_memory_is_bounded_by_bins(self):
+        accumulator = SimulationAccumulator()
+        rng = np.random.default_rng(2)
+        for _ in range(20):
+            accumulator.add_batch(rng.integers(10, 20, size=50_000))
+
+        assert accumulator.total == 1_000_000
+        assert accumulator.counts.size == 20
+        assert accumulator.samples.size == 1000
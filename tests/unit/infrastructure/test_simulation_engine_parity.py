@@ -0,0 +1,196 @@
+"""Parity tests between the loop and vectorized Monte Carlo engines"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.domain.forecasting import (
+    MonteCarloConfiguration,
+    MonteCarloConfigurationWithScenario,
+    SimulationEngine,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_adjustments import (
+    TeamChange,
+    VelocityAdjustment,
+    VelocityScenario,
+)
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.vectorized_simulation import (
+    MAX_SIMULATED_SPRINTS,
+    simulate_completion_sprints,
+)
+from src.infrastructure.velocity_samplers import GaussianVelocitySampler
+
+NUM_SIMULATIONS = 20000
+
+
+def _distribution(completion_sprints):
+    values, counts = np.unique(np.asarray(completion_sprints), return_counts=True)
+    return dict(zip(values.tolist(), (counts / counts.sum()).tolist()))
+
+
+def _total_variation(first, second):
+    keys = set(first) | set(second)
+    return 0.5 * sum(abs(first.get(k, 0.0) - second.get(k, 0.0)) for k in keys)
+
+
+def _expand(histogram):
+    return np.repeat(np.arange(histogram.counts.size), histogram.counts)
+
+
+def _run_both(remaining_work, velocity_metrics, config):
+    model = MonteCarloModel()
+    loop = model._run_simulations(
+        remaining_work,
+        velocity_metrics,
+        replace(config, engine=SimulationEngine.LOOP, random_seed=11),
+    )
+    vectorized = model._run_simulations(
+        remaining_work,
+        velocity_metrics,
+        replace(config, engine=SimulationEngine.VECTORIZED, random_seed=11),
+    )
+    return _expand(loop), _expand(vectorized)
+
+
+VELOCITY_PROFILES = [
+    VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0),  # Typical team
+    VelocityMetrics(8.0, 7.0, 6.0, 1.0, 20.0, 0.0),  # Highly variable team
+    VelocityMetrics(40.0, 40.0, 1.0, 38.0, 42.0, 0.0),  # Very stable team
+]
+
+
+class TestEngineParity:
+    @pytest.mark.parametrize("velocity_metrics", VELOCITY_PROFILES)
+    def test_distribution_matches_loop(self, velocity_metrics):
+        config = MonteCarloConfiguration(num_simulations=NUM_SIMULATIONS)
+
+        loop, vectorized = _run_both(300.0, velocity_metrics, config)
+
+        assert len(vectorized) == NUM_SIMULATIONS
+        assert abs(loop.mean() - vectorized.mean()) < 0.05 * loop.mean()
+        assert abs(loop.std() - vectorized.std()) < 0.1 * max(loop.std(), 0.5)
+        for q in (0.5, 0.85, 0.95):
+            assert abs(np.quantile(loop, q) - np.quantile(vectorized, q)) <= 1
+        assert (
+            _total_variation(_distribution(loop), _distribution(vectorized)) < 0.03
+        )
+
+    def test_no_variance_is_exact(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 0.0, 20.0, 20.0, 0.0)
+        config = MonteCarloConfiguration(
+            num_simulations=500, use_historical_variance=False
+        )
+
+        loop, vectorized = _run_both(100.0, velocity_metrics, config)
+
+        assert np.array_equal(loop, vectorized)
+        assert set(vectorized.tolist()) == {5}
+
+    def test_scenario_distribution_matches_loop(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 4.0, 12.0, 28.0, 0.0)
+        scenario = VelocityScenario(
+            name="Holidays and hiring",
+            adjustments=[VelocityAdjustment(2, 4, 0.5, "Holidays")],
+            team_changes=[TeamChange(sprint=3, change=2, ramp_up_sprints=3)],
+        )
+        config = MonteCarloConfigurationWithScenario(
+            num_simulations=NUM_SIMULATIONS,
+            velocity_scenario=scenario,
+            baseline_team_size=5,
+        )
+
+        loop, vectorized = _run_both(250.0, velocity_metrics, config)
+
+        assert abs(loop.mean() - vectorized.mean()) < 0.05 * loop.mean()
+        for q in (0.5, 0.85, 0.95):
+            assert abs(np.quantile(loop, q) - np.quantile(vectorized, q)) <= 1
+        assert (
+            _total_variation(_distribution(loop), _distribution(vectorized)) < 0.03
+        )
+
+    def test_forecast_results_match(self):
+        velocity_metrics = VELOCITY_PROFILES[0]
+        model = MonteCarloModel()
+        base_config = MonteCarloConfiguration(
+            num_simulations=NUM_SIMULATIONS, random_seed=3
+        )
+
+        loop_result = model.forecast(
+            200.0, velocity_metrics, replace(base_config, engine=SimulationEngine.LOOP)
+        )
+        vectorized_result = model.forecast(
+            200.0,
+            velocity_metrics,
+            replace(base_config, engine=SimulationEngine.VECTORIZED),
+        )
+
+        assert vectorized_result.model_metadata["engine"] == "vectorized"
+        assert len(vectorized_result.sample_predictions) == 1000
+        assert (
+            abs(loop_result.expected_sprints - vectorized_result.expected_sprints)
+            < 0.1
+        )
+        for loop_interval, vectorized_interval in zip(
+            loop_result.prediction_intervals, vectorized_result.prediction_intervals
+        ):
+            assert (
+                abs(loop_interval.predicted_value - vectorized_interval.predicted_value)
+                <= 1
+            )
+        assert (
+            _total_variation(
+                loop_result.probability_distribution,
+                vectorized_result.probability_distribution,
+            )
+            < 0.03
+        )
+
+
+class TestVectorizedEngine:
+    def test_fixed_seed_is_reproducible(self):
+        velocity_metrics = VELOCITY_PROFILES[1]
+        config = MonteCarloConfiguration(
+            num_simulations=2000, engine=SimulationEngine.VECTORIZED, random_seed=7
+        )
+        model = MonteCarloModel()
+
+        first = model._run_simulations(150.0, velocity_metrics, config)
+        second = model._run_simulations(150.0, velocity_metrics, config)
+
+        assert np.array_equal(first.counts, second.counts)
+        assert np.array_equal(first.samples, second.samples)
+
+    def test_stragglers_beyond_first_block(self):
+        # Mean velocity is high but variance is extreme, so some trials need
+        # many more sprints than the first block covers
+        completion_sprints = simulate_completion_sprints(
+            100.0, GaussianVelocitySampler(10.0, 30.0), 5000, np.random.default_rng(1)
+        )
+
+        assert completion_sprints.min() >= 1
+        assert completion_sprints.max() > 20
+
+    def test_sprint_cap(self):
+        completion_sprints = simulate_completion_sprints(
+            10_000.0, GaussianVelocitySampler(1.0, 0.0), 10, np.random.default_rng(1)
+        )
+
+        assert np.all(completion_sprints == MAX_SIMULATED_SPRINTS + 1)
+
+    def test_sprint_factors_are_applied(self):
+        # Velocity is halved for the first two sprints: 10 + 10 + 20 + 20 = 60
+        sprint_factors = np.ones(MAX_SIMULATED_SPRINTS + 1)
+        sprint_factors[:2] = 0.5
+
+        completion_sprints = simulate_completion_sprints(
+            60.0,
+            GaussianVelocitySampler(20.0, 0.0),
+            10,
+            np.random.default_rng(1),
+            sprint_factors,
+        )
+
+        assert np.all(completion_sprints == 4)
@@ -0,0 +1,124 @@
+"""Tests for the daily throughput model"""
+
+import numpy as np
+import pytest
+
+from src.domain.forecasting import (
+    ForecastUnit,
+    ModelType,
+    MonteCarloConfiguration,
+    ThroughputConfiguration,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.forecasting_model_factory import DefaultModelFactory
+from src.infrastructure.sharded_simulation import (
+    SHARD_SIZE,
+    run_sharded_throughput_simulation,
+)
+from src.infrastructure.throughput_model import ThroughputModel
+from src.infrastructure.vectorized_simulation import (
+    MAX_SIMULATED_DAYS,
+    simulate_daily_throughput_completion_days,
+)
+
+HISTORY = (0, 2, 1, 0, 3, 1, 0, 0, 4, 1)
+METRICS = VelocityMetrics(10.0, 10.0, 2.0, 8.0, 12.0, 0.0)
+
+
+class TestDailyThroughputSimulation:
+    def test_constant_throughput_is_exact(self):
+        days = simulate_daily_throughput_completion_days(
+            10, [3], 1000, np.random.default_rng(1)
+        )
+
+        assert (days == 4).all()
+
+    def test_no_remaining_items_takes_no_days(self):
+        days = simulate_daily_throughput_completion_days(
+            0, HISTORY, 100, np.random.default_rng(1)
+        )
+
+        assert (days == 0).all()
+
+    def test_idle_days_slow_completion(self):
+        days = simulate_daily_throughput_completion_days(
+            100, (0, 2), 10_000, np.random.default_rng(2)
+        )
+
+        # Half the days deliver nothing, so 50 busy days take about 100 days
+        assert days.min() >= 50
+        assert 95 < days.mean() < 105
+
+    def test_long_horizons_are_capped(self):
+        days = simulate_daily_throughput_completion_days(
+            10_000, (0, 0, 0, 1), 200, np.random.default_rng(3)
+        )
+
+        assert (days == MAX_SIMULATED_DAYS + 1).all()
+
+    @pytest.mark.parametrize("history", [(), (0, 0, 0)])
+    def test_history_without_completions_raises(self, history):
+        with pytest.raises(ValueError, match="at least one completion"):
+            simulate_daily_throughput_completion_days(
+                10, history, 100, np.random.default_rng(1)
+            )
+
+    def test_results_do_not_depend_on_worker_count(self):
+        runs = [
+            run_sharded_throughput_simulation(
+                60, HISTORY, 2 * SHARD_SIZE + 10, random_seed=5, num_workers=workers
+            )
+            for workers in (1, 2)
+        ]
+
+        assert runs[0].distribution() == runs[1].distribution()
+        assert np.array_equal(runs[0].samples, runs[1].samples)
+
+
+class TestThroughputModel:
+    def _config(self, **overrides):
+        return ThroughputConfiguration(
+            **{
+                "num_simulations": 5000,
+                "random_seed": 42,
+                "daily_throughput": HISTORY,
+                **overrides,
+            }
+        )
+
+    def test_forecast_is_in_days(self):
+        result = ThroughputModel().forecast(30, METRICS, self._config())
+
+        assert result.unit == ForecastUnit.DAYS
+        assert result.model_type == ModelType.THROUGHPUT
+        assert result.model_metadata["mean_daily_throughput"] == 1.2
+        # 30 items at 1.2 items a day
+        assert 20 < result.expected_sprints < 30
+        interval = result.get_prediction_at_confidence(0.85)
+        assert interval.lower_bound <= interval.predicted_value <= interval.upper_bound
+
+    def test_working_days_skip_weekends(self):
+        calendar = ThroughputModel().forecast(
+            30, METRICS, self._config(working_days_only=False)
+        )
+        working = ThroughputModel().forecast(30, METRICS, self._config())
+
+        assert calendar.expected_sprints == working.expected_sprints
+        assert working.expected_completion_date > calendar.expected_completion_date
+        assert working.expected_completion_date.weekday() < 5
+
+    def test_requires_throughput_configuration(self):
+        with pytest.raises(ValueError, match="ThroughputConfiguration"):
+            ThroughputModel().forecast(30, METRICS, MonteCarloConfiguration())
+
+        with pytest.raises(ValueError, match="at least one completion"):
+            ThroughputModel().forecast(30, METRICS, self._config(daily_throughput=()))
+
+    def test_registered_with_factory(self):
+        factory = DefaultModelFactory()
+
+        assert isinstance(factory.create(ModelType.THROUGHPUT), ThroughputModel)
+        assert isinstance(
+            factory.get_default_config(ModelType.THROUGHPUT),
+            ThroughputConfiguration,
+        )
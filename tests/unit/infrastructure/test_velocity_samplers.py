@@ -0,0 +1,201 @@
+"""Tests for velocity samplers and bootstrap forecasting"""
+
+from dataclasses import replace
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from src.domain.forecasting import (
+    MonteCarloConfiguration,
+    RandomSampling,
+    SimulationEngine,
+    VelocitySampling,
+)
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+from src.infrastructure.quasi_random import SOBOL_MAX_DIMENSIONS
+from src.infrastructure.velocity_samplers import (
+    AntitheticVelocitySampler,
+    BootstrapVelocitySampler,
+    GaussianVelocitySampler,
+    SobolVelocitySampler,
+)
+
+# Right-skewed history: mostly steady sprints with occasional big ones
+SKEWED_HISTORY = (12.0, 14.0, 13.0, 15.0, 12.0, 40.0, 13.0, 14.0, 38.0, 12.0)
+
+
+def _skewed_metrics():
+    return VelocityMetrics(
+        average=float(np.mean(SKEWED_HISTORY)),
+        median=float(np.median(SKEWED_HISTORY)),
+        std_dev=float(np.std(SKEWED_HISTORY, ddof=1)),
+        min_value=min(SKEWED_HISTORY),
+        max_value=max(SKEWED_HISTORY),
+        trend=0.0,
+        samples=SKEWED_HISTORY,
+    )
+
+
+class TestVelocitySamplers:
+    def test_gaussian_sampler_clamps_low_velocities(self):
+        sampler = GaussianVelocitySampler(1.0, 5.0)
+
+        velocities = sampler.draw(np.random.default_rng(0), (100, 10))
+
+        assert velocities.shape == (100, 10)
+        assert velocities.min() == pytest.approx(0.1)
+
+    def test_bootstrap_only_draws_historical_values(self):
+        sampler = BootstrapVelocitySampler.from_history(SKEWED_HISTORY)
+
+        velocities = sampler.draw(np.random.default_rng(0), (2000, 20))
+
+        assert set(np.unique(velocities)) <= set(SKEWED_HISTORY)
+        assert velocities.mean() == pytest.approx(np.mean(SKEWED_HISTORY), rel=0.02)
+
+    def test_recency_weights_favour_recent_sprints(self):
+        sampler = BootstrapVelocitySampler.from_history(
+            [10.0, 10.0, 10.0, 30.0], recency_half_life=1.0
+        )
+
+        velocities = sampler.draw(np.random.default_rng(0), (10_000, 1))
+
+        # Weights 1/8, 1/4, 1/2, 1 normalized: the latest sprint gets 8/15
+        assert sampler.weights[-1] == pytest.approx(8 / 15)
+        assert np.mean(velocities == 30.0) == pytest.approx(8 / 15, abs=0.02)
+        assert sampler.mean == pytest.approx(10 + 20 * 8 / 15)
+
+    def test_bootstrap_requires_history(self):
+        with pytest.raises(ValueError):
+            BootstrapVelocitySampler.from_history([])
+
+
+class TestBootstrapForecast:
+    def test_bootstrap_forecast_matches_loop(self):
+        model = MonteCarloModel()
+        config = MonteCarloConfiguration(
+            num_simulations=20_000,
+            velocity_sampling=VelocitySampling.BOOTSTRAP,
+            random_seed=8,
+        )
+
+        loop = model.forecast(200.0, _skewed_metrics(), config)
+        vectorized = model.forecast(
+            200.0,
+            _skewed_metrics(),
+            replace(config, engine=SimulationEngine.VECTORIZED),
+        )
+
+        assert vectorized.model_metadata["velocity_sampling"] == "bootstrap"
+        assert abs(loop.expected_sprints - vectorized.expected_sprints) < 0.1
+        for loop_interval, vectorized_interval in zip(
+            loop.prediction_intervals, vectorized.prediction_intervals
+        ):
+            assert (
+                abs(loop_interval.predicted_value - vectorized_interval.predicted_value)
+                <= 1
+            )
+
+    def test_bootstrap_differs_from_gaussian_for_skewed_team(self):
+        model = MonteCarloModel()
+        config = MonteCarloConfiguration(
+            num_simulations=20_000, engine=SimulationEngine.VECTORIZED, random_seed=8
+        )
+
+        gaussian = model.forecast(100.0, _skewed_metrics(), config)
+        bootstrap = model.forecast(
+            100.0,
+            _skewed_metrics(),
+            replace(config, velocity_sampling=VelocitySampling.BOOTSTRAP),
+        )
+
+        # Bootstrap never draws below the slowest observed sprint (12 points),
+        # while the wide normal fit produces implausibly slow sprints
+        assert max(bootstrap.probability_distribution) <= 9
+        assert max(gaussian.probability_distribution) > 9
+
+    def test_falls_back_to_gaussian_without_history(self):
+        velocity_metrics = VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)
+        config = MonteCarloConfiguration(
+            num_simulations=500, velocity_sampling=VelocitySampling.BOOTSTRAP
+        )
+
+        result = MonteCarloModel().forecast(100.0, velocity_metrics, config)
+
+        assert result.model_metadata["velocity_sampling"] == "gaussian"
+
+    def test_invalid_recency_half_life(self):
+        config = MonteCarloConfiguration(recency_half_life=0)
+
+        assert "Recency half-life must be positive" in config.validate()
+
+
+class TestVarianceReductionSamplers:
+    def test_antithetic_rows_mirror_each_other(self):
+        sampler = AntitheticVelocitySampler(GaussianVelocitySampler(20.0, 5.0))
+
+        velocities = sampler.draw(np.random.default_rng(0), (6, 4))
+
+        assert velocities[:3] - 20.0 == pytest.approx(20.0 - velocities[3:])
+
+    def test_sobol_covers_the_distribution_evenly(self):
+        sampler = SobolVelocitySampler(GaussianVelocitySampler(20.0, 5.0))
+
+        velocities = sampler.draw(np.random.default_rng(0), (1024, 30))
+
+        # One draw per 1/1024 quantile band in every Sobol sprint
+        distribution = NormalDist(20.0, 5.0)
+        bands = [int(distribution.cdf(v) * 1024) for v in velocities[:, 0]]
+        assert len(set(bands)) == 1024
+        assert velocities[:, :SOBOL_MAX_DIMENSIONS].mean() == pytest.approx(
+            20.0, abs=0.01
+        )
+
+    def test_bootstrap_inverse_transform_respects_weights(self):
+        sampler = BootstrapVelocitySampler.from_history(
+            [10.0, 30.0], recency_half_life=1.0
+        )
+
+        velocities = sampler.from_uniforms(np.array([0.1, 0.3, 0.4, 0.9]))
+
+        assert velocities.tolist() == [10.0, 10.0, 30.0, 30.0]
+
+    @pytest.mark.parametrize(
+        "random_sampling", [RandomSampling.ANTITHETIC, RandomSampling.SOBOL]
+    )
+    def test_reduces_forecast_error(self, random_sampling):
+        model = MonteCarloModel()
+        velocity_metrics = VelocityMetrics(8.0, 7.0, 6.0, 1.0, 20.0, 0.0)
+
+        def errors(sampling):
+            estimates = [
+                model.forecast(
+                    120.0,
+                    velocity_metrics,
+                    MonteCarloConfiguration(
+                        num_simulations=1000,
+                        engine=SimulationEngine.VECTORIZED,
+                        random_seed=seed,
+                        random_sampling=sampling,
+                    ),
+                ).expected_sprints
+                for seed in range(20)
+            ]
+            return np.std(estimates)
+
+        assert errors(random_sampling) < errors(RandomSampling.PSEUDO_RANDOM) / 1.5
+
+    def test_loop_engine_reports_pseudo_random(self):
+        config = MonteCarloConfiguration(
+            num_simulations=200,
+            engine=SimulationEngine.LOOP,
+            random_sampling=RandomSampling.SOBOL,
+        )
+
+        result = MonteCarloModel().forecast(
+            100.0, VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0), config
+        )
+
+        assert result.model_metadata["random_sampling"] == "pseudo_random"
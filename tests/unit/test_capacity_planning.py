@@ -0,0 +1,111 @@
+"""Tests for goal-seeking the capacity needed for a target date"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.velocity_prediction_use_cases import (
+    SolveCapacityForTargetDateUseCase,
+)
+from src.domain.capacity_planning import CapacityLever
+from src.domain.forecasting import MonteCarloConfiguration
+from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_adjustments import VelocityAdjustment, VelocityScenario
+from src.infrastructure.analytical_model import AnalyticalModel
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+
+VELOCITY = VelocityMetrics(20.0, 20.0, 5.0, 10.0, 30.0, 0.0)
+START = datetime(2025, 1, 6)
+CONFIG = MonteCarloConfiguration(num_simulations=5000, random_seed=3)
+
+
+def _solve(model=None, weeks=20, **kwargs):
+    use_case = SolveCapacityForTargetDateUseCase(model or MonteCarloModel())
+    return use_case.execute(
+        300.0,
+        VELOCITY,
+        CONFIG,
+        START + timedelta(weeks=weeks),
+        start_date=START,
+        **kwargs,
+    )
+
+
+class TestSolveCapacityForTargetDateUseCase:
+    def test_velocity_factor_is_the_smallest_sufficient(self):
+        solution = _solve()
+
+        evaluate = MonteCarloModel().completion_evaluator(300.0, VELOCITY, CONFIG, 10)
+        assert solution.feasible
+        assert solution.target_sprints == 10
+        assert solution.achieved_probability >= 0.85
+        assert evaluate([solution.value - 0.01] * 10) < 0.85
+        assert solution.scenario.adjustments[-1].factor == solution.value
+
+    def test_team_change_in_part_time_steps(self):
+        solution = _solve(lever=CapacityLever.TEAM_CHANGE, team_size=5)
+
+        assert solution.value > 0
+        assert (solution.value * 2).is_integer()
+        assert solution.scenario.team_changes[-1].change == solution.value
+        assert solution.achieved_probability >= 0.85
+
+    def test_comfortable_target_reports_spare_capacity(self):
+        solution = _solve(weeks=60)
+
+        assert solution.baseline_probability == 1.0
+        assert solution.value < 1.0
+
+    def test_higher_confidence_needs_more_capacity(self):
+        p50 = _solve(confidence=0.5)
+        p95 = _solve(confidence=0.95)
+
+        assert p50.value < p95.value
+
+    def test_planned_adjustments_are_kept(self):
+        holiday = VelocityScenario(
+            name="Holidays",
+            adjustments=[VelocityAdjustment(2, 3, 0.5)],
+            team_changes=[],
+        )
+
+        planned = _solve(base_scenario=holiday)
+        unplanned = _solve()
+
+        assert planned.scenario.adjustments[0] == holiday.adjustments[0]
+        assert planned.value > unplanned.value
+        assert planned.baseline_probability <= unplanned.baseline_probability
+
+    def test_unreachable_target(self):
+        solution = _solve(weeks=2)
+
+        assert not solution.feasible
+        assert solution.target_sprints == 1
+        assert "not reachable" in solution.get_summary()
+
+    def test_target_before_first_sprint_end(self):
+        solution = _solve(weeks=1)
+
+        assert not solution.feasible
+        assert solution.target_sprints == 0
+
+    def test_target_beyond_simulation_horizon(self):
+        solution = _solve(weeks=2 * 1100)
+
+        assert solution.target_sprints == 1100
+        assert solution.baseline_probability == 1.0
+        assert solution.feasible
+
+    def test_analytical_model_delegates_to_simulation(self):
+        solution = _solve(model=AnalyticalModel())
+
+        assert solution.feasible
+        assert solution.achieved_probability >= 0.85
+
+    def test_models_without_evaluation(self):
+        model = Mock()
+        model.completion_evaluator.side_effect = NotImplementedError
+
+        with pytest.raises(NotImplementedError):
+            _solve(model=model)
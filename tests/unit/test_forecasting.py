@@ -1,5 +1,7 @@
 """Tests for forecasting model abstraction"""
 
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
@@ -14,6 +16,7 @@ from src.domain.forecasting import (
     ForecastResult,
     ModelConfiguration,
     ModelInfo,
+    ModelRunStatus,
     ModelType,
     MonteCarloConfiguration,
     PredictionInterval,
@@ -336,6 +339,7 @@ class TestCompareForecastModelsUseCase:
         # Mock model and result
         mock_model = Mock(spec=ForecastingModel)
         mock_model.validate_inputs.return_value = []
+        mock_model.configuration_errors.return_value = []
         mock_model.get_model_info.return_value = model_info
 
         mock_result = ForecastResult(
@@ -363,6 +367,7 @@ class TestCompareForecastModelsUseCase:
 
         # Mock model
         mock_model = Mock(spec=ForecastingModel)
+        mock_model.configuration_errors.return_value = []
         mock_result = ForecastResult(
             prediction_intervals=[],
             expected_sprints=3.0,
@@ -401,3 +406,196 @@ class TestCompareForecastModelsUseCase:
 
         # Should handle error gracefully and return empty results
         assert len(results) == 0
+
+
+class _SleepingModel(ForecastingModel):
+    """Model that takes a fixed time, for concurrency tests"""
+
+    def __init__(self, seconds, release=None):
+        self.seconds = seconds
+        self.release = release
+
+    def forecast(self, remaining_work, velocity_metrics, config):
+        if self.release is not None:
+            self.release.wait(self.seconds)
+        else:
+            time.sleep(self.seconds)
+        return ForecastResult(
+            prediction_intervals=[],
+            expected_sprints=remaining_work / velocity_metrics.average,
+            expected_completion_date=datetime.now(),
+        )
+
+    def get_model_info(self):
+        return ModelInfo(
+            model_type=ModelType.PERT,
+            name="Sleeping",
+            description="Test",
+            supports_probability_distribution=False,
+            required_historical_periods=1,
+            configuration_class=ModelConfiguration,
+        )
+
+    def validate_inputs(self, remaining_work, velocity_metrics):
+        return []
+
+
+class TestParallelModelComparison:
+    def _factory(self, models):
+        factory = Mock(spec=DefaultModelFactory)
+        factory.create.side_effect = lambda model_type: models[model_type]
+        factory.get_default_config.return_value = ModelConfiguration()
+        return factory
+
+    def test_models_run_concurrently(self):
+        models = {
+            ModelType.PERT: _SleepingModel(0.3),
+            ModelType.BAYESIAN: _SleepingModel(0.3),
+            ModelType.LINEAR_REGRESSION: _SleepingModel(0.3),
+        }
+        use_case = CompareForecastModelsUseCase(self._factory(models))
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        started = time.perf_counter()
+        results = use_case.execute(100.0, velocity_metrics, list(models))
+
+        assert time.perf_counter() - started < 0.8
+        assert list(results) == list(models)
+        for result in results.values():
+            assert result.model_metadata["elapsed_seconds"] >= 0.25
+
+    def test_timeout_returns_partial_results(self):
+        release = threading.Event()
+        models = {
+            ModelType.PERT: _SleepingModel(0.0),
+            ModelType.BAYESIAN: _SleepingModel(5.0, release),
+        }
+        use_case = CompareForecastModelsUseCase(self._factory(models), timeout=0.2)
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        try:
+            runs = use_case.run(100.0, velocity_metrics, list(models))
+        finally:
+            release.set()
+
+        assert runs[ModelType.PERT].status == ModelRunStatus.COMPLETED
+        assert runs[ModelType.PERT].result.expected_sprints == 5.0
+        assert runs[ModelType.BAYESIAN].status == ModelRunStatus.TIMED_OUT
+        assert runs[ModelType.BAYESIAN].result is None
+        assert 0.2 <= runs[ModelType.BAYESIAN].elapsed_seconds < 1.0
+
+    def test_queued_thread_models_get_the_full_timeout(self):
+        models = {
+            ModelType.PERT: _SleepingModel(0.15),
+            ModelType.BAYESIAN: _SleepingModel(0.15),
+        }
+        use_case = CompareForecastModelsUseCase(
+            self._factory(models), timeout=0.25, max_workers=1
+        )
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        runs = use_case.run(100.0, velocity_metrics, list(models))
+
+        # The second model starts after the first, past a shared 0.25s budget
+        assert [run.status for run in runs.values()] == [ModelRunStatus.COMPLETED] * 2
+        assert runs[ModelType.BAYESIAN].elapsed_seconds < 0.25
+
+    def test_queued_process_models_get_the_full_timeout(self):
+        models = {
+            ModelType.PERT: _SleepingModel(0.3),
+            ModelType.BAYESIAN: _SleepingModel(0.3),
+        }
+        use_case = CompareForecastModelsUseCase(
+            self._factory(models),
+            timeout=0.5,
+            process_model_types=list(models),
+            max_workers=1,
+        )
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        runs = use_case.run(100.0, velocity_metrics, list(models))
+
+        assert [run.status for run in runs.values()] == [ModelRunStatus.COMPLETED] * 2
+        assert all(run.elapsed_seconds < 0.5 for run in runs.values())
+
+    def test_failures_are_reported(self):
+        failing = _SleepingModel(0.0)
+        failing.validate_inputs = lambda *args: ["broken"]
+        models = {ModelType.PERT: _SleepingModel(0.0), ModelType.BAYESIAN: failing}
+        use_case = CompareForecastModelsUseCase(self._factory(models))
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        runs = use_case.run(100.0, velocity_metrics, list(models))
+
+        assert runs[ModelType.PERT].status == ModelRunStatus.COMPLETED
+        assert runs[ModelType.BAYESIAN].status == ModelRunStatus.FAILED
+        assert "broken" in runs[ModelType.BAYESIAN].error
+
+    def test_process_pool_models(self):
+        use_case = CompareForecastModelsUseCase(
+            DefaultModelFactory(), process_model_types=[ModelType.MONTE_CARLO]
+        )
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        results = use_case.execute(
+            100.0, velocity_metrics, [ModelType.MONTE_CARLO, ModelType.ANALYTICAL]
+        )
+
+        assert set(results) == {ModelType.MONTE_CARLO, ModelType.ANALYTICAL}
+        assert results[ModelType.MONTE_CARLO].expected_sprints > 0
+
+    def test_models_without_inputs_are_not_configured(self):
+        use_case = CompareForecastModelsUseCase(DefaultModelFactory())
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        runs = use_case.run(
+            100.0, velocity_metrics, [ModelType.ANALYTICAL, ModelType.THROUGHPUT]
+        )
+
+        assert runs[ModelType.ANALYTICAL].status == ModelRunStatus.COMPLETED
+        assert runs[ModelType.THROUGHPUT].status == ModelRunStatus.NOT_CONFIGURED
+        assert "throughput history" in runs[ModelType.THROUGHPUT].error
+
+    def test_queued_process_models_time_out(self):
+        # More process-backed models than workers: the queued ones are
+        # cancelled when the pool shuts down and must still time out
+        models = {
+            model_type: _SleepingModel(0.5)
+            for model_type in (
+                ModelType.PERT,
+                ModelType.BAYESIAN,
+                ModelType.LINEAR_REGRESSION,
+                ModelType.ANALYTICAL,
+            )
+        }
+        use_case = CompareForecastModelsUseCase(
+            self._factory(models),
+            timeout=0.05,
+            process_model_types=list(models),
+            max_workers=1,
+        )
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        runs = use_case.run(100.0, velocity_metrics, list(models))
+
+        assert [run.status for run in runs.values()] == [
+            ModelRunStatus.TIMED_OUT
+        ] * len(models)
+
+    def test_thread_models_do_not_delay_exit(self):
+        release = threading.Event()
+        models = {ModelType.BAYESIAN: _SleepingModel(5.0, release)}
+        use_case = CompareForecastModelsUseCase(self._factory(models), timeout=0.05)
+        velocity_metrics = VelocityMetrics(20, 18, 5, 10, 30, 0.5)
+
+        try:
+            use_case.run(100.0, velocity_metrics, list(models))
+            abandoned = [
+                thread
+                for thread in threading.enumerate()
+                if thread.name == "forecast-model"
+            ]
+        finally:
+            release.set()
+
+        assert abandoned and all(thread.daemon for thread in abandoned)
@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 
 from src.domain.entities import Issue
+from src.domain.forecasting import PredictionInterval
 from src.domain.multi_project import AggregatedMetrics, MultiProjectReport, ProjectData
 
 
@@ -81,6 +82,23 @@ class TestAggregatedMetrics:
         assert metrics.overall_completion_percentage == 60.0
         assert metrics.total_projects == 3
 
+    def test_portfolio_prediction_lookup(self):
+        metrics = AggregatedMetrics(
+            total_projects=2,
+            total_issues=10,
+            total_completed_issues=5,
+            total_remaining_work=80.0,
+            combined_velocity=20.0,
+            portfolio_prediction_intervals=[
+                PredictionInterval(0.5, 4, 5, 6),
+                PredictionInterval(0.85, 5, 7, 9),
+            ],
+            portfolio_expected_sprints=5.4,
+        )
+
+        assert metrics.get_portfolio_prediction(0.85).predicted_value == 7
+        assert metrics.get_portfolio_prediction(0.95) is None
+
 
 class TestMultiProjectReport:
     def test_multi_project_report(self):
@@ -4,8 +4,10 @@ from pathlib import Path
 
 from src.domain.entities import Issue, Sprint
 from src.domain.value_objects import DateRange, FieldMapping
+from src.domain.velocity_posterior import NormalInverseGammaPosterior
 from src.infrastructure.repositories import (
     FileConfigRepository,
+    FileVelocityPosteriorRepository,
     InMemoryIssueRepository,
     InMemorySprintRepository,
     SprintExtractor,
@@ -209,6 +211,20 @@ class TestFileConfigRepository:
             assert loaded["todo"] == ["To Do", "Open", "Backlog"]
 
 
+class TestFileVelocityPosteriorRepository:
+    def test_save_and_load_posterior(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = FileVelocityPosteriorRepository(Path(tmpdir))
+            posterior = NormalInverseGammaPosterior.prior(20.0, 5.0).update(
+                23.0, datetime(2024, 3, 1)
+            )
+
+            repo.save("jira:PROJ/1", posterior)
+
+            assert repo.load("jira:PROJ/1") == posterior
+            assert repo.load("other") is None
+
+
 class TestSprintExtractor:
     def test_extract_sprints_from_issues(self):
         # Create issues with sprint information
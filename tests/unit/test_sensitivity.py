@@ -0,0 +1,104 @@
+"""Tests for sensitivity sweeps over velocity assumptions"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.forecasting_use_cases import RunSensitivitySweepUseCase
+from src.domain.forecasting import MonteCarloConfiguration, SimulationEngine
+from src.domain.sensitivity import SensitivityPoint
+from src.domain.value_objects import VelocityMetrics
+from src.infrastructure.monte_carlo_model import MonteCarloModel
+
+VELOCITY = VelocityMetrics(20.0, 19.0, 5.0, 12.0, 30.0, 0.5, (15.0, 20.0, 25.0))
+
+
+def _config():
+    return MonteCarloConfiguration(
+        num_simulations=2000, engine=SimulationEngine.VECTORIZED, random_seed=7
+    )
+
+
+class TestSensitivityPoint:
+    def test_baseline_leaves_metrics_unchanged(self):
+        assert SensitivityPoint().apply(VELOCITY) == VELOCITY
+
+    def test_shift_and_spread(self):
+        adjusted = SensitivityPoint(variance_multiplier=2.0, mean_shift=-0.1).apply(
+            VELOCITY
+        )
+
+        assert adjusted.average == pytest.approx(18.0)
+        assert adjusted.std_dev == pytest.approx(10.0)
+        assert adjusted.min_value == pytest.approx(2.0)
+        assert adjusted.samples == pytest.approx((8.0, 18.0, 28.0))
+        assert adjusted.trend == VELOCITY.trend
+
+
+class TestRunSensitivitySweepUseCase:
+    def test_grid_covers_every_combination(self):
+        use_case = RunSensitivitySweepUseCase(MonteCarloModel())
+
+        analysis = use_case.execute(
+            200.0,
+            VELOCITY,
+            _config(),
+            variance_multipliers=[0.5, 1.5],
+            mean_shifts=[-0.2, 0.2],
+        )
+
+        # The baseline values are added to each axis
+        assert len(analysis.outcomes) == 9
+        assert analysis.baseline.point == SensitivityPoint()
+        assert len(analysis.table()) == 9 * len(_config().confidence_levels)
+
+    def test_tornado_ranks_mean_shift_first(self):
+        use_case = RunSensitivitySweepUseCase(MonteCarloModel())
+
+        analysis = use_case.execute(
+            200.0,
+            VELOCITY,
+            _config(),
+            variance_multipliers=[0.9, 1.1],
+            mean_shifts=[-0.3, 0.3],
+        )
+
+        top = analysis.tornado[0]
+        assert [bar.parameter for bar in analysis.tornado] == [
+            "mean_shift",
+            "variance_multiplier",
+        ]
+        assert top.low_value == 0.3 and top.high_value == -0.3
+        baseline = analysis.baseline.forecast.get_percentile(0.85)
+        assert top.low_outcome <= baseline <= top.high_outcome
+
+    def test_lookback_windows_use_their_velocity(self):
+        slow = VelocityMetrics(10.0, 10.0, 3.0, 6.0, 14.0, 0.0)
+        velocity_for_lookback = Mock(return_value=slow)
+        use_case = RunSensitivitySweepUseCase(MonteCarloModel(), velocity_for_lookback)
+
+        analysis = use_case.execute(
+            200.0,
+            VELOCITY,
+            _config(),
+            variance_multipliers=[1.0],
+            mean_shifts=[0.0],
+            lookback_windows=[None, 4],
+        )
+
+        velocity_for_lookback.assert_called_once_with(4)
+        bar = analysis.tornado[0]
+        assert bar.parameter == "lookback_sprints"
+        assert bar.high_value == 4
+
+    def test_lookback_requires_velocity_source(self):
+        use_case = RunSensitivitySweepUseCase(MonteCarloModel())
+
+        with pytest.raises(ValueError, match="velocity_for_lookback"):
+            use_case.execute(200.0, VELOCITY, _config(), lookback_windows=[6])
+
+    def test_tornado_confidence_must_be_configured(self):
+        use_case = RunSensitivitySweepUseCase(MonteCarloModel())
+
+        with pytest.raises(ValueError, match="Tornado confidence"):
+            use_case.execute(200.0, VELOCITY, _config(), tornado_confidence=0.9)
@@ -1,14 +1,24 @@
 from datetime import datetime, timedelta
 from unittest.mock import Mock
 
+import pytest
+
 from src.application.use_cases import (
+    AnalyzeDailyThroughputUseCase,
     AnalyzeHistoricalDataUseCase,
     CalculateRemainingWorkUseCase,
     CalculateVelocityUseCase,
+    ForecastBacklogItemsUseCase,
+    ForecastEpicsUseCase,
     RunMonteCarloSimulationUseCase,
+    UpdateVelocityPosteriorUseCase,
 )
 from src.domain.entities import Issue, SimulationConfig, Sprint
+from src.domain.forecasting import EpicScheduling, MonteCarloConfiguration
+from src.domain.repositories import VelocityPosteriorRepository
 from src.domain.value_objects import VelocityMetrics
+from src.domain.velocity_posterior import NormalInverseGammaPosterior
+from src.infrastructure.monte_carlo_model import MonteCarloModel
 
 
 class TestCalculateVelocityUseCase:
@@ -55,6 +65,7 @@ class TestCalculateVelocityUseCase:
         assert metrics.std_dev == 0.0
         assert metrics.min_value == 25.0
         assert metrics.max_value == 25.0
+        assert metrics.samples == (25.0, 25.0, 25.0)
 
     def test_calculate_velocity_empty_sprints(self):
         issue_repo = Mock()
@@ -270,6 +281,122 @@ class TestCalculateRemainingWorkUseCase:
         assert 0.0 not in breakdown  # Should not include stories without points
 
 
+class TestForecastBacklogItemsUseCase:
+    def test_forecasts_every_item_in_rank_order(self):
+        issues = [
+            Issue(
+                key=f"TEST-{i}",
+                summary=f"Issue {i}",
+                issue_type="Story",
+                status="To Do",
+                created=datetime.now(),
+                story_points=points,
+            )
+            for i, points in enumerate([5.0, None, 13.0, 8.0], start=1)
+        ]
+        velocity_metrics = VelocityMetrics(
+            average=10.0,
+            median=10.0,
+            std_dev=2.0,
+            min_value=6.0,
+            max_value=14.0,
+            trend=0.0,
+        )
+        config = MonteCarloConfiguration(num_simulations=2000, random_seed=1)
+
+        use_case = ForecastBacklogItemsUseCase(MonteCarloModel())
+        forecasts = use_case.execute(issues, velocity_metrics, config)
+
+        assert [f.issue_key for f in forecasts] == [i.key for i in issues]
+        assert [f.rank for f in forecasts] == [1, 2, 3, 4]
+        assert [f.cumulative_work for f in forecasts] == [5.0, 5.0, 18.0, 26.0]
+        medians = [f.forecast.get_percentile(0.5) for f in forecasts]
+        assert medians == sorted(medians)
+        assert medians[-1] == 3
+
+    def test_empty_backlog(self):
+        use_case = ForecastBacklogItemsUseCase(MonteCarloModel())
+
+        assert use_case.execute([], Mock(), MonteCarloConfiguration()) == []
+
+
+class TestForecastEpicsUseCase:
+    def _issues(self, epics_and_points):
+        return [
+            Issue(
+                key=f"TEST-{i}",
+                summary=f"Issue {i}",
+                issue_type="Story",
+                status="To Do",
+                created=datetime.now(),
+                story_points=points,
+                custom_fields={"epic_link": epic} if epic else {},
+            )
+            for i, (epic, points) in enumerate(epics_and_points, start=1)
+        ]
+
+    def _forecast(self, issues, **kwargs):
+        model = Mock(wraps=MonteCarloModel())
+        velocity_metrics = VelocityMetrics(10.0, 10.0, 2.0, 6.0, 14.0, 0.0)
+        config = MonteCarloConfiguration(num_simulations=2000, random_seed=1)
+        forecasts = ForecastEpicsUseCase(model).execute(
+            issues, velocity_metrics, config, **kwargs
+        )
+        return forecasts, model.forecast_cut_lines.call_args.args[0]
+
+    def test_priority_order_stacks_epics(self):
+        issues = self._issues(
+            [("EPIC-2", 10.0), ("EPIC-1", 20.0), (None, 50.0), ("EPIC-2", 5.0)]
+        )
+
+        forecasts, cut_lines = self._forecast(issues)
+
+        assert list(forecasts) == ["EPIC-2", "EPIC-1"]
+        assert cut_lines == [15.0, 35.0]
+        assert forecasts["EPIC-2"].get_percentile(0.5) <= forecasts[
+            "EPIC-1"
+        ].get_percentile(0.5)
+
+    def test_parallel_shares_capacity(self):
+        issues = self._issues([("A", 30.0), ("B", 10.0), ("C", 20.0)])
+
+        forecasts, cut_lines = self._forecast(
+            issues, scheduling=EpicScheduling.PARALLEL
+        )
+
+        # B finishes after 3 x 10, C after 10 + 2 x 20, A last with all work
+        assert cut_lines == [30.0, 50.0, 60.0]
+        assert list(forecasts) == ["A", "B", "C"]
+        assert forecasts["A"].model_metadata["cut_line"] == 60.0
+
+    def test_parallel_with_custom_shares(self):
+        issues = self._issues([("A", 30.0), ("B", 10.0)])
+
+        _, cut_lines = self._forecast(
+            issues,
+            scheduling=EpicScheduling.PARALLEL,
+            shares={"A": 3.0, "B": 1.0},
+        )
+
+        # Both run at the pace that finishes them together
+        assert cut_lines == [40.0, 40.0]
+
+    def test_parallel_needs_positive_shares(self):
+        issues = self._issues([("A", 30.0), ("B", 10.0)])
+
+        with pytest.raises(ValueError, match="B"):
+            self._forecast(
+                issues, scheduling=EpicScheduling.PARALLEL, shares={"A": 1.0}
+            )
+
+    def test_no_epics(self):
+        forecasts = ForecastEpicsUseCase(MonteCarloModel()).execute(
+            self._issues([(None, 5.0)]), Mock(), MonteCarloConfiguration()
+        )
+
+        assert forecasts == {}
+
+
 class TestAnalyzeHistoricalDataUseCase:
     def test_analyze_historical_data(self):
         # Create issues completed over several weeks
@@ -301,3 +428,98 @@ class TestAnalyzeHistoricalDataUseCase:
         assert len(historical.cycle_times) > 0
         assert len(historical.throughput) > 0
         assert len(historical.dates) > 0
+
+
+class TestAnalyzeDailyThroughputUseCase:
+    def _issue(self, key, resolved):
+        return Issue(
+            key=key,
+            summary=key,
+            issue_type="Story",
+            status="Done",
+            created=resolved - timedelta(days=3),
+            resolved=resolved,
+        )
+
+    def test_counts_completions_per_day_including_idle_days(self):
+        yesterday = datetime.now().replace(hour=12) - timedelta(days=1)
+        issues = [
+            self._issue("A", yesterday),
+            self._issue("B", yesterday),
+            self._issue("C", yesterday - timedelta(days=2)),
+        ]
+        issue_repo = Mock()
+        issue_repo.get_completed_in_range.return_value = issues
+
+        history = AnalyzeDailyThroughputUseCase(issue_repo).execute(
+            lookback_days=5, working_days_only=False
+        )
+
+        assert history == (0, 0, 1, 0, 2)
+
+    def test_working_days_only_skips_weekends(self):
+        issue_repo = Mock()
+        issue_repo.get_completed_in_range.return_value = []
+
+        history = AnalyzeDailyThroughputUseCase(issue_repo).execute(lookback_days=14)
+
+        assert history == (0,) * 10
+
+
+class TestUpdateVelocityPosteriorUseCase:
+    def _sprint(self, days_ago, points):
+        end = datetime.now() - timedelta(days=days_ago)
+        return Sprint(
+            name=f"Sprint {days_ago}",
+            start_date=end - timedelta(days=14),
+            end_date=end,
+            completed_points=points,
+        )
+
+    def _repo(self, stored=None):
+        repo = Mock(spec=VelocityPosteriorRepository)
+        repo.load.return_value = stored
+        return repo
+
+    def test_applies_completed_sprints_in_order(self):
+        repo = self._repo()
+        prior = NormalInverseGammaPosterior.prior(20.0, 5.0)
+        sprints = [
+            self._sprint(14, 25.0),
+            self._sprint(42, 18.0),
+            self._sprint(28, 22.0),
+        ]
+
+        posterior = UpdateVelocityPosteriorUseCase(repo).execute("P", sprints, prior)
+
+        assert posterior == (
+            prior.update(18.0, sprints[1].end_date)
+            .update(22.0, sprints[2].end_date)
+            .update(25.0, sprints[0].end_date)
+        )
+        repo.save.assert_called_once_with("P", posterior)
+
+    def test_only_new_sprints_are_applied(self):
+        sprints = [self._sprint(42, 18.0), self._sprint(28, 22.0)]
+        prior = NormalInverseGammaPosterior.prior(20.0, 5.0)
+        stored = prior.update(18.0, sprints[0].end_date)
+        repo = self._repo(stored)
+
+        posterior = UpdateVelocityPosteriorUseCase(repo).execute(
+            "P", sprints + [self._sprint(-3, 30.0)], prior
+        )
+
+        assert posterior.observations == 2
+        assert posterior == stored.update(22.0, sprints[1].end_date)
+
+    def test_nothing_saved_without_new_sprints(self):
+        sprint = self._sprint(14, 20.0)
+        stored = NormalInverseGammaPosterior.prior(20.0, 5.0).update(
+            20.0, sprint.end_date
+        )
+        repo = self._repo(stored)
+
+        posterior = UpdateVelocityPosteriorUseCase(repo).execute("P", [sprint], stored)
+
+        assert posterior is stored
+        repo.save.assert_not_called()
@@ -221,6 +221,54 @@ class TestVelocityScenario:
         assert "Adding part-time developer (+25% capacity after ramp-up)" in summary
 
 
+    def test_compiled_factors_match_adjusted_velocity(self):
+        """Test compiled factor table agrees with per-sprint evaluation"""
+        scenario = VelocityScenario(
+            name="Complex",
+            adjustments=[
+                VelocityAdjustment(2, 3, 0.8, "holidays"),
+                VelocityAdjustment(10, None, 1.1, "improvements"),
+            ],
+            team_changes=[
+                TeamChange(5, 2, 3, ProductivityCurve.EXPONENTIAL),
+                TeamChange(15, -1, 0),
+            ],
+        )
+
+        compiled = scenario.compile(team_size=4, horizon=40)
+
+        assert compiled.horizon == 40
+        for sprint in range(1, 60):
+            expected, _ = scenario.get_adjusted_velocity(sprint, 1.0, 4)
+            assert compiled.get_factor(sprint) == pytest.approx(expected)
+
+    def test_compile_defaults_to_steady_state(self):
+        """Test compiled table stops once the factor no longer changes"""
+        scenario = VelocityScenario(
+            name="Scaling",
+            adjustments=[VelocityAdjustment(3, 3, 0.5, "vacation")],
+            team_changes=[TeamChange(4, 1, 2)],
+        )
+
+        compiled = scenario.compile(team_size=4)
+
+        assert scenario.get_steady_state_sprint() == 6
+        assert compiled.factors == pytest.approx((1.0, 1.0, 0.5, 1.0625, 1.15625, 1.25))
+        assert compiled.get_factor(100) == 1.25
+
+    def test_compiled_reasons_are_built_on_demand(self):
+        """Test reason strings are available for reporting"""
+        scenario = VelocityScenario(
+            name="Vacation",
+            adjustments=[VelocityAdjustment(3, 3, 0.5, "vacation")],
+            team_changes=[],
+        )
+
+        compiled = scenario.compile(team_size=5)
+
+        assert compiled.get_reason(1) == "No adjustments"
+        assert "vacation" in compiled.get_reason(3)
+
 class TestVelocityAdjustmentParser:
     """Test CLI argument parsing"""
 
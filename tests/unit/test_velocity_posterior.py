@@ -0,0 +1,59 @@
+"""Tests for the Normal-Inverse-Gamma velocity posterior"""
+
+import statistics
+from datetime import datetime
+
+import pytest
+
+from src.domain.velocity_posterior import NormalInverseGammaPosterior
+
+VELOCITIES = [18.0, 22.0, 25.0, 17.0, 21.0, 24.0, 19.0, 23.0]
+
+
+class TestNormalInverseGammaPosterior:
+    def test_prior_expected_variance(self):
+        prior = NormalInverseGammaPosterior.prior(20.0, 5.0, strength=4.0)
+
+        assert prior.mean == 20.0
+        assert prior.kappa == 4.0
+        assert prior.expected_variance == pytest.approx(25.0)
+
+    def test_invalid_strength_raises(self):
+        with pytest.raises(ValueError):
+            NormalInverseGammaPosterior.prior(20.0, 5.0, strength=0)
+
+    def test_incremental_update_matches_batch_summary(self):
+        prior = NormalInverseGammaPosterior.prior(15.0, 8.0, strength=2.0)
+
+        incremental = prior.update_all(VELOCITIES)
+        batch = prior.update_summary(
+            len(VELOCITIES), statistics.mean(VELOCITIES), statistics.stdev(VELOCITIES)
+        )
+
+        assert incremental.observations == batch.observations == len(VELOCITIES)
+        assert incremental.mean == pytest.approx(batch.mean)
+        assert incremental.kappa == pytest.approx(batch.kappa)
+        assert incremental.alpha == pytest.approx(batch.alpha)
+        assert incremental.beta == pytest.approx(batch.beta)
+
+    def test_posterior_concentrates_with_data(self):
+        prior = NormalInverseGammaPosterior.prior(30.0, 10.0)
+        posterior = prior.update_all(VELOCITIES * 10)
+
+        assert posterior.mean == pytest.approx(statistics.mean(VELOCITIES), abs=0.2)
+        assert posterior.predictive_scale < prior.predictive_scale
+
+    def test_update_records_last_sprint(self):
+        end = datetime(2024, 5, 1)
+
+        posterior = NormalInverseGammaPosterior.prior(20.0, 5.0).update(22.0, end)
+
+        assert posterior.last_sprint_end == end
+        assert posterior.update(21.0).last_sprint_end == end
+
+    def test_dict_round_trip(self):
+        posterior = NormalInverseGammaPosterior.prior(20.0, 5.0).update(
+            22.0, datetime(2024, 5, 1)
+        )
+
+        assert NormalInverseGammaPosterior.from_dict(posterior.to_dict()) == posterior